@@ -27,6 +27,7 @@ from .cli_helpers import (  # noqa: F401
 )
 from .config import DEFAULT_PROFILE, load_profile
 from .developer_token import MAX_TTL_DAYS, SECONDS_PER_DAY, decode_claims, mint_developer_token
+from .library_snapshot import SnapshotLibrary, default_snapshot_path, snapshot_enabled
 from .cli_playlist import (  # noqa: F401
     ALIZEE,
     GIPSY_KINGS,
@@ -48,6 +49,8 @@ from .cli_playlist import (  # noqa: F401
     _playlist_sort_key,
 )
 
+HELP_NO_SNAPSHOT = "Refetch every playlist's tracks instead of reusing the local library snapshot"
+
 # ---------------------------------------------------------------------------
 # Dataclasses (C1)
 # ---------------------------------------------------------------------------
@@ -122,6 +125,12 @@ class ExportRequest:
 # ---------------------------------------------------------------------------
 
 
+def _prefetch_tracks(client: Any, playlists: list[dict], track_limit: int | None) -> None:
+    """Let a snapshot-backed library fetch stale track lists concurrently up front."""
+    if isinstance(client, SnapshotLibrary):
+        client.prefetch_tracks(playlists, limit=track_limit)
+
+
 class ListPlaylistsProcessor(SafeProcessor[ListPlaylistsRequest, list[PlaylistResult]]):
     """Fetch and type-convert library playlists."""
 
@@ -143,6 +152,7 @@ class TracksProcessor(SafeProcessor[TracksRequest, list[TrackResult]]):
 
     def _process_safe(self, payload: TracksRequest) -> list[TrackResult]:
         playlists = payload.client.list_library_playlists(limit=payload.playlist_limit)
+        _prefetch_tracks(payload.client, playlists, payload.track_limit)
         results: list[TrackResult] = []
         for pl in playlists:
             pl_name = (pl.get("attributes") or {}).get("name") or ""
@@ -167,7 +177,9 @@ class ExportProcessor(SafeProcessor[ExportRequest, list[ExportPlaylistResult]]):
 
     def _process_safe(self, payload: ExportRequest) -> list[ExportPlaylistResult]:
         results: list[ExportPlaylistResult] = []
-        for pl in payload.client.list_library_playlists(limit=payload.playlist_limit):
+        playlists = payload.client.list_library_playlists(limit=payload.playlist_limit)
+        _prefetch_tracks(payload.client, playlists, payload.track_limit)
+        for pl in playlists:
             attrs = pl.get("attributes") or {}
             tracks_raw = payload.client.list_playlist_tracks(
                 pl["id"], limit=payload.track_limit
@@ -330,6 +342,18 @@ def _produce_and_write(
     return 0
 
 
+def _library(args: Any, client: AppleMusicClient) -> AppleMusicClient | SnapshotLibrary:
+    """Serve library reads from the local snapshot unless it is disabled."""
+    if getattr(args, "no_snapshot", False) or not snapshot_enabled():
+        return client
+    return SnapshotLibrary(client, default_snapshot_path(getattr(client, "user_token", "") or ""))
+
+
+def _save_library(library: Any) -> None:
+    if isinstance(library, SnapshotLibrary):
+        library.save()
+
+
 def _get_client(args: Any) -> AppleMusicClient:
     """Create an AppleMusicClient from args.
 
@@ -504,15 +528,17 @@ def cmd_list(args: Any) -> int:
 @app.argument("--pretty", action="store_true", help=HELP_PRETTY_JSON)
 @app.argument("--playlist-limit", type=int, help="Maximum playlists to fetch")
 @app.argument("--track-limit", type=int, help="Maximum tracks per playlist to fetch")
+@app.argument("--no-snapshot", action="store_true", help=HELP_NO_SNAPSHOT)
 def cmd_tracks(args: Any) -> int:
     """List all tracks with playlist context."""
-    client = _get_client(args)
+    library = _library(args, _get_client(args))
     request = TracksRequest(
-        client=client,
+        client=library,
         playlist_limit=getattr(args, "playlist_limit", None),
         track_limit=getattr(args, "track_limit", None),
     )
     envelope: ResultEnvelope[list[TrackResult]] = TracksProcessor().process(request)
+    _save_library(library)
     writer = _make_json_writer(args)
 
     return _produce_and_write(envelope, TracksProducer(writer), args, _tracks_to_dict)
@@ -526,15 +552,17 @@ def cmd_tracks(args: Any) -> int:
 @app.argument("--pretty", action="store_true", help=HELP_PRETTY_JSON)
 @app.argument("--playlist-limit", type=int, help="Maximum playlists to fetch")
 @app.argument("--track-limit", type=int, help="Maximum tracks per playlist to fetch")
+@app.argument("--no-snapshot", action="store_true", help=HELP_NO_SNAPSHOT)
 def cmd_export(args: Any) -> int:
     """Export playlists and tracks."""
-    client = _get_client(args)
+    library = _library(args, _get_client(args))
     request = ExportRequest(
-        client=client,
+        client=library,
         playlist_limit=getattr(args, "playlist_limit", None),
         track_limit=getattr(args, "track_limit", None),
     )
     envelope: ResultEnvelope[list[ExportPlaylistResult]] = ExportProcessor().process(request)
+    _save_library(library)
     writer = _make_json_writer(args)
 
     def _export_to_dict(payload: list[ExportPlaylistResult]) -> dict[str, Any]:
@@ -565,6 +593,7 @@ def cmd_export(args: Any) -> int:
 @app.argument("--count", type=int, default=20, help="How many seeds to include (<= len seeds)")
 @app.argument("--storefront", help="Storefront code (default: from ping)")
 @app.argument("--shuffle-seed", type=int, help="Deterministic shuffle seed (optional)")
+@app.argument("--no-cache", action="store_true", help="Search every seed again instead of using the song cache")
 def cmd_create(args: Any) -> int:
     """Create a playlist from preset seeds."""
     import sys
@@ -580,6 +609,7 @@ def cmd_create(args: Any) -> int:
         shuffle_seed=getattr(args, "shuffle_seed", None),
         storefront=getattr(args, "storefront", None),
         dry_run=getattr(args, "dry_run", False),
+        use_cache=not getattr(args, "no_cache", False),
     )
     try:
         payload = _create_from_seeds(
@@ -602,9 +632,10 @@ def cmd_create(args: Any) -> int:
 @app.argument("--keep", choices=["latest", "first"], default="latest", help="Which duplicate to keep")
 @app.argument("--delete", action="store_true", help="Delete duplicates (default: plan only)")
 @app.argument("--playlist-limit", type=int, help="Maximum playlists to fetch")
+@app.argument("--no-snapshot", action="store_true", help=HELP_NO_SNAPSHOT)
 def cmd_dedupe(args: Any) -> int:
     """Find (and optionally delete) duplicate playlists by name."""
-    client = _get_client(args)
+    client = _library(args, _get_client(args))
     playlists = client.list_library_playlists(limit=getattr(args, "playlist_limit", None))
     by_name: dict[str, list[dict[str, Any]]] = {}
     for pl in playlists:
@@ -628,6 +659,7 @@ def cmd_dedupe(args: Any) -> int:
         if do_delete:
             deleted.extend(_delete_duplicate_playlists(client, remove))
 
+    _save_library(client)
     payload = {"duplicates": plan, "deleted": deleted if do_delete else []}
     return _output_json(args, payload)
 
@@ -28,6 +28,7 @@ class PlaylistCreationConfig:
     shuffle_seed: int | None = None
     storefront: str | None = None
     dry_run: bool = False
+    use_cache: bool = True
 
 
 def _resolve_tokens(args) -> tuple[str | None, str | None]:
@@ -6,8 +6,12 @@ import random
 import re
 from datetime import datetime
 
+from core.http_transport import concurrency_for
+from core.parallel import chunked, parallel_map
+
 from .client import AppleMusicCLIError, AppleMusicClient
 from .cli_helpers import PlaylistCreationConfig
+from .song_cache import SongCache, cache_enabled, cache_key, song_ref
 
 # Artist name constants (avoids duplicate string literals)
 GIPSY_KINGS = "Gipsy Kings"
@@ -43,6 +47,13 @@ POLO_AND_PAN = "Polo & Pan"
 # catalog-wide relevance, so the intended track is not always first.
 _SEARCH_CANDIDATES = 5
 
+# Seed searches in flight at once; the shared Apple Music concurrency controller
+# lowers the effective limit when the API starts throttling.
+_RESOLVE_WORKERS = 8
+
+# Tracks per create/add request, keeping each payload within Apple's limits.
+_MAX_TRACKS_PER_REQUEST = 100
+
 # Tokens too generic to establish that two artist strings refer to the same act.
 _ARTIST_STOPWORDS = frozenset({"the", "and", "feat", "featuring", "vs", "with", "de", "la", "le"})
 
@@ -464,6 +475,72 @@ def _pick_matching_song(results: list[dict], seed_artist: str) -> dict | None:
     return None
 
 
+def _resolve_seed(
+    client: AppleMusicClient,
+    store: str,
+    seed: tuple[str, str],
+    cache: SongCache | None,
+) -> dict:
+    """Resolve one seed to a song ref, or ``{"miss": reason}``; the cache answers first."""
+    title, artist = seed
+    key = cache_key(store, title, artist)
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        return cached
+    results = client.search_songs(f"{title} {artist}", storefront=store, limit=_SEARCH_CANDIDATES)
+    song = _pick_matching_song(results, artist) if results else None
+    if song is None:
+        if results:
+            top = (results[0].get("attributes") or {})
+            reason = f"artist mismatch: top result '{top.get('name')}' by '{top.get('artistName')}'"
+        else:
+            reason = "no search result"
+        if cache:
+            cache.put_miss(key, reason)
+        return {"miss": reason}
+    ref = song_ref(song)
+    if cache:
+        cache.put_song(key, ref)
+    return ref
+
+
+def _resolve_seeds(
+    client: AppleMusicClient,
+    store: str,
+    seeds: list[tuple[str, str]],
+    use_cache: bool,
+) -> list[dict]:
+    """Resolve seeds concurrently, in seed order; re-raises the first search failure."""
+    cache = SongCache() if use_cache and cache_enabled() else None
+    outcomes = parallel_map(
+        lambda seed: _resolve_seed(client, store, seed, cache),
+        seeds,
+        max_workers=_RESOLVE_WORKERS,
+        return_exceptions=True,
+        concurrency=concurrency_for("apple_music"),
+    )
+    if cache:
+        cache.save()  # keep what resolved even when another search failed
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            raise outcome
+    return outcomes
+
+
+def _create_playlist_batched(client: AppleMusicClient, config: PlaylistCreationConfig, tracks: list[dict]) -> dict:
+    """Create the playlist with the first batch of tracks and append the rest."""
+    first, *rest = chunked(tracks, _MAX_TRACKS_PER_REQUEST)
+    resp = client.create_playlist(config.name, tracks=first, description=config.description)
+    if not rest:
+        return resp
+    playlist_id = ((resp.get("data") or [{}])[0]).get("id")
+    if not playlist_id:
+        raise AppleMusicCLIError("Playlist created without an id; cannot add the remaining tracks.")
+    for batch in rest:
+        client.add_playlist_tracks(playlist_id, batch)
+    return resp
+
+
 def _create_from_seeds(
     client: AppleMusicClient,
     seeds: list[tuple[str, str]],
@@ -482,31 +559,19 @@ def _create_from_seeds(
     tracks_data = []
     resolved = []
     unmatched = []
-    for title, artist in seeds_copy:
-        term = f"{title} {artist}"
-        results = client.search_songs(term, storefront=store, limit=_SEARCH_CANDIDATES)
-        if not results:
-            unmatched.append({"title": title, "artist": artist, "reason": "no search result"})
-            continue
-        song = _pick_matching_song(results, artist)
-        if song is None:
-            top = (results[0].get("attributes") or {})
-            unmatched.append({
-                "title": title,
-                "artist": artist,
-                "reason": f"artist mismatch: top result '{top.get('name')}' by '{top.get('artistName')}'",
-            })
+    for (title, artist), ref in zip(seeds_copy, _resolve_seeds(client, store, seeds_copy, config.use_cache)):
+        if "miss" in ref:
+            unmatched.append({"title": title, "artist": artist, "reason": ref["miss"]})
             continue
-        attributes = song.get("attributes") or {}
-        tracks_data.append({"id": song.get("id"), "type": song.get("type", "songs") or "songs"})
-        resolved.append({"title": title, "artist": artist, "matched": attributes.get("name")})
+        tracks_data.append({"id": ref.get("id"), "type": ref.get("type") or "songs"})
+        resolved.append({"title": title, "artist": artist, "matched": ref.get("name")})
 
     plan = {"storefront": store, "name": config.name, "tracks": resolved, "unmatched": unmatched}
     if config.dry_run:
         return {"plan": plan}
     if not tracks_data:
         raise AppleMusicCLIError("No tracks resolved from seeds; cannot create playlist.")
-    resp = client.create_playlist(config.name, tracks=tracks_data, description=config.description)
+    resp = _create_playlist_batched(client, config, tracks_data)
     return {"created": resp, "plan": plan}
 
 
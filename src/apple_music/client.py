@@ -23,7 +23,7 @@ class AppleMusicClient:
         self.developer_token = developer_token
         self.user_token = user_token
         self.base_url = base_url.rstrip("/")
-        self._http = HttpClient(base_url, session=session)
+        self._http = HttpClient(base_url, session=session, api="apple_music")
 
     def _make_path(self, path: str) -> str:
         if path.startswith("http://") or path.startswith("https://"):
@@ -113,6 +113,10 @@ class AppleMusicClient:
             body["attributes"]["description"] = description
         return self._post("me/library/playlists", json_body=body)
 
+    def add_playlist_tracks(self, playlist_id: str, tracks: list[dict]) -> dict:
+        """Append tracks to a library playlist (Apple answers 204 No Content)."""
+        return self._post(f"me/library/playlists/{playlist_id}/tracks", json_body={"data": tracks})
+
     def delete_playlist(self, playlist_id: str) -> dict:
         """Attempt to delete a library playlist."""
         return self._request("DELETE", f"me/library/playlists/{playlist_id}")
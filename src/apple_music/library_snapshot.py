@@ -0,0 +1,180 @@
+"""Local snapshot of the Apple Music library for incremental export and dedupe.
+
+Listing playlists is a few pages; fetching every playlist's tracks is one
+paginated walk per playlist, which dominates large exports. The snapshot
+records each playlist's ``lastModifiedDate`` with its (trimmed) track list.
+A later run still lists playlists, but only refetches tracks for playlists
+that are new or whose ``lastModifiedDate`` changed (or is missing), and it
+fetches those concurrently under the shared Apple Music concurrency
+controller.
+
+``SnapshotLibrary`` exposes the two read methods of ``AppleMusicClient`` the
+list/tracks/export processors and dedupe use, so those commands compute
+from the snapshot without knowing it exists.
+
+Snapshots live under ``<data home>/apple_music/`` keyed by the music user
+token, so two accounts never share one. Set ``APPLE_MUSIC_SNAPSHOT=0`` to
+bypass it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.http_transport import concurrency_for
+from core.parallel import parallel_map
+from core.paths import data_home
+
+ENV_SNAPSHOT = "APPLE_MUSIC_SNAPSHOT"
+_SNAPSHOT_VERSION = 1
+_FETCH_WORKERS = 8
+
+# Track attributes the tracks/export commands read; everything else (artwork,
+# play params, ...) is dropped to keep the snapshot small.
+_TRACK_FIELDS = ("name", "artistName", "albumName", "durationInMillis", "trackNumber")
+
+
+def snapshot_enabled() -> bool:
+    return os.environ.get(ENV_SNAPSHOT, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def default_snapshot_path(user_token: str) -> Path:
+    key = hashlib.sha256((user_token or "").encode("utf-8")).hexdigest()[:12]
+    return data_home() / "apple_music" / f"library-{key}.json"
+
+
+def _trim_track(track: dict) -> dict:
+    attrs = track.get("attributes") or {}
+    return {
+        "id": track.get("id"),
+        "type": track.get("type"),
+        "attributes": {k: attrs[k] for k in _TRACK_FIELDS if k in attrs},
+    }
+
+
+def _modified(playlist: dict) -> str | None:
+    return (playlist.get("attributes") or {}).get("lastModifiedDate")
+
+
+@dataclass
+class SnapshotStats:
+    playlists: int = 0
+    refetched: int = 0
+    reused: int = 0
+
+
+class SnapshotLibrary:
+    """Read-through view of a library: playlist listing live, tracks from the snapshot."""
+
+    def __init__(self, client: Any, path: Path, *, max_workers: int = _FETCH_WORKERS):
+        self._client = client
+        self.path = Path(path)
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._listings: dict[int | None, list[dict]] = {}
+        self.stats = SnapshotStats()
+        raw = safe_load_json(self.path, {})
+        entries = raw.get("playlists") if isinstance(raw, dict) and raw.get("version") == _SNAPSHOT_VERSION else None
+        self._entries: dict[str, dict[str, Any]] = entries if isinstance(entries, dict) else {}
+
+    # -- listing ---------------------------------------------------------
+
+    def list_library_playlists(self, limit: int | None = None) -> list[dict]:
+        """List playlists (live); playlists that changed lose their cached tracks."""
+        if limit in self._listings:
+            return self._listings[limit]
+        playlists = self._client.list_library_playlists(limit=limit)
+        with self._lock:
+            for pl in playlists:
+                pl_id = pl.get("id")
+                if not pl_id:
+                    continue
+                entry = self._entries.get(pl_id)
+                modified = _modified(pl)
+                if entry is None or modified is None or entry.get("modified") != modified:
+                    self._entries[pl_id] = {"modified": modified, "playlist": pl}
+                    self._dirty = True
+            if limit is None:  # a complete listing: forget playlists deleted elsewhere
+                listed = {pl.get("id") for pl in playlists}
+                for gone in [pl_id for pl_id in self._entries if pl_id not in listed]:
+                    del self._entries[gone]
+                    self._dirty = True
+        self.stats.playlists = len(playlists)
+        self._listings[limit] = playlists
+        return playlists
+
+    # -- tracks ----------------------------------------------------------
+
+    def _cached_tracks(self, playlist_id: str, limit: int | None) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(playlist_id) or {}
+        tracks = entry.get("tracks")
+        if tracks is None:
+            return None
+        complete = entry.get("track_limit") is None
+        if complete or (limit is not None and limit <= entry["track_limit"]):
+            return tracks[:limit] if limit is not None else tracks
+        return None
+
+    def _fetch_tracks(self, playlist_id: str, limit: int | None) -> list[dict]:
+        tracks = [_trim_track(t) for t in self._client.list_playlist_tracks(playlist_id, limit=limit)]
+        with self._lock:
+            entry = self._entries.setdefault(playlist_id, {"modified": None})
+            entry["tracks"] = tracks
+            entry["track_limit"] = limit
+            self._dirty = True
+            self.stats.refetched += 1
+        return tracks
+
+    def prefetch_tracks(self, playlists: list[dict], limit: int | None = None) -> None:
+        """Fetch tracks for every listed playlist the snapshot cannot answer, concurrently."""
+        stale = [pl["id"] for pl in playlists if pl.get("id") and self._cached_tracks(pl["id"], limit) is None]
+        self.stats.reused += len([pl for pl in playlists if pl.get("id")]) - len(stale)
+        if not stale:
+            return
+        outcomes = parallel_map(
+            lambda pl_id: self._fetch_tracks(pl_id, limit),
+            stale,
+            max_workers=self._max_workers,
+            return_exceptions=True,
+            concurrency=concurrency_for("apple_music"),
+        )
+        self.save()  # keep what was fetched even when another playlist failed
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+
+    def list_playlist_tracks(self, playlist_id: str, limit: int | None = None) -> list[dict]:
+        cached = self._cached_tracks(playlist_id, limit)
+        if cached is not None:
+            return cached
+        return self._fetch_tracks(playlist_id, limit)
+
+    # -- writes ----------------------------------------------------------
+
+    def delete_playlist(self, playlist_id: str) -> dict:
+        resp = self._client.delete_playlist(playlist_id)
+        with self._lock:
+            if self._entries.pop(playlist_id, None) is not None:
+                self._dirty = True
+        for listing in self._listings.values():
+            listing[:] = [pl for pl in listing if pl.get("id") != playlist_id]
+        return resp
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {"version": _SNAPSHOT_VERSION, "playlists": dict(self._entries)}
+            self._dirty = False
+        try:
+            atomic_write_json(self.path, snapshot, indent=None)
+        except OSError:  # nosec B110 - an unwritable data home only costs the next run a full fetch
+            pass
@@ -0,0 +1,99 @@
+"""Persistent seed → catalog song cache for playlist creation.
+
+Resolving a seed costs one catalog search. Results are keyed by storefront
+and the normalized title and artist, so re-running a preset (including dry
+runs) and presets that share seeds skip the search entirely. Misses are
+remembered for ``MISS_TTL_S`` only, since the catalog gains tracks over time.
+
+Set ``APPLE_MUSIC_SONG_CACHE=0`` to bypass the cache.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+ENV_SONG_CACHE = "APPLE_MUSIC_SONG_CACHE"
+MISS_TTL_S = 7 * 24 * 3600
+_CACHE_VERSION = 1
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(ENV_SONG_CACHE, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def default_cache_path() -> Path:
+    return data_home() / "apple_music" / "song-cache.json"
+
+
+def normalize(text: str) -> str:
+    """Casefolded, NFKC-normalized text with punctuation and runs of whitespace collapsed."""
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(re.sub(r"[^\w\s]", " ", folded).split())
+
+
+def cache_key(storefront: str, title: str, artist: str) -> str:
+    return f"{storefront}|{normalize(title)}|{normalize(artist)}"
+
+
+def song_ref(song: dict) -> dict[str, Any]:
+    """The fields playlist creation needs from a catalog search result."""
+    attributes = song.get("attributes") or {}
+    return {
+        "id": song.get("id"),
+        "type": song.get("type", "songs") or "songs",
+        "name": attributes.get("name"),
+        "artistName": attributes.get("artistName"),
+    }
+
+
+class SongCache:
+    """Thread-safe JSON-backed map of seed key → song ref (or a dated miss)."""
+
+    def __init__(self, path: Path | None = None, *, clock=time.time):
+        self.path = Path(path) if path else default_cache_path()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty = False
+        raw = safe_load_json(self.path, {})
+        entries = raw.get("songs") if isinstance(raw, dict) and raw.get("version") == _CACHE_VERSION else None
+        self._songs: dict[str, dict[str, Any]] = entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Cached entry, or None when unknown or an expired miss."""
+        with self._lock:
+            entry = self._songs.get(key)
+        if not isinstance(entry, dict):
+            return None
+        if "miss" in entry and self._clock() - float(entry.get("at", 0)) > MISS_TTL_S:
+            return None
+        return entry
+
+    def put_song(self, key: str, ref: dict[str, Any]) -> None:
+        with self._lock:
+            self._songs[key] = ref
+            self._dirty = True
+
+    def put_miss(self, key: str, reason: str) -> None:
+        with self._lock:
+            self._songs[key] = {"miss": reason, "at": round(self._clock())}
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {"version": _CACHE_VERSION, "songs": dict(self._songs)}
+            self._dirty = False
+        try:
+            atomic_write_json(self.path, snapshot, indent=None)
+        except OSError:  # nosec B110 - an unwritable data home only costs the next run its searches
+            pass
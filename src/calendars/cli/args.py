@@ -17,6 +17,10 @@ HELP_CONFIG_EVENTS = "YAML with events: [] entries"
 HELP_DRY_RUN = "Preview changes without writing"
 HELP_DEFAULT_CALENDAR = "Default calendar name to include in plan entries"
 HELP_INBOX_ONLY = "Restrict to Inbox (adds in:inbox)"
+HELP_USE_INDEX = (
+    "Answer from the delta-synced local message index "
+    "(matches subject, preview and addresses only; not message bodies)"
+)
 
 
 def add_common_outlook_args(sp):
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 
 from core.assistant import BaseAssistant
-from core.cli_framework import CLIApp
+from core.cli_framework import CLIApp, lazy_handlers
 from core.cli_help_text import (
     HELP_CACHE_DIR,
     HELP_DAYS,
@@ -26,34 +26,13 @@ from .args import (
     HELP_CONFIG_EVENTS,
     HELP_DRY_RUN,
     HELP_DEFAULT_CALENDAR,
+    HELP_USE_INDEX,
     HELP_INBOX_ONLY,
 )
-from ..outlook.commands import (
-    run_outlook_add,
-    run_outlook_add_recurring,
-    run_outlook_add_from_config,
-    run_outlook_verify_from_config,
-    run_outlook_update_locations,
-    run_outlook_apply_locations,
-    run_outlook_locations_enrich,
-    run_outlook_list_one_offs,
-    run_outlook_remove_from_config,
-    run_outlook_dedup,
-    run_outlook_scan_classes,
-    run_outlook_schedule_import,
-    run_outlook_reminders_off,
-    run_outlook_reminders_set,
-    run_outlook_calendar_share,
-    run_outlook_settings_apply,
-    run_outlook_mail_list,
-)
-from ..gmail.commands import (
-    run_gmail_scan_classes,
-    run_gmail_scan_receipts,
-    run_gmail_scan_activerh,
-    run_gmail_mail_list,
-    run_gmail_sweep_top,
-)
+# Command handlers bind lazily: the Outlook/Gmail command modules and their
+# client code load only when one of their commands is dispatched.
+outlook_commands = lazy_handlers("..outlook.commands", package=__package__)
+gmail_commands = lazy_handlers("..gmail.commands", package=__package__)
 
 assistant = BaseAssistant(
     "calendar",
@@ -92,7 +71,7 @@ outlook_group = app.group("outlook", help="Outlook calendar operations")
 @outlook_group.argument("--no-reminder", action="store_true", help="No reminders")
 @outlook_group.argument("--reminder-minutes", type=int, help="Reminder minutes before start")
 def cmd_outlook_add(args) -> int:
-    return run_outlook_add(args)
+    return outlook_commands.run_outlook_add(args)
 
 
 @outlook_group.command("add-recurring", help="Add a recurring event with optional exclusions")
@@ -116,7 +95,7 @@ def cmd_outlook_add(args) -> int:
 @outlook_group.argument("--no-reminder", action="store_true", help="No reminders")
 @outlook_group.argument("--reminder-minutes", type=int, help="Reminder minutes before start")
 def cmd_outlook_add_recurring(args) -> int:
-    return run_outlook_add_recurring(args)
+    return outlook_commands.run_outlook_add_recurring(args)
 
 
 @outlook_group.command("add-from-config", help="Add events defined in a YAML file")
@@ -127,7 +106,7 @@ def cmd_outlook_add_recurring(args) -> int:
 @outlook_group.argument("--dry-run", action="store_true", help="Preview without creating")
 @outlook_group.argument("--no-reminder", action="store_true", help="No reminders")
 def cmd_outlook_add_from_config(args) -> int:
-    return run_outlook_add_from_config(args)
+    return outlook_commands.run_outlook_add_from_config(args)
 
 
 @outlook_group.command("verify-from-config", help="Verify plan against Outlook to avoid duplicates")
@@ -137,7 +116,7 @@ def cmd_outlook_add_from_config(args) -> int:
 @outlook_group.argument("--config", required=True, help=HELP_CONFIG_EVENTS)
 @outlook_group.argument("--calendar", help=HELP_CALENDAR_DEFAULT)
 def cmd_outlook_verify_from_config(args) -> int:
-    return run_outlook_verify_from_config(args)
+    return outlook_commands.run_outlook_verify_from_config(args)
 
 
 @outlook_group.command("update-locations", help="Update YAML event locations from Outlook calendar")
@@ -148,7 +127,7 @@ def cmd_outlook_verify_from_config(args) -> int:
 @outlook_group.argument("--calendar", help=HELP_CALENDAR_DEFAULT)
 @outlook_group.argument("--dry-run", action="store_true", help="Preview without writing")
 def cmd_outlook_update_locations(args) -> int:
-    return run_outlook_update_locations(args)
+    return outlook_commands.run_outlook_update_locations(args)
 
 
 @outlook_group.command("apply-locations", help="Apply locations from YAML to Outlook events")
@@ -160,7 +139,7 @@ def cmd_outlook_update_locations(args) -> int:
 @outlook_group.argument("--dry-run", action="store_true", help="Preview without patching")
 @outlook_group.argument("--all-occurrences", action="store_true", help="Update all matching events")
 def cmd_outlook_apply_locations(args) -> int:
-    return run_outlook_apply_locations(args)
+    return outlook_commands.run_outlook_apply_locations(args)
 
 
 @outlook_group.command("locations-enrich", help="Enrich Outlook event locations with full addresses")
@@ -172,7 +151,7 @@ def cmd_outlook_apply_locations(args) -> int:
 @outlook_group.argument("--to", dest="to_date", help=HELP_END_DATE)
 @outlook_group.argument("--dry-run", action="store_true", help=HELP_DRY_RUN)
 def cmd_outlook_locations_enrich(args) -> int:
-    return run_outlook_locations_enrich(args)
+    return outlook_commands.run_outlook_locations_enrich(args)
 
 
 @outlook_group.command("list-one-offs", help="List non-recurring events in a calendar window")
@@ -185,7 +164,7 @@ def cmd_outlook_locations_enrich(args) -> int:
 @outlook_group.argument("--limit", type=int, default=200, help="Max rows (default 200)")
 @outlook_group.argument("--out", help="Optional YAML output path")
 def cmd_outlook_list_one_offs(args) -> int:
-    return run_outlook_list_one_offs(args)
+    return outlook_commands.run_outlook_list_one_offs(args)
 
 
 @outlook_group.command("remove-from-config", help="Delete Outlook events/series matching a YAML config")
@@ -197,7 +176,7 @@ def cmd_outlook_list_one_offs(args) -> int:
 @outlook_group.argument("--apply", action="store_true", help="Actually delete; otherwise just plan")
 @outlook_group.argument("--subject-only", action="store_true", help="Match by subject only")
 def cmd_outlook_remove_from_config(args) -> int:
-    return run_outlook_remove_from_config(args)
+    return outlook_commands.run_outlook_remove_from_config(args)
 
 
 @outlook_group.command("dedup", help="Find and optionally remove duplicate series")
@@ -212,7 +191,7 @@ def cmd_outlook_remove_from_config(args) -> int:
 @outlook_group.argument("--keep-newest", action="store_true", help="Keep newest series")
 @outlook_group.argument("--prefer-delete-nonstandard", action="store_true", help="Prefer deleting non-standard locations")
 def cmd_outlook_dedup(args) -> int:
-    return run_outlook_dedup(args)
+    return outlook_commands.run_outlook_dedup(args)
 
 
 @outlook_group.command("scan-classes", help="Scan recent emails for class schedules")
@@ -225,8 +204,9 @@ def cmd_outlook_dedup(args) -> int:
 @outlook_group.argument("--pages", type=int, default=2, help=HELP_MAX_PAGES)
 @outlook_group.argument("--out", help="Optional output YAML plan path")
 @outlook_group.argument("--calendar", help=HELP_DEFAULT_CALENDAR)
+@outlook_group.argument("--use-index", action="store_true", help=HELP_USE_INDEX)
 def cmd_outlook_scan_classes(args) -> int:
-    return run_outlook_scan_classes(args)
+    return outlook_commands.run_outlook_scan_classes(args)
 
 
 @outlook_group.command("schedule-import", help="Import schedule file/URL and create calendar events")
@@ -241,7 +221,7 @@ def cmd_outlook_scan_classes(args) -> int:
 @outlook_group.argument("--dry-run", action="store_true", help="Preview without writing")
 @outlook_group.argument("--no-reminder", action="store_true", help="No reminders")
 def cmd_outlook_schedule_import(args) -> int:
-    return run_outlook_schedule_import(args)
+    return outlook_commands.run_outlook_schedule_import(args)
 
 
 @outlook_group.command("reminders-off", help="Turn off reminders for events in a date window")
@@ -254,7 +234,7 @@ def cmd_outlook_schedule_import(args) -> int:
 @outlook_group.argument("--all-occurrences", action="store_true", help="Also update occurrences")
 @outlook_group.argument("--dry-run", action="store_true", help="Preview changes")
 def cmd_outlook_reminders_off(args) -> int:
-    return run_outlook_reminders_off(args)
+    return outlook_commands.run_outlook_reminders_off(args)
 
 
 @outlook_group.command("reminders-set", help="Set reminders on/off or minutes for events")
@@ -268,7 +248,7 @@ def cmd_outlook_reminders_off(args) -> int:
 @outlook_group.argument("--minutes", type=int, help="Set reminder minutes")
 @outlook_group.argument("--dry-run", action="store_true", help=HELP_DRY_RUN)
 def cmd_outlook_reminders_set(args) -> int:
-    return run_outlook_reminders_set(args)
+    return outlook_commands.run_outlook_reminders_set(args)
 
 
 @outlook_group.command("calendar-share", help="Share a calendar with a recipient")
@@ -279,7 +259,7 @@ def cmd_outlook_reminders_set(args) -> int:
 @outlook_group.argument("--with", dest="recipient", required=True, help="Email address to share with")
 @outlook_group.argument("--role", default="write", help="Role: read|write|limitedRead|freeBusyRead|delegate")
 def cmd_outlook_calendar_share(args) -> int:
-    return run_outlook_calendar_share(args)
+    return outlook_commands.run_outlook_calendar_share(args)
 
 
 @outlook_group.command("settings-apply", help="Apply appointment settings from YAML rules")
@@ -292,7 +272,7 @@ def cmd_outlook_calendar_share(args) -> int:
 @outlook_group.argument("--config", required=True, help="YAML with rules")
 @outlook_group.argument("--dry-run", action="store_true", help=HELP_DRY_RUN)
 def cmd_outlook_settings_apply(args) -> int:
-    return run_outlook_settings_apply(args)
+    return outlook_commands.run_outlook_settings_apply(args)
 
 
 @outlook_group.command("mail-list", help="List recent messages (read-only)")
@@ -302,8 +282,9 @@ def cmd_outlook_settings_apply(args) -> int:
 @outlook_group.argument("--folder", default="inbox", help="Mail folder (default: inbox)")
 @outlook_group.argument("--top", type=int, default=5, help="Items per page")
 @outlook_group.argument("--pages", type=int, default=1, help="Pages to fetch")
+@outlook_group.argument("--use-index", action="store_true", help=HELP_USE_INDEX)
 def cmd_outlook_mail_list(args) -> int:
-    return run_outlook_mail_list(args)
+    return outlook_commands.run_outlook_mail_list(args)
 
 
 # --- gmail group ---
@@ -323,7 +304,7 @@ gmail_group = app.group("gmail", help="Gmail scan helpers for calendar")
 @gmail_group.argument("--out", help="Optional output YAML plan path")
 @gmail_group.argument("--calendar", help=HELP_DEFAULT_CALENDAR)
 def cmd_gmail_scan_classes(args) -> int:
-    return run_gmail_scan_classes(args)
+    return gmail_commands.run_gmail_scan_classes(args)
 
 
 @gmail_group.command("scan-receipts", help="Scan Gmail receipts and extract recurring events")
@@ -338,7 +319,7 @@ def cmd_gmail_scan_classes(args) -> int:
 @gmail_group.argument("--out", required=True, help="Output YAML plan path")
 @gmail_group.argument("--calendar", help=HELP_DEFAULT_CALENDAR)
 def cmd_gmail_scan_receipts(args) -> int:
-    return run_gmail_scan_receipts(args)
+    return gmail_commands.run_gmail_scan_receipts(args)
 
 
 @gmail_group.command("scan-activerh", help="Generic scan for ActiveRH receipts")
@@ -352,7 +333,7 @@ def cmd_gmail_scan_receipts(args) -> int:
 @gmail_group.argument("--out", required=True, help="Output YAML plan path")
 @gmail_group.argument("--calendar", help=HELP_DEFAULT_CALENDAR)
 def cmd_gmail_scan_activerh(args) -> int:
-    return run_gmail_scan_activerh(args)
+    return gmail_commands.run_gmail_scan_activerh(args)
 
 
 @gmail_group.command("mail-list", help="List recent Gmail messages (read-only)")
@@ -366,7 +347,7 @@ def cmd_gmail_scan_activerh(args) -> int:
 @gmail_group.argument("--page-size", type=int, default=10, help=HELP_PAGE_SIZE)
 @gmail_group.argument("--inbox-only", action="store_true", help=HELP_INBOX_ONLY)
 def cmd_gmail_mail_list(args) -> int:
-    return run_gmail_mail_list(args)
+    return gmail_commands.run_gmail_mail_list(args)
 
 
 @gmail_group.command("sweep-top", help="Find top frequent senders in Inbox")
@@ -380,7 +361,7 @@ def cmd_gmail_mail_list(args) -> int:
 @gmail_group.argument("--inbox-only", action="store_true", help=HELP_INBOX_ONLY)
 @gmail_group.argument("--out", help="Optional suggested filters YAML path")
 def cmd_gmail_sweep_top(args) -> int:
-    return run_gmail_sweep_top(args)
+    return gmail_commands.run_gmail_sweep_top(args)
 
 
 def _add_profile_arg(parser) -> None:
@@ -70,6 +70,7 @@ CONFIG = llm_cli.make_app_llm_config(
     policies=_policies_md,
     agentic_filename="AGENTIC_CALENDAR.md",
     domain_map_filename="DOMAIN_MAP_CALENDAR.md",
+    package="calendars",
 )
 
 
@@ -6,7 +6,11 @@ from typing import Any
 
 from .selection import compute_window, filter_events_by_day_time
 from .model import normalize_event
+from core.http_transport import concurrency_for
 from core.outlook.models import UpdateEventLocationRequest
+from core.parallel import parallel_map
+
+_PLAN_MAX_WORKERS = 16
 
 
 @dataclass
@@ -118,7 +122,18 @@ class LocationSync:
             return []
 
     def plan_from_config(self, items: list[dict[str, Any]], *, calendar: str | None, dry_run: bool = False) -> int:
-        return sum(1 for ev in items if self._plan_one(ev, calendar, dry_run))
+        """Count events whose location differs; lookups run concurrently under the Graph controller."""
+        results = parallel_map(
+            lambda ev: self._plan_one(ev, calendar, dry_run),
+            items,
+            max_workers=_PLAN_MAX_WORKERS,
+            return_exceptions=True,
+            concurrency=concurrency_for("graph"),
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                raise res
+        return sum(1 for res in results if res)
 
     def _apply_location_update(self, update: LocationUpdate) -> None:
         """Update a single event/series location (dry-run safe)."""
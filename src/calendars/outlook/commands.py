@@ -82,6 +82,7 @@ def run_outlook_mail_list(args: argparse.Namespace) -> int:
         folder=getattr(args, "folder", "inbox"),
         top=int(getattr(args, "top", 5)),
         pages=int(getattr(args, "pages", 1)),
+        use_index=bool(getattr(args, "use_index", False)),
     )
     return run_pipeline(request, OutlookMailListProcessor, OutlookMailListProducer)
 
@@ -409,6 +410,7 @@ class OutlookScanRequest:
     pages: int
     calendar: str | None
     out: str | None
+    use_index: bool = False
 
 
 @dataclass
@@ -423,7 +425,9 @@ class OutlookScanProcessor(SafeProcessor[OutlookScanRequest, OutlookScanResult])
     def _process_safe(self, payload: OutlookScanRequest) -> OutlookScanResult:
         svc = payload.service
         query = f'from:"{payload.from_text}"'
-        ids = svc.search_inbox_messages(query, days=payload.days, top=payload.top, pages=payload.pages)
+        ids = svc.search_inbox_messages(
+            query, days=payload.days, top=payload.top, pages=payload.pages, use_index=payload.use_index
+        )
         if not ids:
             return OutlookScanResult(events=[], message_count=0, extracted=[], out=payload.out)
 
@@ -483,5 +487,6 @@ def run_outlook_scan_classes(args: argparse.Namespace) -> int:
         pages=int(getattr(args, "pages", 2)),
         calendar=getattr(args, "calendar", None),
         out=getattr(args, "out", None),
+        use_index=bool(getattr(args, "use_index", False)),
     )
     return run_pipeline(request, OutlookScanProcessor, OutlookScanProducer)
@@ -21,6 +21,7 @@ class OutlookMailListRequest:
     folder: str
     top: int
     pages: int
+    use_index: bool = False
 
 
 OutlookMailListRequestConsumer = RequestConsumer[OutlookMailListRequest]
@@ -36,8 +37,9 @@ class OutlookMailListProcessor(SafeProcessor[OutlookMailListRequest, OutlookMail
     def _process_safe(self, payload: OutlookMailListRequest) -> OutlookMailListResult:
         check_service_required(payload.service)
         svc = payload.service
-        msgs = svc.list_messages(folder=payload.folder, top=payload.top, pages=payload.pages)
-        msgs = msgs or []
+        msgs = svc.list_messages(
+            folder=payload.folder, top=payload.top, pages=payload.pages, use_index=payload.use_index
+        ) or []
         result = OutlookMailListResult(messages=msgs, folder=payload.folder)
         return result
 
@@ -42,7 +42,7 @@ class OutlookService:
 
     def __post_init__(self) -> None:
         self.client = self.ctx.ensure_client()
-        self._http = HttpClient("", timeout=DEFAULT_REQUEST_TIMEOUT)
+        self._http = HttpClient("", timeout=DEFAULT_REQUEST_TIMEOUT, api="graph")
 
     # Creation helpers
     def create_event(self, params: EventCreationParams) -> dict[str, Any]:
@@ -59,10 +59,12 @@ class OutlookService:
         return self.client.list_events_in_range(params)
 
     # Mail/message helpers (inbox search)
-    def search_inbox_messages(self, query: str, *, days: int = 60, top: int = 25, pages: int = 2) -> list[str]:
+    def search_inbox_messages(
+        self, query: str, *, days: int = 60, top: int = 25, pages: int = 2, use_index: bool = False
+    ) -> list[str]:
         from core.outlook.models import SearchParams
         return self.client.search_inbox_messages(
-            SearchParams(search_query=query, days=days, top=top, pages=pages)
+            SearchParams(search_query=query, days=days, top=top, pages=pages, use_index=use_index)
         )
 
     def get_message(self, message_id: str, *, select_body: bool = True) -> dict[str, Any]:
@@ -150,7 +152,10 @@ class OutlookService:
         top: int = 5,
         pages: int = 1,
         select: str = "id,subject,receivedDateTime,from",
+        use_index: bool = False,
     ) -> list[dict[str, Any]]:
+        if use_index and folder:
+            return self.client.list_messages(folder=folder, top=top, pages=pages, use_index=True)
         base = self.graph_base()
         hdrs = self.headers()
         folder_path = f"/me/mailFolders/{folder}/messages" if folder else "/me/messages"
@@ -0,0 +1,197 @@
+"""Batch rendering of many charts from one manifest.
+
+A manifest (YAML, or JSON when PyYAML is missing) lists chart specs in the
+charts JSON contract and where to write each one::
+
+    theme: dark            # default for every chart
+    dpi: 150               # optional default DPI override
+    charts:
+      - input: data/gold.json
+        output: out/gold.png
+      - input: data/silver.json
+        output: out/silver.svg
+        theme: light
+
+Relative paths resolve against the manifest's directory. A chart is skipped
+when its output still matches the last render, i.e. the hash of its spec file
+(spec + data), theme and DPI is unchanged and the output file is untouched.
+Remaining charts render in a process pool whose workers import matplotlib
+once at start-up; ``render_chart`` builds figures with the object-oriented
+Figure API, so nothing relies on pyplot state.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+_STATE_VERSION = 1
+_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    input: str
+    output: str
+    theme: str = "dark"
+    dpi: int | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    output: str
+    status: str  # "rendered" | "skipped" | "error"
+    seconds: float = 0.0
+    error: str = ""
+
+
+def load_manifest(path: str) -> list[BatchItem]:
+    """Parse a batch manifest. Raises ValueError on schema violations."""
+    manifest = Path(path)
+    text = manifest.read_text()
+    try:
+        import yaml  # noqa: PLC0415
+
+        raw = yaml.safe_load(text)
+    except ImportError:
+        raw = json.loads(text)
+
+    if not isinstance(raw, dict):
+        raise ValueError(f"Batch manifest must be a mapping, got {type(raw).__name__}")
+    charts = raw.get("charts")
+    if not isinstance(charts, list) or not charts:
+        raise ValueError("'charts' must be a non-empty list")
+
+    from charts.theme import get_theme
+
+    base = manifest.parent
+    default_theme = str(raw.get("theme") or "dark")
+    default_dpi = raw.get("dpi")
+    items: list[BatchItem] = []
+    for idx, entry in enumerate(charts):
+        if not isinstance(entry, dict):
+            raise ValueError(f"charts[{idx}]: must be a mapping")
+        for req in ("input", "output"):
+            if req not in entry:
+                raise ValueError(f"charts[{idx}]: missing required field {req!r}")
+        theme = str(entry.get("theme") or default_theme)
+        get_theme(theme)  # validate eagerly
+        dpi = entry.get("dpi", default_dpi)
+        items.append(
+            BatchItem(
+                input=str(base / str(entry["input"])),
+                output=str(base / str(entry["output"])),
+                theme=theme,
+                dpi=int(dpi) if dpi is not None else None,
+            )
+        )
+    return items
+
+
+def default_state_path(manifest: str) -> Path:
+    """Render state for ``manifest``, kept under the data home."""
+    key = hashlib.sha256(str(Path(manifest).resolve()).encode("utf-8")).hexdigest()[:12]
+    return data_home() / "charts" / f"batch-{key}.json"
+
+
+def _item_hash(item: BatchItem, spec_text: str) -> str:
+    payload = json.dumps([_STATE_VERSION, item.theme, item.dpi, Path(item.output).suffix.lower()])
+    return hashlib.sha256(f"{payload}\0{spec_text}".encode("utf-8")).hexdigest()
+
+
+def _output_stamp(output: str) -> list[int] | None:
+    try:
+        st = os.stat(output)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay the matplotlib import once per worker."""
+    try:
+        import matplotlib  # noqa: F401, PLC0415
+        import matplotlib.figure  # noqa: F401, PLC0415
+        import charts.renderer  # noqa: F401, PLC0415
+    except ImportError:  # nosec B110 - the render itself reports the missing dependency
+        pass
+
+
+def _render_one(job: tuple[str, str, str, int | None]) -> tuple[float, str]:
+    """Worker entry point: render one spec; returns (seconds, error message)."""
+    spec_text, output, theme, dpi = job
+    from charts.renderer import render_chart
+    from charts.reshape import json_to_spec
+
+    started = time.perf_counter()
+    try:
+        render_chart(json_to_spec(json.loads(spec_text)), output, theme=theme, dpi=dpi)
+    except (ValueError, OSError, ImportError) as exc:
+        return time.perf_counter() - started, str(exc)
+    return time.perf_counter() - started, ""
+
+
+def _run_jobs(jobs: list[tuple[str, str, str, int | None]], max_workers: int) -> list[tuple[float, str]]:
+    """Render jobs in a warm process pool; in-process when one worker would do."""
+    workers = min(max_workers, len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+                return list(pool.map(_render_one, jobs))
+        except (OSError, RuntimeError):  # nosec B110 - no usable process pool here; render in this process
+            pass
+    return [_render_one(job) for job in jobs]
+
+
+def render_batch(
+    items: list[BatchItem],
+    *,
+    state_path: Path,
+    force: bool = False,
+    max_workers: int = _MAX_WORKERS,
+) -> list[BatchResult]:
+    """Render every item whose output is stale; results keep manifest order."""
+    state = safe_load_json(state_path, {})
+    if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+        state = {}
+    outputs: dict[str, dict] = state.get("outputs") or {}
+
+    results: dict[int, BatchResult] = {}
+    pending: list[tuple[int, str, tuple[str, str, str, int | None]]] = []
+    for idx, item in enumerate(items):
+        try:
+            spec_text = Path(item.input).read_text()
+        except OSError as exc:
+            results[idx] = BatchResult(item.output, "error", error=str(exc))
+            continue
+        digest = _item_hash(item, spec_text)
+        seen = outputs.get(item.output) or {}
+        if not force and seen.get("hash") == digest and seen.get("stamp") == _output_stamp(item.output):
+            results[idx] = BatchResult(item.output, "skipped")
+            continue
+        pending.append((idx, digest, (spec_text, item.output, item.theme, item.dpi)))
+
+    rendered = _run_jobs([job for _, _, job in pending], max_workers)
+    for (idx, digest, job), (seconds, error) in zip(pending, rendered):
+        output = job[1]
+        if error:
+            results[idx] = BatchResult(output, "error", seconds, error)
+            outputs.pop(output, None)
+            continue
+        results[idx] = BatchResult(output, "rendered", seconds)
+        outputs[output] = {"hash": digest, "stamp": _output_stamp(output)}
+
+    if pending:
+        try:
+            atomic_write_json(state_path, {"version": _STATE_VERSION, "outputs": outputs}, indent=None)
+        except OSError:  # nosec B110 - an unwritable data home only costs the next run a re-render
+            pass
+    return [results[idx] for idx in range(len(items))]
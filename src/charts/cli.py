@@ -224,6 +224,47 @@ def _handle_grid(args: argparse.Namespace, writer: OutputWriter | None = None) -
     return 0
 
 
+@app.command("batch", help="Render every chart in a manifest in parallel, skipping unchanged ones.")
+@app.argument("--manifest", "-m", dest="manifest_path", required=True,
+              help="YAML manifest listing chart spec inputs and outputs.")
+@app.argument("--jobs", "-j", type=int, default=None,
+              help="Worker processes (default: CPU count, max 8).")
+@app.argument("--force", action="store_true", default=False,
+              help="Re-render charts even when their output is up to date.")
+def _handle_batch(args: argparse.Namespace, writer: OutputWriter | None = None) -> int:
+    _require_matplotlib()
+
+    import time
+
+    from charts.batch import default_state_path, load_manifest, render_batch
+
+    out = writer or OutputWriter()
+
+    try:
+        items = load_manifest(args.manifest_path)
+    except (ValueError, OSError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        raise SystemExit(1)
+
+    started = time.perf_counter()
+    kwargs = {"max_workers": args.jobs} if args.jobs else {}
+    results = render_batch(
+        items, state_path=default_state_path(args.manifest_path), force=args.force, **kwargs,
+    )
+    for res in results:
+        timing = f"{res.seconds:6.2f}s" if res.status != "skipped" else "      -"
+        out.print(f"{res.status:<8} {timing}  {res.output}")
+        if res.error:
+            print(f"error: {res.output}: {res.error}", file=sys.stderr)
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("rendered", "skipped", "error")}
+    out.print(
+        f"{counts['rendered']} rendered, {counts['skipped']} skipped, {counts['error']} failed "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return 1 if counts["error"] else 0
+
+
 @app.command(
     "reshape",
     help="Normalise arbitrary row data into the charts JSON contract, writes to stdout.",
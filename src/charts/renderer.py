@@ -13,6 +13,8 @@ functions (render_chart, render_grid, _dispatch) that wire them together.
 
 matplotlib is lazily imported at call time so this module is always
 importable in headless/CI environments even if matplotlib is not installed.
+Figures are built with the object-oriented ``matplotlib.figure.Figure`` API
+(no pyplot global state), so renders are safe to run side by side.
 """
 
 from __future__ import annotations
@@ -151,9 +153,7 @@ def render_chart(
     """
     _require_matplotlib()
 
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(output)
     suffix = out.suffix.lstrip(".").lower()
@@ -170,14 +170,14 @@ def render_chart(
         raise ValueError(f"dpi must be positive, got {effective_dpi}")
     figsize = (spec.width_px / effective_dpi, spec.height_px / effective_dpi)
 
-    fig, ax = plt.subplots(figsize=figsize, dpi=effective_dpi)
+    fig = Figure(figsize=figsize, dpi=effective_dpi)
+    ax = fig.subplots()
     _apply_theme(fig, ax, chart_theme)
     _dispatch(fig, ax, spec, chart_theme)
     _apply_labels(ax, spec, chart_theme)
 
     fig.savefig(str(out), dpi=effective_dpi, bbox_inches="tight",
                 facecolor=fig.get_facecolor())
-    plt.close(fig)
     return out
 
 
@@ -191,9 +191,7 @@ def render_grid(
     """
     _require_matplotlib()
 
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     if len(specs) != len(grid_cfg.panels):
         raise ValueError(f"Expected {len(grid_cfg.panels)} spec(s), got {len(specs)}")
@@ -213,12 +211,8 @@ def render_grid(
     chart_theme = get_theme(grid_cfg.theme)
     figsize = (grid_cfg.width_px / grid_cfg.dpi, grid_cfg.height_px / grid_cfg.dpi)
 
-    fig, axes = plt.subplots(
-        nrows=grid_cfg.rows,
-        ncols=grid_cfg.cols,
-        figsize=figsize,
-        dpi=grid_cfg.dpi,
-    )
+    fig = Figure(figsize=figsize, dpi=grid_cfg.dpi)
+    axes = fig.subplots(nrows=grid_cfg.rows, ncols=grid_cfg.cols)
     fig.patch.set_facecolor(chart_theme.background)
 
     axes_grid = _normalize_axes_grid(axes, grid_cfg.rows, grid_cfg.cols)
@@ -243,5 +237,4 @@ def render_grid(
     fig.tight_layout()
     fig.savefig(str(out), dpi=grid_cfg.dpi, bbox_inches="tight",
                 facecolor=fig.get_facecolor())
-    plt.close(fig)
     return out
@@ -148,7 +148,7 @@ def _build_row_map(
 
 def _configure_date_axis(ax: object, spec: ChartSpec) -> None:
     import matplotlib.dates as mdates
-    import matplotlib.pyplot as plt
+    from matplotlib.artist import setp
     locator = mdates.AutoDateLocator(minticks=15, maxticks=30)
     ax.xaxis.set_major_locator(locator)  # type: ignore[union-attr]
     if spec.date_format:
@@ -156,7 +156,7 @@ def _configure_date_axis(ax: object, spec: ChartSpec) -> None:
     else:
         formatter = mdates.AutoDateFormatter(locator)
     ax.xaxis.set_major_formatter(formatter)  # type: ignore[union-attr]
-    plt.setp(ax.get_xticklabels(), rotation=30, ha="right")  # type: ignore[union-attr]
+    setp(ax.get_xticklabels(), rotation=30, ha="right")  # type: ignore[union-attr]
 
 
 def _maybe_shade_weekends(
@@ -16,7 +16,7 @@ from typing import Any, Callable, Sequence, TypeVar
 from .cli_errors import CLIError, ExitCode, handle_error
 from .cli_framework_group import CommandGroup
 from .cli_framework_parser import _HelpfulArgumentParser
-from .cli_framework_types import Argument, CommandDef, CommandFunc
+from .cli_framework_types import Argument, CommandDef, CommandFunc, LazyHandler, LazyHandlers, lazy_handlers  # noqa: F401 - re-exported
 from .cli_help_text import (
     HELP_DRY_RUN,
     HELP_OUTPUT,
@@ -44,6 +44,15 @@ class CLIApp:
 
         if __name__ == "__main__":
             app.run()
+
+    Handlers that pull in a heavy import graph can be bound lazily, so that
+    ``--help`` and every other command skip that import::
+
+        sync = lazy_handlers("my_assistant.sync")
+
+        @app.command("sync", help="Sync items")
+        def cmd_sync(args):
+            return sync.run_sync(args)
     """
 
     def __init__(
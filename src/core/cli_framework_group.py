@@ -7,7 +7,7 @@ from __future__ import annotations
 import argparse
 from typing import Any, Callable, TYPE_CHECKING
 
-from .cli_framework_types import Argument, CommandDef, CommandFunc
+from .cli_framework_types import Argument, CommandDef, CommandFunc, LazyHandler
 
 if TYPE_CHECKING:
     from .cli_framework import CLIApp
@@ -84,8 +84,10 @@ class CommandGroup:
         self,
         name: str,
         help: str,
-        func: CommandFunc,
+        func: CommandFunc | str,
         arguments: list[tuple[tuple[str, ...], dict[str, Any]]],
+        *,
+        package: str | None = None,
     ) -> None:
         """Register one command from a spec instead of stacked decorators.
 
@@ -93,7 +95,13 @@ class CommandGroup:
         in source order, matching how decorators read top-to-bottom. Use this
         for groups whose subcommands are uniform pass-throughs, where the
         decorator form is mostly repeated boilerplate.
+
+        `func` may be a `"module:attr"` string, registered as a LazyHandler
+        (relative modules resolve against `package`) so the handler module
+        is imported only when the command runs.
         """
+        if isinstance(func, str):
+            func = LazyHandler(func, package)
         # `argument()` only queues when its returned decorator is applied to a
         # function, so push onto the pending list directly. Reversed, because
         # `command()` un-reverses the stack that bottom-up decorators produce.
@@ -6,6 +6,7 @@ without a circular import.
 from __future__ import annotations
 
 import argparse
+import importlib
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
@@ -29,3 +30,60 @@ class CommandDef:
     arguments: list[Argument] = field(default_factory=list)
     aliases: list[str] = field(default_factory=list)
     parent: str | None = None  # For nested commands like "outlook add"
+
+
+class LazyHandler:
+    """A command handler imported only when its command is dispatched.
+
+    Registering commands (and building the parser for ``--help`` or dispatch)
+    then costs only the argument specs, not the handler module's import
+    graph. ``target`` is ``"module:attr"``; a relative module is resolved
+    against ``package``. The attribute is looked up on every call, so
+    ``unittest.mock.patch`` on the handler module still takes effect.
+    """
+
+    __slots__ = ("module", "attr", "package")
+
+    def __init__(self, target: str, package: str | None = None) -> None:
+        module, sep, attr = target.partition(":")
+        if not sep or not module or not attr:
+            raise ValueError(f"Lazy handler target must be 'module:attr', got {target!r}")
+        self.module = module
+        self.attr = attr
+        self.package = package
+
+    def resolve(self) -> Callable[..., Any]:
+        return getattr(importlib.import_module(self.module, self.package), self.attr)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyHandler({self.module}:{self.attr})"
+
+
+class LazyHandlers:
+    """The handlers of one module, each bound lazily by attribute name.
+
+    ``handlers.run_sync`` is ``LazyHandler("module:run_sync")``, so a handler
+    is named once, where it is called, and nothing is imported until then.
+    """
+
+    __slots__ = ("_module", "_package")
+
+    def __init__(self, module: str, package: str | None = None) -> None:
+        self._module = module
+        self._package = package
+
+    def __getattr__(self, name: str) -> LazyHandler:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return LazyHandler(f"{self._module}:{name}", self._package)
+
+    def __repr__(self) -> str:
+        return f"LazyHandlers({self._module})"
+
+
+def lazy_handlers(module: str, package: str | None = None) -> LazyHandlers:
+    """Lazy form of ``from module import ...``: attributes are handlers bound on first call."""
+    return LazyHandlers(module, package)
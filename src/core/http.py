@@ -49,14 +49,44 @@ def _parse_env_int(key: str, default: int) -> int:
 
 
 def _make_session():  # type: ignore[return]
-    """Lazy-import requests and return a new Session."""
-    import requests  # noqa: PLC0415 - intentional lazy import
+    """Return a new requests Session drawing on the process-wide connection pool."""
+    from core.http_transport import pooled_session  # noqa: PLC0415 - imports requests lazily
 
-    return requests.Session()
+    return pooled_session()
+
+
+def parse_retry_after(response: Any) -> int | None:
+    """Return Retry-After seconds from response headers, or None.
+
+    Handles both delta-seconds (RFC 9110 §10.2.4) and HTTP-date formats.
+    """
+    try:
+        ra = response.headers.get("Retry-After")
+        if not ra:
+            return None
+        value = str(ra).strip()
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        # Try HTTP-date format (e.g. "Wed, 25 Jun 2026 15:00:00 GMT")
+        from email.utils import parsedate_to_datetime  # noqa: PLC0415 - stdlib lazy import
+        dt = parsedate_to_datetime(value)
+        delta = (dt - datetime.now(timezone.utc)).total_seconds()
+        return max(0, int(delta))
+    except Exception:  # nosec B110 - header may be absent or malformed
+        pass
+    return None
 
 
 class HttpClient:
-    """requests.Session wrapper with retries and secret masking."""
+    """requests.Session wrapper with retries and secret masking.
+
+    Sessions share the process-wide keep-alive pool (core.http_transport).
+    Pass ``api`` ("graph", "gmail", "apple_music") to draw every attempt from
+    that API's shared rate limiter; a 429 with Retry-After pauses it, and
+    429/503 responses also shrink the API's concurrency controller.
+    """
 
     def __init__(
         self,
@@ -65,6 +95,7 @@ class HttpClient:
         timeout: float | None = None,
         retries: int | None = None,
         session: Any = None,
+        api: str | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.default_headers: dict[str, str] = default_headers or {}
@@ -73,6 +104,12 @@ class HttpClient:
         self.retries = max(1, raw_retries)  # always allow at least one attempt
         self.logger = logging.getLogger(f"http.{self.__class__.__name__}")
         self._session = session if session is not None else _make_session()
+        self.api = api
+        self._limiter = None
+        if api:
+            from core.http_transport import rate_limiter  # noqa: PLC0415 - avoid import cycle
+
+            self._limiter = rate_limiter(api)
 
     def _build_url(self, path: str, params: dict[str, Any] | None = None) -> str:
         """Join base_url + path, appending query params if provided.
@@ -93,27 +130,8 @@ class HttpClient:
         return urlunsplit((parts.scheme, parts.netloc, combined, query, ""))
 
     def _parse_retry_after(self, response: Any) -> int | None:
-        """Return Retry-After seconds from response headers, or None.
-
-        Handles both delta-seconds (RFC 9110 §10.2.4) and HTTP-date formats.
-        """
-        try:
-            ra = response.headers.get("Retry-After")
-            if not ra:
-                return None
-            value = str(ra).strip()
-            try:
-                return int(value)
-            except ValueError:
-                pass
-            # Try HTTP-date format (e.g. "Wed, 25 Jun 2026 15:00:00 GMT")
-            from email.utils import parsedate_to_datetime  # noqa: PLC0415 - stdlib lazy import
-            dt = parsedate_to_datetime(value)
-            delta = (dt - datetime.now(timezone.utc)).total_seconds()
-            return max(0, int(delta))
-        except Exception:  # nosec B110 - header may be absent or malformed
-            pass
-        return None
+        """Return Retry-After seconds from response headers, or None."""
+        return parse_retry_after(response)
 
     def _log_request(self, method: str, url: str, hdrs: dict[str, str], attempt: int) -> None:
         if not self.logger.isEnabledFor(logging.DEBUG):
@@ -151,6 +169,10 @@ class HttpClient:
             return False
         retry_after = self._parse_retry_after(resp)
         self._log_transient(resp.status_code, method, url, attempt, retry_after)
+        if self.api and resp.status_code in (429, 503):
+            from core.http_transport import report_throttle  # noqa: PLC0415 - avoid import cycle
+
+            report_throttle(self.api, resp.status_code, retry_after)
         self._sleep_for_retry(attempt, retry_after)
         return True
 
@@ -190,6 +212,8 @@ class HttpClient:
         import requests as _requests  # noqa: PLC0415 - intentional lazy import
 
         b = body or HttpRequestBody()
+        if self._limiter is not None:
+            self._limiter.acquire()
         self._log_request(method, url, hdrs, attempt)
         try:
             resp = self._session.request(
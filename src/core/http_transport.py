@@ -0,0 +1,325 @@
+"""Shared HTTP transport: pooled keep-alive connections, per-API rate limits, async fan-out.
+
+``HttpClient`` and the Outlook Graph client used to open a fresh connection
+pool per client (or, for Graph, per call through ``requests.get``), so every
+request paid a TCP + TLS handshake. Here:
+
+- one ``HTTPAdapter`` is shared by every session the process creates, so
+  keep-alive connections are pooled per host across clients;
+- each API (Graph, Gmail, Apple Music) has a ``TokenBucket`` shared by every
+  caller, and a 429 with ``Retry-After`` pauses the bucket so concurrent
+  callers back off together instead of each hammering the API;
+- ``Transport`` is a requests-style client (``get``/``post``/...) that retries
+  429/5xx responses, honouring ``Retry-After``; the wait happens in the
+  calling thread only, never under a lock other requests need;
+- each API also has an ``AdaptiveConcurrency`` controller (``concurrency_for``)
+  that ``parallel_map`` callers can opt into; 429/503 seen here shrink it;
+- ``AsyncTransport`` runs the same transport from asyncio for fan-out
+  callers; backoff waits are ``asyncio.sleep`` and release the in-flight slot,
+  so other requests keep going while one waits out a Retry-After.
+
+``requests`` stays a lazy import, as in ``core.http``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from core.parallel import AdaptiveConcurrency
+from core.http import (
+    DEFAULT_HTTP_RETRIES,
+    DEFAULT_HTTP_TIMEOUT,
+    ENV_HTTP_RETRIES,
+    ENV_HTTP_TIMEOUT,
+    _RETRYABLE_STATUS_CODES,
+    _parse_env_float,
+    _parse_env_int,
+    parse_retry_after,
+)
+
+# Sustained requests/second and burst per API. Graph allows 10k requests per
+# 10 minutes per mailbox; Gmail's per-user quota is 250 units/s (most calls
+# cost 5-10); Apple Music publishes no figure but throttles bursts.
+API_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "graph": (15.0, 30.0),
+    "gmail": (25.0, 50.0),
+    "apple_music": (20.0, 20.0),
+}
+
+# Concurrency controller bounds per API: (initial, max). Bulk fan-out starts
+# at ``initial`` in-flight calls and grows additively while the API keeps up.
+API_CONCURRENCY: dict[str, tuple[int, int]] = {
+    "graph": (4, 16),
+    "gmail": (4, 16),
+    "apple_music": (4, 8),
+}
+
+_POOL_CONNECTIONS = 16  # distinct hosts kept
+_POOL_MAXSIZE = 16  # keep-alive connections per host
+_MAX_BACKOFF_S = 10.0
+
+# Methods safe to resend after a 5xx or a connection error; others are only
+# retried when the server says it did not process the request.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_NOT_PROCESSED_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` waits for a token outside the lock.
+
+    Callers reserve a token (the balance may go negative) and then wait for
+    their own reservation, so waiters are served in arrival order and a slow
+    waiter never holds up the lock.
+    """
+
+    def __init__(
+        self, rate: float, capacity: float | None = None, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (a server-sent Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_lock = threading.Lock()
+_limiters: dict[str, TokenBucket] = {}
+_controllers: dict[str, AdaptiveConcurrency] = {}
+_transports: dict[str, Transport] = {}
+_adapter: Any = None
+
+
+def rate_limiter(api: str) -> TokenBucket:
+    """The process-wide bucket for ``api`` (unknown APIs get the Graph limits)."""
+    with _lock:
+        if api not in _limiters:
+            rate, burst = API_RATE_LIMITS.get(api, API_RATE_LIMITS["graph"])
+            _limiters[api] = TokenBucket(rate, burst)
+        return _limiters[api]
+
+
+def concurrency_for(api: str) -> AdaptiveConcurrency:
+    """The process-wide AIMD concurrency controller for ``api``."""
+    with _lock:
+        if api not in _controllers:
+            initial, ceiling = API_CONCURRENCY.get(api, API_CONCURRENCY["graph"])
+            _controllers[api] = AdaptiveConcurrency(api, initial=initial, max_limit=ceiling)
+        return _controllers[api]
+
+
+def report_throttle(api: str, status: int, retry_after: float | None) -> None:
+    """Feed a 429/503 for ``api`` to its rate limiter and concurrency controller."""
+    if status == 429 and retry_after is not None:
+        rate_limiter(api).pause(retry_after)
+    concurrency_for(api).record_throttle(status, retry_after)
+
+
+def _shared_adapter() -> Any:
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            from requests.adapters import HTTPAdapter  # noqa: PLC0415 - intentional lazy import
+
+            _adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        return _adapter
+
+
+def pooled_session() -> Any:
+    """A new ``requests.Session`` whose connections come from the shared pool.
+
+    Sessions keep their own cookies and headers; only the connection pool is
+    shared.
+    """
+    import requests  # noqa: PLC0415 - intentional lazy import
+
+    session = requests.Session()
+    mount = getattr(session, "mount", None)
+    if mount is not None:
+        try:
+            adapter = _shared_adapter()
+        except ImportError:
+            return session
+        mount("https://", adapter)
+        mount("http://", adapter)
+    return session
+
+
+def _backoff(attempt: int) -> float:
+    return float(min(2 ** attempt, _MAX_BACKOFF_S))
+
+
+class Transport:
+    """requests-style client for one API: pooled, rate-limited, Retry-After aware.
+
+    Unlike ``HttpClient`` it never raises for an HTTP status; the final
+    response is returned for the caller to ``raise_for_status``, as with a
+    bare ``requests.get``.
+    """
+
+    def __init__(
+        self,
+        api: str | None = None,
+        *,
+        timeout: float | None = None,
+        retries: int | None = None,
+        session: Any = None,
+        limiter: TokenBucket | None = None,
+    ) -> None:
+        self.api = api
+        self.limiter = limiter if limiter is not None else (rate_limiter(api) if api else None)
+        self.timeout = timeout if timeout is not None else _parse_env_float(ENV_HTTP_TIMEOUT, DEFAULT_HTTP_TIMEOUT)
+        raw_retries = retries if retries is not None else _parse_env_int(ENV_HTTP_RETRIES, DEFAULT_HTTP_RETRIES)
+        self.retries = max(1, raw_retries)
+        self._session = session if session is not None else pooled_session()
+
+    def _retry_delay(self, method: str, attempt: int, resp: Any = None, exc: Exception | None = None) -> float | None:
+        """Seconds to wait before the next attempt, or None when this outcome is final."""
+        if attempt >= self.retries - 1:
+            return None
+        idempotent = method.upper() in _IDEMPOTENT_METHODS
+        if exc is not None:
+            return _backoff(attempt) if idempotent else None
+        status = resp.status_code
+        if status not in _RETRYABLE_STATUS_CODES:
+            return None
+        if not idempotent and status not in _NOT_PROCESSED_STATUS_CODES:
+            return None
+        retry_after = parse_retry_after(resp)
+        if status in _NOT_PROCESSED_STATUS_CODES and self.api:
+            concurrency_for(self.api).record_throttle(status, retry_after)
+        if retry_after is not None:
+            if status == 429 and self.limiter is not None:
+                self.limiter.pause(retry_after)
+            return float(max(retry_after, _backoff(attempt)))
+        return _backoff(attempt)
+
+    def _send(self, method: str, url: str, kwargs: dict[str, Any]) -> Any:
+        kwargs.setdefault("timeout", self.timeout)
+        return self._session.request(method.upper(), url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        import requests as _requests  # noqa: PLC0415 - intentional lazy import
+
+        for attempt in range(self.retries):
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                resp = self._send(method, url, kwargs)
+            except (_requests.exceptions.ConnectionError, _requests.exceptions.Timeout) as exc:
+                delay = self._retry_delay(method, attempt, exc=exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            delay = self._retry_delay(method, attempt, resp=resp)
+            if delay is None:
+                return resp
+            resp.close()
+            time.sleep(delay)
+        raise AssertionError("unreachable: the last attempt always returns or raises")
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PATCH", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> Any:
+        return self.request("HEAD", url, **kwargs)
+
+
+class AsyncTransport:
+    """Await a ``Transport`` from asyncio with at most ``max_in_flight`` requests sent at once.
+
+    Requests run on worker threads over the shared connection pool. Rate-limit
+    and backoff waits are awaited outside the in-flight limit.
+    """
+
+    def __init__(self, transport: Transport | None = None, *, api: str | None = None, max_in_flight: int = 8) -> None:
+        self.transport = transport if transport is not None else Transport(api)
+        self._slots = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        import requests as _requests  # noqa: PLC0415 - intentional lazy import
+
+        t = self.transport
+        for attempt in range(t.retries):
+            if t.limiter is not None:
+                await t.limiter.acquire_async()
+            try:
+                async with self._slots:
+                    resp = await asyncio.to_thread(t._send, method, url, dict(kwargs))
+            except (_requests.exceptions.ConnectionError, _requests.exceptions.Timeout) as exc:
+                delay = t._retry_delay(method, attempt, exc=exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            delay = t._retry_delay(method, attempt, resp=resp)
+            if delay is None:
+                return resp
+            resp.close()
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable: the last attempt always returns or raises")
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("POST", url, **kwargs)
+
+    async def get_all(self, urls: Iterable[str], **kwargs: Any) -> list[Any]:
+        """GET every URL concurrently; results keep the order of ``urls``."""
+        return list(await asyncio.gather(*(self.get(url, **kwargs) for url in urls)))
+
+
+def transport_for(api: str) -> Transport:
+    """The process-wide ``Transport`` for ``api``."""
+    with _lock:
+        existing = _transports.get(api)
+    if existing is not None:
+        return existing
+    created = Transport(api)
+    with _lock:
+        return _transports.setdefault(api, created)
@@ -189,4 +189,5 @@ def make_domain_llm_module(
         policies=policies_builder,
         agentic_filename=f"AGENTIC_{config.app_id.upper()}.md",
         domain_map_filename=f"DOMAIN_MAP_{config.app_id.upper()}.md",
+        package=config.agentic_module.split(".", 1)[0],
     )
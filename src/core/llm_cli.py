@@ -29,6 +29,7 @@ from core.llm_handlers import (  # noqa: F401
     _emit_content,
     _extract_app_arg,
     _familiar_content,
+    _repo_root,
     main,
 )
 
@@ -43,6 +44,11 @@ from core.llm_staleness import (  # noqa: F401
     _status_for_area,
 )
 
+# ---------------------------------------------------------------------------
+# Derive-all engine
+# ---------------------------------------------------------------------------
+from core.llm_derive import Artifact, derive, write_outputs
+
 # ---------------------------------------------------------------------------
 # Locals (LlmConfig must be defined here — llm_builders back-imports it)
 # ---------------------------------------------------------------------------
@@ -63,6 +69,9 @@ class LlmConfig:
     inventory_filename: str = DEFAULT_INVENTORY_FILENAME
     familiar_filename: str = DEFAULT_FAMILIAR_FILENAME
     policies_filename: str = DEFAULT_POLICIES_FILENAME
+    # Source package (src/<package>) whose files key derive-all's cache of the
+    # agentic and domain-map artifacts; None rebuilds them every run.
+    package: str | None = None
 
 
 def make_app_llm_config(**kwargs) -> LlmConfig:
@@ -133,34 +142,24 @@ def _make_familiar_handler(config: LlmConfig) -> Callable:
     return _run_familiar
 
 
-def _collect_derive_outputs(config: LlmConfig) -> list[tuple[str, str]]:
-    """Collect (filename, content) pairs from config builders."""
-    outputs: list[tuple[str, str]] = []
-
-    def _add(
-        filename: str | None,
-        builder: Callable[[], str] | None,
-        fallback: str = "",
-    ) -> None:
-        if not filename or not builder:
-            return
-        content = _safe_call(builder, fallback)
-        if content:
-            outputs.append((filename, content))
-
-    _add(config.agentic_filename, config.agentic)
-    _add(config.domain_map_filename, config.domain_map)
-    _add(config.inventory_filename, config.inventory)
-    fam_builder = config.familiar_extended or config.familiar_compact
-    _add(config.familiar_filename, fam_builder)
-    _add(config.policies_filename, config.policies, _default_policies())
-
+def _derive_artifacts(config: LlmConfig) -> list[Artifact]:
+    """Derive-all artifacts for a domain config, in output order."""
+    inputs = (f"src/{config.package}", "src/core") if config.package else ()
+    candidates = [
+        (config.agentic_filename, config.agentic, "", inputs),
+        (config.domain_map_filename, config.domain_map, "", inputs),
+        (config.inventory_filename, config.inventory, "", ()),
+        (config.familiar_filename, config.familiar_extended or config.familiar_compact, "", ()),
+        (config.policies_filename, config.policies, _default_policies(), ()),
+    ]
     if hasattr(config, "extra_generators"):
         extra: Sequence[tuple[str, Callable[[], str]]] = getattr(config, "extra_generators")
-        for fname, builder in extra:
-            _add(fname, builder)
-
-    return outputs
+        candidates.extend((fname, builder, "", ()) for fname, builder in extra)
+    return [
+        Artifact(fname, builder, inputs, fallback)
+        for fname, builder, fallback, inputs in candidates
+        if fname and builder
+    ]
 
 
 def _make_derive_handler(config: LlmConfig) -> Callable:
@@ -168,18 +167,13 @@ def _make_derive_handler(config: LlmConfig) -> Callable:
     from pathlib import Path
 
     def _run_derive(args):
-        outputs = _collect_derive_outputs(config)
+        derived = derive(_derive_artifacts(config), root=_repo_root())
 
-        if getattr(args, "include_generated", False) and outputs:
-            out_dir = Path(getattr(args, "out_dir", ".llm") or ".llm")
-            out_dir.mkdir(parents=True, exist_ok=True)
-            for fname, content in outputs:
-                target = out_dir / fname
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(content, encoding="utf-8")
+        if getattr(args, "include_generated", False) and derived:
+            write_outputs(Path(getattr(args, "out_dir", ".llm") or ".llm"), derived)
 
         summary_lines = (
-            ["Generated:"] + ([f"- {f}" for f, _ in outputs] if outputs else ["- (none)"])
+            ["Generated:"] + ([f"- {d.filename}" for d in derived] if derived else ["- (none)"])
         )
         if getattr(args, "stdout", False) or not getattr(args, "include_generated", False):
             print("\n".join(summary_lines))
@@ -0,0 +1,296 @@
+"""Memoized, concurrent artifact generation behind ``llm derive-all``.
+
+The agentic capsule and domain map of every app are built by importing the
+app and introspecting its parsers, which dominates a derive-all run. Each
+``Artifact`` names the source trees its content depends on; the engine keys
+the generated content on a hash of those files and only rebuilds an artifact
+when one of them changed. Builders also read context resolved from the
+working directory (``.llm/`` docs, ``AGENTS.md``, the ``bin/`` listing), so
+the working directory and those paths are part of the key too. Per-file
+hashes are memoized by (size, mtime_ns), so checking an unchanged tree only
+stats it. A build that fails or falls back is never cached.
+
+Artifacts whose builder is a ``"module:attr.path"`` target are built in a
+process pool when targets from more than one module need rebuilding, so apps
+are imported and introspected side by side. Callable builders run in this
+process. Artifacts
+without inputs (inventory, familiar, policies) are cheap and always rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, Iterable
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+_CACHE_VERSION = 2
+_MAX_WORKERS = 8
+
+# Working-directory files and directories the capsule and domain-map builders
+# read; any file type counts, and a missing path is part of the key.
+CONTEXT_INPUTS: tuple[str, ...] = (
+    ".llm/CONTEXT.md",
+    ".llm/UNIFIED.llm",
+    ".llm/DOMAIN_MAP.md",
+    ".llm/MIGRATION_STATE.md",
+    ".llm/PATTERNS.md",
+    "AGENTS.md",
+    "bin",
+)
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """One derive-all output file and how to build it.
+
+    ``build`` is either a ``"module:attr.path"`` target (resolved on use, so it
+    can run in a worker process) or a callable. ``inputs`` are root-relative
+    files or directories whose ``.py`` files key the cache; leave it empty to
+    rebuild every run. ``context`` are working-directory-relative files or
+    directories (every file type) that also key the cache of such an artifact.
+    """
+
+    filename: str
+    build: str | Callable[[], str]
+    inputs: tuple[str, ...] = ()
+    fallback: str = ""
+    context: tuple[str, ...] = CONTEXT_INPUTS
+
+
+@dataclass(frozen=True)
+class Derived:
+    filename: str
+    content: str
+    cached: bool = False
+
+
+def default_cache_path(root: Path) -> Path:
+    """Derive cache for ``root``, kept out of the checkout under the data home."""
+    key = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return data_home() / "llm" / f"derive-{key}.json"
+
+
+def resolve_target(target: str) -> Callable[[], str]:
+    """Import ``module`` from a ``"module:attr.path"`` target and walk the attributes."""
+    module_name, _, attr_path = target.partition(":")
+    obj = import_module(module_name)
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def build_content(build: str | Callable[[], str] | None, fallback: str) -> tuple[str, bool]:
+    """Run one builder; returns ``(content, built)``.
+
+    A failing or empty build yields ``fallback`` and ``built=False``, as does a
+    builder that returned ``fallback`` itself (one that swallows its errors).
+    """
+    try:
+        func = resolve_target(build) if isinstance(build, str) else build
+        if func is None:  # e.g. an LlmConfig without a domain_map builder
+            return fallback, False
+        text = func()
+    except Exception as exc:  # nosec B110 - surface fallback instead of crashing
+        return fallback or f"(error generating content: {exc})", False
+    if not text or text == fallback:
+        return fallback, False
+    return text, True
+
+
+def _builder_id(build: str | Callable[[], str]) -> str:
+    if isinstance(build, str):
+        return build
+    func = getattr(build, "func", build)  # functools.partial
+    return f"{getattr(func, '__module__', '')}:{getattr(func, '__qualname__', repr(func))}"
+
+
+class _InputHasher:
+    """Content hashes of input trees, memoized across runs by (size, mtime_ns)."""
+
+    def __init__(self, root: Path, known: dict[str, list]) -> None:
+        self.root = root
+        self.known = known
+        self.seen: dict[str, list] = {}
+        self._listed: dict[tuple[str, str], list[tuple[str, str, os.stat_result]]] = {}
+
+    def _file_hash(self, rel: str, path: str, st: os.stat_result) -> str:
+        entry = self.seen.get(rel)
+        if entry is None:
+            entry = self.known.get(rel)
+            if entry is None or entry[:2] != [st.st_size, st.st_mtime_ns]:
+                digest = hashlib.sha256()
+                try:
+                    with open(path, "rb") as fh:
+                        for chunk in iter(lambda: fh.read(1 << 16), b""):
+                            digest.update(chunk)
+                except OSError:
+                    return ""
+                entry = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+            self.seen[rel] = entry
+        return entry[2]
+
+    def _iter_files(self, base: str, rel_input: str, py_only: bool) -> Iterable[tuple[str, str, os.stat_result]]:
+        stack = [os.path.join(base, rel_input)]
+        while stack:
+            path = stack.pop()
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isdir(path):
+                yield os.path.relpath(path, base), path, st
+                continue
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif not py_only or entry.name.endswith(".py"):
+                    try:
+                        yield os.path.relpath(entry.path, base), entry.path, entry.stat()
+                    except OSError:
+                        continue
+
+    def _files(self, base: str, rel_input: str, py_only: bool = True) -> list[tuple[str, str, os.stat_result]]:
+        key = (base, rel_input)
+        if key not in self._listed:
+            self._listed[key] = list(self._iter_files(base, rel_input, py_only))
+        return self._listed[key]
+
+    def digest(self, artifact: Artifact) -> str:
+        root = str(self.root)
+        files = sorted(f for rel_input in artifact.inputs for f in self._files(root, rel_input))
+        digest = hashlib.sha256(_builder_id(artifact.build).encode("utf-8"))
+        for rel, path, st in files:
+            digest.update(f"\0{rel}\0{self._file_hash(rel, path, st)}".encode("utf-8"))
+        cwd = os.getcwd()
+        digest.update(f"\0cwd\0{cwd}".encode("utf-8"))
+        for rel_input in artifact.context:
+            listed = sorted(self._files(cwd, rel_input, py_only=False))
+            digest.update(f"\0{rel_input}\0{len(listed)}".encode("utf-8"))
+            for rel, path, st in listed:
+                # Absolute memo key: these resolve against the cwd, not ``root``.
+                digest.update(f"\0{rel}\0{self._file_hash(path, path, st)}".encode("utf-8"))
+        return digest.hexdigest()
+
+
+def _build_targets(jobs: list[tuple[str, str]]) -> list[tuple[str, bool]]:
+    """Worker entry point: build ``(target, fallback)`` jobs from one module."""
+    return [build_content(target, fallback) for target, fallback in jobs]
+
+
+def _build_missing(artifacts: list[Artifact], max_workers: int) -> list[tuple[str, bool]]:
+    """Build ``artifacts``, fanning target builders out over a process pool.
+
+    Targets are grouped by module so each worker imports an app once. The pool
+    is only used with more than one module to build and more than one CPU.
+    """
+    groups: dict[str, list[Artifact]] = {}
+    for artifact in artifacts:
+        if isinstance(artifact.build, str):
+            groups.setdefault(artifact.build.partition(":")[0], []).append(artifact)
+    workers = min(max_workers, len(groups), os.cpu_count() or 1)
+    built: dict[str, tuple[str, bool]] = {}
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    module: pool.submit(_build_targets, [(a.build, a.fallback) for a in group])
+                    for module, group in groups.items()
+                }
+                for module, fut in futures.items():
+                    built.update(zip((a.filename for a in groups[module]), fut.result()))
+        except (OSError, RuntimeError):
+            built = {}  # no usable process pool here; build in this process
+    return [
+        built[a.filename] if a.filename in built else build_content(a.build, a.fallback)
+        for a in artifacts
+    ]
+
+
+def derive(
+    artifacts: Iterable[Artifact],
+    *,
+    root: Path,
+    cache_path: Path | None = None,
+    max_workers: int = _MAX_WORKERS,
+) -> list[Derived]:
+    """Build every artifact, reusing cached content whose inputs are unchanged.
+
+    Results keep the order of ``artifacts``; empty content is dropped, as
+    derive-all has always done.
+    """
+    artifacts = list(artifacts)
+    cache_path = cache_path or default_cache_path(root)
+    cache = safe_load_json(cache_path, {})
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        cache = {}
+    known: dict[str, list] = cache.get("files") or {}
+    hasher = _InputHasher(root, known)
+    stored: dict[str, dict] = cache.get("artifacts") or {}
+
+    keys = {a.filename: f"{a.filename}|{_builder_id(a.build)}" for a in artifacts}
+    digests = {a.filename: hasher.digest(a) for a in artifacts if a.inputs}
+    contents: dict[str, str] = {}
+    for artifact in artifacts:
+        hit = stored.get(keys[artifact.filename])
+        if artifact.inputs and hit and hit.get("digest") == digests[artifact.filename]:
+            contents[artifact.filename] = hit["content"]
+    cached = set(contents)
+    missing = [a for a in artifacts if a.filename not in cached]
+    built: set[str] = set()
+    for artifact, (content, ok) in zip(missing, _build_missing(missing, max_workers)):
+        contents[artifact.filename] = content
+        if ok:
+            built.add(artifact.filename)
+
+    fresh = {
+        keys[a.filename]: {"digest": digests[a.filename], "content": contents[a.filename]}
+        for a in missing
+        if a.inputs and a.filename in built
+    }
+    if fresh or any(known.get(rel) != entry for rel, entry in hasher.seen.items()):
+        try:
+            atomic_write_json(
+                cache_path,
+                {
+                    "version": _CACHE_VERSION,
+                    "files": {**known, **hasher.seen},
+                    "artifacts": {**stored, **fresh},
+                },
+                indent=None,
+            )
+        except OSError:  # nosec B110 - an unwritable data home only costs the next run a rebuild
+            pass
+    return [
+        Derived(a.filename, contents[a.filename], a.filename in cached)
+        for a in artifacts
+        if contents[a.filename]
+    ]
+
+
+def write_outputs(out_dir: Path, derived: Iterable[Derived]) -> list[Path]:
+    """Write each artifact under ``out_dir``, skipping files already up to date."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for item in derived:
+        target = out_dir / item.filename
+        try:
+            if target.read_text(encoding="utf-8") == item.content:
+                continue
+        except (OSError, UnicodeDecodeError):
+            pass
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(item.content, encoding="utf-8")
+        written.append(target)
+    return written
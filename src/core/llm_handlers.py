@@ -7,6 +7,7 @@ and dispatches --app routing to per-domain llm_cli modules.
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import json
 import sys
@@ -23,6 +24,7 @@ from core.llm_builders import (
     _DOMAIN_MAP_UNAVAILABLE,
     _DEFAULT_POLICIES_YAML,
 )
+from core.llm_derive import Artifact, derive, write_outputs
 from core.llm_staleness import (
     _handle_check,
     _handle_deps,
@@ -112,6 +114,9 @@ def _run_app_cli(app: str, argv: list[str]) -> int:
 # Mail helpers (lazy-imported)
 # ---------------------------------------------------------------------------
 
+_MAIL_CAPSULE_UNAVAILABLE = "agentic: mail\n(pending capsule)"
+
+
 def _mail_agentic_capsule(compact: bool = False) -> str:
     try:
         from mail.agentic import build_agentic_capsule
@@ -119,7 +124,7 @@ def _mail_agentic_capsule(compact: bool = False) -> str:
     except Exception as exc:  # nosec B110 - fallback on import/build failure
         import logging
         logging.getLogger(__name__).warning("_mail_agentic_capsule failed: %s", exc)
-        return "agentic: mail\n(pending capsule)"
+        return _MAIL_CAPSULE_UNAVAILABLE
 
 
 def _mail_domain_map() -> str:
@@ -320,6 +325,10 @@ def _build_repo_parser() -> argparse.ArgumentParser:
     derive.add_argument("--out-dir", default=".llm")
     derive.add_argument("--include-generated", action="store_true")
     derive.add_argument("--stdout", action="store_true")
+    derive.add_argument(
+        "--all-apps", action="store_true",
+        help="Also derive every app's agentic capsule and domain map, built concurrently",
+    )
 
     deps = sp.add_parser("deps", help="Approximate dependencies by area")
     deps.add_argument("--root", default=".")
@@ -448,26 +457,45 @@ def _handle_flows(args: argparse.Namespace, _llm_dir: Path) -> int:
     return 0
 
 
+def _derive_all_artifacts(all_apps: bool) -> list[Artifact]:
+    """Repo-level derive-all artifacts; with ``all_apps`` also each app's capsule and domain map."""
+    from mail.agentic import CWD_INPUTS as mail_context
+
+    mail_inputs = ("src/mail", "src/core")
+    artifacts = [
+        Artifact(
+            DEFAULT_AGENTIC_FILENAME, "core.llm_handlers:_mail_agentic_capsule", mail_inputs,
+            fallback=_MAIL_CAPSULE_UNAVAILABLE, context=mail_context,
+        ),
+        Artifact(
+            DEFAULT_DOMAIN_MAP_FILENAME, "core.llm_handlers:_mail_domain_map", mail_inputs,
+            fallback=_DOMAIN_MAP_UNAVAILABLE, context=mail_context,
+        ),
+        Artifact(DEFAULT_INVENTORY_FILENAME, _default_inventory),
+        Artifact(DEFAULT_FAMILIAR_FILENAME, functools.partial(_familiar_content, verbose=False)),
+        Artifact(DEFAULT_POLICIES_FILENAME, _default_policies),
+    ]
+    if all_apps:
+        for app, module_name in sorted(_APP_MODULES.items()):
+            if app == "mail":
+                continue
+            inputs = (f"src/{module_name.split('.', 1)[0]}", "src/core")
+            artifacts.extend([
+                Artifact(f"AGENTIC_{app.upper()}.md", f"{module_name}:CONFIG.agentic", inputs),
+                Artifact(f"DOMAIN_MAP_{app.upper()}.md", f"{module_name}:CONFIG.domain_map", inputs),
+            ])
+    return artifacts
+
+
 def _handle_derive_all(args: argparse.Namespace, llm_dir: Path) -> int:
     """Handle derive-all command."""
-    outputs = [
-        (llm_dir / DEFAULT_AGENTIC_FILENAME, _mail_agentic_capsule()),
-        (llm_dir / DEFAULT_DOMAIN_MAP_FILENAME, _mail_domain_map()),
-        (llm_dir / DEFAULT_INVENTORY_FILENAME, _default_inventory()),
-        (llm_dir / DEFAULT_FAMILIAR_FILENAME, _familiar_content(verbose=False)),
-        (llm_dir / DEFAULT_POLICIES_FILENAME, _default_policies()),
-    ]
+    derived = derive(_derive_all_artifacts(getattr(args, "all_apps", False)), root=_repo_root())
     if getattr(args, "include_generated", False):
-        out_dir = Path(getattr(args, "out_dir", ".llm") or ".llm")
-        out_dir.mkdir(parents=True, exist_ok=True)
-        for target, content in outputs:
-            target_path = out_dir / target.name
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            target_path.write_text(content, encoding="utf-8")
+        write_outputs(Path(getattr(args, "out_dir", ".llm") or ".llm"), derived)
     if getattr(args, "stdout", False):
         print("Generated:")
-        for target, _ in outputs:
-            print(f"- {target}")
+        for item in derived:
+            print(f"- {llm_dir / item.filename}" + (" (unchanged)" if item.cached else ""))
     return 0
 
 
@@ -0,0 +1,225 @@
+"""One-pass, cached directory scan behind ``llm stale``, ``llm deps`` and ``llm check``.
+
+Each top-level area under ``--root`` is walked once with ``os.scandir`` for its
+latest mtime, its ``.py`` file count and the top-level modules its Python files
+import. Results are persisted under the data home so the ``llm`` commands CI
+runs back to back share one scan. A directory's listing is keyed by the
+directory's own mtime: one with no entries added, removed or renamed since the
+last run is not listed again. Its files are still stat'ed, because rewriting a
+file in place does not move the directory's mtime; each file's parsed imports
+are keyed by its own (size, mtime_ns), so only edited files are parsed again.
+Set ``LLM_SCAN_CACHE=0`` to ignore the cache and walk everything.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+_CACHE_VERSION = 2
+ENV_SCAN_CACHE = "LLM_SCAN_CACHE"
+
+
+@dataclass(frozen=True)
+class AreaScan:
+    """What one walk of a top-level area found."""
+
+    name: str
+    latest_mtime: float
+    py_files: int
+    imports: frozenset[str]  # empty unless scanned with_imports
+    modules: frozenset[str]
+
+
+def default_cache_path(root: Path) -> Path:
+    """Scan cache for ``root``, kept out of the checkout under the data home."""
+    key = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return data_home() / "llm" / f"scan-{key}.json"
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get(ENV_SCAN_CACHE, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _top_level_imports(path: str) -> list[str]:
+    """Top-level module names imported by one Python file ([] if unparseable)."""
+    try:
+        with open(path, "rb") as fh:
+            tree = ast.parse(fh.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".", 1)[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split(".", 1)[0])
+    return sorted(names)
+
+
+def _list_dir(path: str) -> tuple[dict, dict[str, os.stat_result]]:
+    """List one directory's direct entries into a cache entry, with their stats.
+
+    ``d`` holds the subdirectories to descend into and ``f`` every other
+    entry. Symlinked directories count as entries but are not followed.
+    """
+    subdirs: list[str] = []
+    files: list[str] = []
+    stats: dict[str, os.stat_result] = {}
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        entries = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+                continue
+            stats[entry.name] = entry.stat()
+        except OSError:  # broken symlink or permission error
+            pass
+        files.append(entry.name)
+    return {"d": sorted(subdirs), "f": sorted(files)}, stats
+
+
+def _scan_files(
+    abs_path: str, entry: dict, stats: dict[str, os.stat_result], old_py: dict, with_imports: bool
+) -> tuple[float, dict]:
+    """Latest mtime of the directory's files and its ``.py`` files' cache records.
+
+    Each ``.py`` record keeps the file's ``s`` (size) and ``m`` (mtime_ns) and
+    its parsed imports ``i``, left as None until a caller needs them; parsed
+    imports are reused only while size and mtime still match.
+    """
+    latest = 0.0
+    py: dict[str, dict] = {}
+    for name in entry["f"]:
+        st = stats.get(name)
+        if st is None:
+            try:
+                st = os.stat(os.path.join(abs_path, name))
+            except OSError:  # broken symlink or permission error
+                continue
+        latest = max(latest, st.st_mtime)
+        if not name.endswith(".py") or not stat.S_ISREG(st.st_mode):
+            continue
+        prev = old_py.get(name)
+        same = isinstance(prev, dict) and prev.get("s") == st.st_size and prev.get("m") == st.st_mtime_ns
+        names = prev.get("i") if same else None
+        if names is None and with_imports:
+            names = _top_level_imports(os.path.join(abs_path, name))
+        py[name] = {"s": st.st_size, "m": st.st_mtime_ns, "i": names}
+    return latest, py
+
+
+def _walk_area(
+    name: str, path: Path, old: dict[str, dict], fresh: dict[str, dict], with_imports: bool
+) -> AreaScan | None:
+    """Walk one area, reusing listings whose directory mtime and files whose
+    (size, mtime) still match ``old``."""
+    try:
+        os.stat(path)
+    except OSError:
+        return None
+    latest = 0.0
+    py_files = 0
+    imports: set[str] = set()
+    stack = [(name, str(path))]
+    while stack:
+        rel, abs_path = stack.pop()
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            continue
+        prev = old.get(rel) or {}
+        stats: dict[str, os.stat_result] = {}
+        if prev.get("m") == st.st_mtime_ns:
+            listing = {"d": prev["d"], "f": prev["f"]}
+        else:
+            listing, stats = _list_dir(abs_path)
+        files_latest, py = _scan_files(abs_path, listing, stats, prev.get("py") or {}, with_imports)
+        entry = {"m": st.st_mtime_ns, **listing, "py": py}
+        fresh[rel] = entry
+        latest = max(latest, st.st_mtime, files_latest)
+        py_files += len(py)
+        for record in py.values():
+            imports.update(record["i"] or ())
+        stack.extend((f"{rel}/{sub}", os.path.join(abs_path, sub)) for sub in entry["d"])
+    return AreaScan(name, latest, py_files, frozenset(imports), _area_modules(name, fresh))
+
+
+def _area_modules(name: str, entries: dict[str, dict]) -> frozenset[str]:
+    """Top-level module names an area provides to ``import`` statements.
+
+    A package area (``tests/`` with an ``__init__.py``) provides its own name.
+    A plain directory such as ``src/`` is treated as an import root: its
+    packages and modules are importable by their own names.
+    """
+    top = entries[name]
+    if "__init__.py" in top["py"]:
+        return frozenset({name})
+    provided = {name}
+    provided.update(stem[:-3] for stem in top["py"])
+    for sub in top["d"]:
+        if "__init__.py" in entries.get(f"{name}/{sub}", {}).get("py", {}):
+            provided.add(sub)
+    return frozenset(provided)
+
+
+def scan_areas(
+    root: Path, areas: Iterable[tuple[str, Path]], *, with_imports: bool = False
+) -> list[AreaScan]:
+    """Scan each ``(name, path)`` area once, sharing the on-disk cache for ``root``.
+
+    Python imports are only parsed with ``with_imports`` (``llm deps``), and
+    then only for files the cache has not parsed before. Areas that cannot be
+    stat'ed are left out, as the per-command walks did.
+    """
+    areas = list(areas)
+    use_cache = _cache_enabled()
+    cache_path = default_cache_path(root)
+    cached = safe_load_json(cache_path, {}) if use_cache else {}
+    if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+        cached = {}
+    old: dict[str, dict] = cached.get("dirs") or {}
+    fresh: dict[str, dict] = {}
+    scans = [
+        scan
+        for name, path in areas
+        if (scan := _walk_area(name, path, old, fresh, with_imports)) is not None
+    ]
+    if use_cache:
+        scanned = {name for name, _ in areas}
+        dirs = {rel: e for rel, e in old.items() if rel.split("/", 1)[0] not in scanned}
+        dirs.update(fresh)
+        if dirs != old:
+            try:
+                atomic_write_json(cache_path, {"version": _CACHE_VERSION, "dirs": dirs}, indent=None)
+            except OSError:  # nosec B110 - a read-only data home only costs the next run a rescan
+                pass
+    return scans
+
+
+def import_edges(scans: list[AreaScan]) -> dict[str, set[str]]:
+    """Map each area to the other areas its Python files import.
+
+    An import is attributed to the area named after it when there is one,
+    else to the import-root area that provides it.
+    """
+    providers: dict[str, str] = {}
+    for scan in scans:
+        for module in scan.modules - {scan.name}:
+            providers.setdefault(module, scan.name)
+    providers.update({scan.name: scan.name for scan in scans})
+    return {
+        scan.name: {providers[m] for m in scan.imports if m in providers} - {scan.name}
+        for scan in scans
+    }
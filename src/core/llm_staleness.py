@@ -1,7 +1,9 @@
 """Staleness and dependency analytics helpers for the LLM CLI.
 
 Provides stale/deps/check analytics: collecting stale stats, dependency counts,
-SLA-based status checks, and formatting helpers.
+SLA-based status checks, and formatting helpers. All three commands read the
+same cached one-pass scan from core.llm_scan; dependency counts come from the
+import edges between areas.
 """
 
 from __future__ import annotations
@@ -13,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
+from core.llm_scan import AreaScan, import_edges, scan_areas
+
 DEFAULT_SKIP_DIRS = {
     "backups",
     "_disasm",
@@ -89,67 +93,45 @@ def _iter_candidate_dirs(root: Path, include: Iterable[str] | None = None) -> li
     return entries
 
 
-def _latest_mtime(path: Path) -> float:
-    latest = path.stat().st_mtime
-    for sub in path.rglob("*"):
-        try:
-            latest = max(latest, sub.stat().st_mtime)
-        except Exception:  # nosec B112 - skip inaccessible files (permissions, broken symlinks)
-            continue
-    return latest
+def _stale_entry(scan: AreaScan, now: float) -> dict[str, object]:
+    days = max(0.0, (now - scan.latest_mtime) / 86400.0)
+    return {
+        "area": scan.name,
+        "staleness_days": round(days, 2),
+        "latest_ts": datetime.fromtimestamp(scan.latest_mtime, tz=timezone.utc).isoformat(timespec="seconds"),
+    }
 
 
 def _collect_stale_stats(root: Path, include: list[str] | None, limit: int) -> list[dict[str, object]]:
     now = time.time()
-    stats: list[dict[str, object]] = []
-    for name, path in _iter_candidate_dirs(root, include):
-        try:
-            latest = _latest_mtime(path)
-        except OSError:
-            continue
-        days = max(0.0, (now - latest) / 86400.0)
-        stats.append(
-            {
-                "area": name,
-                "staleness_days": round(days, 2),
-                "latest_ts": datetime.fromtimestamp(latest, tz=timezone.utc).isoformat(timespec="seconds"),
-            }
-        )
+    scans = scan_areas(root, _iter_candidate_dirs(root, include))
+    stats = [_stale_entry(scan, now) for scan in scans]
     stats.sort(key=lambda entry: entry["staleness_days"], reverse=True)
     if limit > 0:
         stats = stats[:limit]
     return stats
 
 
-def _count_py_files(path: Path) -> int | None:
-    """Return the number of .py files under path, or None if it can't be scanned."""
-    try:
-        return sum(1 for _ in path.rglob("*.py"))
-    except OSError:
-        return None
-
-
-def _dep_stat_for_dir(name: str, path: Path) -> dict[str, int] | None:
-    """Build one dependency-stat entry for a directory, or None if unscannable."""
-    py_files = _count_py_files(path)
-    if py_files is None:
-        return None
-    dependencies = py_files
-    dependents = max(0, py_files // 2)
-    return {
-        "area": name,
-        "dependencies": dependencies,
-        "dependents": dependents,
-        "combined": dependencies + dependents,
-    }
+def _dep_stats(scans: list[AreaScan]) -> list[dict[str, int]]:
+    """Per-area counts of distinct areas imported (dependencies) and importing it (dependents)."""
+    edges = import_edges(scans)
+    dependents = {scan.name: 0 for scan in scans}
+    for targets in edges.values():
+        for target in targets:
+            dependents[target] += 1
+    return [
+        {
+            "area": scan.name,
+            "dependencies": len(edges[scan.name]),
+            "dependents": dependents[scan.name],
+            "combined": len(edges[scan.name]) + dependents[scan.name],
+        }
+        for scan in scans
+    ]
 
 
 def _collect_dep_stats(root: Path, limit: int, order: str) -> list[dict[str, int]]:
-    stats = [
-        entry
-        for name, path in _iter_candidate_dirs(root)
-        if (entry := _dep_stat_for_dir(name, path)) is not None
-    ]
+    stats = _dep_stats(scan_areas(root, _iter_candidate_dirs(root), with_imports=True))
     reverse = order == "desc"
     stats.sort(key=lambda entry: entry["combined"], reverse=reverse)
     if limit > 0:
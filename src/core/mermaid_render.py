@@ -0,0 +1,241 @@
+"""Content-addressed cache and batch rendering for mmdc.
+
+Each ``mmdc`` run boots headless Chromium, which dominates the cost of a
+render. ``render_many`` keeps rendered bytes in a cache under the data home,
+keyed by the final Mermaid text (after dark-mode fixes), format, theme,
+background, size, scale and the mmdc version. It then renders all misses that
+share options in one mmdc launch, using mmdc's markdown mode: every
+```` ```mermaid ```` block in an input ``.md`` is written to ``<out>-<n>.<fmt>``.
+``diagrams`` (``LocalRenderer``) and ``slides`` share the cache, so a diagram
+rendered by one is reused by the other.
+
+Set ``MERMAID_RENDER_CACHE=0`` to bypass the cache. Renders still batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+ENV_RENDER_CACHE = "MERMAID_RENDER_CACHE"
+
+_CACHE_VERSION = 1
+# mmdc's markdown mode writes svg/png per block; pdf is rendered one at a time.
+_BATCH_FORMATS = frozenset({"svg", "png"})
+
+Runner = Callable[[list[str]], None]
+
+
+class MermaidRenderError(RuntimeError):
+    """mmdc failed or produced no output."""
+
+
+@dataclass(frozen=True)
+class MermaidJob:
+    """One diagram to render; ``text`` is the final source handed to mmdc."""
+
+    text: str
+    output_format: str = "svg"
+    background: str | None = None
+    theme: str | None = None
+    width: int | None = None
+    height: int | None = None
+    scale: int | None = None
+
+    def flags(self) -> list[str]:
+        """mmdc flags for the visual options (shared by a whole batch)."""
+        flags: list[str] = []
+        if self.background:
+            flags += ["-b", self.background]
+        if self.theme:
+            flags += ["-t", self.theme]
+        if self.width:
+            flags += ["-w", str(self.width)]
+        if self.height:
+            flags += ["-H", str(self.height)]
+        if self.scale:
+            flags += ["-s", str(self.scale)]
+        return flags
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(ENV_RENDER_CACHE, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def cache_dir() -> Path:
+    return data_home() / "diagrams" / "render-cache"
+
+
+def mmdc_version(mmdc_path: str) -> str:
+    """mmdc's ``--version``, remembered per binary (path + mtime) across runs.
+
+    Returns "" when it cannot be determined; callers then skip the cache.
+    """
+    import subprocess  # noqa: PLC0415 - deferred like the rest of the mmdc plumbing
+
+    try:
+        real = os.path.realpath(mmdc_path)
+        stamp = f"{real}|{os.stat(real).st_mtime_ns}"
+    except OSError:
+        return ""
+    index_path = cache_dir() / "mmdc-versions.json"
+    known = safe_load_json(index_path, {})
+    if not isinstance(known, dict):
+        known = {}
+    if stamp in known:
+        return str(known[stamp])
+    try:
+        result = subprocess.run(  # nosec B603 - mmdc_path resolved via shutil.which or validated by the caller
+            [mmdc_path, "--version"], capture_output=True, timeout=30, check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    version = result.stdout.decode("utf-8", errors="replace").strip() if result.returncode == 0 else ""
+    if version:
+        try:
+            atomic_write_json(index_path, {**known, stamp: version}, indent=None)
+        except OSError:  # nosec B110 - only costs the next run a --version call
+            pass
+    return version
+
+
+def cache_version(mmdc_path: str | None) -> str:
+    """The mmdc version to key the cache on; "" when caching is off or impossible."""
+    if not mmdc_path or not cache_enabled():
+        return ""
+    return mmdc_version(mmdc_path)
+
+
+def cache_key(job: MermaidJob, version: str) -> str:
+    payload = [
+        _CACHE_VERSION, version, job.output_format, job.theme, job.background,
+        job.width, job.height, job.scale, job.text,
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str, output_format: str) -> Path:
+    return cache_dir() / key[:2] / f"{key}.{output_format}"
+
+
+def lookup(job: MermaidJob, version: str) -> bytes | None:
+    """Cached output for ``job`` rendered by mmdc ``version``, or None."""
+    if not version:
+        return None
+    try:
+        return _cache_path(cache_key(job, version), job.output_format).read_bytes()
+    except OSError:
+        return None
+
+
+def store(job: MermaidJob, version: str, data: bytes) -> None:
+    """Cache ``data`` as the output of ``job``; a no-op without a version."""
+    if not version:
+        return
+    path = _cache_path(cache_key(job, version), job.output_format)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError:  # nosec B110 - an unwritable cache only costs a re-render
+        pass
+
+
+def run_mmdc(cmd: list[str], timeout: int = 60) -> None:
+    """Default runner: run mmdc, raising ``MermaidRenderError`` on failure."""
+    import subprocess  # noqa: PLC0415 - deferred like the rest of the mmdc plumbing
+
+    try:
+        result = subprocess.run(  # nosec B603 - argv built here from a resolved mmdc path and our temp files
+            cmd, capture_output=True, timeout=timeout, check=False,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise MermaidRenderError(f"mmdc timed out after {timeout}s") from exc
+    except FileNotFoundError as exc:
+        raise MermaidRenderError(f"mmdc not found at {cmd[0]}") from exc
+    if result.returncode != 0:
+        raise MermaidRenderError(f"mmdc failed: {result.stderr.decode('utf-8', errors='replace')}")
+
+
+def _render_one(job: MermaidJob, mmdc_path: str, run: Runner) -> bytes:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        inp = Path(tmpdir) / "input.mmd"
+        out = Path(tmpdir) / f"output.{job.output_format}"
+        inp.write_text(job.text, encoding="utf-8")
+        run([mmdc_path, "-i", str(inp), "-o", str(out), *job.flags()])
+        if not out.exists():
+            raise MermaidRenderError("mmdc did not produce output file")
+        return out.read_bytes()
+
+
+def _render_batch(jobs: Sequence[MermaidJob], mmdc_path: str, run: Runner) -> list[bytes] | None:
+    """Render same-option jobs in one mmdc launch; None when the batch did not work."""
+    first = jobs[0]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        inp = Path(tmpdir) / "batch.md"
+        out = Path(tmpdir) / "out.md"
+        inp.write_text("".join(f"```mermaid\n{job.text}\n```\n\n" for job in jobs), encoding="utf-8")
+        try:
+            run([mmdc_path, "-i", str(inp), "-o", str(out), "-e", first.output_format, *first.flags()])
+        except Exception:  # nosec B110 - retried one by one so the failing diagram reports its own error
+            return None
+        images = [Path(tmpdir) / f"out-{n}.{first.output_format}" for n in range(1, len(jobs) + 1)]
+        if not all(image.exists() for image in images):
+            return None
+        return [image.read_bytes() for image in images]
+
+
+def _batchable(job: MermaidJob) -> bool:
+    return job.output_format in _BATCH_FORMATS and "```" not in job.text
+
+
+def render_many(
+    jobs: Sequence[MermaidJob],
+    *,
+    mmdc_path: str,
+    run: Runner | None = None,
+    use_cache: bool = True,
+) -> list[bytes]:
+    """Render ``jobs`` (order kept), reusing cached output and batching the misses.
+
+    ``run`` executes one mmdc argv and raises on failure (default
+    ``run_mmdc``). Identical jobs render once. A batch that fails is retried
+    one diagram at a time, so the error names the diagram that broke it.
+    """
+    run = run or run_mmdc
+    version = cache_version(mmdc_path) if use_cache else ""
+    results: dict[MermaidJob, bytes] = {}
+    for job in dict.fromkeys(jobs):
+        cached = lookup(job, version)
+        if cached is not None:
+            results[job] = cached
+
+    groups: dict[tuple, list[MermaidJob]] = {}
+    for job in dict.fromkeys(jobs):
+        if job not in results:
+            batch_key = (job.output_format, *job.flags()) if _batchable(job) else (id(job),)
+            groups.setdefault(batch_key, []).append(job)
+
+    def keep(job: MermaidJob, data: bytes) -> None:
+        results[job] = data
+        store(job, version, data)
+
+    for group in groups.values():
+        rendered = _render_batch(group, mmdc_path, run) if len(group) > 1 else None
+        if rendered is not None:
+            for job, data in zip(group, rendered):
+                keep(job, data)
+            continue
+        for job in group:
+            keep(job, _render_one(job, mmdc_path, run))
+    return [results[job] for job in jobs]
@@ -0,0 +1,356 @@
+"""Delta-synced local message index for Outlook via Microsoft Graph.
+
+``$search`` requests page through ``@odata.nextLink`` serially, cannot carry a
+``$filter`` (so the days window is applied client-side), and re-download the
+same recent messages on every sweep. This mixin keeps a SQLite index of each
+synced folder, fed by Graph delta queries:
+
+- the first sync of a folder pulls its last N days with a strict ``$select``;
+- every later sync follows the persisted ``@odata.deltaLink`` and only receives
+  messages added, changed or removed since the previous run;
+- searches over a window the index already covers are answered locally.
+
+Local matching understands the subset of KQL the sweeps and scans emit
+(``from:``, ``subject:``, ``to:``, bare words and quoted phrases, all ANDed)
+and checks subject, sender, recipients and ``bodyPreview``. Anything else
+(``OR``, parentheses, other properties, unbounded windows) returns ``None`` so
+callers fall back to a Graph ``$search``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as _dt
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from .client import OutlookClientBase, _requests
+from core.constants import GRAPH_API_URL
+from core.parallel import parallel_map
+from core.paths import data_home
+
+_NEXT_LINK = "@odata.nextLink"
+_DELTA_LINK = "@odata.deltaLink"
+
+# Projection for delta pages: every field a search row, a sweep or a
+# mail-list line reads, and nothing else.
+SYNC_SELECT = (
+    "id,subject,receivedDateTime,from,toRecipients,"
+    "bodyPreview,hasAttachments,conversationId,isRead"
+)
+
+# Window pulled by a folder's first sync. Searches for longer windows widen it
+# (one re-baseline); unbounded searches never use the index.
+DEFAULT_SYNC_DAYS = 90
+
+# A folder synced this recently is not re-synced before answering a query, so
+# back-to-back searches in one sweep cost one delta round trip, not one each.
+_SYNC_FRESH_S = 30.0
+
+_PAGE_SIZE = 200
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS messages ("
+    "folder TEXT NOT NULL, id TEXT NOT NULL, received TEXT NOT NULL, data TEXT NOT NULL, "
+    "PRIMARY KEY (folder, id))",
+    "CREATE INDEX IF NOT EXISTS messages_received ON messages (folder, received)",
+    "CREATE TABLE IF NOT EXISTS sync_state ("
+    "folder TEXT PRIMARY KEY, delta_link TEXT NOT NULL, window_start TEXT NOT NULL, "
+    "synced_at REAL NOT NULL)",
+)
+
+
+@dataclass
+class FolderSyncState:
+    """Persisted delta position of one folder."""
+
+    delta_link: str
+    window_start: str
+    synced_at: float
+
+
+@dataclass
+class SyncStats:
+    """Outcome of syncing one folder."""
+
+    folder: str
+    upserted: int = 0
+    removed: int = 0
+    pages: int = 0
+    full: bool = False
+    skipped: bool = False
+
+
+def _iso_days_ago(days: int) -> str:
+    start = _dt.datetime.now(_dt.timezone.utc) - _dt.timedelta(days=int(days))
+    return start.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class MessageIndex:
+    """SQLite store of synced messages and per-folder delta links.
+
+    Each call opens its own connection, so one index can be shared by the
+    threads of a concurrent multi-folder sync.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._transaction() as conn:
+            for stmt in _SCHEMA:
+                conn.execute(stmt)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def state(self, folder: str) -> FolderSyncState | None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT delta_link, window_start, synced_at FROM sync_state WHERE folder = ?", (folder,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return FolderSyncState(str(row[0]), str(row[1]), float(row[2])) if row else None
+
+    def reset(self, folder: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM messages WHERE folder = ?", (folder,))
+            conn.execute("DELETE FROM sync_state WHERE folder = ?", (folder,))
+
+    def apply(self, folder: str, changes: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Upsert changed messages and drop ``@removed`` ones; return (upserted, removed)."""
+        upserts: list[tuple[str, str, str, str]] = []
+        removals: list[tuple[str, str]] = []
+        for m in changes:
+            mid = m.get("id")
+            if not mid:
+                continue
+            if "@removed" in m:
+                removals.append((folder, mid))
+                continue
+            data = {k: v for k, v in m.items() if not k.startswith("@")}
+            upserts.append((folder, mid, data.get("receivedDateTime") or "", json.dumps(data)))
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO messages (folder, id, received, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(folder, id) DO UPDATE SET received = excluded.received, data = excluded.data",
+                upserts,
+            )
+            conn.executemany("DELETE FROM messages WHERE folder = ? AND id = ?", removals)
+        return len(upserts), len(removals)
+
+    def discard(self, msg_id: str) -> None:
+        """Forget a message everywhere (e.g. after moving it), ahead of the next delta."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM messages WHERE id = ?", (msg_id,))
+
+    def set_state(self, folder: str, delta_link: str, window_start: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (folder, delta_link, window_start, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(folder) DO UPDATE SET delta_link = excluded.delta_link, "
+                "window_start = excluded.window_start, synced_at = excluded.synced_at",
+                (folder, delta_link, window_start, time.time()),
+            )
+
+    def messages(self, folder: str, since: str = "") -> list[dict[str, Any]]:
+        """Indexed messages in ``folder`` received at or after ``since``, newest first.
+
+        Rows without ``receivedDateTime`` are kept, matching ``_within_cutoff``.
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT data FROM messages WHERE folder = ? AND (received = '' OR received >= ?) "
+                "ORDER BY received DESC",
+                (folder, since),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(r[0]) for r in rows]
+
+
+_TOKEN_RE = re.compile(r'(\w+):"([^"]*)"|(\w+):(\S+)|"([^"]*)"|(\S+)')
+_KQL_OPERATORS = {"OR", "AND", "NOT", "NEAR"}
+
+
+def _address_text(entries: Any) -> str:
+    if isinstance(entries, dict):
+        entries = [entries]
+    parts: list[str] = []
+    for e in entries or []:
+        addr = (e or {}).get("emailAddress") or {}
+        parts.append(f"{addr.get('name') or ''} {addr.get('address') or ''}")
+    return " ".join(parts).lower()
+
+
+_FIELD_TEXT: dict[str, Callable[[dict[str, Any]], str]] = {
+    "from": lambda m: _address_text(m.get("from")),
+    "to": lambda m: _address_text(m.get("toRecipients")),
+    "subject": lambda m: (m.get("subject") or "").lower(),
+}
+
+
+def _any_text(m: dict[str, Any]) -> str:
+    return " ".join((
+        (m.get("subject") or "").lower(),
+        (m.get("bodyPreview") or "").lower(),
+        _address_text(m.get("from")),
+    ))
+
+
+def compile_local_query(query: str) -> Callable[[dict[str, Any]], bool] | None:
+    """Turn a raw KQL term into a predicate over indexed messages, or None if unsupported."""
+    terms: list[tuple[Callable[[dict[str, Any]], str], str]] = []
+    for match in _TOKEN_RE.finditer(query or ""):
+        field_q, val_q, field, val, phrase, word = match.groups()
+        field = field_q or field
+        value = val_q if field_q else (val if field else (phrase if phrase is not None else word))
+        if field is None and phrase is None and (word in _KQL_OPERATORS or "(" in word or ")" in word):
+            return None
+        if field is not None and field.lower() not in _FIELD_TEXT:
+            return None
+        needle = (value or "").strip().lower()
+        if not needle:
+            continue
+        terms.append((_FIELD_TEXT[field.lower()] if field else _any_text, needle))
+    if not terms:
+        return None
+    return lambda m: all(needle in text(m) for text, needle in terms)
+
+
+class MailSyncMixin:
+    """Mixin providing delta sync into a local message index.
+
+    Requires OutlookClientBase methods: _headers.
+    """
+
+    _message_index: MessageIndex | None = None
+
+    def message_index(self) -> MessageIndex:
+        """The index for this account: under ``cache_dir`` when set, else the data home."""
+        if self._message_index is None:
+            cache_dir = getattr(self, "cache_dir", None)
+            if cache_dir:
+                path = os.path.join(cache_dir, "outlook_messages.sqlite")
+            else:
+                account = f"{getattr(self, 'client_id', '')}|{getattr(self, 'tenant', '')}|{getattr(self, 'token_path', '')}"
+                key = hashlib.sha256(account.encode("utf-8")).hexdigest()[:12]
+                path = str(data_home() / "outlook" / f"messages-{key}.sqlite")
+            self._message_index = MessageIndex(path)
+        return self._message_index
+
+    def _initial_delta_url(self, folder: str, window_start: str) -> str:
+        flt = urllib.parse.quote(f"receivedDateTime ge {window_start}")
+        return (
+            f"{GRAPH_API_URL}/me/mailFolders/{folder}/messages/delta"
+            f"?$select={SYNC_SELECT}&$filter={flt}"
+        )
+
+    def _delta_pages(self: OutlookClientBase, url: str) -> Iterable[tuple[list[dict[str, Any]], str | None]]:
+        """Yield (changes, delta_link) per page; delta_link is set on the last page only."""
+        headers = dict(self._headers())
+        headers["Prefer"] = f"odata.maxpagesize={_PAGE_SIZE}"
+        nxt: str | None = url
+        while nxt:
+            r = _requests().get(nxt, headers=headers)
+            r.raise_for_status()
+            data = r.json()
+            yield data.get("value", []), data.get(_DELTA_LINK)
+            nxt = data.get(_NEXT_LINK)
+
+    def sync_folder(self, folder: str = "inbox", days: int = DEFAULT_SYNC_DAYS, max_age_s: float = 0.0) -> SyncStats:
+        """Bring ``folder``'s index up to date via its delta link.
+
+        The first sync (or one asking for more days than the stored window
+        covers) pulls the window from scratch; later ones only receive changes.
+        A delta link Graph no longer honours (HTTP 410) triggers one re-baseline.
+        ``max_age_s`` skips the round trip when the folder synced that recently.
+        """
+        index = self.message_index()
+        wanted_start = _iso_days_ago(days)
+        state = index.state(folder)
+        stats = SyncStats(folder=folder)
+        if state and state.window_start > wanted_start:
+            state = None
+        if state and max_age_s and time.time() - state.synced_at < max_age_s:
+            stats.skipped = True
+            return stats
+        if state is None:
+            index.reset(folder)
+        window_start = state.window_start if state else wanted_start
+        url = state.delta_link if state else self._initial_delta_url(folder, window_start)
+        stats.full = state is None
+        try:
+            self._follow_delta(index, folder, url, window_start, stats)
+        except Exception as exc:
+            if stats.full or getattr(getattr(exc, "response", None), "status_code", None) != 410:
+                raise
+            index.reset(folder)
+            stats = SyncStats(folder=folder, full=True)
+            self._follow_delta(index, folder, self._initial_delta_url(folder, wanted_start), wanted_start, stats)
+        return stats
+
+    def _follow_delta(self, index: MessageIndex, folder: str, url: str, window_start: str, stats: SyncStats) -> None:
+        for changes, delta_link in self._delta_pages(url):
+            stats.pages += 1
+            upserted, removed = index.apply(folder, changes)
+            stats.upserted += upserted
+            stats.removed += removed
+            if delta_link:
+                index.set_state(folder, delta_link, window_start)
+
+    def sync_folders(
+        self,
+        folders: Iterable[str],
+        days: int = DEFAULT_SYNC_DAYS,
+        max_workers: int = 16,
+    ) -> list[SyncStats | Exception | None]:
+        """Sync several folders concurrently; per-folder failures are returned, not raised.
+
+        Parallelism follows the shared Graph concurrency controller, so a
+        throttled mailbox backs off instead of stampeding; ``max_workers`` is
+        only the ceiling.
+        """
+        from core.http_transport import concurrency_for  # noqa: PLC0415 - lazy: keeps module import light
+
+        return parallel_map(
+            lambda f: self.sync_folder(f, days=days),
+            list(folders),
+            max_workers=max_workers,
+            return_exceptions=True,
+            concurrency=concurrency_for("graph"),
+        )
+
+    def indexed_messages(self, folder: str = "inbox", days: int | None = None) -> list[dict[str, Any]]:
+        """Sync ``folder`` (unless synced moments ago) and return its messages, newest first."""
+        window = max(int(days or 0), DEFAULT_SYNC_DAYS)
+        self.sync_folder(folder, days=window, max_age_s=_SYNC_FRESH_S)
+        return self.message_index().messages(folder, _iso_days_ago(days) if days else "")
+
+    def search_index(self, query: str, days: int | None, limit: int, folder: str = "inbox") -> list[dict[str, Any]] | None:
+        """Answer a windowed search from the index; None when it cannot (caller uses Graph)."""
+        if not days or int(days) <= 0:
+            return None
+        predicate = compile_local_query(query)
+        if predicate is None:
+            return None
+        hits = [m for m in self.indexed_messages(folder, days=int(days)) if predicate(m)]
+        return hits[: max(0, int(limit))]
@@ -19,7 +19,6 @@ from core.constants import (
 
 # Lazy optional deps: avoid importing on --help to prevent warnings/overhead
 msal = None  # type: ignore
-requests = None  # type: ignore
 
 def _msal():  # type: ignore
     global msal
@@ -30,7 +29,7 @@ def _msal():  # type: ignore
 
 
 class _TimeoutRequestsWrapper:
-    """Wrapper around requests module that adds default timeout to all calls."""
+    """Wrapper around a requests-style client that adds a default timeout to all calls."""
 
     def __init__(self, requests_module, default_timeout):
         self._requests = requests_module
@@ -65,12 +64,16 @@ _requests_wrapper = None  # type: ignore
 
 
 def _requests():  # type: ignore
-    """Return requests module wrapped with default timeout."""
-    global requests, _requests_wrapper
+    """Return the shared Graph transport, wrapped with the default timeout.
+
+    Every Graph call in core.outlook goes through here: keep-alive connections
+    are pooled per host, requests draw on the "graph" rate limiter, and 429/5xx
+    responses are retried with Retry-After-aware backoff (core.http_transport).
+    """
+    global _requests_wrapper
     if _requests_wrapper is None:  # pragma: no cover - optional import
-        import requests as _req  # type: ignore
-        requests = _req
-        _requests_wrapper = _TimeoutRequestsWrapper(_req, DEFAULT_REQUEST_TIMEOUT)
+        from core.http_transport import transport_for
+        _requests_wrapper = _TimeoutRequestsWrapper(transport_for("graph"), DEFAULT_REQUEST_TIMEOUT)
     return _requests_wrapper
 
 
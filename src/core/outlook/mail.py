@@ -12,6 +12,7 @@ from .client import OutlookClientBase, _requests
 from .models import MessageSearchQuery, SearchParams
 from ._mail_labels import LabelsFiltersMixin
 from ._mail_folders import FoldersMixin
+from ._mail_sync import SYNC_SELECT, MailSyncMixin
 from core.constants import GRAPH_API_URL
 
 _NEXT_LINK = "@odata.nextLink"
@@ -78,8 +79,8 @@ def _map_search_result(m: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
-    """Mixin providing all mail operations (categories, rules, messages, folders).
+class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin, MailSyncMixin):
+    """Mixin providing all mail operations (categories, rules, messages, folders, sync).
 
     Requires OutlookClientBase methods: _headers, _headers_search, cfg_get_json, cfg_put_json, cfg_clear.
     """
@@ -164,6 +165,16 @@ class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
                 break
         return msgs
 
+    def _search_indexed(self, params: "SearchParams") -> list[dict[str, Any]] | None:
+        """Inbox matches from the message index, or None when Graph must answer."""
+        if not params.use_index:
+            return None
+        return self.search_index(
+            params.search_query,
+            params.days,
+            limit=int(params.top) * max(1, int(params.pages)),
+        )
+
     def search_inbox_message_dicts(
         self: OutlookClientBase,
         params: SearchParams,
@@ -179,6 +190,9 @@ class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
         """
         import hashlib
 
+        indexed = self._search_indexed(params)
+        if indexed is not None:
+            return indexed
         key = None
         if self.cache_dir and params.use_cache:
             # Prefix must differ from search_inbox_messages' "search_": the two
@@ -206,6 +220,9 @@ class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
         """Return message IDs in Inbox matching $search query, optional days filter."""
         import hashlib
 
+        indexed = self._search_indexed(params)
+        if indexed is not None:
+            return [str(m["id"]) for m in indexed]
         key = None
         if self.cache_dir and params.use_cache:
             key = f"search_{hashlib.sha256(f'{params.search_query}|{params.top}|{params.pages}|{params.days}'.encode()).hexdigest()}"
@@ -225,10 +242,17 @@ class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
         folder: str = "inbox",
         top: int = 25,
         pages: int = 1,
+        use_index: bool = False,
     ) -> list[dict[str, Any]]:
-        """List messages in a folder with pagination."""
+        """List messages in a folder with pagination.
+
+        With ``use_index`` the newest ``top * pages`` messages come from the
+        delta-synced index, so repeat listings only transfer what changed.
+        """
+        if use_index:
+            return self.indexed_messages(folder)[: int(top) * max(1, int(pages))]
         base = f"{GRAPH_API_URL}/me/mailFolders/{folder}/messages"
-        url = f"{base}?$top={int(top)}&$orderby=receivedDateTime desc"
+        url = f"{base}?$top={int(top)}&$orderby=receivedDateTime desc&$select={SYNC_SELECT}"
         msgs: list[dict[str, Any]] = []
         for _ in range(max(1, int(pages))):
             r = _requests().get(url, headers=self._headers())
@@ -248,6 +272,10 @@ class OutlookMailMixin(LabelsFiltersMixin, FoldersMixin):
             json=body,
         )
         r.raise_for_status()
+        if self._message_index is not None:
+            # The move shows up as a removal on the next delta; drop it now so
+            # a later search in the same run does not return it again.
+            self._message_index.discard(msg_id)
 
     def get_message(
         self: OutlookClientBase,
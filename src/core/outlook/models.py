@@ -240,6 +240,9 @@ class SearchParams:
     pages: int = 2
     use_cache: bool = True
     ttl: int = 300
+    # Answer from the delta-synced message index when the query and window
+    # allow it (see _mail_sync); falls back to Graph $search otherwise.
+    use_index: bool = False
 
 
 @dataclass
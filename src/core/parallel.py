@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TypeVar
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
-__all__ = ["chunked", "parallel_map"]
+__all__ = ["AdaptiveConcurrency", "ThrottleEvent", "chunked", "parallel_map"]
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -24,23 +30,194 @@ def chunked(seq: Iterable[T], size: int) -> Iterator[list[T]]:
         yield list(items[i : i + n])
 
 
+_THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThrottleEvent:
+    """One throttle signal and the concurrency limit it left behind."""
+
+    at: float
+    status: int
+    retry_after: float | None
+    limit: int
+
+
+def throttle_status(exc: BaseException) -> int | None:
+    """HTTP status of a throttling error (requests or googleapiclient style), else None."""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "resp", None), "status", None)
+    try:
+        status = int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+    return status if status in _THROTTLE_STATUS_CODES else None
+
+
+def _exc_retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or getattr(exc, "resp", None) or {}
+    try:
+        value = headers.get("Retry-After") or headers.get("retry-after")
+    except AttributeError:
+        return None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit shared by every thread that uses it.
+
+    Work runs inside ``slot()``, which blocks while ``limit`` slots are busy.
+    Each success adds ``1/limit`` (so the limit grows by one per window of
+    successes); a 429/503 halves it, at most once per cooldown so a burst of
+    throttled responses from one window only counts once. A Retry-After also
+    holds new slots until it elapses. Share one instance per API (see
+    ``core.http_transport.concurrency_for``) so concurrent fan-outs split one
+    budget instead of each stampeding the API.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease: float = 0.5,
+        cooldown_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self._limit = float(min(max(int(initial), self.min_limit), self.max_limit))
+        self._decrease = decrease
+        self._cooldown_s = cooldown_s
+        self._clock = clock
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self.successes = 0
+        self.throttles = 0
+        self.events: deque[ThrottleEvent] = deque(maxlen=64)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _wait_time(self) -> float | None:
+        """Seconds until a slot may open (0 = now), or None to wait for a release."""
+        pause = self._paused_until - self._clock()
+        if pause > 0:
+            return pause
+        return 0.0 if self._in_flight < int(self._limit) else None
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                wait = self._wait_time()
+                if wait == 0.0:
+                    self._in_flight += 1
+                    return
+                self._cond.wait(wait)
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_success(self) -> None:
+        with self._cond:
+            self.successes += 1
+            if self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                self._cond.notify()
+
+    def record_throttle(self, status: int = 429, retry_after: float | None = None) -> None:
+        """Multiplicative decrease (once per cooldown) and hold slots for ``retry_after``."""
+        with self._cond:
+            now = self._clock()
+            self.throttles += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if now - self._last_decrease < max(self._cooldown_s, retry_after or 0.0):
+                return
+            self._last_decrease = now
+            before = self.limit
+            self._limit = max(float(self.min_limit), float(int(self._limit * self._decrease)))
+            event = ThrottleEvent(at=now, status=status, retry_after=retry_after, limit=self.limit)
+            self.events.append(event)
+        logger.info(
+            "concurrency %s: HTTP %d, limit %d -> %d%s",
+            self.name or "-", status, before, event.limit,
+            f" (Retry-After={retry_after:g}s)" if retry_after else "",
+        )
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "successes": self.successes,
+                "throttles": self.throttles,
+                "decreases": len(self.events),
+            }
+
+    def run(self, func: Callable[[T], R], item: T) -> R:
+        """Call ``func(item)`` in a slot, feeding its outcome back into the limit."""
+        with self.slot():
+            try:
+                result = func(item)
+            except Exception as exc:
+                status = throttle_status(exc)
+                if status is not None:
+                    self.record_throttle(status, _exc_retry_after(exc))
+                raise
+        self.record_success()
+        return result
+
+
 def parallel_map(
     func: Callable[[T], R],
     items: Iterable[T],
     *,
     max_workers: int = 16,
     return_exceptions: bool = False,
+    concurrency: AdaptiveConcurrency | None = None,
 ) -> list[R | Exception | None]:
     """Run ``func`` over ``items`` in a thread pool; return order-preserving results.
 
     On per-item failure: inserts the exception if ``return_exceptions=True``,
     otherwise inserts ``None``.
+
+    With ``concurrency``, ``max_workers`` is only the ceiling: items run in
+    the controller's slots, so the effective parallelism follows its AIMD
+    limit (shared with any other caller using the same controller).
     """
     it_list: list[T] = list(items)
     n = max(1, int(max_workers or 1))
     results: list[R | Exception | None] = [None] * len(it_list)
     with ThreadPoolExecutor(max_workers=n) as ex:
-        futs = {ex.submit(func, it): idx for idx, it in enumerate(it_list)}
+        if concurrency is None:
+            futs = {ex.submit(func, it): idx for idx, it in enumerate(it_list)}
+        else:
+            futs = {ex.submit(concurrency.run, func, it): idx for idx, it in enumerate(it_list)}
         for fut in as_completed(futs):
             idx = futs[fut]
             try:
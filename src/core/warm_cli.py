@@ -0,0 +1,370 @@
+"""Run allow-listed assistant CLIs in warm, pre-started interpreters.
+
+The worker's ``run_cli`` jobs and the workflow engine's invoke stages start a
+fresh ``bin/<cli>`` subprocess per command. For short commands, interpreter
+startup, ``sys.path`` setup and importing the assistant package cost more
+than the command itself. ``WarmCliPool`` keeps a few long-lived worker processes
+that import the allow-listed CLIs once and then call their ``main(argv)``
+per job.
+
+Isolation between jobs:
+
+- every job runs in a worker process, never in the caller's process, and a
+  worker runs one job at a time;
+- the job's env overlay and cwd are applied for the call and restored after;
+- stdout/stderr are captured both as ``sys.stdout``/``sys.stderr`` and at
+  the file-descriptor level, so output from child processes a CLI starts is
+  captured too;
+- a job that exceeds its timeout kills only its own worker, which is
+  replaced on demand; workers are also recycled every
+  ``max_tasks_per_child`` jobs so module-level state cannot accumulate
+  indefinitely.
+
+In-process execution is opt-in: set ``DANCING_BEAR_INPROCESS_CLI=1`` or pass
+``"inprocess": true`` in a ``run_cli`` job payload.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import subprocess  # nosec B404 - only for the TimeoutExpired type
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from importlib import import_module
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from core.assistant_cli import APP_MODULES
+
+ENV_INPROCESS = "DANCING_BEAR_INPROCESS_CLI"
+
+# bin/ wrapper name -> APP_MODULES key. Deliberately excludes the worker CLI
+# itself and CLIs that drive long-lived or interactive sessions.
+INPROCESS_BINS: dict[str, str] = {
+    "mail": "mail",
+    "mail-assistant": "mail",
+    "calendar": "calendar",
+    "calendar-assistant": "calendar",
+    "schedule": "schedule",
+    "schedule-assistant": "schedule",
+    "phone": "phone",
+    "phone-assistant": "phone",
+    "resume": "resume",
+    "whatsapp": "whatsapp",
+}
+
+# warm_cli.py lives at <root>/src/core/; only wrappers in <root>/bin qualify.
+REPO_BIN = Path(__file__).resolve().parents[2] / "bin"
+
+_DEFAULT_WORKERS = 2
+_DEFAULT_TASKS_PER_CHILD = 100
+
+
+def inprocess_requested(flag: object = None) -> bool:
+    """True when a job asked for in-process execution, or the env opts in globally."""
+    if flag is not None:
+        return str(flag).strip().lower() in {"1", "true", "yes", "on"}
+    return os.environ.get(ENV_INPROCESS, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def app_for_bin(prog: str) -> str | None:
+    """APP_MODULES key for a path to one of this repo's ``bin/`` wrappers, or None.
+
+    Bare names are left to the shell: PATH lookup may find an unrelated
+    program (``/usr/bin/mail``). Relative paths resolve against the cwd, as
+    the shell would resolve them.
+    """
+    p = Path(prog)
+    if p.parent == Path("."):
+        return None
+    try:
+        resolved = p.resolve()
+    except (OSError, RuntimeError):
+        return None
+    if resolved.parent != REPO_BIN or not resolved.is_file():
+        return None
+    return INPROCESS_BINS.get(resolved.name)
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _call_main(app: str, argv: list[str]) -> int:
+    try:
+        main = getattr(import_module(APP_MODULES.get(app, app)), "main")
+        return _exit_code(main(argv))
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except BaseException:  # noqa: BLE001 - a job must never take the pool worker down with it
+        traceback.print_exc()
+        return 1
+
+
+def _capture_stream(f: Any) -> io.TextIOWrapper:
+    """Text stream writing straight through to ``f``'s file."""
+    raw = io.FileIO(os.dup(f.fileno()), "w")
+    return io.TextIOWrapper(raw, encoding="utf-8", errors="replace", write_through=True)
+
+
+def run_in_this_process(
+    app: str,
+    argv: list[str],
+    env_overlay: dict[str, str] | None = None,
+    cwd: str | None = None,
+) -> dict[str, Any]:
+    """Run one CLI invocation here, capturing its output. Pool worker entry point.
+
+    ``app`` is an APP_MODULES key or a module name exposing ``main(argv)``.
+    Returns the same ``{"returncode", "stdout", "stderr"}`` shape as the
+    subprocess runners.
+    """
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    saved_streams = (sys.stdout, sys.stderr)
+    with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = (os.dup(1), os.dup(2))
+        os.dup2(out_f.fileno(), 1)
+        os.dup2(err_f.fileno(), 2)
+        # sys.stdout may not be backed by fd 1 (pytest capture, a replaced
+        # stream); unbuffered writers over the same files keep Python-level
+        # and fd-level output in the order it was written.
+        captured = (_capture_stream(out_f), _capture_stream(err_f))
+        sys.stdout, sys.stderr = captured
+        try:
+            os.environ.update({k: str(v) for k, v in (env_overlay or {}).items()})
+            if cwd:
+                os.chdir(cwd)
+            returncode = _call_main(app, list(argv))
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:  # nosec B110 - a CLI may have closed its own stream
+                    pass
+            sys.stdout, sys.stderr = saved_streams
+            for stream in captured:
+                try:
+                    stream.close()
+                except Exception:  # nosec B110 - a CLI may have closed its own stream
+                    pass
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            for fd in saved_fds:
+                os.close(fd)
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+        out_f.seek(0)
+        err_f.seek(0)
+        return {
+            "returncode": returncode,
+            "stdout": out_f.read().decode("utf-8", errors="replace"),
+            "stderr": err_f.read().decode("utf-8", errors="replace"),
+        }
+
+
+def _warm_up(apps: tuple[str, ...]) -> None:
+    """Import each allow-listed CLI once per worker."""
+    for app in apps:
+        try:
+            import_module(APP_MODULES.get(app, app))
+        except Exception:  # nosec B110 - a broken CLI fails its own jobs, not the pool
+            pass
+
+
+def _serve(conn: Connection, apps: tuple[str, ...]) -> None:
+    """Worker process loop: warm up, then run one job per message until told to stop."""
+    _warm_up(apps)
+    conn.send(os.getpid())
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        conn.send(run_in_this_process(*job))
+
+
+class _Worker:
+    """One warm interpreter and the pipe its jobs and results travel over."""
+
+    def __init__(self, ctx: Any, apps: tuple[str, ...]) -> None:
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_serve, args=(child, apps), daemon=True)
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.tasks = 0
+
+    def _recv(self, deadline: float | None) -> Any:
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.conn.poll(wait):
+            raise TimeoutError
+        return self.conn.recv()  # EOFError when the process died
+
+    def wait_ready(self, deadline: float | None = None) -> None:
+        if not self.ready:
+            self._recv(deadline)
+            self.ready = True
+
+    def call(self, job: tuple, timeout: float | None) -> dict[str, Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.wait_ready(deadline)
+        self.conn.send(job)
+        return self._recv(deadline)
+
+    def stop(self, *, kill: bool) -> None:
+        if not kill:
+            try:
+                self.conn.send(None)
+            except OSError:
+                kill = True
+        if kill:
+            self.process.kill()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WarmCliPool:
+    """A pool of interpreters with the assistant CLIs already imported.
+
+    Each job has a worker process to itself for its duration, so a timed-out
+    or crashed job is handled by replacing only that worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _DEFAULT_WORKERS,
+        *,
+        max_tasks_per_child: int = _DEFAULT_TASKS_PER_CHILD,
+        apps: tuple[str, ...] | None = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.apps = apps if apps is not None else tuple(sorted(set(INPROCESS_BINS.values())))
+        # spawn: workers must not inherit the caller's threads or locks.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _acquire(self) -> _Worker:
+        with self._cond:
+            while not self._closed and not self._idle and self._live >= self.max_workers:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("in-process CLI pool is shut down")
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+        try:
+            return _Worker(self._ctx, self.apps)
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        with self._cond:
+            if not self._closed:
+                self._idle.append(worker)
+                self._cond.notify()
+                return
+        self._retire(worker, kill=False)
+
+    def _retire(self, worker: _Worker, *, kill: bool) -> None:
+        worker.stop(kill=kill)
+        with self._cond:
+            self._live -= 1
+            self._cond.notify()
+
+    def start(self) -> None:
+        """Start every worker now rather than on the first jobs."""
+        workers = [self._acquire() for _ in range(self.max_workers - len(self._idle))]
+        try:
+            for worker in workers:
+                worker.wait_ready()
+        finally:
+            for worker in workers:
+                self._release(worker)
+
+    def run(
+        self,
+        app: str,
+        argv: list[str],
+        *,
+        env_overlay: dict[str, str] | None = None,
+        cwd: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Run ``app``'s main(argv) in a warm worker.
+
+        Raises subprocess.TimeoutExpired on timeout, like the subprocess path,
+        and RuntimeError if the worker process died. Either way only the
+        worker that ran this job is replaced.
+        """
+        worker = self._acquire()
+        try:
+            result = worker.call((app, list(argv), env_overlay, cwd), timeout)
+        except TimeoutError:
+            self._retire(worker, kill=True)
+            raise subprocess.TimeoutExpired([app, *argv], timeout or 0) from None
+        except (EOFError, OSError) as exc:
+            self._retire(worker, kill=True)
+            raise RuntimeError(f"in-process CLI worker died: {exc!r}") from exc
+        worker.tasks += 1
+        if worker.tasks >= self.max_tasks_per_child:
+            self._retire(worker, kill=False)
+        else:
+            self._release(worker)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the idle workers; a worker still running a job stops once it returns.
+
+        Later ``run`` calls raise RuntimeError.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop(kill=False)
+
+
+_shared: WarmCliPool | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool() -> WarmCliPool:
+    """The process-wide pool (size from DANCING_BEAR_INPROCESS_WORKERS, default 2)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            try:
+                workers = int(os.environ.get("DANCING_BEAR_INPROCESS_WORKERS") or _DEFAULT_WORKERS)
+            except ValueError:
+                workers = _DEFAULT_WORKERS
+            _shared = WarmCliPool(workers)
+        return _shared
@@ -144,6 +144,50 @@ def cmd_render(args) -> int:
     return run_pipeline(request, RenderDiagramProcessor, RenderDiagramProducer)
 
 
+@app.command("render-all", help="Render many .mmd files in one mmdc launch (cached)")
+@app.argument("inputs", nargs="+", help="Input .mmd files")
+@app.argument("--out-dir", "-d", type=str, required=True, help="Directory for rendered files (<stem>.<format>)")
+@app.argument("--format", "-f", choices=["svg", "png", "pdf"], default="svg", help="Output format (default: svg)")
+@app.argument("--timeout", type=int, default=120, help="Timeout in seconds per mmdc launch")
+@app.argument("--theme", choices=["default", "forest", "dark", "neutral"], help="Mermaid theme")
+@app.argument("--background", "-b", type=str, help="Background color (e.g. 'white', 'transparent')")
+@app.argument("--width", "-w", type=int, help="Width in pixels (PNG only)")
+@app.argument("--height", type=int, help="Height in pixels (PNG only)")
+def cmd_render_all(args) -> int:
+    """Render several .mmd files with shared options; unchanged diagrams come from the cache."""
+    import os
+
+    sources: list[str] = []
+    for path in args.inputs:
+        text = _read_input(path)
+        if text is None or not _validate_non_empty(text):
+            return 1
+        sources.append(text)
+
+    from .renderers import LocalRenderer, LocalRendererError, RenderOptions
+
+    opts = RenderOptions(
+        output_format=args.format,
+        background=getattr(args, "background", None),
+        theme=getattr(args, "theme", None),
+        width=getattr(args, "width", None),
+        height=getattr(args, "height", None),
+    )
+    try:
+        rendered = LocalRenderer(timeout=args.timeout).render_many(sources, opts)
+    except LocalRendererError as e:
+        print(f"Error: {e.message}", file=sys.stderr)
+        return 1
+    os.makedirs(args.out_dir, exist_ok=True)
+    for path, data in zip(args.inputs, rendered):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        out = os.path.join(args.out_dir, f"{stem}.{args.format}")
+        with open(out, "wb") as f:
+            f.write(data)
+        print(f"Rendered to: {out}")
+    return 0
+
+
 @app.command("validate", help="Validate mermaid syntax via mmdc")
 @app.argument("--input", "-i", type=str, help="Input .mmd file (stdin if omitted)")
 @app.argument("--timeout", type=int, default=60, help="Timeout in seconds")
@@ -1,7 +1,8 @@
 """Mermaid diagram renderers.
 
 TextRenderer: zero-dependency plain text output.
-LocalRenderer: renders via local mmdc CLI (requires @mermaid-js/mermaid-cli).
+LocalRenderer: renders via local mmdc CLI (requires @mermaid-js/mermaid-cli),
+through the shared content-addressed cache in ``core.mermaid_render``.
 """
 
 from __future__ import annotations
@@ -12,10 +13,12 @@ from pathlib import Path
 from core.cli_errors import CLIError, ExitCode
 from core.pipeline import BaseProducer, SafeProcessor
 
+from core.mermaid_render import MermaidJob, MermaidRenderError, render_many as render_jobs
+
 
 @dataclass(frozen=True)
 class RenderOptions:
-    """Visual rendering options shared by render/render_to_file/_build_command.
+    """Visual rendering options shared by render/render_many/render_to_file.
 
     output_format: format override; inferred from output extension when None.
     background: Background color (e.g. ``"white"``, ``"transparent"``).
@@ -149,24 +152,6 @@ class LocalRenderer:
             return diagram
         return diagram.render()  # type: ignore[union-attr]
 
-    def _build_command(
-        self,
-        input_path: str,
-        output_path: str,
-        opts: RenderOptions,
-    ) -> list[str]:
-        """Build the mmdc command list from input/output paths and render options."""
-        cmd = [self.mmdc_path, "-i", input_path, "-o", output_path]
-        if opts.background:
-            cmd.extend(["-b", opts.background])
-        if opts.theme:
-            cmd.extend(["-t", opts.theme])
-        if opts.width:
-            cmd.extend(["-w", str(opts.width)])
-        if opts.height:
-            cmd.extend(["-H", str(opts.height)])
-        return cmd
-
     def _run(self, cmd: list[str]) -> None:
         import subprocess
         try:
@@ -198,6 +183,42 @@ class LocalRenderer:
             "Use --format or a recognised extension (.svg, .png, .pdf)."
         )
 
+    def _job(self, diagram: object, opts: RenderOptions, output_format: str) -> MermaidJob:
+        mermaid_text = self._get_mermaid_text(diagram)
+        if opts.theme == "dark":
+            from .dark_mode import apply_dark_mode_fixes
+            mermaid_text = apply_dark_mode_fixes(mermaid_text)
+        return MermaidJob(
+            text=mermaid_text,
+            output_format=output_format,
+            background=opts.background,
+            theme=opts.theme,
+            width=opts.width,
+            height=opts.height,
+        )
+
+    def render_many(
+        self,
+        diagrams: list[object],
+        opts: RenderOptions | None = None,
+    ) -> list[bytes]:
+        """Render several diagrams with the same options, in order.
+
+        Cached diagrams are not re-rendered; the rest share one mmdc launch.
+
+        Raises:
+            LocalRendererError: If rendering fails.
+        """
+        opts = opts or RenderOptions()
+        output_format = opts.output_format or "svg"
+        if output_format not in {"svg", "png", "pdf"}:
+            raise ValueError(f"Unsupported format {output_format!r}")
+        jobs = [self._job(diagram, opts, output_format) for diagram in diagrams]
+        try:
+            return render_jobs(jobs, mmdc_path=self.mmdc_path, run=self._run)
+        except MermaidRenderError as e:
+            raise LocalRendererError(str(e)) from e
+
     def render(
         self,
         diagram: object,
@@ -216,31 +237,7 @@ class LocalRenderer:
         Raises:
             LocalRendererError: If rendering fails.
         """
-        import pathlib
-        import tempfile
-
-        opts = opts or RenderOptions()
-        output_format = opts.output_format or "svg"
-
-        mermaid_text = self._get_mermaid_text(diagram)
-        if opts.theme == "dark":
-            from .dark_mode import apply_dark_mode_fixes
-            mermaid_text = apply_dark_mode_fixes(mermaid_text)
-
-        if output_format not in {"svg", "png", "pdf"}:
-            raise ValueError(f"Unsupported format {output_format!r}")
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            inp = pathlib.Path(tmpdir) / "input.mmd"
-            out = pathlib.Path(tmpdir) / f"output.{output_format}"
-            inp.write_text(mermaid_text)
-
-            cmd = self._build_command(str(inp), str(out), opts)
-            self._run(cmd)
-
-            if not out.exists():
-                raise LocalRendererError("mmdc did not produce output file")
-            return out.read_bytes()
+        return self.render_many([diagram], opts)[0]
 
     def render_to_file(
         self,
@@ -263,32 +260,23 @@ class LocalRenderer:
             LocalRendererError: If rendering fails.
             ValueError: If the output format cannot be determined.
         """
+        import dataclasses
         import pathlib
-        import tempfile
 
         opts = opts or RenderOptions()
-        # Validate the target format up front (raises ValueError on an unknown
-        # extension); mmdc derives the actual output format from output_path's
-        # extension, so _build_command only needs the visual options
-        # (background/theme/size) carried by opts.
-        if opts.output_format is None:
-            self._infer_format(output_path)
-
-        mermaid_text = self._get_mermaid_text(diagram)
-        if opts.theme == "dark":
-            from .dark_mode import apply_dark_mode_fixes
-            mermaid_text = apply_dark_mode_fixes(mermaid_text)
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".mmd", delete=False) as f:
-            f.write(mermaid_text)
-            tmp_input = f.name
-
+        # mmdc picks the format from the output extension, so a recognised
+        # extension wins over output_format; otherwise output_format is used
+        # (and an unknown extension without one raises ValueError).
         try:
-            cmd = self._build_command(tmp_input, output_path, opts)
-            self._run(cmd)
-            return output_path
-        finally:
-            pathlib.Path(tmp_input).unlink(missing_ok=True)
+            output_format = self._infer_format(output_path)
+        except ValueError:
+            if opts.output_format is None:
+                raise
+            output_format = opts.output_format
+
+        data = self.render(diagram, dataclasses.replace(opts, output_format=output_format))
+        pathlib.Path(output_path).write_bytes(data)
+        return output_path
 
     def validate_syntax(self, diagram: object) -> tuple[bool, str | None]:
         """Validate Mermaid syntax by attempting an SVG render.
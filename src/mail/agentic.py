@@ -15,6 +15,17 @@ from core.agentic import (
 from core.textio import read_text as _read_text
 
 
+# Working-directory files the full capsule embeds, when present.
+_CONTEXT_FILES = (
+    ".llm/CONTEXT.md",
+    ".llm/UNIFIED.llm",
+    ".llm/DOMAIN_MAP.md",
+    ".llm/MIGRATION_STATE.md",
+    ".llm/PATTERNS.md",
+    "AGENTS.md",
+)
+
+
 def build_agentic_capsule(compact: bool = False) -> str:
     """Return a compact, LLM-friendly capsule of repo context as a string.
 
@@ -23,7 +34,6 @@ def build_agentic_capsule(compact: bool = False) -> str:
                  skip .llm context files for token efficiency).
     """
     root = Path(os.getcwd())
-    llm = root / ".llm"
 
     commands = [
         "setup venv: python3 -m venv .venv && source .venv/bin/activate",
@@ -42,15 +52,7 @@ def build_agentic_capsule(compact: bool = False) -> str:
 
     if not compact:
         # Full mode: include .llm context files
-        files: list[Path] = [
-            llm / "CONTEXT.md",
-            llm / "UNIFIED.llm",
-            llm / "DOMAIN_MAP.md",
-            llm / "MIGRATION_STATE.md",
-            llm / "PATTERNS.md",
-            root / "AGENTS.md",
-        ]
-        for p in files:
+        for p in (root / rel for rel in _CONTEXT_FILES):
             if not p.exists():
                 continue
             title = f"{p.parent.name}/{p.name}" if p.parent.name == ".llm" else p.name
@@ -107,6 +109,16 @@ _FOLDER_SECTIONS = [
 ]
 
 
+# Everything the capsule and domain map read relative to the working
+# directory, for keying cached copies of them (see core.llm_derive).
+CWD_INPUTS: tuple[str, ...] = (
+    *_CONTEXT_FILES,
+    "bin",
+    *_KEY_FILES,
+    *(folder for _, folder in _FOLDER_SECTIONS),
+)
+
+
 def _list_folder_modules(root: Path, folder: str) -> list[tuple[str, str]]:
     """Return (name, first-doc-line) pairs for Python files in a folder."""
     items: list[tuple[str, str]] = []
@@ -312,6 +324,16 @@ def _mail_flows() -> list[dict[str, Any]]:
                 "./bin/mail-assistant auto apply --proposal out/auto.proposal.json --cutoff-days 7 --dry-run",
             ],
         },
+        {
+            'id': 'gmail.auto.run',
+            'title': 'Auto (categorize + archive) — Streaming propose + apply in one pass',
+            'tags': ['gmail', 'auto', 'propose', 'apply', 'streaming', 'dry-run'],
+            'requires': [["auto", "run"], ["auto", "summary"]],
+            'commands': [
+                "./bin/mail-assistant auto run --out out/auto.proposal.jsonl --days 7 --cutoff-days 7 --dry-run",
+                "./bin/mail-assistant auto summary --proposal out/auto.proposal.jsonl",
+            ],
+        },
     ]
 
 
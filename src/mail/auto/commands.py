@@ -6,22 +6,27 @@ from pathlib import Path
 from ..context import MailContext
 from .consumers import (
     AutoProposeConsumer,
+    AutoStreamConsumer,
     AutoSummaryConsumer,
     AutoApplyConsumer,
 )
 from .processors import (
     AutoProposeProcessor,
+    AutoStreamProcessor,
     AutoSummaryProcessor,
     AutoApplyProcessor,
 )
 from .producers import (
     AutoProposeProducer,
+    AutoStreamProducer,
     AutoSummaryProducer,
     AutoApplyProducer,
 )
 
 
 def run_auto_propose(args) -> int:
+    if Path(args.out).suffix == ".jsonl":
+        return _run_auto_stream(args, apply=False)
     context = MailContext.from_args(args)
     consumer = AutoProposeConsumer(
         context=context,
@@ -69,3 +74,31 @@ def run_auto_apply(args) -> int:
     envelope = processor.process(payload)
     producer.produce(envelope)
     return 0 if envelope.ok() else int((envelope.diagnostics or {}).get("code", 1))
+
+
+def run_auto_run(args) -> int:
+    """Propose and apply in one streaming pass."""
+    return _run_auto_stream(args, apply=True)
+
+
+def _run_auto_stream(args, *, apply: bool) -> int:
+    context = MailContext.from_args(args)
+    consumer = AutoStreamConsumer(
+        context=context,
+        out_path=Path(args.out),
+        days=int(args.days),
+        pages=int(args.pages),
+        protect=getattr(args, "protect", []) or [],
+        apply=apply,
+        cutoff_days=getattr(args, "cutoff_days", None),
+        batch_size=getattr(args, "batch_size", 500),
+        dry_run=getattr(args, "dry_run", False),
+        log_path=getattr(args, "log", "logs/auto_runs.jsonl"),
+    )
+    processor = AutoStreamProcessor()
+    producer = AutoStreamProducer()
+
+    payload = consumer.consume()
+    envelope = processor.process(payload)
+    producer.produce(envelope)
+    return 0 if envelope.ok() else int((envelope.diagnostics or {}).get("code", 1))
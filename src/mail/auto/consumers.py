@@ -4,8 +4,9 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from core.fileutil import iter_jsonl_file
 from core.pipeline import Consumer
 
 from ..context import MailContext
@@ -24,6 +25,22 @@ class AutoProposePayload:
     log_path: str = "logs/auto_runs.jsonl"
 
 
+@dataclass
+class AutoStreamPayload:
+    """Payload for streaming propose (optionally applying as it goes)."""
+
+    context: MailContext
+    out_path: Path
+    days: int
+    pages: int
+    protect: list[str] = field(default_factory=list)
+    apply: bool = False
+    cutoff_days: int | None = None
+    batch_size: int = 500
+    dry_run: bool = False
+    log_path: str = "logs/auto_runs.jsonl"
+
+
 @dataclass
 class AutoSummaryPayload:
     """Payload for auto summary."""
@@ -54,6 +71,43 @@ class AutoProposeConsumer(Consumer[AutoProposePayload]):
         return AutoProposePayload(context=self._context, **self._kwargs)
 
 
+def _iter_jsonl_messages(path: Path) -> Iterator[dict[str, Any]]:
+    # Tolerant: an interrupted streaming run can leave a truncated last line.
+    for rec in iter_jsonl_file(path, tolerant=True):
+        if isinstance(rec, dict) and rec.get("id"):
+            yield rec
+
+
+def load_proposal(path: Path) -> dict[str, Any]:
+    """Read a proposal file.
+
+    ``.jsonl`` proposals (written by the streaming propose) start with a header
+    record followed by one message per line; their ``messages`` are returned as
+    a lazy iterator so large proposals are never held in memory at once.
+    """
+    if path.suffix != ".jsonl":
+        return json.loads(path.read_text(encoding="utf-8"))
+    header: dict[str, Any] = {}
+    with path.open(encoding="utf-8") as fh:
+        first = fh.readline().strip()
+    if first:
+        rec = json.loads(first)
+        if isinstance(rec, dict) and not rec.get("id"):
+            header = rec
+    return {**header, "messages": _iter_jsonl_messages(path)}
+
+
+class AutoStreamConsumer(Consumer[AutoStreamPayload]):
+    """Consume args to create streaming propose payload."""
+
+    def __init__(self, context: MailContext, **kwargs):
+        self._context = context
+        self._kwargs = kwargs
+
+    def consume(self) -> AutoStreamPayload:
+        return AutoStreamPayload(context=self._context, **self._kwargs)
+
+
 class AutoSummaryConsumer(Consumer[AutoSummaryPayload]):
     """Consume proposal file to create summary payload."""
 
@@ -61,7 +115,7 @@ class AutoSummaryConsumer(Consumer[AutoSummaryPayload]):
         self._proposal_path = proposal_path
 
     def consume(self) -> AutoSummaryPayload:
-        proposal = json.loads(self._proposal_path.read_text(encoding="utf-8"))
+        proposal = load_proposal(self._proposal_path)
         return AutoSummaryPayload(proposal=proposal)
 
 
@@ -74,5 +128,5 @@ class AutoApplyConsumer(Consumer[AutoApplyPayload]):
         self._kwargs = kwargs
 
     def consume(self) -> AutoApplyPayload:
-        proposal = json.loads(self._proposal_path.read_text(encoding="utf-8"))
+        proposal = load_proposal(self._proposal_path)
         return AutoApplyPayload(context=self._context, proposal=proposal, **self._kwargs)
@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 import time
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from core.pipeline import SafeProcessor
 
-from .consumers import AutoProposePayload, AutoSummaryPayload, AutoApplyPayload
+from .consumers import AutoProposePayload, AutoStreamPayload, AutoSummaryPayload, AutoApplyPayload
 
 
 _PROMO_KEYWORDS = ["sale", "% off", "percent off", "deal", "promo", "clearance", "free shipping", "coupon"]
@@ -61,7 +61,8 @@ def classify_low_interest(msg: dict) -> dict | None:
         "reasons": reasons,
         "from": from_addr,
         "subject": hdrs.get("subject") or "",
-        "ts": int(msg.get("internalDate", 0)),
+        # internalDate is epoch milliseconds; ts is compared with a cutoff in seconds.
+        "ts": int(msg.get("internalDate", 0)) // 1000,
     }
 
 
@@ -94,6 +95,23 @@ def _is_protected(from_val: str, protected_patterns: list[str]) -> bool:
     )
 
 
+def _protect_patterns(protect: list[str]) -> list[str]:
+    return [p.strip().lower() for p in protect if p and isinstance(p, str)]
+
+
+def _proposal_record(msg: dict, protected_patterns: list[str]) -> dict | None:
+    """Proposal entry for ``msg``, or None when protected or not low-interest."""
+    from ..gmail_api import GmailClient
+
+    hdrs = GmailClient.headers_to_dict(msg)
+    if _is_protected(hdrs.get("from", ""), protected_patterns):
+        return None
+    act = classify_low_interest(msg)
+    if not act:
+        return None
+    return {"id": msg.get("id"), "threadId": msg.get("threadId"), **act}
+
+
 @dataclass
 class AutoProposeResult:
     """Result of auto propose."""
@@ -129,7 +147,6 @@ class AutoProposeProcessor(SafeProcessor[AutoProposePayload, AutoProposeResult])
         import json
 
         from ..applog import AppLogger
-        from ..gmail_api import GmailClient
         from ..utils.gmail_ops import MessageQueryParams, fetch_messages_with_metadata
 
         logger = AppLogger(payload.log_path)
@@ -145,22 +162,8 @@ class AutoProposeProcessor(SafeProcessor[AutoProposePayload, AutoProposeResult])
                 MessageQueryParams(query=q, pages=payload.pages),
             )
 
-            selected = []
-            prot = [p.strip().lower() for p in payload.protect if p and isinstance(p, str)]
-
-            for m in msgs:
-                hdrs = GmailClient.headers_to_dict(m)
-                if _is_protected(hdrs.get("from", ""), prot):
-                    continue
-                act = classify_low_interest(m)
-                if act:
-                    selected.append(
-                        {
-                            "id": m.get("id"),
-                            "threadId": m.get("threadId"),
-                            **act,
-                        }
-                    )
+            prot = _protect_patterns(payload.protect)
+            selected = [rec for rec in (_proposal_record(m, prot) for m in msgs) if rec]
 
             doc = {
                 "generated_at": int(time.time()),
@@ -193,32 +196,81 @@ class AutoSummaryProcessor(SafeProcessor[AutoSummaryPayload, AutoSummaryResult])
         msgs = payload.proposal.get("messages") or []
         reasons: Counter = Counter()
         add_labels: Counter = Counter()
+        count = 0
 
         for m in msgs:
+            count += 1
             for r in m.get("reasons") or []:
                 reasons[r] += 1
             for a in m.get("add") or []:
                 add_labels[a] += 1
 
         return AutoSummaryResult(
-            message_count=len(msgs),
+            message_count=count,
             reasons=dict(reasons.most_common(10)),
             label_adds=dict(add_labels.most_common()),
         )
 
 
-def _group_messages_by_labels(
-    msgs: list, name_to_id: dict, cutoff_ts: int | None
-) -> dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]]:
-    """Group message IDs by their (add_ids, remove_ids) label signature."""
-    groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]] = defaultdict(list)
-    for m in msgs:
-        if cutoff_ts and int(m.get("ts", 0)) > cutoff_ts:
-            continue
-        add_ids = tuple(sorted(name_to_id.get(x) or x for x in (m.get("add") or [])))
-        rem_ids = tuple(sorted(name_to_id.get(x) or x for x in (m.get("remove") or [])))
-        groups[(add_ids, rem_ids)].append(m.get("id"))
-    return groups
+LabelSignature = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+class _LabelBatcher:
+    """Accumulate message IDs per (add_ids, remove_ids) signature and flush full batches.
+
+    ``batchModify`` takes one label change for up to ``batch_size`` IDs, so a
+    group is sent as soon as it fills rather than after the whole proposal has
+    been grouped. ``flush`` sends the partial remainders at the end.
+    """
+
+    def __init__(self, client, name_to_id: dict, *, batch_size: int, dry_run: bool, cutoff_ts: int | None = None):
+        self._client = client
+        self._name_to_id = name_to_id
+        self._batch_size = max(1, int(batch_size))
+        self._dry_run = dry_run
+        self._cutoff_ts = cutoff_ts
+        self._pending: dict[LabelSignature, list[str]] = {}
+        self._counts: dict[LabelSignature, int] = {}
+        self.total = 0
+        self.batches = 0
+
+    def signature(self, msg: dict) -> LabelSignature:
+        add_ids = tuple(sorted(self._name_to_id.get(x) or x for x in (msg.get("add") or [])))
+        rem_ids = tuple(sorted(self._name_to_id.get(x) or x for x in (msg.get("remove") or [])))
+        return add_ids, rem_ids
+
+    def add(self, msg: dict) -> None:
+        if self._cutoff_ts and int(msg.get("ts", 0)) > self._cutoff_ts:
+            return
+        sig = self.signature(msg)
+        ids = self._pending.setdefault(sig, [])
+        ids.append(msg.get("id"))
+        self._counts[sig] = self._counts.get(sig, 0) + 1
+        self.total += 1
+        if len(ids) >= self._batch_size:
+            self._send(sig)
+
+    def flush(self) -> None:
+        for sig in list(self._pending):
+            self._send(sig)
+
+    def _send(self, sig: LabelSignature) -> None:
+        ids = self._pending.pop(sig, [])
+        if not ids or self._dry_run:
+            return
+        add_ids, rem_ids = sig
+        self._client.batch_modify_messages(ids, list(add_ids), list(rem_ids))
+        self.batches += 1
+
+    def groups(self) -> list[tuple[int, list[str], list[str]]]:
+        """(count, add_ids, rem_ids) per signature, in first-seen order."""
+        return [(n, list(add_ids), list(rem_ids)) for (add_ids, rem_ids), n in self._counts.items()]
+
+
+def _cutoff_ts(cutoff_days: int | None) -> int | None:
+    if not cutoff_days:
+        return None
+    return int(time.time()) - cutoff_days * 86400
 
 
 class AutoApplyProcessor(SafeProcessor[AutoApplyPayload, AutoApplyResult]):
@@ -233,37 +285,109 @@ class AutoApplyProcessor(SafeProcessor[AutoApplyPayload, AutoApplyResult]):
             msgs = payload.proposal.get("messages") or []
             client = payload.context.get_gmail_client()
             client.authenticate()
-            name_to_id = client.get_label_id_map()
-
-            cutoff_ts = None
-            if payload.cutoff_days:
-                cutoff_ts = int(time.time()) - payload.cutoff_days * 86400
-
-            groups = _group_messages_by_labels(msgs, name_to_id, cutoff_ts)
-            total, result_groups = self._apply_groups(client, groups, payload)
+            batcher = _LabelBatcher(
+                client,
+                client.get_label_id_map(),
+                batch_size=payload.batch_size,
+                dry_run=payload.dry_run,
+                cutoff_ts=_cutoff_ts(payload.cutoff_days),
+            )
+            for m in msgs:
+                batcher.add(m)
+            batcher.flush()
 
             logger.end(sid, status="ok")
             return AutoApplyResult(
-                total_modified=total,
+                total_modified=batcher.total,
                 dry_run=payload.dry_run,
-                groups=result_groups,
+                groups=batcher.groups(),
             )
         except Exception as e:
             logger.error(sid, f"auto_apply failed: {e}")
             logger.end(sid, status="error", error=str(e))
             raise
 
-    def _apply_groups(self, client, groups, payload) -> tuple[int, list]:
-        """Apply label changes per group; return (total, result_groups)."""
-        total = 0
-        result_groups = []
-        B = payload.batch_size
-        for (add_ids, rem_ids), id_list in groups.items():
-            result_groups.append((len(id_list), list(add_ids), list(rem_ids)))
-            if payload.dry_run:
-                total += len(id_list)
-                continue
-            for i in range(0, len(id_list), B):
-                client.batch_modify_messages(id_list[i : i + B], list(add_ids), list(rem_ids))
-            total += len(id_list)
-        return total, result_groups
+
+@dataclass
+class AutoStreamResult:
+    """Result of a streaming propose (and optional apply)."""
+
+    out_path: Path | None = None
+    query: str = ""
+    pages: int = 0
+    total_considered: int = 0
+    selected_count: int = 0
+    applied: bool = False
+    dry_run: bool = False
+    total_modified: int = 0
+    batches: int = 0
+    groups: list[tuple[int, list[str], list[str]]] = field(default_factory=list)
+
+
+class AutoStreamProcessor(SafeProcessor[AutoStreamPayload, AutoStreamResult]):
+    """Classify each page as it arrives, append JSONL records, and optionally apply.
+
+    Unlike :class:`AutoProposeProcessor`, nothing waits for the last page: each
+    page's selections are written (and flushed) to the proposal before the next
+    page is fetched, and with ``apply`` set, label groups are modified as soon
+    as they reach the batch size. An interrupted run leaves a valid proposal of
+    everything classified so far.
+    """
+
+    def _process_safe(self, payload: AutoStreamPayload) -> AutoStreamResult:
+        import json
+
+        from ..applog import AppLogger
+        from ..utils.gmail_ops import MessageQueryParams, iter_messages_with_metadata
+
+        logger = AppLogger(payload.log_path)
+        sid = logger.start(
+            "auto_stream",
+            {"days": payload.days, "pages": payload.pages, "apply": payload.apply, "dry_run": payload.dry_run},
+        )
+        try:
+            client = payload.context.get_gmail_client()
+            client.authenticate()
+            batcher = None
+            if payload.apply:
+                batcher = _LabelBatcher(
+                    client,
+                    client.get_label_id_map(),
+                    batch_size=payload.batch_size,
+                    dry_run=payload.dry_run,
+                    cutoff_ts=_cutoff_ts(payload.cutoff_days),
+                )
+
+            q = f"in:inbox newer_than:{payload.days}d"
+            result = AutoStreamResult(out_path=payload.out_path, query=q, applied=payload.apply, dry_run=payload.dry_run)
+            prot = _protect_patterns(payload.protect)
+            header = {"generated_at": int(time.time()), "days": payload.days, "query": q}
+
+            payload.out_path.parent.mkdir(parents=True, exist_ok=True)
+            with payload.out_path.open("w", encoding="utf-8") as out:
+                out.write(json.dumps(header, ensure_ascii=False) + "\n")
+                params = MessageQueryParams(query=q, pages=payload.pages)
+                for page in iter_messages_with_metadata(client, params):
+                    result.pages += 1
+                    result.total_considered += len(page)
+                    for m in page:
+                        rec = _proposal_record(m, prot)
+                        if not rec:
+                            continue
+                        out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                        result.selected_count += 1
+                        if batcher is not None:
+                            batcher.add(rec)
+                    out.flush()
+            if batcher is not None:
+                batcher.flush()
+                result.total_modified = batcher.total
+                result.batches = batcher.batches
+                result.groups = batcher.groups()
+
+            logger.end(sid, status="ok")
+            return result
+        except Exception as e:
+            logger.error(sid, f"auto_stream failed: {e}")
+            logger.end(sid, status="error", error=str(e))
+            raise
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from core.pipeline import Producer, ResultEnvelope
 
-from .processors import AutoProposeResult, AutoSummaryResult, AutoApplyResult
+from .processors import AutoProposeResult, AutoStreamResult, AutoSummaryResult, AutoApplyResult
 
 
 class AutoProposeProducer(Producer[ResultEnvelope[AutoProposeResult]]):
@@ -19,6 +19,29 @@ class AutoProposeProducer(Producer[ResultEnvelope[AutoProposeResult]]):
         print(f"Proposal written to {payload.out_path} (selected {payload.selected_count} of {payload.total_considered})")
 
 
+class AutoStreamProducer(Producer[ResultEnvelope[AutoStreamResult]]):
+    """Produce streaming propose/apply output."""
+
+    def produce(self, result: ResultEnvelope[AutoStreamResult]) -> None:
+        if not result.ok() or not result.payload:
+            diag = result.diagnostics or {}
+            print(f"Error: {diag.get('error', 'Auto run failed.')}")
+            return
+
+        payload = result.payload
+        print(
+            f"Proposal written to {payload.out_path} "
+            f"(selected {payload.selected_count} of {payload.total_considered} over {payload.pages} pages)"
+        )
+        if not payload.applied:
+            return
+        if payload.dry_run:
+            for count, add_ids, rem_ids in payload.groups:
+                print(f"Would modify {count} messages; +{add_ids} -{rem_ids}")
+            return
+        print(f"Applied to {payload.total_modified} messages in {payload.batches} batches.")
+
+
 class AutoSummaryProducer(Producer[ResultEnvelope[AutoSummaryResult]]):
     """Produce auto summary output."""
 
@@ -17,59 +17,48 @@ _AUTH_ARGS: tuple[ArgSpec, ...] = (
     (("--token",), {"help": "Path to token.json"}),
 )
 
+# Handler modules, imported only when one of their commands is dispatched.
+_PLAN = "..labels.commands_plan"
+_DOCTOR = "..labels.commands_doctor"
+
 _DRY_RUN: ArgSpec = (("--dry-run",), {"action": "store_true", "help": "Preview changes"})
 
 
 def register_labels_commands(app: CLIApp) -> object:
     """Register all labels subcommands on app and return the labels group."""
-    from ..labels.commands_plan import (
-        run_labels_plan,
-        run_labels_sync,
-        run_labels_export,
-        run_labels_list,
-    )
-    from ..labels.commands_doctor import (
-        run_labels_doctor,
-        run_labels_prune_empty,
-        run_labels_learn,
-        run_labels_apply_suggestions,
-        run_labels_delete,
-        run_labels_sweep_parents,
-    )
-
-    # (subcommand, help, handler, extra args appended after the shared auth pair)
-    specs: list[tuple[str, str, Any, list[ArgSpec]]] = [
-        ("list", "List Gmail labels", run_labels_list, [
+    # (subcommand, help, handler target, extra args appended after the shared auth pair)
+    specs: list[tuple[str, str, str, list[ArgSpec]]] = [
+        ("list", "List Gmail labels", f"{_PLAN}:run_labels_list", [
             (("--json",), {"action": "store_true", "help": "Output JSON instead of table"}),
         ]),
-        ("export", "Export Gmail labels to YAML", run_labels_export, [
+        ("export", "Export Gmail labels to YAML", f"{_PLAN}:run_labels_export", [
             (("--out",), {"required": True, "help": HELP_YAML_OUT}),
         ]),
-        ("sync", "Sync Gmail labels from YAML config", run_labels_sync, [
+        ("sync", "Sync Gmail labels from YAML config", f"{_PLAN}:run_labels_sync", [
             (("--config",), {"required": True, "help": "Labels YAML config"}),
             _DRY_RUN,
             (("--delete-missing",), {"action": "store_true", "help": "Delete labels not in config"}),
         ]),
-        ("plan", "Plan label changes from YAML config", run_labels_plan, [
+        ("plan", "Plan label changes from YAML config", f"{_PLAN}:run_labels_plan", [
             (("--config",), {"required": True, "help": "Labels YAML config"}),
         ]),
-        ("doctor", "Check for label inconsistencies", run_labels_doctor, []),
-        ("prune-empty", "Delete empty labels", run_labels_prune_empty, [_DRY_RUN]),
-        ("learn", "Learn label patterns from existing messages", run_labels_learn, [
+        ("doctor", "Check for label inconsistencies", f"{_DOCTOR}:run_labels_doctor", []),
+        ("prune-empty", "Delete empty labels", f"{_DOCTOR}:run_labels_prune_empty", [_DRY_RUN]),
+        ("learn", "Learn label patterns from existing messages", f"{_DOCTOR}:run_labels_learn", [
             (("--out",), {"help": "Output suggestions YAML"}),
             (("--days",), {"type": int, "default": 30, "help": "Days of messages to analyze"}),
         ]),
-        ("apply-suggestions", "Apply learned label suggestions", run_labels_apply_suggestions, [
+        ("apply-suggestions", "Apply learned label suggestions", f"{_DOCTOR}:run_labels_apply_suggestions", [
             (("--config",), {"required": True, "help": "Suggestions YAML from learn"}),
             _DRY_RUN,
         ]),
-        ("delete", "Delete a specific label", run_labels_delete, [
+        ("delete", "Delete a specific label", f"{_DOCTOR}:run_labels_delete", [
             (("--name",), {"required": True, "help": "Label name to delete"}),
         ]),
-        ("sweep-parents", "Clean up orphan parent labels", run_labels_sweep_parents, [_DRY_RUN]),
+        ("sweep-parents", "Clean up orphan parent labels", f"{_DOCTOR}:run_labels_sweep_parents", [_DRY_RUN]),
     ]
 
     labels_group = app.group("labels", help="Gmail labels operations")
     for name, help_text, handler, extra in specs:
-        labels_group.register(name, help_text, handler, list(_AUTH_ARGS) + extra)
+        labels_group.register(name, help_text, handler, list(_AUTH_ARGS) + extra, package=__package__)
     return labels_group
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 
 from core.assistant import BaseAssistant
-from core.cli_framework import CLIApp
+from core.cli_framework import CLIApp, lazy_handlers
 from core.cli_help_text import (
     HELP_ACCOUNTS,
     HELP_ACCOUNTS_LIST,
@@ -31,91 +31,21 @@ from ..config_resolver import (
     default_outlook_flow_path,
     default_outlook_token_path,
 )
-# Pipeline command imports
-from ..signatures.commands import (
-    run_signatures_export,
-    run_signatures_sync,
-    run_signatures_normalize,
-)
-from ..auto.commands import (
-    run_auto_propose,
-    run_auto_summary,
-    run_auto_apply,
-)
-from ..forwarding.commands import (
-    run_forwarding_list,
-    run_forwarding_add,
-    run_forwarding_status,
-    run_forwarding_enable,
-    run_forwarding_disable,
-)
-from ..outlook.commands import (
-    run_outlook_messages_search,
-    run_outlook_messages_summarize,
-    run_outlook_rules_list,
-    run_outlook_rules_export,
-    run_outlook_rules_sync,
-    run_outlook_rules_plan,
-    run_outlook_rules_delete,
-    run_outlook_rules_sweep,
-    run_outlook_rules_prune_empty,
-    run_outlook_categories_list,
-    run_outlook_categories_export,
-    run_outlook_categories_sync,
-    run_outlook_folders_sync,
-    run_outlook_calendar_add,
-    run_outlook_calendar_add_recurring,
-    run_outlook_calendar_add_from_config,
-    run_outlook_auth_device_code,
-    run_outlook_auth_poll,
-    run_outlook_auth_ensure,
-    run_outlook_auth_validate,
-)
 from .cmd_labels import register_labels_commands
 from .cmd_filters import register_filters_commands
-from ..accounts.commands import (
-    run_accounts_list,
-    run_accounts_export_labels,
-    run_accounts_sync_labels,
-    run_accounts_export_filters,
-    run_accounts_sync_filters,
-    run_accounts_plan_labels,
-    run_accounts_plan_filters,
-    run_accounts_export_signatures,
-    run_accounts_sync_signatures,
-)
-from ..messages_cli.commands import (
-    run_messages_search,
-    run_messages_summarize,
-    run_messages_get,
-)
-from ..messages_cli.commands_threads import (
-    run_messages_threads_get,
-)
-from ..messages_cli.commands_reply import (
-    run_messages_reply,
-    run_messages_apply_scheduled,
-)
-from ..messages_cli.commands_attachments import (
-    run_messages_list_attachments,
-    run_messages_download_attachment,
-)
-from ..config_cli.commands import (
-    run_auth,
-    run_backup,
-    run_cache_stats,
-    run_cache_clear,
-    run_cache_prune,
-    run_config_inspect,
-    run_config_derive_labels,
-    run_config_derive_filters,
-    run_config_optimize_filters,
-    run_config_audit_filters,
-    run_workflows_gmail_from_unified,
-    run_workflows_from_unified,
-    run_env_setup,
-)
 
+# Command handlers bind lazily: a handler module, and the Gmail/Outlook client
+# code it imports, loads only when one of its commands is dispatched.
+signatures_commands = lazy_handlers("..signatures.commands", package=__package__)
+auto_commands = lazy_handlers("..auto.commands", package=__package__)
+forwarding_commands = lazy_handlers("..forwarding.commands", package=__package__)
+outlook_commands = lazy_handlers("..outlook.commands", package=__package__)
+accounts_commands = lazy_handlers("..accounts.commands", package=__package__)
+messages_commands = lazy_handlers("..messages_cli.commands", package=__package__)
+threads_commands = lazy_handlers("..messages_cli.commands_threads", package=__package__)
+reply_commands = lazy_handlers("..messages_cli.commands_reply", package=__package__)
+attachments_commands = lazy_handlers("..messages_cli.commands_attachments", package=__package__)
+config_commands = lazy_handlers("..config_cli.commands", package=__package__)
 
 assistant = BaseAssistant(
     "mail",
@@ -146,7 +76,7 @@ def _lazy_emit_agentic():
 @app.argument("--token", help=f"Path to token.json (default: {_default_gmail_token})")
 @app.argument("--validate", action="store_true", help="Validate existing Gmail token non-interactively")
 def cmd_auth(args) -> int:
-    return run_auth(args)
+    return config_commands.run_auth(args)
 
 
 # --- backup command ---
@@ -155,7 +85,7 @@ def cmd_auth(args) -> int:
 @app.argument("--token", help="Path to token.json")
 @app.argument("--out-dir", help="Output directory (default backups/<timestamp>)")
 def cmd_backup(args) -> int:
-    return run_backup(args)
+    return config_commands.run_backup(args)
 
 
 # --- labels group ---
@@ -184,7 +114,7 @@ messages_group = app.group("messages", help="Search, get, summarize (Gmail+Outlo
 @messages_group.argument("--unread", action="store_true", help="Only unread messages (Gmail only)")
 @messages_group.argument("--json", action="store_true", help="Output JSON")
 def cmd_messages_search(args) -> int:
-    return run_messages_search(args)
+    return messages_commands.run_messages_search(args)
 
 
 @messages_group.command("summarize", help="Summarize a message's content")
@@ -198,7 +128,7 @@ def cmd_messages_search(args) -> int:
 @messages_group.argument("--out", help="Write summary to file")
 @messages_group.argument("--max-words", type=int, default=120, help="Max words in summary")
 def cmd_messages_summarize(args) -> int:
-    return run_messages_summarize(args)
+    return messages_commands.run_messages_summarize(args)
 
 
 @messages_group.command("get", help="Fetch and print a message body")
@@ -211,7 +141,7 @@ def cmd_messages_summarize(args) -> int:
 @messages_group.argument("--only-inbox", action="store_true", help="Restrict query to inbox")
 @messages_group.argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
 def cmd_messages_get(args) -> int:
-    return run_messages_get(args)
+    return messages_commands.run_messages_get(args)
 
 
 @messages_group.command("threads-get", help="Fetch all messages in a conversation")
@@ -225,7 +155,7 @@ def cmd_messages_get(args) -> int:
 @messages_group.argument("--include-body", action="store_true", help="Include each message body")
 @messages_group.argument("--json", action="store_true", help="Output JSON")
 def cmd_messages_threads_get(args) -> int:
-    return run_messages_threads_get(args)
+    return threads_commands.run_messages_threads_get(args)
 
 
 @messages_group.command("reply", help="Draft or send a reply for a message")
@@ -252,14 +182,14 @@ def cmd_messages_threads_get(args) -> int:
 @messages_group.argument("--plan", action="store_true", help="Plan-only: print intent and exit")
 @messages_group.argument("--create-draft", action="store_true", help="Create Gmail Draft (no send)")
 def cmd_messages_reply(args) -> int:
-    return run_messages_reply(args)
+    return reply_commands.run_messages_reply(args)
 
 
 @messages_group.command("apply-scheduled", help="Send scheduled messages that are due")
 @messages_group.argument("--max", type=int, default=10, help="Max messages to send")
 @messages_group.argument("--profile", help="Only send for specific profile")
 def cmd_messages_apply_scheduled(args) -> int:
-    return run_messages_apply_scheduled(args)
+    return reply_commands.run_messages_apply_scheduled(args)
 
 
 @messages_group.command("list-attachments", help="List attachments in a Gmail message")
@@ -268,7 +198,7 @@ def cmd_messages_apply_scheduled(args) -> int:
 @messages_group.argument("--id", required=True, help="Message ID")
 @messages_group.argument("--json", action="store_true", help="Output JSON")
 def cmd_messages_list_attachments(args) -> int:
-    return run_messages_list_attachments(args)
+    return attachments_commands.run_messages_list_attachments(args)
 
 
 @messages_group.command("download-attachment", help="Download an attachment from a Gmail message")
@@ -280,7 +210,7 @@ def cmd_messages_list_attachments(args) -> int:
 @messages_group.argument("--out", help="Output file path; if a directory, writes <original_filename> inside it")
 @messages_group.argument("--out-dir", dest="out_dir", default=".", help="Output directory (default: .)")
 def cmd_messages_download_attachment(args) -> int:
-    return run_messages_download_attachment(args)
+    return attachments_commands.run_messages_download_attachment(args)
 
 
 # --- cache group ---
@@ -290,20 +220,20 @@ cache_group = app.group("cache", help="Manage local message cache")
 @cache_group.command("stats", help="Show cache stats")
 @cache_group.argument("--cache", required=True, help="Cache directory root")
 def cmd_cache_stats(args) -> int:
-    return run_cache_stats(args)
+    return config_commands.run_cache_stats(args)
 
 
 @cache_group.command("clear", help="Delete entire cache")
 @cache_group.argument("--cache", required=True, help="Cache directory root")
 def cmd_cache_clear(args) -> int:
-    return run_cache_clear(args)
+    return config_commands.run_cache_clear(args)
 
 
 @cache_group.command("prune", help="Prune files older than N days")
 @cache_group.argument("--cache", required=True, help="Cache directory root")
 @cache_group.argument("--days", type=int, required=True, help="Days threshold")
 def cmd_cache_prune(args) -> int:
-    return run_cache_prune(args)
+    return config_commands.run_cache_prune(args)
 
 
 # --- auto group ---
@@ -320,29 +250,45 @@ auto_group = app.group("auto", help="Gmail: propose/apply categorization + archi
 @auto_group.argument("--batch-size", type=int, default=500)
 @auto_group.argument("--log", default="logs/auto_runs.jsonl", help="Log file")
 @auto_group.argument("--protect", action="append", default=[], help="Protected senders/domains")
-@auto_group.argument("--out", required=True, help="Path to proposal JSON")
+@auto_group.argument("--out", required=True, help="Path to proposal JSON (.jsonl streams page by page)")
 @auto_group.argument("--dry-run", action="store_true")
 def cmd_auto_propose(args) -> int:
-    return run_auto_propose(args)
+    return auto_commands.run_auto_propose(args)
+
+
+@auto_group.command("run", help="Propose and apply in one streaming pass")
+@auto_group.argument("--credentials", help="Path to OAuth credentials.json")
+@auto_group.argument("--token", help="Path to token.json")
+@auto_group.argument("--cache", help=HELP_CACHE_DIR)
+@auto_group.argument("--days", type=int, default=7, help="Days of messages")
+@auto_group.argument("--pages", type=int, default=20, help="Pages to fetch")
+@auto_group.argument("--protect", action="append", default=[], help="Protected senders/domains")
+@auto_group.argument("--cutoff-days", type=int, help="Only apply to messages older than N days")
+@auto_group.argument("--batch-size", type=int, default=500)
+@auto_group.argument("--log", default="logs/auto_runs.jsonl", help="Log file")
+@auto_group.argument("--out", required=True, help="Path to proposal JSONL (appended per page)")
+@auto_group.argument("--dry-run", action="store_true")
+def cmd_auto_run(args) -> int:
+    return auto_commands.run_auto_run(args)
 
 
 @auto_group.command("apply", help="Apply a saved proposal (archive + label)")
 @auto_group.argument("--credentials", help="Path to OAuth credentials.json")
 @auto_group.argument("--token", help="Path to token.json")
 @auto_group.argument("--cache", help=HELP_CACHE_DIR)
-@auto_group.argument("--proposal", required=True, help="Proposal JSON path")
+@auto_group.argument("--proposal", required=True, help="Proposal JSON/JSONL path")
 @auto_group.argument("--cutoff-days", type=int, help="Only apply to messages older than N days")
 @auto_group.argument("--batch-size", type=int, default=500)
 @auto_group.argument("--dry-run", action="store_true")
 @auto_group.argument("--log", default="logs/auto_runs.jsonl", help="Log file")
 def cmd_auto_apply(args) -> int:
-    return run_auto_apply(args)
+    return auto_commands.run_auto_apply(args)
 
 
 @auto_group.command("summary", help="Summarize a proposal JSON")
-@auto_group.argument("--proposal", required=True, help="Proposal JSON path")
+@auto_group.argument("--proposal", required=True, help="Proposal JSON/JSONL path")
 def cmd_auto_summary(args) -> int:
-    return run_auto_summary(args)
+    return auto_commands.run_auto_summary(args)
 
 
 # --- forwarding group ---
@@ -353,7 +299,7 @@ forwarding_group = app.group("forwarding", help="Gmail forwarding configuration"
 @forwarding_group.argument("--credentials", help="Path to OAuth credentials.json")
 @forwarding_group.argument("--token", help="Path to token.json")
 def cmd_forwarding_list(args) -> int:
-    return run_forwarding_list(args)
+    return forwarding_commands.run_forwarding_list(args)
 
 
 @forwarding_group.command("add", help="Add a forwarding address")
@@ -361,14 +307,14 @@ def cmd_forwarding_list(args) -> int:
 @forwarding_group.argument("--token", help="Path to token.json")
 @forwarding_group.argument("--email", required=True, help="Email address to add")
 def cmd_forwarding_add(args) -> int:
-    return run_forwarding_add(args)
+    return forwarding_commands.run_forwarding_add(args)
 
 
 @forwarding_group.command("status", help="Check forwarding status")
 @forwarding_group.argument("--credentials", help="Path to OAuth credentials.json")
 @forwarding_group.argument("--token", help="Path to token.json")
 def cmd_forwarding_status(args) -> int:
-    return run_forwarding_status(args)
+    return forwarding_commands.run_forwarding_status(args)
 
 
 @forwarding_group.command("enable", help="Enable forwarding")
@@ -376,14 +322,14 @@ def cmd_forwarding_status(args) -> int:
 @forwarding_group.argument("--token", help="Path to token.json")
 @forwarding_group.argument("--email", required=True, help="Address to forward to")
 def cmd_forwarding_enable(args) -> int:
-    return run_forwarding_enable(args)
+    return forwarding_commands.run_forwarding_enable(args)
 
 
 @forwarding_group.command("disable", help="Disable forwarding")
 @forwarding_group.argument("--credentials", help="Path to OAuth credentials.json")
 @forwarding_group.argument("--token", help="Path to token.json")
 def cmd_forwarding_disable(args) -> int:
-    return run_forwarding_disable(args)
+    return forwarding_commands.run_forwarding_disable(args)
 
 
 # --- signatures group ---
@@ -395,7 +341,7 @@ signatures_group = app.group("signatures", help="Gmail signatures operations")
 @signatures_group.argument("--token", help="Path to token.json")
 @signatures_group.argument("--out-dir", required=True, help=HELP_OUT_DIR)
 def cmd_signatures_export(args) -> int:
-    return run_signatures_export(args)
+    return signatures_commands.run_signatures_export(args)
 
 
 @signatures_group.command("sync", help="Sync signatures from files to Gmail")
@@ -404,14 +350,14 @@ def cmd_signatures_export(args) -> int:
 @signatures_group.argument("--in-dir", required=True, help="Input directory with signatures")
 @signatures_group.argument("--dry-run", action="store_true", help="Preview changes")
 def cmd_signatures_sync(args) -> int:
-    return run_signatures_sync(args)
+    return signatures_commands.run_signatures_sync(args)
 
 
 @signatures_group.command("normalize", help="Normalize signature HTML")
 @signatures_group.argument("--input", required=True, help="Input HTML file")
 @signatures_group.argument("--output", required=True, help="Output HTML file")
 def cmd_signatures_normalize(args) -> int:
-    return run_signatures_normalize(args)
+    return signatures_commands.run_signatures_normalize(args)
 
 
 # --- config group ---
@@ -423,7 +369,7 @@ config_group = app.group("config", help="Inspect and manage configuration")
 @config_group.argument("--section", help="Only show a specific section")
 @config_group.argument("--only-mail", action="store_true", help="Restrict to mail.* sections")
 def cmd_config_inspect(args) -> int:
-    return run_config_inspect(args)
+    return config_commands.run_config_inspect(args)
 
 
 @config_group.command("derive.labels", help="Derive Gmail and Outlook labels YAML from unified")
@@ -431,7 +377,7 @@ def cmd_config_inspect(args) -> int:
 @config_group.argument("--out-gmail", required=True, help="Output Gmail labels YAML")
 @config_group.argument("--out-outlook", required=True, help="Output Outlook categories YAML")
 def cmd_config_derive_labels(args) -> int:
-    return run_config_derive_labels(args)
+    return config_commands.run_config_derive_labels(args)
 
 
 @config_group.command("derive.filters", help="Derive Gmail and Outlook filters YAML from unified")
@@ -442,7 +388,7 @@ def cmd_config_derive_labels(args) -> int:
 @config_group.argument("--no-outlook-move-to-folders", action="store_false", dest="outlook_move_to_folders", help="Categories-only on Outlook")
 @config_group.argument("--outlook-archive-on-remove-inbox", action="store_true", dest="outlook_archive_on_remove_inbox", help="Move to Archive when INBOX removed")
 def cmd_config_derive_filters(args) -> int:
-    return run_config_derive_filters(args)
+    return config_commands.run_config_derive_filters(args)
 
 
 @config_group.command("optimize.filters", help="Optimize unified configs by merging similar rules")
@@ -451,7 +397,7 @@ def cmd_config_derive_filters(args) -> int:
 @config_group.argument("--merge-threshold", type=int, default=2, help="Minimum rules to merge")
 @config_group.argument("--preview", action="store_true", help="Print merge summary")
 def cmd_config_optimize_filters(args) -> int:
-    return run_config_optimize_filters(args)
+    return config_commands.run_config_optimize_filters(args)
 
 
 @config_group.command("audit.filters", help="Audit unified coverage vs provider exports")
@@ -459,7 +405,7 @@ def cmd_config_optimize_filters(args) -> int:
 @config_group.argument("--export", dest="export_path", required=True, help="Gmail exported filters YAML")
 @config_group.argument("--preview-missing", action="store_true", help="List missing rules")
 def cmd_config_audit_filters(args) -> int:
-    return run_config_audit_filters(args)
+    return config_commands.run_config_audit_filters(args)
 
 
 # --- workflows group ---
@@ -472,7 +418,7 @@ workflows_group = app.group("workflows", help="Agentic workflows that chain plan
 @workflows_group.argument("--delete-missing", action="store_true", help="Include deletions")
 @workflows_group.argument("--apply", action="store_true", help="Apply changes after planning")
 def cmd_workflows_gmail_from_unified(args) -> int:
-    return run_workflows_gmail_from_unified(args)
+    return config_commands.run_workflows_gmail_from_unified(args)
 
 
 @workflows_group.command("from-unified", help="Derive provider configs from unified, plan per provider, optionally apply")
@@ -486,7 +432,7 @@ def cmd_workflows_gmail_from_unified(args) -> int:
 @workflows_group.argument("--outlook-move-to-folders", action="store_true", dest="outlook_move_to_folders", default=True)
 @workflows_group.argument("--no-outlook-move-to-folders", action="store_false", dest="outlook_move_to_folders")
 def cmd_workflows_from_unified(args) -> int:
-    return run_workflows_from_unified(args)
+    return config_commands.run_workflows_from_unified(args)
 
 
 # --- env group ---
@@ -505,7 +451,7 @@ env_group = app.group("env", help="Environment setup and verification")
 @env_group.argument("--copy-gmail-example", dest="copy_gmail_example", action="store_true", default=True)
 @env_group.argument("--no-copy-gmail-example", dest="copy_gmail_example", action="store_false")
 def cmd_env_setup(args) -> int:
-    return run_env_setup(args)
+    return config_commands.run_env_setup(args)
 
 
 # --- accounts group ---
@@ -517,7 +463,7 @@ accounts_group = app.group("accounts", help="Operate across multiple email accou
 @accounts_group.argument("--accounts", help="Comma-separated list of accounts to include")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_list(args) -> int:
-    return run_accounts_list(args)
+    return accounts_commands.run_accounts_list(args)
 
 
 @accounts_group.command("export-labels", help="Export labels from all accounts")
@@ -526,7 +472,7 @@ def cmd_accounts_list(args) -> int:
 @accounts_group.argument("--out-dir", required=True, help=HELP_OUT_DIR)
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_export_labels(args) -> int:
-    return run_accounts_export_labels(args)
+    return accounts_commands.run_accounts_export_labels(args)
 
 
 @accounts_group.command("sync-labels", help="Sync labels to all accounts")
@@ -535,7 +481,7 @@ def cmd_accounts_export_labels(args) -> int:
 @accounts_group.argument("--labels", required=True, help="Labels YAML")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_sync_labels(args) -> int:
-    return run_accounts_sync_labels(args)
+    return accounts_commands.run_accounts_sync_labels(args)
 
 
 @accounts_group.command("export-filters", help="Export filters from all accounts")
@@ -544,7 +490,7 @@ def cmd_accounts_sync_labels(args) -> int:
 @accounts_group.argument("--out-dir", required=True, help=HELP_OUT_DIR)
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_export_filters(args) -> int:
-    return run_accounts_export_filters(args)
+    return accounts_commands.run_accounts_export_filters(args)
 
 
 @accounts_group.command("sync-filters", help="Sync filters to all accounts")
@@ -554,7 +500,7 @@ def cmd_accounts_export_filters(args) -> int:
 @accounts_group.argument("--require-forward-verified", action="store_true")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_sync_filters(args) -> int:
-    return run_accounts_sync_filters(args)
+    return accounts_commands.run_accounts_sync_filters(args)
 
 
 @accounts_group.command("plan-labels", help="Plan label changes for all accounts")
@@ -563,7 +509,7 @@ def cmd_accounts_sync_filters(args) -> int:
 @accounts_group.argument("--labels", required=True, help="Labels YAML")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_plan_labels(args) -> int:
-    return run_accounts_plan_labels(args)
+    return accounts_commands.run_accounts_plan_labels(args)
 
 
 @accounts_group.command("plan-filters", help="Plan filter changes for all accounts")
@@ -572,7 +518,7 @@ def cmd_accounts_plan_labels(args) -> int:
 @accounts_group.argument("--filters", required=True, help="Filters YAML")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_plan_filters(args) -> int:
-    return run_accounts_plan_filters(args)
+    return accounts_commands.run_accounts_plan_filters(args)
 
 
 @accounts_group.command("export-signatures", help="Export signatures from all accounts")
@@ -581,7 +527,7 @@ def cmd_accounts_plan_filters(args) -> int:
 @accounts_group.argument("--out-dir", required=True, help=HELP_OUT_DIR)
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_export_signatures(args) -> int:
-    return run_accounts_export_signatures(args)
+    return accounts_commands.run_accounts_export_signatures(args)
 
 
 @accounts_group.command("sync-signatures", help="Sync signatures to all accounts")
@@ -590,7 +536,7 @@ def cmd_accounts_export_signatures(args) -> int:
 @accounts_group.argument("--send-as", help="Send-as address")
 @accounts_group.argument("--dry-run", action="store_true")
 def cmd_accounts_sync_signatures(args) -> int:
-    return run_accounts_sync_signatures(args)
+    return accounts_commands.run_accounts_sync_signatures(args)
 
 
 # --- outlook group ---
@@ -602,14 +548,14 @@ outlook_group = app.group("outlook", help="Outlook-specific operations")
 @outlook_group.argument("--tenant", default="consumers", help="AAD tenant")
 @outlook_group.argument("--out", default=_default_outlook_flow, help=f"Path to store device-flow JSON (default: {_default_outlook_flow})")
 def cmd_outlook_auth_device_code(args) -> int:
-    return run_outlook_auth_device_code(args)
+    return outlook_commands.run_outlook_auth_device_code(args)
 
 
 @outlook_group.command("auth.poll", help="Poll device-code flow and write token cache")
 @outlook_group.argument("--flow", default=_default_outlook_flow, help=f"Path to device-flow JSON (default: {_default_outlook_flow})")
 @outlook_group.argument("--token", default=_default_outlook_token, help=f"Path to token cache output (default: {_default_outlook_token})")
 def cmd_outlook_auth_poll(args) -> int:
-    return run_outlook_auth_poll(args)
+    return outlook_commands.run_outlook_auth_poll(args)
 
 
 @outlook_group.command("auth.ensure", help="Ensure valid Outlook token (silent refresh or device-code)")
@@ -617,7 +563,7 @@ def cmd_outlook_auth_poll(args) -> int:
 @outlook_group.argument("--tenant", default="consumers", help="AAD tenant")
 @outlook_group.argument("--token", help="Path to token cache JSON")
 def cmd_outlook_auth_ensure(args) -> int:
-    return run_outlook_auth_ensure(args)
+    return outlook_commands.run_outlook_auth_ensure(args)
 
 
 @outlook_group.command("auth.validate", help="Validate Outlook token non-interactively")
@@ -625,7 +571,7 @@ def cmd_outlook_auth_ensure(args) -> int:
 @outlook_group.argument("--tenant", default="consumers", help="AAD tenant")
 @outlook_group.argument("--token", help="Path to token cache JSON")
 def cmd_outlook_auth_validate(args) -> int:
-    return run_outlook_auth_validate(args)
+    return outlook_commands.run_outlook_auth_validate(args)
 
 
 # outlook rules subgroup
@@ -638,7 +584,7 @@ def cmd_outlook_auth_validate(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_list(args) -> int:
-    return run_outlook_rules_list(args)
+    return outlook_commands.run_outlook_rules_list(args)
 
 
 @outlook_group.command("rules.export", help="Export Outlook rules to filters YAML")
@@ -651,7 +597,7 @@ def cmd_outlook_rules_list(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_export(args) -> int:
-    return run_outlook_rules_export(args)
+    return outlook_commands.run_outlook_rules_export(args)
 
 
 @outlook_group.command("rules.plan", help="Plan Outlook rule changes from filters YAML")
@@ -666,7 +612,7 @@ def cmd_outlook_rules_export(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_plan(args) -> int:
-    return run_outlook_rules_plan(args)
+    return outlook_commands.run_outlook_rules_plan(args)
 
 
 @outlook_group.command("rules.sync", help="Sync rules from filters YAML into Outlook Inbox")
@@ -681,7 +627,7 @@ def cmd_outlook_rules_plan(args) -> int:
 @outlook_group.argument("--account", help="Account name for defaults")
 @outlook_group.argument("--delete-missing", action="store_true", help="Delete rules not in YAML")
 def cmd_outlook_rules_sync(args) -> int:
-    return run_outlook_rules_sync(args)
+    return outlook_commands.run_outlook_rules_sync(args)
 
 
 @outlook_group.command("rules.delete", help="Delete an Outlook rule by ID")
@@ -692,7 +638,7 @@ def cmd_outlook_rules_sync(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_delete(args) -> int:
-    return run_outlook_rules_delete(args)
+    return outlook_commands.run_outlook_rules_delete(args)
 
 
 @outlook_group.command("rules.prune-empty", help="Delete Outlook rules with no conditions or actions")
@@ -703,7 +649,7 @@ def cmd_outlook_rules_delete(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_prune_empty(args) -> int:
-    return run_outlook_rules_prune_empty(args)
+    return outlook_commands.run_outlook_rules_prune_empty(args)
 
 
 @outlook_group.command("rules.sweep", help="Apply folder moves to existing messages")
@@ -718,12 +664,16 @@ def cmd_outlook_rules_prune_empty(args) -> int:
 @outlook_group.argument("--categories-only", action="store_false", dest="move_to_folders")
 @outlook_group.argument("--dry-run", action="store_true")
 @outlook_group.argument("--clear-cache", action="store_true", help="Clear caches before running")
+@outlook_group.argument(
+    "--use-index", action="store_true",
+    help="Match rules against the synced index (subject, preview and addresses only; not message bodies)",
+)
 @outlook_group.argument("--use-cache", action="store_true")
 @outlook_group.argument("--cache-ttl", type=int, default=600)
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_rules_sweep(args) -> int:
-    return run_outlook_rules_sweep(args)
+    return outlook_commands.run_outlook_rules_sweep(args)
 
 
 # outlook calendar subgroup
@@ -743,7 +693,7 @@ def cmd_outlook_rules_sweep(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_calendar_add(args) -> int:
-    return run_outlook_calendar_add(args)
+    return outlook_commands.run_outlook_calendar_add(args)
 
 
 @outlook_group.command("calendar.add-recurring", help="Add a recurring event with optional exclusions")
@@ -768,7 +718,7 @@ def cmd_outlook_calendar_add(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_calendar_add_recurring(args) -> int:
-    return run_outlook_calendar_add_recurring(args)
+    return outlook_commands.run_outlook_calendar_add_recurring(args)
 
 
 @outlook_group.command("calendar.add-from-config", help="Add events defined in a YAML file")
@@ -780,7 +730,7 @@ def cmd_outlook_calendar_add_recurring(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_calendar_add_from_config(args) -> int:
-    return run_outlook_calendar_add_from_config(args)
+    return outlook_commands.run_outlook_calendar_add_from_config(args)
 
 
 # outlook categories subgroup
@@ -793,7 +743,7 @@ def cmd_outlook_calendar_add_from_config(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_categories_list(args) -> int:
-    return run_outlook_categories_list(args)
+    return outlook_commands.run_outlook_categories_list(args)
 
 
 @outlook_group.command("categories.export", help="Export categories to YAML")
@@ -806,7 +756,7 @@ def cmd_outlook_categories_list(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_categories_export(args) -> int:
-    return run_outlook_categories_export(args)
+    return outlook_commands.run_outlook_categories_export(args)
 
 
 @outlook_group.command("categories.sync", help="Sync categories from labels YAML")
@@ -818,7 +768,7 @@ def cmd_outlook_categories_export(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_categories_sync(args) -> int:
-    return run_outlook_categories_sync(args)
+    return outlook_commands.run_outlook_categories_sync(args)
 
 
 # outlook folders subgroup
@@ -831,7 +781,7 @@ def cmd_outlook_categories_sync(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_folders_sync(args) -> int:
-    return run_outlook_folders_sync(args)
+    return outlook_commands.run_outlook_folders_sync(args)
 
 
 @outlook_group.command("messages.search", help="Search Outlook messages across all folders")
@@ -849,7 +799,7 @@ def cmd_outlook_folders_sync(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_messages_search(args) -> int:
-    return run_outlook_messages_search(args)
+    return outlook_commands.run_outlook_messages_search(args)
 
 
 @outlook_group.command("messages.summarize", help="Summarize an Outlook message")
@@ -865,7 +815,7 @@ def cmd_outlook_messages_search(args) -> int:
 @outlook_group.argument("--accounts-config", default="config/accounts.yaml")
 @outlook_group.argument("--account", help="Account name for defaults")
 def cmd_outlook_messages_summarize(args) -> int:
-    return run_outlook_messages_summarize(args)
+    return outlook_commands.run_outlook_messages_summarize(args)
 
 
 def _install_output_masking() -> None:
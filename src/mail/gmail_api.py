@@ -6,7 +6,7 @@ Provides the subset needed by the CLI with lazy imports of Google libs.
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, Iterator
 
 try:
     # Imported here; CLI avoids importing this module on --help unless used.
@@ -183,6 +183,24 @@ class GmailClient(ConfigCacheMixin):
         )
         return gather_pages(pages, max_pages=max_pages)
 
+    def iter_message_id_pages(
+        self,
+        query: str | None = None,
+        label_ids: list[str] | None = None,
+        max_pages: int = 1,
+        page_size: int = 500,
+    ) -> Iterator[list[str]]:
+        """Yield message IDs one list page at a time (at most ``max_pages``)."""
+        from .paging import paginate_gmail_messages
+
+        pages = paginate_gmail_messages(
+            self.service.users().messages(), query=query, label_ids=label_ids, page_size=page_size
+        )
+        for count, ids in enumerate(pages, start=1):
+            yield ids
+            if max_pages and count >= max_pages:
+                return
+
     def batch_modify_messages(
         self,
         ids: list[str],
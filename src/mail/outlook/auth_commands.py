@@ -213,7 +213,7 @@ def _ping_graph_me(access_token: str) -> int:
     from core.http import HttpClient
 
     try:
-        HttpClient(GRAPH_API_URL).get("/me", headers={"Authorization": f"Bearer {access_token}"})
+        HttpClient(GRAPH_API_URL, api="graph").get("/me", headers={"Authorization": f"Bearer {access_token}"})
         print("Outlook token valid.")
         return 0
     except _requests.exceptions.HTTPError as exc:
@@ -191,6 +191,7 @@ def run_outlook_rules_sweep(args) -> int:
             'days': getattr(args, 'days', 30),
             'top': getattr(args, 'top', 25),
             'pages': getattr(args, 'pages', 2),
+            'use_index': getattr(args, 'use_index', False),
         },
         {'dry_run': dry_run},
     )
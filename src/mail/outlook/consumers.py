@@ -63,6 +63,7 @@ class OutlookRulesSweepPayload:
     days: int = 30
     top: int = 25
     pages: int = 2
+    use_index: bool = False
 
 
 @dataclass
@@ -351,6 +351,7 @@ class OutlookRulesSweepProcessor(Processor[OutlookRulesSweepPayload, ResultEnvel
                 top=payload.top,
                 pages=payload.pages,
                 use_cache=not payload.clear_cache,
+                use_index=payload.use_index,
             )
         )
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Iterator, Protocol
 
 
 class _ListMessagesClient(Protocol):
@@ -41,3 +41,30 @@ def fetch_messages_with_metadata(
 ) -> tuple[list[str], list[dict]]:
     ids = list_message_ids(client, params)
     return ids, client.get_messages_metadata(ids, use_cache=True)
+
+
+def iter_messages_with_metadata(
+    client: _ListMessagesClient,
+    params: MessageQueryParams,
+) -> Iterator[list[dict]]:
+    """Yield metadata one list page at a time instead of after the last page.
+
+    Clients exposing ``iter_message_id_pages`` are paged lazily, so callers can
+    act on early pages while later ones are still being listed. Other clients
+    fall back to a single page holding every ID.
+    """
+    pager = getattr(client, "iter_message_id_pages", None)
+    if pager is None:
+        ids = list_message_ids(client, params)
+        if ids:
+            yield client.get_messages_metadata(ids, use_cache=True)
+        return
+    remaining = params.max_msgs
+    for ids in pager(query=params.query, max_pages=params.pages, page_size=params.page_size or 500):
+        ids = _clip_ids(ids, remaining)
+        if ids:
+            yield client.get_messages_metadata(ids, use_cache=True)
+        if remaining is not None:
+            remaining -= len(ids)
+            if remaining <= 0:
+                return
@@ -39,6 +39,7 @@ CONFIG = llm_cli.make_app_llm_config(
     policies=lambda: read_text(LLM_DIR / "PR_POLICIES.yaml") or "",
     agentic_filename="AGENTIC_MAKER.md",
     domain_map_filename="DOMAIN_MAP_MAKER.md",
+    package="maker",
 )
 
 
@@ -74,6 +74,7 @@ CONFIG = llm_cli.LlmConfig(
     policies=_policies,
     agentic_filename="AGENTIC_PHONE.md",
     domain_map_filename="DOMAIN_MAP_PHONE.md",
+    package="phone",
 )
 
 
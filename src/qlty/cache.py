@@ -0,0 +1,280 @@
+"""Persistent per-file finding cache for incremental scans.
+
+A full ``qlty check`` + ``qlty smells`` pass over this repo is several qlty
+invocations, and almost every file is unchanged between two scans. The cache
+stores each file's findings keyed by (content hash, source, tool fingerprint),
+so a repeat scan only hands qlty the files whose content changed and merges
+their fresh findings with everything cached.
+
+The fingerprint is the qlty version plus a hash of ``.qlty/qlty.toml`` and the
+scan flags that change what qlty reports. Any change there invalidates every
+entry for that source, because a plugin bump or a new exclude pattern can move
+findings in files whose content did not change.
+
+Two things keep the cache from turning into a false clean:
+
+* entries are only written from full-fidelity (``--json``) runs -- a SARIF
+  fallback has no ``value`` fields and must not be replayed as if it had;
+* ``qlty smells`` pairs files (``similar-code``), so a new clone pair between
+  a changed file and an unchanged one only shows up when both are scanned
+  together. Any stale file therefore re-runs smells over the whole scope,
+  and the unchanged files' cached "clean" entries are rewritten from it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import subprocess  # nosec B404 - git ls-files with a fixed arg vector, never shell=True
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+from .models import Finding, Location, Source, WireFormat
+
+_CACHE_VERSION = 1
+
+# Above this share of stale files a targeted run is no cheaper than a full one
+# (and qlty's per-run cap makes the two equivalent anyway), so fall back to it.
+_FULL_SCAN_FRACTION = 0.25
+
+_CONFIG_FILE = Path(".qlty") / "qlty.toml"
+
+# Sources whose findings relate files to each other. A targeted run over the
+# stale files alone cannot see a pair with an unchanged file.
+_CROSS_FILE_SOURCES = frozenset({Source.SMELLS})
+
+FileLister = Callable[[Path, Sequence[str]], list[str]]
+
+
+def git_list_files(root: Path, paths: Sequence[str] = ()) -> list[str]:
+    """Tracked plus untracked-but-not-ignored files under ``paths``.
+
+    Mirrors what qlty walks closely enough for change detection: files qlty
+    excludes are still hashed, and a stale one is simply handed back to qlty,
+    which excludes it again and reports nothing.
+    """
+    proc = subprocess.run(  # nosec B603 B607 - fixed git arg vector, paths after "--"
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", *paths],
+        capture_output=True,
+        cwd=str(root),
+        check=False,
+    )
+    if proc.returncode != 0:
+        return []
+    names = {n for n in proc.stdout.decode("utf-8", "replace").split("\0") if n}
+    return sorted(n for n in names if (root / n).is_file())
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+def config_fingerprint(root: Path, version: str, *, include_tests: bool) -> str:
+    """Hash of everything besides file content that shapes qlty's output."""
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(_hash_file(root / _CONFIG_FILE).encode("utf-8"))
+    digest.update(b"tests" if include_tests else b"no-tests")
+    return digest.hexdigest()[:16]
+
+
+def default_cache_path(root: Path) -> Path:
+    """Cache file for ``root``, kept out of the checkout under the data home."""
+    key = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return data_home() / "qlty" / f"findings-{key}.json"
+
+
+def _location_to_dict(loc: Location) -> list:
+    return [loc.path, loc.line]
+
+
+def _finding_to_dict(finding: Finding) -> dict:
+    return {
+        "rule": finding.rule,
+        "location": _location_to_dict(finding.location),
+        "level": finding.level,
+        "message": finding.message,
+        "tool": finding.tool,
+        "value": finding.value,
+        "other_locations": [_location_to_dict(o) for o in finding.other_locations],
+        "group_key": finding.group_key,
+    }
+
+
+def _finding_from_dict(raw: dict, source: Source) -> Finding:
+    path, line = raw["location"]
+    return Finding(
+        rule=raw["rule"],
+        location=Location(path=path, line=line),
+        level=raw["level"],
+        message=raw["message"],
+        source=source,
+        wire_format=WireFormat.JSON,
+        tool=raw.get("tool", ""),
+        value=raw.get("value"),
+        other_locations=tuple(Location(path=p, line=n) for p, n in raw.get("other_locations") or []),
+        group_key=raw.get("group_key"),
+    )
+
+
+@dataclass(frozen=True)
+class CachePlan:
+    """What a scan of one source needs from qlty, given the cache.
+
+    ``full`` means the cache is cold, too stale to be worth targeting, or
+    the source pairs files and something in scope changed: run qlty over the
+    whole scope. Otherwise ``stale`` lists the files to hand
+    qlty; it may be empty, in which case qlty does not run at all.
+    """
+
+    source: Source
+    fingerprint: str
+    hashes: dict[str, str]
+    stale: tuple[str, ...]
+    full: bool
+
+
+class FindingCache:
+    """Findings per (file, source), valid while content hash and fingerprint match."""
+
+    def __init__(
+        self,
+        root: Path,
+        path: Optional[Path] = None,
+        list_files: FileLister = git_list_files,
+    ) -> None:
+        self.root = root
+        self.path = path or default_cache_path(root)
+        self._list_files = list_files
+        self._data: Optional[dict] = None
+        # check and smells plan over the same scope; hash it once per scan.
+        self._hashes: dict[tuple[str, ...], dict[str, str]] = {}
+
+    def _hash_scope(self, paths: Sequence[str]) -> dict[str, str]:
+        key = tuple(paths)
+        if key not in self._hashes:
+            self._hashes[key] = {
+                name: _hash_file(self.root / name) for name in self._list_files(self.root, paths)
+            }
+        return self._hashes[key]
+
+    def _load(self) -> dict:
+        if self._data is None:
+            data = safe_load_json(self.path, default=None)
+            if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+                data = {"version": _CACHE_VERSION, "sources": {}}
+            self._data = data
+        return self._data
+
+    def _bucket(self, source: Source, fingerprint: str) -> dict[str, dict]:
+        sources = self._load()["sources"]
+        bucket = sources.get(source.value)
+        if not isinstance(bucket, dict) or bucket.get("fingerprint") != fingerprint:
+            bucket = {"fingerprint": fingerprint, "files": {}}
+            sources[source.value] = bucket
+        return bucket["files"]
+
+    def plan(self, source: Source, fingerprint: str, paths: Sequence[str] = ()) -> CachePlan:
+        """Hash the files in scope and decide which ones qlty must see."""
+        hashes = self._hash_scope(paths)
+        files = self._bucket(source, fingerprint)
+        changed = {name for name, sha in hashes.items() if files.get(name, {}).get("sha") != sha}
+        removed = {name for name in files if name not in hashes and _in_scope(name, paths)}
+        stale = changed | _referencing(files, changed | removed, hashes)
+        cold = not any(name in files for name in hashes)
+        full = (
+            cold
+            or (bool(stale) and source in _CROSS_FILE_SOURCES)
+            or (bool(hashes) and len(stale) > _FULL_SCAN_FRACTION * len(hashes))
+        )
+        return CachePlan(
+            source=source,
+            fingerprint=fingerprint,
+            hashes=hashes,
+            stale=tuple(sorted(stale)),
+            full=full,
+        )
+
+    def store(self, plan: CachePlan, findings: Iterable[Finding], paths: Sequence[str] = ()) -> None:
+        """Record fresh findings for every file the run covered.
+
+        A full run covered every hashed file; a targeted run only the stale
+        ones. Covered files with no findings are stored as clean so they are
+        not re-scanned next time.
+        """
+        files = self._bucket(plan.source, plan.fingerprint)
+        covered = set(plan.hashes) if plan.full else set(plan.stale)
+        by_file: dict[str, list[dict]] = {name: [] for name in covered}
+        for finding in findings:
+            if finding.file in by_file:
+                by_file[finding.file].append(_finding_to_dict(finding))
+        for name in [n for n in files if n not in plan.hashes and _in_scope(n, paths)]:
+            del files[name]
+        for name, items in by_file.items():
+            if name in plan.hashes:
+                files[name] = {"sha": plan.hashes[name], "findings": items}
+
+    def cached_findings(self, plan: CachePlan) -> list[Finding]:
+        """Findings for every in-scope file whose cached hash is current."""
+        files = self._bucket(plan.source, plan.fingerprint)
+        out: list[Finding] = []
+        for name, sha in plan.hashes.items():
+            entry = files.get(name)
+            if entry and entry.get("sha") == sha:
+                out.extend(_finding_from_dict(raw, plan.source) for raw in entry.get("findings") or [])
+        return out
+
+    def merge(self, plan: CachePlan, findings: Iterable[Finding]) -> None:
+        """Add findings a stability re-scan surfaced to current entries.
+
+        The first run of a re-scan loop may have been capped, so files whose
+        findings were crowded out were stored as clean. Findings later
+        iterations recover are folded back in rather than lost.
+        """
+        files = self._bucket(plan.source, plan.fingerprint)
+        for finding in findings:
+            entry = files.get(finding.file)
+            if not entry or entry.get("sha") != plan.hashes.get(finding.file):
+                continue
+            raw = _finding_to_dict(finding)
+            if raw not in entry["findings"]:
+                entry["findings"].append(raw)
+
+    def save(self) -> None:
+        if self._data is not None:
+            atomic_write_json(self.path, self._data, indent=None)
+
+
+def _in_scope(name: str, paths: Sequence[str]) -> bool:
+    if not paths:
+        return True
+    for p in paths:
+        prefix = p.rstrip("/")
+        if prefix in ("", ".") or name == prefix or name.startswith(prefix + "/"):
+            return True
+    return False
+
+
+def _referencing(files: dict[str, dict], changed: set[str], hashes: dict[str, str]) -> set[str]:
+    """Unchanged files holding a cross-file finding that points at a changed one."""
+    if not changed:
+        return set()
+    out: set[str] = set()
+    for name, entry in files.items():
+        if name in changed or name not in hashes:
+            continue
+        for raw in entry.get("findings") or []:
+            if any(loc[0] in changed for loc in raw.get("other_locations") or []):
+                out.add(name)
+                break
+    return out
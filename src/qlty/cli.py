@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Sequence
 
 from core.assistant import BaseAssistant
@@ -11,6 +12,7 @@ from core.cli_errors import ExitCode
 from core.cli_framework import CLIApp
 
 from . import report
+from .cache import FindingCache
 from .meta import META
 from .models import Finding, Source, Tier
 from .report import TriageEntry
@@ -48,6 +50,8 @@ def _scan_arguments(func):
         _format_argument,
         app.argument("--expect-min", type=int, help="Exit nonzero if fewer than N findings (env guard)"),
         app.argument("--rescan-until-stable", action="store_true", help="Re-scan until findings stop changing"),
+        app.argument("--no-cache", action="store_true", help="Ignore the per-file finding cache and scan everything"),
+        app.argument("--jobs", type=int, help="Max concurrent qlty processes across sources and path shards (default: core count)"),
         app.argument("--smells-only", action="store_true", help="Run only qlty smells"),
         app.argument("--check-only", action="store_true", help="Run only qlty check"),
         app.argument("--changed", action="store_true", help="Scan only changed files (default: all)"),
@@ -69,7 +73,7 @@ def _lazy_agentic():
 
 
 def _build_scanner() -> Scanner:
-    return Scanner(QltyRunner())
+    return Scanner(QltyRunner(), cache=FindingCache(Path.cwd()))
 
 
 def _sources(args) -> tuple[Source, ...]:
@@ -94,6 +98,8 @@ def _run_scan(args) -> ScanResult:
         include_tests=not getattr(args, "no_include_tests", False),
         paths=tuple(getattr(args, "paths", ()) or ()),
         sources=_sources(args),
+        use_cache=not getattr(args, "no_cache", False),
+        max_workers=getattr(args, "jobs", None),
     )
     return _build_scanner().scan(
         request,
@@ -99,11 +99,30 @@ def _scan_header(result: ScanResult) -> list[str]:
             f"deduped: {result.duplicates_collapsed} duplicate reports collapsed "
             "(qlty reports each clone once per location)"
         )
+    timing = _timing_summary(result)
+    if timing:
+        lines.append(f"timing: {timing}")
     for degradation in result.degradations:
         lines.append(f"WARNING: {degradation}")
     return lines
 
 
+def _timing_summary(result: ScanResult) -> str:
+    """Per-source wall time, summed over invocations, with shard/call counts.
+
+    Sources and shards run concurrently, so the parts do not add up to the
+    elapsed time of the scan -- that is the point of showing them.
+    """
+    per_source: dict[str, list[float]] = {}
+    for timing in result.timings:
+        per_source.setdefault(timing.source.value, []).append(timing.seconds)
+    parts = []
+    for source, seconds in per_source.items():
+        calls = f" over {len(seconds)} calls" if len(seconds) > 1 else ""
+        parts.append(f"{source} {sum(seconds):.1f}s{calls} (max {max(seconds):.1f}s)")
+    return ", ".join(parts)
+
+
 def render_scan_text(result: ScanResult) -> str:
     """Human/LLM-readable scan summary."""
     lines = _scan_header(result)
@@ -153,6 +172,16 @@ def scan_payload(result: ScanResult) -> dict:
         "degraded": result.degraded,
         "degradations": list(result.degradations),
         "duplicates_collapsed": result.duplicates_collapsed,
+        "timings": [
+            {
+                "source": t.source.value,
+                "seconds": round(t.seconds, 3),
+                "paths": t.paths,
+                "shard": t.shard,
+                "shards": t.shards,
+            }
+            for t in result.timings
+        ],
         "counts_by_rule": {
             rule: len(items) for rule, items in result.by_rule().items()
         },
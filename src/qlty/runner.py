@@ -157,6 +157,7 @@ class QltyRunner:
         self._binary = binary
         self._cwd = cwd
         self._timeout = timeout
+        self._version: Optional[str] = None
 
     def _resolved_binary(self) -> str:
         return resolve_binary(self._binary)
@@ -205,6 +206,22 @@ class QltyRunner:
             command=command,
         )
 
+    @property
+    def cwd(self) -> Path:
+        """Directory qlty runs in; the root scan paths are relative to."""
+        return self._cwd or Path.cwd()
+
+    def version(self) -> str:
+        """qlty's ``--version`` output, or "" if it could not be read.
+
+        Part of the finding-cache fingerprint: a qlty or plugin upgrade can
+        change findings in files whose content did not.
+        """
+        if self._version is None:
+            run = self._execute(["--version"])
+            self._version = run.stdout.strip() if run.returncode == 0 else ""
+        return self._version
+
     def invoke(
         self,
         source: Source,
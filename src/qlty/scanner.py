@@ -2,23 +2,50 @@
 
 ``qlty check`` (lint/security) and ``qlty smells`` (structure/duplication) are
 disjoint finding sets -- neither is a superset of the other -- so a complete
-picture requires running both and merging (plan F2).
+picture requires running both and merging (plan F2). The two sources are
+independent subprocesses, so they run concurrently, and a large explicit path
+set is sharded across parallel invocations of the same source.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional, Sequence
 
+from core.parallel import chunked, parallel_map
+
+from .cache import CachePlan, FindingCache, config_fingerprint
 from .models import Finding, Source, WireFormat
-from .runner import QltyRunner
+from .runner import InvocationResult, QltyRunner
 
 # radarlint caps issues per run, so one high-count cluster can crowd out
 # findings elsewhere. Re-scan until the finding set stops changing, bounded so a
 # genuinely unstable repo cannot loop forever.
 _MAX_RESCAN_ITERATIONS = 5
 
+# Below this many paths per shard, qlty's own startup (plugin resolution, git
+# state) dominates and another subprocess costs more than it saves.
+_MIN_PATHS_PER_SHARD = 40
+
+
+def _default_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class InvocationTiming:
+    """Wall time of one qlty subprocess, so speed/fidelity trade-offs show."""
+
+    source: Source
+    seconds: float
+    paths: int = 0
+    shard: int = 1
+    shards: int = 1
+
 
 @dataclass(frozen=True)
 class ScanResult:
@@ -31,6 +58,7 @@ class ScanResult:
     stable: bool = True
     scanned_all: bool = True
     duplicates_collapsed: int = 0
+    timings: tuple[InvocationTiming, ...] = ()
 
     @property
     def total(self) -> int:
@@ -65,12 +93,17 @@ class ScanRequest:
     excludes anything matching ``.qlty/qlty.toml``'s ``test_patterns`` unless
     told otherwise, so scanning a test file silently analyzes zero files and
     reports a confident "clean" -- a false clean is worse than an error.
+
+    ``max_workers`` bounds concurrent qlty subprocesses across sources and
+    shards; it defaults to the core count.
     """
 
     scan_all: bool = True
     include_tests: bool = True
     paths: tuple[str, ...] = ()
     sources: tuple[Source, ...] = (Source.CHECK, Source.SMELLS)
+    use_cache: bool = True
+    max_workers: Optional[int] = None
 
 
 @dataclass
@@ -85,6 +118,7 @@ class _Accumulator:
     collapsed: int = 0
     degradations: list[str] = field(default_factory=list)
     wire_formats: list[WireFormat] = field(default_factory=list)
+    timings: list[InvocationTiming] = field(default_factory=list)
 
     def add(self, findings: Sequence[Finding]) -> None:
         for finding in findings:
@@ -102,6 +136,13 @@ class _Accumulator:
         if wire_format not in self.wire_formats:
             self.wire_formats.append(wire_format)
 
+    def add_invocation(self, invocation: InvocationResult) -> None:
+        """Merge one qlty call's findings, degradation, and wire format."""
+        self.add(invocation.findings)
+        if invocation.degraded:
+            self.note_degradation(invocation.degrade_reason)
+        self.note_format(invocation.wire_format)
+
     def absorb(self, result: ScanResult) -> None:
         """Merge an existing result's findings and metadata."""
         self.add(result.findings)
@@ -109,6 +150,17 @@ class _Accumulator:
             self.note_degradation(reason)
         for wire_format in result.wire_formats:
             self.note_format(wire_format)
+        self.timings.extend(result.timings)
+
+    def merge(self, other: "_Accumulator") -> None:
+        """Fold in a per-source accumulator built on a worker thread."""
+        self.add(tuple(other.seen.values()))
+        self.collapsed += other.collapsed
+        for reason in other.degradations:
+            self.note_degradation(reason)
+        for wire_format in other.wire_formats:
+            self.note_format(wire_format)
+        self.timings.extend(other.timings)
 
     def ordered(self) -> tuple[Finding, ...]:
         return tuple(
@@ -129,14 +181,28 @@ class _Accumulator:
             stable=stable,
             scanned_all=scanned_all,
             duplicates_collapsed=self.collapsed,
+            timings=tuple(self.timings),
         )
 
 
 class Scanner:
-    """Runs qlty check + smells and merges the results."""
+    """Runs qlty check + smells and merges the results.
+
+    With a ``FindingCache``, full-scope ``check`` scans only hand qlty the
+    files whose content changed since the cached run and merge the rest from
+    the cache. ``smells`` is replayed only while nothing in scope changed.
+    """
 
-    def __init__(self, runner: Optional[QltyRunner] = None) -> None:
+    def __init__(
+        self,
+        runner: Optional[QltyRunner] = None,
+        cache: Optional[FindingCache] = None,
+    ) -> None:
         self._runner = runner or QltyRunner()
+        self._cache = cache
+        self._plans: dict[Source, CachePlan] = {}
+        # Sources scan on worker threads; cache reads/writes stay serialized.
+        self._cache_lock = threading.Lock()
 
     def scan(
         self,
@@ -147,15 +213,19 @@ class Scanner:
     ) -> ScanResult:
         """Run the requested qlty sources and merge their findings.
 
-        With ``rescan_until_stable``, repeats the whole scan until two
-        consecutive runs report the same finding identities, because qlty's
-        per-run issue cap means a single scan can under-report.
+        With ``rescan_until_stable``, repeats the scan until two consecutive
+        runs report the same finding identities, because qlty's per-run issue
+        cap means a single scan can under-report.
         """
         req = request or ScanRequest()
+        self._plans = {}
         result = self._scan_once(req)
-        if not rescan_until_stable:
-            return result
-        return self._rescan(req, first=result, max_iterations=max_iterations)
+        if rescan_until_stable:
+            result = self._rescan(req, first=result, max_iterations=max_iterations)
+            self._merge_into_cache(result)
+        if self._plans and self._cache is not None:
+            self._cache.save()
+        return result
 
     def _rescan(
         self,
@@ -169,26 +239,39 @@ class Scanner:
         Findings are accumulated across iterations rather than replaced: the
         point of re-scanning is that any single run may omit findings the cap
         crowded out, so the union is closer to the truth than the last run.
+
+        Re-scans bypass the cache (replaying it would trivially "stabilize").
+        The first re-scan covers the full scope; after that only the files
+        whose findings still moved between the last two runs are re-scanned,
+        since the rest of the tree has already settled. Narrowing is only
+        done for full-scope requests: explicit paths under ``--changed`` would
+        silently widen the scan.
         """
         accumulated = _Accumulator()
         accumulated.absorb(first)
         accumulated.collapsed = first.duplicates_collapsed
 
+        uncached = replace(request, use_cache=False)
         previous = first.identities()
+        targets: tuple[str, ...] = ()
         iterations = 1
 
         for _ in range(max(0, max_iterations - 1)):
             iterations += 1
-            current = self._scan_once(request)
+            scoped = replace(uncached, paths=targets) if targets else uncached
+            current = self._scan_once(scoped)
             accumulated.absorb(current)
 
-            identities = current.identities()
-            if identities == previous:
+            identities = _within(current.identities(), targets)
+            before = _within(previous, targets)
+            if identities == before:
                 return accumulated.build(
                     iterations=iterations,
                     stable=True,
                     scanned_all=request.scan_all,
                 )
+            if request.scan_all:
+                targets = tuple(sorted({path for _, path, _ in identities ^ before if path}))
             previous = identities
 
         return accumulated.build(
@@ -196,23 +279,212 @@ class Scanner:
         )
 
     def _scan_once(self, request: ScanRequest) -> ScanResult:
+        """Scan every requested source concurrently and merge in source order.
+
+        Merging in request order (not completion order) keeps dedupe choices,
+        and so the reported finding set, independent of thread timing.
+        """
+        partials = parallel_map(
+            lambda source: self._scan_source(source, request),
+            request.sources,
+            max_workers=max(1, len(request.sources)),
+            return_exceptions=True,
+        )
         accumulated = _Accumulator()
-        for source in request.sources:
-            invocation = self._runner.invoke(
-                source,
-                scan_all=request.scan_all,
-                include_tests=request.include_tests,
-                paths=request.paths,
-            )
-            accumulated.add(invocation.findings)
-            if invocation.degraded:
-                accumulated.note_degradation(invocation.degrade_reason)
-            accumulated.note_format(invocation.wire_format)
+        for partial in partials:
+            if isinstance(partial, BaseException):
+                raise partial
+            if partial is not None:
+                accumulated.merge(partial)
 
         return accumulated.build(
             iterations=1, stable=True, scanned_all=request.scan_all
         )
 
+    def _scan_source(self, source: Source, request: ScanRequest) -> _Accumulator:
+        accumulated = _Accumulator()
+        if self._cache_applies(request):
+            self._scan_cached(source, request, accumulated)
+        else:
+            accumulated.add_invocation(
+                self._invoke(source, request, request.paths, accumulated)
+            )
+        return accumulated
+
+    def _invoke(
+        self,
+        source: Source,
+        request: ScanRequest,
+        paths: Sequence[str],
+        accumulated: _Accumulator,
+        *,
+        shardable: bool = True,
+    ) -> InvocationResult:
+        """Run one source, sharding a large path set across subprocesses.
+
+        Shard results are combined into one ``InvocationResult`` so callers
+        see a single run; per-shard wall times go to ``accumulated``.
+        Sharding ``smells`` cannot pair clones that land in different shards,
+        so that trade-off is reported as a degradation. Pass
+        ``shardable=False`` to run the paths in one invocation.
+        """
+        shards = self._shards(request, paths) if shardable else [list(paths)]
+        if len(shards) <= 1:
+            invocation, timing = self._timed(source, request, paths, 1, 1)
+            accumulated.timings.append(timing)
+            return invocation
+
+        runs = parallel_map(
+            lambda item: self._timed(source, request, item[1], item[0], len(shards)),
+            list(enumerate(shards, start=1)),
+            max_workers=len(shards),
+            return_exceptions=True,
+        )
+        invocations: list[InvocationResult] = []
+        for run in runs:
+            if isinstance(run, BaseException):
+                raise run
+            if run is not None:
+                invocations.append(run[0])
+                accumulated.timings.append(run[1])
+        if source is Source.SMELLS:
+            accumulated.note_degradation(
+                f"smells sharded into {len(shards)} invocations; similar-code "
+                "pairs spanning shards are not detected"
+            )
+        return _combine(source, invocations)
+
+    def _timed(
+        self,
+        source: Source,
+        request: ScanRequest,
+        paths: Sequence[str],
+        shard: int,
+        shards: int,
+    ) -> tuple[InvocationResult, InvocationTiming]:
+        started = time.monotonic()
+        invocation = self._runner.invoke(
+            source,
+            scan_all=request.scan_all,
+            include_tests=request.include_tests,
+            paths=paths,
+        )
+        timing = InvocationTiming(
+            source=source,
+            seconds=time.monotonic() - started,
+            paths=len(paths),
+            shard=shard,
+            shards=shards,
+        )
+        return invocation, timing
+
+    @staticmethod
+    def _shards(request: ScanRequest, paths: Sequence[str]) -> list[list[str]]:
+        """Split ``paths`` into at most this source's share of the workers."""
+        if not paths:
+            return [[]]
+        workers = request.max_workers or _default_workers()
+        per_source = max(1, workers // max(1, len(request.sources)))
+        count = min(per_source, max(1, len(paths) // _MIN_PATHS_PER_SHARD))
+        if count <= 1:
+            return [list(paths)]
+        size = -(-len(paths) // count)
+        return list(chunked(list(paths), size))
+
+    def _cache_applies(self, request: ScanRequest) -> bool:
+        """Only full-scope scans are cached: ``--changed`` is already narrow,
+        and its scope is decided by qlty from git state the cache cannot see.
+        An unreadable qlty version cannot be fingerprinted, so it disables
+        the cache rather than risking stale replays across an upgrade.
+        """
+        return (
+            self._cache is not None
+            and request.use_cache
+            and request.scan_all
+            and bool(self._runner.version())
+        )
+
+    def _scan_cached(
+        self, source: Source, request: ScanRequest, accumulated: _Accumulator
+    ) -> None:
+        cache = self._cache
+        assert cache is not None  # nosec B101 - guarded by _cache_applies
+        fingerprint = config_fingerprint(
+            cache.root, self._runner.version(), include_tests=request.include_tests
+        )
+        with self._cache_lock:
+            plan = cache.plan(source, fingerprint, request.paths)
+            self._plans[source] = plan
+
+        # Sharded smells miss clone pairs spanning shards; storing that run
+        # would record those files as clean, so cached smells run unsharded
+        # (and, per the plan, over the whole scope).
+        shardable = source is not Source.SMELLS
+        invocation: Optional[InvocationResult] = None
+        if plan.full:
+            invocation = self._invoke(source, request, request.paths, accumulated, shardable=shardable)
+        elif plan.stale:
+            invocation = self._invoke(source, request, plan.stale, accumulated, shardable=shardable)
+
+        with self._cache_lock:
+            self._merge_cached(cache, plan, invocation, request, accumulated)
+
+    @staticmethod
+    def _merge_cached(
+        cache: FindingCache,
+        plan: CachePlan,
+        invocation: Optional[InvocationResult],
+        request: ScanRequest,
+        accumulated: _Accumulator,
+    ) -> None:
+        if invocation is None:
+            accumulated.note_format(WireFormat.JSON)
+            accumulated.add(cache.cached_findings(plan))
+            return
+        if invocation.degraded:
+            accumulated.note_degradation(invocation.degrade_reason)
+        accumulated.note_format(invocation.wire_format)
+        if not invocation.degraded:
+            cache.store(plan, invocation.findings, request.paths)
+        if plan.full:
+            accumulated.add(invocation.findings)
+            return
+        # Targeted run: stale files' fresh findings (stored above, unless the
+        # run degraded) plus every still-current cached entry.
+        if invocation.degraded:
+            accumulated.add(invocation.findings)
+        accumulated.add(cache.cached_findings(plan))
+
+    def _merge_into_cache(self, result: ScanResult) -> None:
+        if self._cache is None:
+            return
+        for source, plan in self._plans.items():
+            self._cache.merge(plan, (f for f in result.findings if f.source is source))
+
+
+def _combine(source: Source, invocations: Sequence[InvocationResult]) -> InvocationResult:
+    """One ``InvocationResult`` from several shards of the same source."""
+    degraded = [inv for inv in invocations if inv.degraded]
+    reasons = list(dict.fromkeys(inv.degrade_reason for inv in degraded if inv.degrade_reason))
+    return InvocationResult(
+        findings=tuple(f for inv in invocations for f in inv.findings),
+        wire_format=WireFormat.SARIF if degraded else WireFormat.JSON,
+        source=source,
+        command=invocations[0].command if invocations else (),
+        degraded=bool(degraded),
+        degrade_reason="; ".join(reasons),
+    )
+
+
+def _within(
+    identities: set[tuple[str, str, int]], paths: Sequence[str]
+) -> set[tuple[str, str, int]]:
+    """Identities under ``paths`` (all of them when no paths are given)."""
+    if not paths:
+        return identities
+    wanted = set(paths)
+    return {identity for identity in identities if identity[1] in wanted}
+
 
 def sibling_uses_params_object(
     module_path: str, root: Optional[Path] = None
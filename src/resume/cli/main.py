@@ -20,7 +20,7 @@ from typing import Callable
 
 from core.assistant import BaseAssistant
 from core.cli_errors import CLIError, ExitCode
-from core.cli_framework import CLIApp
+from core.cli_framework import CLIApp, lazy_handlers
 from core.paths import ENV_DATA_HOME, output_dir
 
 from core.textio import write_text
@@ -31,8 +31,6 @@ from ..parsing_linkedin import parse_linkedin_text
 from ..parsing_experience_text import parse_resume_text, merge_profiles
 from ..summarizer import build_summary
 from ..templating import load_template, parse_seed_criteria
-from ..docx_writer import write_resume_docx
-from ..structure import infer_structure_from_docx
 from ..job import load_job_config, build_keyword_spec
 from ..aligner import align_candidate_to_job, build_tailored_candidate
 from ..cleanup import build_tidy_plan, execute_archive, execute_delete, purge_temp_files
@@ -40,6 +38,11 @@ from ..experience_summary import build_experience_summary
 from ..overlays import apply_profile_overlays
 from ..pipeline import FilterPipeline
 
+# python-docx is the bulk of this CLI's import time and only the render and
+# structure commands need it, so those helpers bind on first call.
+docx_helpers = lazy_handlers("..docx_writer", package=__package__)
+structure_helpers = lazy_handlers("..structure", package=__package__)
+
 # Default profile used when --profile is not provided
 DEFAULT_PROFILE = "sample"
 
@@ -265,7 +268,7 @@ def _load_structure(args: argparse.Namespace) -> dict | None:
         sf = str(args.structure_from)
         if sf.lower().endswith((EXT_JSON, EXT_YAML, ".yml")):
             return _try_load_structure(Path(sf))
-        return infer_structure_from_docx(sf)
+        return structure_helpers.infer_structure_from_docx(sf)
 
     profile = getattr(args, "profile", None)
     if not profile:
@@ -322,7 +325,7 @@ def cmd_render(args: argparse.Namespace) -> int:
         out_docx.parent.mkdir(parents=True, exist_ok=True)
     except Exception:  # nosec B110 - mkdir failure
         pass
-    write_resume_docx(
+    docx_helpers.write_resume_docx(
         data=data,
         template=template,
         out_path=str(out_docx),
@@ -339,7 +342,7 @@ def cmd_render(args: argparse.Namespace) -> int:
 @app.argument("--profile", help="Output prefix (e.g., 'briancorysherwin_general')")
 @app.argument("--out-dir", help=OUT_DIR_HELP)
 def cmd_structure(args: argparse.Namespace) -> int:
-    struct = infer_structure_from_docx(args.source)
+    struct = structure_helpers.infer_structure_from_docx(args.source)
     out = _resolve_out(args, EXT_JSON, kind="structure")
     write_yaml_or_json(struct, out)
     return 0
@@ -0,0 +1,263 @@
+"""Batch deck builds: many decks (e.g. per-customer variants) from shared templates.
+
+Running ``generate`` once per deck re-reads the template for every deck and
+renders each deck's Mermaid diagrams inside slide population. ``build_decks``
+splits the work into stages, each timed in the returned ``BatchReport``:
+
+1. ``load`` — parse every deck YAML and apply template / layout-map overrides.
+2. ``template`` — read each distinct template once. With
+   ``infer_layout_map``, infer its layout map once and give it to every deck
+   that does not declare one.
+3. ``prerender`` — render the Mermaid diagrams of all decks in one batched
+   ``mmdc`` launch, which fills the shared render cache the assembly reads.
+   Also open every referenced image in parallel, so a missing or unreadable
+   image fails its deck before assembly starts. Tables are native shapes and
+   need no pre-render.
+4. ``assemble`` — build the decks in a process pool. Each worker process
+   receives the template bytes once, through the pool initializer. Each deck
+   reports its own ``prepare_ms`` / ``populate_ms`` / ``save_ms``.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core import mermaid_render
+from core.parallel import parallel_map
+from slides.constants import ERR_NO_TEMPLATE_PATH
+from slides.generator import SlideGenerator, _mermaid_job, load_deck_from_yaml
+from slides.schema import SlideDeck
+
+__all__ = [
+    "BatchReport",
+    "DeckBuild",
+    "DeckJob",
+    "build_decks",
+]
+
+_IMAGE_WORKERS = 8
+
+# Template bytes by path, set once per assembly worker process.
+_worker_templates: dict[str, bytes] = {}
+
+
+@dataclass(frozen=True)
+class DeckJob:
+    """One deck to build: its YAML definition and where to write the .pptx."""
+
+    yaml_path: str
+    output_path: str
+
+
+@dataclass
+class DeckBuild:
+    """Outcome of building one deck."""
+
+    yaml_path: str
+    output_path: str
+    ok: bool = False
+    error: str = ""
+    timings: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class BatchReport:
+    """Per-deck outcomes plus wall-clock milliseconds per batch stage."""
+
+    builds: list[DeckBuild]
+    timings: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return all(build.ok for build in self.builds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "timings": dict(self.timings),
+            "decks": [
+                {
+                    "yaml": b.yaml_path, "output": b.output_path, "ok": b.ok,
+                    "error": b.error, "timings": dict(b.timings),
+                }
+                for b in self.builds
+            ],
+        }
+
+
+class _Stopwatch:
+    def __init__(self, timings: dict[str, int]) -> None:
+        self._timings = timings
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._timings[f"{stage}_ms"] = int((now - self._last) * 1000)
+        self._last = now
+
+    def total(self) -> None:
+        self._timings["total_ms"] = int((time.perf_counter() - self._start) * 1000)
+
+
+def _load_decks(
+    jobs: list[DeckJob],
+    builds: list[DeckBuild],
+    template_path: str | None,
+    layout_map: dict[str, int] | None,
+) -> dict[int, SlideDeck]:
+    decks: dict[int, SlideDeck] = {}
+    for i, job in enumerate(jobs):
+        try:
+            deck = load_deck_from_yaml(job.yaml_path)
+        except Exception as exc:  # noqa: BLE001 - one bad deck must not sink the batch
+            builds[i].error = f"Error loading YAML: {exc}"
+            continue
+        if layout_map is not None:
+            deck.metadata.layout_map = dict(layout_map)
+        deck.template_path = template_path or deck.template_path
+        if not deck.template_path:
+            builds[i].error = ERR_NO_TEMPLATE_PATH
+            continue
+        decks[i] = deck
+    return decks
+
+
+def _load_templates(
+    decks: dict[int, SlideDeck],
+    builds: list[DeckBuild],
+    infer_layout_map: bool,
+) -> dict[str, bytes]:
+    """Read each distinct template once (and infer its layout map once)."""
+    templates: dict[str, bytes | None] = {}
+    errors: dict[str, str] = {}
+    inferred: dict[str, dict[str, int] | None] = {}
+    for i, deck in list(decks.items()):
+        path = str(deck.template_path)
+        if path not in templates:
+            try:
+                templates[path] = Path(path).read_bytes()
+            except OSError as exc:
+                templates[path], errors[path] = None, str(exc)
+        data = templates[path]
+        if data is None:
+            builds[i].error = f"Error reading template: {errors[path]}"
+            del decks[i]
+            continue
+        if infer_layout_map and deck.metadata.layout_map is None:
+            if path not in inferred:
+                try:
+                    inferred[path] = SlideGenerator.infer_layout_map_from_template(io.BytesIO(data))
+                except Exception:  # noqa: BLE001 # nosec B110 - like generate, inference is best-effort
+                    inferred[path] = None
+            if inferred[path]:
+                deck.metadata.layout_map = dict(inferred[path])
+    return {path: data for path, data in templates.items() if data is not None}
+
+
+def _check_image(path: str) -> str:
+    """Open an image the way slide population will; return an error message or ''."""
+    from PIL import Image as PILImage
+
+    try:
+        with PILImage.open(path) as img:
+            img.size  # noqa: B018 - forces the header parse
+    except Exception as exc:  # noqa: BLE001 - reported per deck
+        return f"image {path!r} cannot be read: {exc}"
+    return ""
+
+
+def _prerender_assets(decks: dict[int, SlideDeck], builds: list[DeckBuild]) -> None:
+    """Fill the Mermaid render cache for every deck and pre-check every image."""
+    sources = list(dict.fromkeys(
+        content.mermaid for deck in decks.values() for content in deck.slides
+        if isinstance(getattr(content, "mermaid", None), str) and content.mermaid
+    ))
+    mmdc = shutil.which("mmdc")
+    if sources and mermaid_render.cache_version(mmdc):
+        try:
+            mermaid_render.render_many([_mermaid_job(src) for src in sources], mmdc_path=mmdc)
+        except Exception:  # nosec B110 - each deck's own render reports the failing diagram
+            pass
+
+    images = list(dict.fromkeys(
+        content.image for deck in decks.values() for content in deck.slides
+        if not getattr(content, "mermaid", None) and isinstance(getattr(content, "image", None), str) and content.image
+    ))
+    errors = dict(zip(images, parallel_map(_check_image, images, max_workers=_IMAGE_WORKERS)))
+    for i, deck in list(decks.items()):
+        problems = [errors[c.image] for c in deck.slides if errors.get(getattr(c, "image", None) or "")]
+        if problems:
+            builds[i].error = problems[0]
+            del decks[i]
+
+
+def _init_worker(templates: dict[str, bytes]) -> None:
+    _worker_templates.clear()
+    _worker_templates.update(templates)
+
+
+def _assemble(args: tuple[SlideDeck, str]) -> tuple[str, dict[str, int]]:
+    """Build one deck in an assembly worker; returns (error, timings)."""
+    deck, output_path = args
+    template = str(deck.template_path)
+    generator = SlideGenerator(template_path=template, template_data=_worker_templates.get(template))
+    timings: dict[str, int] = {}
+    try:
+        generator.generate(deck, output_path, timings=timings)
+    except Exception as exc:  # noqa: BLE001 - reported per deck
+        return f"Error generating slides: {exc}", timings
+    return "", timings
+
+
+def build_decks(
+    jobs: list[DeckJob],
+    *,
+    template_path: str | None = None,
+    layout_map: dict[str, int] | None = None,
+    infer_layout_map: bool = False,
+    max_workers: int | None = None,
+) -> BatchReport:
+    """Build every deck in ``jobs``; never raises for a single deck's failure.
+
+    Args:
+        jobs: Decks to build.
+        template_path: Template for every deck (overrides ``template_path:``).
+        layout_map: Layout map for every deck (overrides the YAML value).
+        infer_layout_map: Give decks without a layout map the one inferred
+            from their template.
+        max_workers: Assembly processes (default: CPU count, capped at the
+            number of decks). ``1`` assembles in this process.
+    """
+    builds = [DeckBuild(yaml_path=j.yaml_path, output_path=j.output_path) for j in jobs]
+    report = BatchReport(builds=builds)
+    clock = _Stopwatch(report.timings)
+
+    decks = _load_decks(jobs, builds, template_path, layout_map)
+    clock.lap("load")
+    templates = _load_templates(decks, builds, infer_layout_map)
+    clock.lap("template")
+    _prerender_assets(decks, builds)
+    clock.lap("prerender")
+
+    work = [(i, (deck, jobs[i].output_path)) for i, deck in decks.items()]
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(work)))
+    if workers == 1:
+        _init_worker(templates)
+        outcomes = [_assemble(args) for _, args in work]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(templates,)) as pool:
+            outcomes = list(pool.map(_assemble, [args for _, args in work]))
+    for (i, _), (error, timings) in zip(work, outcomes):
+        builds[i].ok = not error
+        builds[i].error = error
+        builds[i].timings = timings
+    clock.lap("assemble")
+    clock.total()
+    return report
@@ -198,6 +198,61 @@ def cmd_generate(args) -> int:
     return 0
 
 
+@app.command("batch", help="Generate many .pptx decks in parallel, sharing template work")
+@app.argument("yaml_files", nargs="+", help="YAML deck definitions")
+@app.argument("-d", "--output-dir", help="Directory for the decks (default: the slides output dir)")
+@app.argument("-t", "--template", help="Path to template .pptx file for every deck (overrides YAML setting)")
+@app.argument("--layout-map", help="Layout name to template slide index mapping for every deck")
+@app.argument(
+    "--infer-layout-map", action="store_true",
+    help="Give decks without a layout_map the one inferred from their template",
+)
+@app.argument("-j", "--jobs", type=int, default=None, help="Assembly processes (default: CPU count)")
+@app.argument("--format", choices=["table", "json"], default="table", help="Output format")
+def cmd_batch(args) -> int:
+    """Generate several decks; report per-deck and per-stage timings."""
+    try:
+        layout_map = _parse_layout_map_flag(args.layout_map)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output_dir:
+        out_dir = Path(args.output_dir)
+    else:
+        from core.paths import output_dir
+
+        out_dir = output_dir("slides")
+    stems = [Path(f).stem for f in args.yaml_files]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        print(f"Error: decks would overwrite each other: {', '.join(duplicates)}", file=sys.stderr)
+        return 1
+
+    from .batch import DeckJob, build_decks
+
+    jobs = [DeckJob(f, str(out_dir / f"{stem}.pptx")) for f, stem in zip(args.yaml_files, stems)]
+    report = build_decks(
+        jobs, template_path=args.template, layout_map=layout_map,
+        infer_layout_map=args.infer_layout_map, max_workers=args.jobs,
+    )
+
+    if args.format == "json":
+        print(json.dumps(report.as_dict()))
+    else:
+        emit_rows(
+            [{
+                "deck": b.yaml_path, "status": "ok" if b.ok else "error",
+                **{k: b.timings.get(k, "-") for k in ("prepare_ms", "populate_ms", "save_ms")},
+                "output": b.output_path if b.ok else b.error,
+            } for b in report.builds],
+            "table",
+            headers=["deck", "status", "prepare_ms", "populate_ms", "save_ms", "output"],
+        )
+        print("Stages: " + ", ".join(f"{k}={v}" for k, v in report.timings.items()))
+    return 0 if report.ok else 1
+
+
 @app.command("validate", help="Validate YAML deck definition")
 @app.argument("yaml_file", help="Path to YAML deck definition")
 def cmd_validate(args) -> int:
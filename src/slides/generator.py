@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import copy
+import io
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from typing import TYPE_CHECKING, Any
 
 from slides._content import ContentMixin
@@ -26,12 +29,18 @@ from slides.schema import (
     SlideDeck,
     TableSlide,
 )
+from core import mermaid_render
 from core.yamlio import load_config
 
 if TYPE_CHECKING:
     from pptx.enum.dml import MSO_THEME_COLOR
 
 
+def _mermaid_job(mermaid_src: str) -> mermaid_render.MermaidJob:
+    """Slides always render Mermaid as a white-background PNG at 3x scale."""
+    return mermaid_render.MermaidJob(text=mermaid_src, output_format="png", background="white", scale=3)
+
+
 def load_deck_from_yaml(yaml_path: str) -> SlideDeck:
     """Load a slide deck definition from YAML file.
 
@@ -71,16 +80,22 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
     def __init__(
         self,
         template_path: str | None,
+        *,
+        template_data: bytes | None = None,
     ) -> None:
         """Initialize the slide generator.
 
         Args:
             template_path: Path to the template .pptx file, or None if deck provides it
+            template_data: Contents of ``template_path`` already read into
+                memory (batch builds read each template once); used in place
+                of the file whenever the deck resolves to ``template_path``
 
         Note:
             Theme color is read from deck.metadata.theme_color at generation time.
         """
         self.template_path = template_path
+        self.template_data = template_data
 
     # ------------------------------------------------------------------
     # Mermaid rendering — lives here so subprocess/tempfile patches work
@@ -90,6 +105,9 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
     def _render_mermaid(mermaid_src: str) -> str:
         """Render Mermaid diagram source to a PNG file.
 
+        Served from the shared Mermaid render cache (``core.mermaid_render``)
+        when this source was rendered before; fresh renders are added to it.
+
         Args:
             mermaid_src: Mermaid diagram source code
 
@@ -99,6 +117,12 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
         Raises:
             RuntimeError: If mmdc is not installed or rendering fails
         """
+        version = mermaid_render.cache_version(shutil.which("mmdc"))
+        cached = mermaid_render.lookup(_mermaid_job(mermaid_src), version)
+        if cached is not None:
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as png:
+                png.write(cached)
+            return png.name
         with tempfile.NamedTemporaryFile(mode="w", suffix=".mmd", delete=False) as mmd:
             mmd.write(mermaid_src)
             mmd_path = mmd.name
@@ -124,8 +148,32 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
             raise RuntimeError(f"Mermaid render failed: {stderr}") from exc
         finally:
             os.unlink(mmd_path)
+        if version and os.path.exists(png_path):
+            with open(png_path, "rb") as fh:
+                mermaid_render.store(_mermaid_job(mermaid_src), version, fh.read())
         return png_path
 
+    @staticmethod
+    def _prerender_mermaid(deck: SlideDeck) -> None:
+        """Render the deck's uncached Mermaid diagrams in one mmdc launch.
+
+        Only fills the shared cache that ``_render_mermaid`` reads; failures
+        are left for the per-slide render to report.
+        """
+        mmdc = shutil.which("mmdc")
+        if not mermaid_render.cache_version(mmdc):
+            return
+        sources = [
+            content.mermaid for content in deck.slides
+            if isinstance(getattr(content, "mermaid", None), str) and content.mermaid
+        ]
+        if len(set(sources)) < 2:
+            return
+        try:
+            mermaid_render.render_many([_mermaid_job(src) for src in sources], mmdc_path=mmdc)
+        except Exception:  # nosec B110 - _render_mermaid re-renders and raises per slide
+            pass
+
     # ------------------------------------------------------------------
     # Presentation preparation — lives here so Presentation patches work
     # ------------------------------------------------------------------
@@ -151,7 +199,11 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
 
         # Resolved through the module attribute (not a local import) so tests
         # can patch slides.generator.Presentation. See __getattr__ below.
-        prs = sys.modules[__name__].Presentation(template)
+        if self.template_data is not None and template == self.template_path:
+            source: Any = io.BytesIO(self.template_data)
+        else:
+            source = template
+        prs = sys.modules[__name__].Presentation(source)
         theme_color = self._get_theme_color(deck.metadata.theme_color)
 
         if deck.metadata.layout_map is not None:
@@ -295,22 +347,38 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
         self,
         deck: SlideDeck,
         output_path: str,
+        *,
+        timings: dict[str, int] | None = None,
     ) -> str:
         """Generate a PowerPoint file from a SlideDeck definition.
 
         Args:
             deck: The slide deck definition
             output_path: Path to save the generated .pptx file
+            timings: When given, filled with ``prepare_ms`` (Mermaid
+                pre-render and template load), ``populate_ms`` and ``save_ms``
 
         Returns:
             Path to the generated file
         """
+        stage_start = time.perf_counter()
+
+        def lap(stage: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            if timings is not None:
+                timings[stage] = int((now - stage_start) * 1000)
+            stage_start = now
+
+        self._prerender_mermaid(deck)
         prs, first_slide, layouts, theme_color = self._prepare_presentation(deck)
+        lap("prepare_ms")
 
         if isinstance(layouts, dict):
             self._generate_layout_map_mode(prs, deck, layouts, theme_color)
         else:
             self._generate_legacy_mode(prs, deck, first_slide, layouts, theme_color)
+        lap("populate_ms")
 
         # Renumber slide parts to avoid duplicate filenames in the zip.
         # When template slides are deleted and new slides added, python-pptx
@@ -330,6 +398,7 @@ class SlideGenerator(ShapeUtilsMixin, StylingMixin, TableMixin, ContentMixin, Im
             os.makedirs(parent, exist_ok=True)
 
         prs.save(output_path)
+        lap("save_ms")
         return output_path
 
     def generate_from_yaml(
@@ -0,0 +1,195 @@
+"""Compiled form of the classification rules used by ClassifyEngine.
+
+``load_rules()`` yields plain dicts with raw regex strings. Matching them as
+``re.search(pattern, text)`` per event and per rule re-resolves every pattern
+through the ``re`` module cache each time, and the Read/Edit lookback rules
+re-scanned a window of prior events for every event. ``CompiledRules`` does
+that work once per rule set:
+
+- each rule's patterns are compiled into a single alternation, and all
+  enabled ``bash-as-*`` include patterns (and all custom-rule patterns
+  applicable to a tool) into one more, used as a pre-filter so the common
+  "nothing matches" case costs one search;
+- :class:`FileAccessTracker` keeps the recent accesses per file path, so the
+  redundant-read and rapid-re-edit checks look at prior accesses of that one
+  file instead of walking back over every event.
+
+Rule order and first-match-wins semantics are unchanged: the pre-filter only
+decides whether the ordered per-rule checks need to run at all.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+Matcher = Callable[[str], bool]
+
+# A backreference would point at a different group once patterns are joined.
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+
+_DEFAULT_PRODUCTIVE = ("Edit", "Write", "MultiEdit", "NotebookEdit")
+_EDIT_TOOLS = frozenset({"Edit", "MultiEdit", "NotebookEdit"})
+
+
+def compile_any(patterns: list[str]) -> Matcher | None:
+    """Compile *patterns* into one matcher equivalent to ``any(re.search(p, t))``.
+
+    Returns None for an empty list. Patterns that cannot share an alternation
+    (global inline flags, backreferences) are matched one by one.
+    """
+    if not patterns:
+        return None
+    if not any(_BACKREF.search(p) for p in patterns):
+        try:
+            return re.compile("|".join(f"(?:{p})" for p in patterns)).search  # type: ignore[return-value]
+        except re.error:
+            pass
+    compiled = [re.compile(p) for p in patterns]
+    return lambda text: any(rx.search(text) for rx in compiled)
+
+
+@dataclass(frozen=True)
+class BashRule:
+    name: str
+    include: Matcher | None
+    exclude: Matcher | None
+
+    def matches(self, text: str) -> bool:
+        if self.include is None or not self.include(text):
+            return False
+        return self.exclude is None or not self.exclude(text)
+
+
+@dataclass(frozen=True)
+class CustomRule:
+    tool: str | None
+    pattern: re.Pattern[str] | None
+    classification: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class WindowRule:
+    """A lookback rule: a prior access of the same file within a window."""
+
+    enabled: bool
+    tools: frozenset[str]
+    window_seconds: float
+    lookback_events: int
+    min_gap_seconds: float = 0.0
+
+
+class FileAccessTracker:
+    """Recent accesses per file path for one :class:`WindowRule`.
+
+    Only valid over events in non-decreasing timestamp order: the backward
+    scan it replaces stops at the first event older than the window, which
+    for ordered events is exactly "only accesses within the window count".
+    """
+
+    def __init__(self, rule: WindowRule) -> None:
+        self.rule = rule
+        self._recent: dict[str, deque[tuple[int, datetime]]] = {}
+
+    def hit(self, idx: int, ts: datetime, path: str) -> bool:
+        """True if a recorded access of *path* falls inside the rule's window."""
+        recent = self._recent.get(path)
+        if not recent:
+            return False
+        oldest = idx - self.rule.lookback_events
+        for prev_idx, prev_ts in recent:
+            if prev_idx < oldest:
+                continue
+            delta = (ts - prev_ts).total_seconds()
+            if self.rule.min_gap_seconds <= delta <= self.rule.window_seconds:
+                return True
+        return False
+
+    def record(self, idx: int, ts: datetime, path: str) -> None:
+        recent = self._recent.get(path)
+        if recent is None:
+            recent = self._recent[path] = deque(maxlen=max(0, self.rule.lookback_events))
+        recent.append((idx, ts))
+
+
+class CompiledRules:
+    """Everything ClassifyEngine's first pass needs, compiled from a rules dict."""
+
+    def __init__(self, rules: dict[str, Any]) -> None:
+        avoidable = rules.get("avoidable", {})
+        bash_rules: list[BashRule] = []
+        includes: list[str] = []
+        for name, cfg in avoidable.items():
+            if not name.startswith("bash-as-") or not cfg.get("enabled", True):
+                continue
+            patterns = cfg.get("patterns", [])
+            includes.extend(patterns)
+            bash_rules.append(BashRule(name, compile_any(patterns), compile_any(cfg.get("exclude", []))))
+        self.bash_rules = tuple(bash_rules)
+        self._bash_any = compile_any(includes)
+
+        read_cfg = avoidable.get("redundant-read", {})
+        self.redundant_read = WindowRule(
+            enabled=read_cfg.get("enabled", True),
+            tools=frozenset({"Read"}),
+            window_seconds=read_cfg.get("window_seconds", 60),
+            lookback_events=read_cfg.get("lookback_events", 10),
+        )
+        edit_cfg = avoidable.get("rapid-re-edit", {})
+        self.rapid_re_edit = WindowRule(
+            enabled=edit_cfg.get("enabled", True),
+            tools=_EDIT_TOOLS,
+            window_seconds=edit_cfg.get("window_seconds", 30),
+            lookback_events=edit_cfg.get("lookback_events", 5),
+            min_gap_seconds=edit_cfg.get("min_gap_seconds", 0),
+        )
+        self.max_lookback = max(self.redundant_read.lookback_events, self.rapid_re_edit.lookback_events, 0)
+
+        self._custom = tuple(
+            CustomRule(
+                tool=rule.get("tool") or None,
+                pattern=re.compile(rule["pattern"]) if rule.get("pattern") else None,
+                classification=rule.get("classification", "review"),
+                reason=rule.get("reason", "custom"),
+            )
+            for rule in rules.get("custom_rules", [])
+        )
+        self._custom_by_tool: dict[str | None, tuple[tuple[CustomRule, ...], Matcher | None]] = {}
+
+        tools_cfg = rules.get("tools", {})
+        self.productive_tools = frozenset(tools_cfg.get("productive", _DEFAULT_PRODUCTIVE))
+        self.neutral_tools = frozenset(tools_cfg.get("neutral", []))
+
+    def match_bash(self, first_segment: str) -> str | None:
+        """Name of the first enabled bash-as-* rule matching the command, if any."""
+        if self._bash_any is None or not self._bash_any(first_segment):
+            return None
+        for rule in self.bash_rules:
+            if rule.matches(first_segment):
+                return rule.name
+        return None
+
+    def _custom_for(self, tool_name: str | None) -> tuple[tuple[CustomRule, ...], Matcher | None]:
+        cached = self._custom_by_tool.get(tool_name)
+        if cached is None:
+            applicable = tuple(r for r in self._custom if r.tool is None or r.tool == tool_name)
+            prefilter = None
+            if applicable and all(r.pattern is not None for r in applicable):
+                prefilter = compile_any([r.pattern.pattern for r in applicable])  # type: ignore[union-attr]
+            cached = self._custom_by_tool[tool_name] = (applicable, prefilter)
+        return cached
+
+    def match_custom(self, tool_name: str | None, command: str) -> tuple[str, str] | None:
+        """(classification, reason) of the first custom rule matching, if any."""
+        applicable, prefilter = self._custom_for(tool_name)
+        if not applicable or (prefilter is not None and not prefilter(command)):
+            return None
+        for rule in applicable:
+            if rule.pattern is not None and not rule.pattern.search(command):
+                continue
+            return (rule.classification, rule.reason)
+        return None
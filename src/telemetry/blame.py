@@ -20,25 +20,39 @@ class BlameEngine:
         active_skill: str | None = None
 
         for evt in events:
-            if evt.tool_name == "Skill" and evt.tool_input:
-                active_skill = evt.tool_input.get("skill", "") or active_skill
-
-            if evt.classification not in ("avoidable", "review"):
-                evt.blame_target = None
-                continue
-
-            if agent_context is not None:
-                level = "agent"
-                name = agent_context
-            elif active_skill:
-                level = "skill"
-                name = active_skill
-            else:
-                level = "session"
-                name = "session"
-
-            fix_hint = self._get_fix_hint(evt.waste_reason, level, name)
-            evt.blame_target = BlameTarget(level=level, name=name, fix_hint=fix_hint)
+            active_skill = self.active_skill_after(evt, active_skill)
+            self.attribute_one(evt, active_skill, agent_context)
+
+    @staticmethod
+    def active_skill_after(evt: SessionEvent, active_skill: str | None) -> str | None:
+        """The skill in effect once *evt* has been seen."""
+        if evt.tool_name == "Skill" and evt.tool_input:
+            return evt.tool_input.get("skill", "") or active_skill
+        return active_skill
+
+    def attribute_one(
+        self,
+        evt: SessionEvent,
+        active_skill: str | None,
+        agent_context: str | None = None,
+    ) -> None:
+        """Set (or clear) blame_target on one event given the skill in effect."""
+        if evt.classification not in ("avoidable", "review"):
+            evt.blame_target = None
+            return
+
+        if agent_context is not None:
+            level = "agent"
+            name = agent_context
+        elif active_skill:
+            level = "skill"
+            name = active_skill
+        else:
+            level = "session"
+            name = "session"
+
+        fix_hint = self._get_fix_hint(evt.waste_reason, level, name)
+        evt.blame_target = BlameTarget(level=level, name=name, fix_hint=fix_hint)
 
     def _get_fix_hint(
         self,
@@ -1,9 +1,9 @@
 """Classification engine — classifies SessionEvent objects in-place."""
 
-import re
 from dataclasses import dataclass
 from typing import Any
 
+from telemetry._classify_rules import CompiledRules, FileAccessTracker, WindowRule
 from telemetry.models import SessionEvent
 
 # Default tool → classification mapping for first-pass fallback.
@@ -17,6 +17,15 @@ _TOOL_CLASS_MAP: dict[str, str] = {
 }
 
 
+_SEARCH_TOOLS = frozenset({"Read", "Grep", "Glob"})
+_WRITE_TOOLS = frozenset({"Edit", "Write", "MultiEdit", "NotebookEdit"})
+
+_DEFAULT_EXEMPT_AGENT_TYPES = (
+    "reviewer", "researcher", "Explore", "fact-checker",
+    "unit-validator", "cross-unit-validator", "claude-code-guide",
+)
+
+
 @dataclass(frozen=True)
 class WindowConfig:
     """Search-window constraints for write-after-agent detection."""
@@ -26,11 +35,6 @@ class WindowConfig:
     write_tools: frozenset[str]
 
 
-def _matches_any(pattern_list: list[str], text: str) -> bool:
-    """Return True if any regex in *pattern_list* matches *text*."""
-    return any(re.search(p, text) for p in pattern_list)
-
-
 @dataclass(frozen=True)
 class ToolWindowScan:
     """Lookback-window constraints for a backward tool_use scan."""
@@ -51,7 +55,8 @@ def _scan_tool_window(
 
     Returns True when a prior event matches *scan.allowed_tools*, is within
     *scan.window_seconds*, and has at least *scan.min_gap_seconds* elapsed
-    since *evt*.
+    since *evt*. Only used when timestamps go backwards; ordered sessions use
+    a FileAccessTracker instead.
     """
     file_path = (evt.tool_input or {}).get("file_path")
     if not file_path:
@@ -71,12 +76,46 @@ def _scan_tool_window(
     return False
 
 
+def _is_ordered(events: list[SessionEvent], start: int) -> bool:
+    """True if timestamps never decrease from *start* onward."""
+    return all(
+        events[i - 1].timestamp <= events[i].timestamp
+        for i in range(start + 1, len(events))
+    )
+
+
+def _window_scan(rule: WindowRule) -> ToolWindowScan:
+    return ToolWindowScan(
+        allowed_tools=rule.tools,
+        window_seconds=rule.window_seconds,
+        lookback_events=rule.lookback_events,
+        min_gap_seconds=rule.min_gap_seconds,
+    )
+
+
+def _fruitless_window(rule: dict[str, Any]) -> WindowConfig:
+    return WindowConfig(
+        window_seconds=rule.get("window_seconds", 300),
+        lookforward_events=rule.get("lookforward_events", 10),
+        write_tools=_WRITE_TOOLS,
+    )
+
+
 class ClassifyEngine:
     """Classifies a list of SessionEvent objects using configurable rules."""
 
     def __init__(self, rules: dict[str, Any]) -> None:
         self.rules = rules
 
+    @property
+    def rules(self) -> dict[str, Any]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: dict[str, Any]) -> None:
+        self._rules = rules
+        self._compiled = CompiledRules(rules)
+
     def classify(self, events: list[SessionEvent]) -> None:
         """Classify events in-place using two passes."""
         self._first_pass(events)
@@ -86,21 +125,49 @@ class ClassifyEngine:
     # First pass: per-event classification
     # ------------------------------------------------------------------
 
-    def _first_pass(self, events: list[SessionEvent]) -> None:
-        for i, evt in enumerate(events):
-            if evt.event_type != "tool_use" or evt.classification is not None:
+    def _first_pass(self, events: list[SessionEvent], start: int = 0) -> None:
+        # Events before *start* are already classified but still count as
+        # prior accesses for the lookback rules, so feed the trackers from
+        # one lookback window earlier.
+        lo = max(0, start - self._compiled.max_lookback)
+        trackers: tuple[FileAccessTracker, FileAccessTracker] | None = None
+        if _is_ordered(events, lo):
+            trackers = (
+                FileAccessTracker(self._compiled.redundant_read),
+                FileAccessTracker(self._compiled.rapid_re_edit),
+            )
+        for i in range(lo, len(events)):
+            evt = events[i]
+            if evt.event_type != "tool_use":
                 continue
-            result = self._classify_tool_use(evt, i, events)
-            if result is not None:
-                evt.classification, evt.waste_reason = result
-            else:
-                evt.classification = self._default_classification(evt)
+            if i >= start and evt.classification is None:
+                result = self._classify_tool_use(evt, i, events, trackers)
+                if result is not None:
+                    evt.classification, evt.waste_reason = result
+                else:
+                    evt.classification = self._default_classification(evt)
+            if trackers is not None:
+                self._record_access(evt, i, trackers)
+
+    @staticmethod
+    def _record_access(
+        evt: SessionEvent,
+        i: int,
+        trackers: tuple[FileAccessTracker, FileAccessTracker],
+    ) -> None:
+        file_path = (evt.tool_input or {}).get("file_path")
+        if not isinstance(file_path, str) or not file_path:
+            return
+        for tracker in trackers:
+            if evt.tool_name in tracker.rule.tools:
+                tracker.record(i, evt.timestamp, file_path)
 
     def _classify_tool_use(
         self,
         evt: SessionEvent,
         i: int,
         events: list[SessionEvent],
+        trackers: tuple[FileAccessTracker, FileAccessTracker] | None = None,
     ) -> tuple[str, str] | None:
         """Classify a single tool_use event. Returns (classification, reason) or None."""
         if evt.success is False:
@@ -111,14 +178,13 @@ class ClassifyEngine:
             if result is not None:
                 return result
 
-        if evt.tool_name == "Read":
-            rule = self.rules.get("avoidable", {}).get("redundant-read", {})
-            if rule.get("enabled", True) and self._is_redundant_read(evt, i, events, rule):
+        read_tracker, edit_tracker = trackers or (None, None)
+        if evt.tool_name == "Read" and self._compiled.redundant_read.enabled:
+            if self._seen_recently(evt, i, events, self._compiled.redundant_read, read_tracker):
                 return ("avoidable", "redundant-read")
 
-        if evt.tool_name in ("Edit", "MultiEdit", "NotebookEdit"):
-            rule = self.rules.get("avoidable", {}).get("rapid-re-edit", {})
-            if rule.get("enabled", True) and self._is_rapid_re_edit(evt, i, events, rule):
+        if evt.tool_name in ("Edit", "MultiEdit", "NotebookEdit") and self._compiled.rapid_re_edit.enabled:
+            if self._seen_recently(evt, i, events, self._compiled.rapid_re_edit, edit_tracker):
                 return ("avoidable", "rapid-re-edit")
 
         return self._apply_custom_rules(evt)
@@ -127,85 +193,35 @@ class ClassifyEngine:
         """Check bash-as-X rules. Returns (classification, reason) or None."""
         command = (evt.tool_input or {}).get("command", "")
         first_segment = command.split("|")[0].strip()
+        rule_name = self._compiled.match_bash(first_segment)
+        return ("avoidable", rule_name) if rule_name else None
 
-        avoidable_rules = self.rules.get("avoidable", {})
-        bash_rules = {k: v for k, v in avoidable_rules.items() if k.startswith("bash-as-")}
-
-        for rule_name, rule_cfg in bash_rules.items():
-            if not rule_cfg.get("enabled", True):
-                continue
-            patterns = rule_cfg.get("patterns", [])
-            excludes = rule_cfg.get("exclude", [])
-            if _matches_any(patterns, first_segment) and not _matches_any(excludes, first_segment):
-                return ("avoidable", rule_name)
-
-        return None
-
-    def _is_redundant_read(
-        self,
-        evt: SessionEvent,
-        idx: int,
-        events: list[SessionEvent],
-        rule: dict[str, Any],
-    ) -> bool:
-        return _scan_tool_window(
-            evt,
-            idx,
-            events,
-            ToolWindowScan(
-                allowed_tools=frozenset({"Read"}),
-                window_seconds=rule.get("window_seconds", 60),
-                lookback_events=rule.get("lookback_events", 10),
-            ),
-        )
-
-    def _is_rapid_re_edit(
-        self,
+    @staticmethod
+    def _seen_recently(
         evt: SessionEvent,
         idx: int,
         events: list[SessionEvent],
-        rule: dict[str, Any],
+        rule: WindowRule,
+        tracker: FileAccessTracker | None,
     ) -> bool:
-        return _scan_tool_window(
-            evt,
-            idx,
-            events,
-            ToolWindowScan(
-                allowed_tools=frozenset({"Edit", "MultiEdit", "NotebookEdit"}),
-                window_seconds=rule.get("window_seconds", 30),
-                lookback_events=rule.get("lookback_events", 5),
-                min_gap_seconds=rule.get("min_gap_seconds", 0),
-            ),
-        )
+        """Redundant-read / rapid-re-edit check: a recent access of the same file."""
+        file_path = (evt.tool_input or {}).get("file_path")
+        if not file_path:
+            return False
+        if tracker is None or not isinstance(file_path, str):
+            return _scan_tool_window(evt, idx, events, _window_scan(rule))
+        return tracker.hit(idx, evt.timestamp, file_path)
 
     def _apply_custom_rules(self, evt: SessionEvent) -> tuple[str, str] | None:
         """Apply custom rules. Returns (classification, reason) or None."""
-        custom_rules = self.rules.get("custom_rules", [])
-        for rule in custom_rules:
-            tool = rule.get("tool")
-            if tool and evt.tool_name != tool:
-                continue
-            pattern = rule.get("pattern")
-            if pattern:
-                command = (evt.tool_input or {}).get("command", "")
-                if not re.search(pattern, command):
-                    continue
-            classification = rule.get("classification", "review")
-            reason = rule.get("reason", "custom")
-            return (classification, reason)
-        return None
+        command = (evt.tool_input or {}).get("command", "")
+        return self._compiled.match_custom(evt.tool_name, command)
 
     def _default_classification(self, evt: SessionEvent) -> str:
         """Return the default classification for an event."""
-        tools_cfg = self.rules.get("tools", {})
-        productive_tools = set(tools_cfg.get(
-            "productive", ["Edit", "Write", "MultiEdit", "NotebookEdit"]
-        ))
-        neutral_tools = set(tools_cfg.get("neutral", []))
-
-        if evt.tool_name in productive_tools:
+        if evt.tool_name in self._compiled.productive_tools:
             return "productive"
-        if evt.tool_name in neutral_tools:
+        if evt.tool_name in self._compiled.neutral_tools:
             return "neutral"
         return _TOOL_CLASS_MAP.get(evt.tool_name, "neutral")
 
@@ -220,11 +236,10 @@ class ClassifyEngine:
     def _mark_abandoned_run(
         self,
         run: list[tuple[int, SessionEvent]],
-        tail_events: list[tuple[int, SessionEvent]],
-        write_tools: set[str],
+        write_follows: bool,
     ) -> None:
         """Mark a run of search events as abandoned if no write follows."""
-        if any(e.tool_name in write_tools for _, e in tail_events):
+        if write_follows:
             return
         for _, evt in run:
             if evt.classification in (None, "neutral"):
@@ -252,19 +267,23 @@ class ClassifyEngine:
             return
 
         consecutive_reads = rule.get("consecutive_reads", 3)
-        search_tools = {"Read", "Grep", "Glob"}
-        write_tools = {"Edit", "Write", "MultiEdit", "NotebookEdit"}
+        search_tools = set(_SEARCH_TOOLS)
+        write_tools = set(_WRITE_TOOLS)
 
         tool_events = [
             (i, e) for i, e in enumerate(events)
             if e.event_type == "tool_use" and e.tool_name is not None
         ]
+        last_write = max(
+            (k for k, (_, e) in enumerate(tool_events) if e.tool_name in write_tools),
+            default=-1,
+        )
 
         i = 0
         while i < len(tool_events):
             run = self._scan_search_run(tool_events, i, search_tools)
             if len(run) >= consecutive_reads:
-                self._mark_abandoned_run(run, tool_events[i + len(run):], write_tools)
+                self._mark_abandoned_run(run, last_write >= i + len(run))
                 i += len(run)
             else:
                 i += 1
@@ -316,15 +335,119 @@ class ClassifyEngine:
             return
 
         # Agent types that are read-only by design — never fruitless
-        exempt_types = set(rule.get("exempt_agent_types", [
-            "reviewer", "researcher", "Explore", "fact-checker",
-            "unit-validator", "cross-unit-validator", "claude-code-guide",
-        ]))
-        window = WindowConfig(
-            window_seconds=rule.get("window_seconds", 300),
-            lookforward_events=rule.get("lookforward_events", 10),
-            write_tools=frozenset({"Edit", "Write", "MultiEdit", "NotebookEdit"}),
-        )
+        exempt_types = set(rule.get("exempt_agent_types", _DEFAULT_EXEMPT_AGENT_TYPES))
+        window = _fruitless_window(rule)
 
         for i, evt in enumerate(events):
             self._mark_if_fruitless(evt, i, events, exempt_types, window)
+
+
+# (event, classification, waste_reason) as it was before a provisional mark.
+_Mark = tuple[SessionEvent, str | None, str | None]
+
+
+@dataclass
+class _PendingAgent:
+    mark: _Mark
+    seen: int = 0
+
+
+class IncrementalClassifier:
+    """Classify a growing event list one appended suffix at a time.
+
+    After every :meth:`extend`, labels match what ``ClassifyEngine.classify``
+    would give the whole list. The first pass only looks back a bounded
+    window, so it runs over the new suffix alone. The two second-pass rules
+    look *forward* ("no write follows the search run", "no write within N
+    events of the Agent call"); a full pass over a list that ends mid-window
+    marks those events, so they are marked provisionally here too and the
+    marks are retracted when a later write disproves them.
+    """
+
+    def __init__(self, engine: ClassifyEngine) -> None:
+        self._engine = engine
+        review = engine.rules.get("review", {})
+        abandoned = review.get("abandoned-search", {})
+        self._abandoned_enabled = abandoned.get("enabled", True)
+        self._min_run = abandoned.get("consecutive_reads", 3)
+        fruitless = review.get("fruitless-agent", {})
+        self._fruitless_enabled = fruitless.get("enabled", True)
+        self._exempt_types = set(fruitless.get("exempt_agent_types", _DEFAULT_EXEMPT_AGENT_TYPES))
+        self._window = _fruitless_window(fruitless)
+        self._run: list[SessionEvent] = []
+        self._provisional_runs: list[_Mark] = []
+        self._pending_agents: list[_PendingAgent] = []
+
+    def extend(self, events: list[SessionEvent], start: int) -> list[_Mark]:
+        """Classify ``events[start:]`` and update verdicts on earlier events.
+
+        Returns one entry per event whose second-pass label changed, holding
+        its label from before this call (first change wins), so callers can
+        retract it from running aggregates.
+        """
+        self._engine._first_pass(events, start)
+        changed: dict[int, _Mark] = {}
+        for evt in events[start:]:
+            if evt.event_type != "tool_use":
+                continue
+            self._advance_agents(evt, changed)
+            if evt.tool_name is not None:
+                self._advance_search_run(evt, changed)
+            if evt.tool_name == "Agent":
+                self._open_agent(evt, changed)
+        return list(changed.values())
+
+    @staticmethod
+    def _set(evt: SessionEvent, cls: str | None, reason: str | None, changed: dict[int, _Mark]) -> None:
+        changed.setdefault(id(evt), (evt, evt.classification, evt.waste_reason))
+        evt.classification, evt.waste_reason = cls, reason
+
+    def _restore(self, marks: list[_Mark], changed: dict[int, _Mark]) -> None:
+        for evt, cls, reason in marks:
+            self._set(evt, cls, reason, changed)
+
+    def _mark_abandoned(self, evt: SessionEvent, changed: dict[int, _Mark]) -> None:
+        if evt.classification in (None, "neutral"):
+            self._provisional_runs.append((evt, evt.classification, evt.waste_reason))
+            self._set(evt, "review", "abandoned-search", changed)
+
+    def _advance_search_run(self, evt: SessionEvent, changed: dict[int, _Mark]) -> None:
+        if not self._abandoned_enabled:
+            return
+        if evt.tool_name in _SEARCH_TOOLS:
+            self._run.append(evt)
+            if len(self._run) == self._min_run:
+                for e in self._run:
+                    self._mark_abandoned(e, changed)
+            elif len(self._run) > self._min_run:
+                self._mark_abandoned(evt, changed)
+            return
+        self._run = []
+        if evt.tool_name in _WRITE_TOOLS:
+            self._restore(self._provisional_runs, changed)
+            self._provisional_runs = []
+
+    def _open_agent(self, evt: SessionEvent, changed: dict[int, _Mark]) -> None:
+        if not self._fruitless_enabled:
+            return
+        if (evt.tool_input or {}).get("subagent_type", "") in self._exempt_types:
+            return
+        if evt.classification not in (None, "productive"):
+            return
+        pending = _PendingAgent(mark=(evt, evt.classification, evt.waste_reason))
+        self._set(evt, "review", "fruitless-agent", changed)
+        self._pending_agents.append(pending)
+
+    def _advance_agents(self, evt: SessionEvent, changed: dict[int, _Mark]) -> None:
+        still_open: list[_PendingAgent] = []
+        for pending in self._pending_agents:
+            agent_evt = pending.mark[0]
+            delta = (evt.timestamp - agent_evt.timestamp).total_seconds()
+            if delta > self._window.window_seconds or pending.seen >= self._window.lookforward_events:
+                continue  # window closed: the mark is final
+            if evt.tool_name in self._window.write_tools:
+                self._restore([pending.mark], changed)
+                continue
+            pending.seen += 1
+            still_open.append(pending)
+        self._pending_agents = still_open
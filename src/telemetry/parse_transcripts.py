@@ -11,6 +11,7 @@ Implementation lives in:
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -39,12 +40,24 @@ class TranscriptParseResult:
     """Result of parsing JSONL transcripts."""
 
     results: list[ParseResult] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def bytes_processed(self) -> int:
+        return sum(r.bytes_processed for r in self.results)
+
+    @property
+    def mb_per_s(self) -> float:
+        if self.elapsed_s <= 0:
+            return 0.0
+        return self.bytes_processed / 1_000_000 / self.elapsed_s
 
 
 class TranscriptParseProcessor(SafeProcessor[TranscriptParseRequest, TranscriptParseResult]):
     """Parse JSONL transcripts and build a structured index."""
 
     def _process_safe(self, payload: TranscriptParseRequest) -> TranscriptParseResult:
+        started = time.perf_counter()
         results = run_parse_transcripts(
             since=payload.since,
             projects_dir=payload.projects_dir,
@@ -52,7 +65,7 @@ class TranscriptParseProcessor(SafeProcessor[TranscriptParseRequest, TranscriptP
             force=payload.force,
             limit=payload.limit,
         )
-        return TranscriptParseResult(results=results)
+        return TranscriptParseResult(results=results, elapsed_s=time.perf_counter() - started)
 
 
 class TranscriptParseProducer(BaseProducer):
@@ -96,6 +109,11 @@ class TranscriptParseProducer(BaseProducer):
             fmt="table",
             headers=["session_id", "prompts", "bash_cmds", "new_bytes", "status"],
         )
+        if payload.elapsed_s > 0:
+            w.print(
+                f"\n{len(payload.results)} files, {payload.bytes_processed / 1_000_000:.1f} MB"
+                f" in {payload.elapsed_s:.2f}s ({payload.mb_per_s:.1f} MB/s)"
+            )
 
 
 def _run_parse_transcripts(request: TranscriptParseRequest, fmt: str) -> None:
@@ -2,6 +2,13 @@
 
 Extracted from parse_transcripts.py to reduce complexity.
 Record-parsing helpers (no I/O) live in _transcript_record_parser.py.
+
+Files are independent apart from the shared high-water-mark state, so a run
+with several files to catch up on fans them out over a process pool. Files
+that share a stem share a session index, so they go to one worker and run in
+order, as a serial run would take them. The parent alone owns
+``.state.json``, which it commits every ``_CHECKPOINT_EVERY`` files and once
+at the end rather than after every file.
 """
 
 from __future__ import annotations
@@ -9,6 +16,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import BinaryIO
@@ -20,10 +28,26 @@ from telemetry.timeutil import now_utc, parse_window
 from telemetry.parse_transcripts_emit import ParseResult
 from telemetry._transcript_record_parser import _process_one_record
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads = orjson.loads
+    _DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError, UnicodeDecodeError)
+except ImportError:  # orjson is optional — the stdlib decoder is only slower
+    _loads = json.loads
+    _DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
 DEFAULT_INDEX_DIR = Path.home() / ".config" / "dancing-bear" / "work" / "prompt-index"
 STATE_FILE = ".state.json"
 LOCK_FILE = ".lock"
 
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 4
+_MAX_WORKERS = 8
+# Commit the high-water marks this often so an interrupted run resumes close
+# to where it stopped instead of reprocessing everything since the last run.
+_CHECKPOINT_EVERY = 64
+
 
 def _load_json_nullable(path: Path) -> dict[str, object] | None:
     """Load JSON from path, returning None if the file is missing or invalid.
@@ -146,13 +170,16 @@ def _process_one_line(
     line is blank, malformed JSON, or not a JSON object — all of which still
     count as "processed" bytes but contribute no record deltas.
     """
-    line = raw_line.decode("utf-8", errors="replace").strip()
+    line = raw_line.strip()
     if not line:
         return None
     try:
-        record = json.loads(line)
-    except json.JSONDecodeError:
-        return None
+        record = _loads(line)
+    except _DECODE_ERRORS:
+        try:
+            record = json.loads(line.decode("utf-8", errors="replace"))
+        except json.JSONDecodeError:
+            return None
     if not isinstance(record, dict):
         return None
     return _process_one_record(record, session_index, prompt_index_base, prompts_added_so_far)
@@ -220,36 +247,40 @@ def _process_jsonl_file(
     return prompts_added, bash_added, bytes_processed, new_offset
 
 
-def _process_one_file(
-    jsonl_path: Path,
-    index_dir: Path,
-    state: dict[str, object],
-    state_path: Path,
-    force: bool,
-) -> ParseResult:
-    """Process a single JSONL file and update state. Returns a ParseResult."""
-    abs_path = str(jsonl_path.resolve())
-    session_id = _session_id_from_path(jsonl_path)
+def _start_offset(state: dict[str, object], abs_path: str, force: bool) -> int:
     try:
-        start_offset = 0 if force else int(state.get(abs_path, 0) or 0)
+        return 0 if force else int(state.get(abs_path, 0) or 0)
     except (TypeError, ValueError):
-        start_offset = 0  # corrupted state entry — reprocess from beginning
-    project_path = str(jsonl_path.parent)
-    session_index = _load_or_init_session_index(index_dir, session_id)
+        return 0  # corrupted state entry — reprocess from beginning
+
+
+def _parse_file_job(
+    jsonl_path: str,
+    index_dir: str,
+    start_offset: int,
+) -> tuple[str, int | None, ParseResult]:
+    """Process one JSONL file and write its session index (process-pool worker).
+
+    Returns (abs_path, new_offset, result). ``new_offset`` is None when the
+    file failed, so the caller leaves its high-water mark untouched.
+    """
+    path = Path(jsonl_path)
+    abs_path = str(path.resolve())
+    session_id = _session_id_from_path(path)
+    session_index = _load_or_init_session_index(Path(index_dir), session_id)
 
     try:
         prompts_added, bash_added, bytes_proc, new_offset = _process_jsonl_file(
-            jsonl_path, start_offset, session_index, project_path
+            path, start_offset, session_index, str(path.parent)
         )
+        atomic_write_json(Path(index_dir) / f"{session_id}.json", session_index)
     except Exception as exc:  # noqa: BLE001
-        print(f"[parse-transcripts] error processing {jsonl_path}: {exc}", file=sys.stderr)
-        return ParseResult(session_id=session_id, prompts_added=0, bash_added=0, bytes_processed=0, status="error")
-
-    atomic_write_json(index_dir / f"{session_id}.json", session_index)
-    state[abs_path] = new_offset
-    atomic_write_json(state_path, state)
+        print(f"[parse-transcripts] error processing {path}: {exc}", file=sys.stderr)
+        return abs_path, None, ParseResult(
+            session_id=session_id, prompts_added=0, bash_added=0, bytes_processed=0, status="error"
+        )
 
-    return ParseResult(
+    return abs_path, new_offset, ParseResult(
         session_id=session_id,
         prompts_added=prompts_added,
         bash_added=bash_added,
@@ -258,6 +289,68 @@ def _process_one_file(
     )
 
 
+def _parse_session_jobs(jobs: list[tuple[str, str, int]]) -> list[tuple[str, int | None, ParseResult]]:
+    """Run the jobs of files that write the same session index, one after another."""
+    return [_parse_file_job(*job) for job in jobs]
+
+
+def _process_one_file(
+    jsonl_path: Path,
+    index_dir: Path,
+    state: dict[str, object],
+    state_path: Path,
+    force: bool,
+) -> ParseResult:
+    """Process a single JSONL file and update state. Returns a ParseResult."""
+    abs_path = str(jsonl_path.resolve())
+    _, new_offset, result = _parse_file_job(
+        str(jsonl_path), str(index_dir), _start_offset(state, abs_path, force)
+    )
+    if new_offset is not None:
+        state[abs_path] = new_offset
+        atomic_write_json(state_path, state)
+    return result
+
+
+def _iter_parsed_files(
+    files: list[Path],
+    index_dir: Path,
+    state: dict[str, object],
+    force: bool,
+):
+    """Yield (abs_path, new_offset, result) per file, in a process pool when worthwhile.
+
+    Files are grouped by session id, since each group writes one index file;
+    a group runs in one worker. Falls back to in-process parsing if the pool
+    cannot start. Results keep the order of ``files`` either way.
+    """
+    jobs = [
+        (str(p), str(index_dir), _start_offset(state, str(p.resolve()), force))
+        for p in files
+    ]
+    sessions: dict[str, list[int]] = {}
+    for i, p in enumerate(files):
+        sessions.setdefault(_session_id_from_path(p), []).append(i)
+    if len(sessions) >= _PARALLEL_MIN_FILES:
+        try:
+            pool = ProcessPoolExecutor(max_workers=min(_MAX_WORKERS, len(sessions)))
+        except (OSError, RuntimeError) as exc:
+            print(f"[parse-transcripts] process pool unavailable, parsing serially: {exc}", file=sys.stderr)
+        else:
+            with pool:
+                futures = {
+                    sid: pool.submit(_parse_session_jobs, [jobs[i] for i in members])
+                    for sid, members in sessions.items()
+                }
+                slot = {i: (sid, k) for sid, members in sessions.items() for k, i in enumerate(members)}
+                for i in range(len(jobs)):
+                    sid, k = slot[i]
+                    yield futures[sid].result()[k]
+            return
+    for job in jobs:
+        yield _parse_file_job(*job)
+
+
 def run_parse_transcripts(
     since: str,
     projects_dir: Path | None,
@@ -290,8 +383,20 @@ def run_parse_transcripts(
             files.sort(key=_safe_mtime, reverse=True)
             files = files[:limit]
 
-        for jsonl_path in files:
-            results.append(_process_one_file(jsonl_path, index_dir, state, state_path, force))
+        pending = 0
+        try:
+            for abs_path, new_offset, result in _iter_parsed_files(files, index_dir, state, force):
+                results.append(result)
+                if new_offset is None:
+                    continue
+                state[abs_path] = new_offset
+                pending += 1
+                if pending >= _CHECKPOINT_EVERY:
+                    atomic_write_json(state_path, state)
+                    pending = 0
+        finally:
+            if pending:
+                atomic_write_json(state_path, state)
 
     except click.BadParameter:
         raise  # propagate bad --since values to the CLI layer for user-facing error
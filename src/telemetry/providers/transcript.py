@@ -2,12 +2,13 @@
 
 Session discovery and windowed-aggregation entry points.  Low-level JSONL
 record parsing lives in ``transcript_parse``.  Agent token accumulation
-lives in ``transcript_aggregate``.
+lives in ``transcript_aggregate``.  Per-file summaries used by discovery and
+windowed totals are cached in ``transcript_index``.
 """
 
 import logging
 from collections.abc import Iterator
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 
 from telemetry.models import AgentSummary, AgentTokenRow, SessionEvent, SessionSummary
@@ -17,6 +18,16 @@ from telemetry.providers.transcript_aggregate import (
     accumulate_agent_tokens,
     build_agent_row,
 )
+from telemetry.providers.transcript_index import (
+    HOUR_S,
+    SessionIndex,
+    build_entry,
+    default_index_path,
+    entry_agents,
+    entry_totals,
+    hour_floor,
+    to_datetime,
+)
 from telemetry.providers.transcript_parse import (
     iter_jsonl_files,
     parse_assistant_record,
@@ -34,10 +45,19 @@ _SUBDIR_GLOB = "*/subagents/*.jsonl"
 class TranscriptProvider:
     """Reads and parses Claude Code JSONL transcript files."""
 
-    def __init__(self, projects_dir: Path | None = None):
+    def __init__(self, projects_dir: Path | None = None, index_path: Path | None = None):
+        """Args:
+            projects_dir: Transcript root; defaults to ``~/.claude/projects``.
+            index_path: Where to persist the session summary index. Defaults
+                to the data home for the default projects dir; an explicit
+                projects dir without one gets an in-memory index.
+        """
         if projects_dir is None:
             projects_dir = Path.home() / ".claude" / "projects"
+            if index_path is None:
+                index_path = default_index_path()
         self.projects_dir = Path(projects_dir)
+        self._index = SessionIndex(index_path)
 
     # ------------------------------------------------------------------
     # Core parsing
@@ -107,32 +127,68 @@ class TranscriptProvider:
     # Session discovery
     # ------------------------------------------------------------------
 
-    def _session_summary_from_file(
-        self, jsonl_file: Path, project_path: str
-    ) -> SessionSummary:
-        """Build a SessionSummary from a single .jsonl transcript file."""
-        file_ts = datetime.fromtimestamp(jsonl_file.stat().st_mtime, tz=timezone.utc)
+    def _parse_index_entry(self, jsonl_file: Path) -> dict:
+        """Parse one transcript into its summary index entry."""
+        st = jsonl_file.stat()
         try:
             events, agents = self.parse_session_with_agents(jsonl_file)
         except Exception:
             events, agents = [], []
+        return build_entry(events, agents, st.st_size, st.st_mtime_ns)
+
+    def _index_entry(self, jsonl_file: Path) -> dict:
+        """Return the index entry for a file, parsing it only if it changed."""
+        st = jsonl_file.stat()
+        entry = self._index.lookup(jsonl_file, st.st_size, st.st_mtime_ns)
+        if entry is None:
+            entry = self._parse_index_entry(jsonl_file)
+            self._index.put(jsonl_file, entry)
+        return entry
+
+    def _refresh_index(self, since: datetime | None) -> None:
+        """Bring the index up to date for every file modified since ``since``.
+
+        Stale files are parsed together (in parallel on a cold index) rather
+        than one by one as the scan reaches them. Entries for files that have
+        disappeared are dropped.
+        """
+        listed: list[Path] = []
+        for project_dir in self.projects_dir.iterdir():
+            if project_dir.is_dir():
+                listed.extend(p for p, _ in iter_jsonl_files(project_dir))
+        cutoff = since.timestamp() if since is not None else None
+        wanted = []
+        for p in listed:
+            try:
+                if cutoff is None or p.stat().st_mtime >= cutoff:
+                    wanted.append(p)
+            except OSError:
+                continue
+        self._index.refresh(wanted, self._parse_index_entry, self._compute_token_cost)
+        self._index.prune({str(p) for p in listed})
 
-        api_events = [e for e in events if e.event_type == "api_request"]
+    def _session_summary_from_file(
+        self, jsonl_file: Path, project_path: str
+    ) -> SessionSummary:
+        """Build a SessionSummary from a single .jsonl transcript file."""
+        file_ts = datetime.fromtimestamp(jsonl_file.stat().st_mtime, tz=timezone.utc)
+        entry = self._index_entry(jsonl_file)
+        cost, input_tokens, output_tokens, cache_read, cache_create = entry_totals(entry)
         return SessionSummary(
             session_id=jsonl_file.stem,
             project_path=project_path or None,
-            start_time=events[0].timestamp if events else file_ts,
-            end_time=events[-1].timestamp if events else file_ts,
-            model=api_events[0].model if api_events else "",
-            total_cost=sum(e.cost_usd or 0.0 for e in api_events),
+            start_time=to_datetime(entry["first"]) if entry["events"] else file_ts,
+            end_time=to_datetime(entry["last"]) if entry["events"] else file_ts,
+            model=entry["model"] or "",
+            total_cost=cost,
             cost_is_estimated=False,
-            total_events=len(events),
+            total_events=entry["events"],
             efficiency_score=0.0,
-            agents=agents,
-            input_tokens=sum(e.input_tokens or 0 for e in api_events),
-            output_tokens=sum(e.output_tokens or 0 for e in api_events),
-            cache_read_tokens=sum(e.cache_read_tokens or 0 for e in api_events),
-            cache_creation_tokens=sum(e.cache_creation_tokens or 0 for e in api_events),
+            agents=entry_agents(entry),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
+            cache_creation_tokens=cache_create,
         )
 
     @staticmethod
@@ -147,27 +203,6 @@ class TranscriptProvider:
         """
         return iter_jsonl_files(project_dir)
 
-    def _merge_subagent_files(
-        self, jsonl_files: list[Path]
-    ) -> tuple[list[SessionEvent], list[AgentSummary], datetime | None]:
-        """Parse and merge all subagent JSONL files, returning (events, agents, latest_mtime)."""
-        all_events: list[SessionEvent] = []
-        all_agents: list[AgentSummary] = []
-        file_ts: datetime | None = None
-
-        for jsonl_file in jsonl_files:
-            ts = datetime.fromtimestamp(jsonl_file.stat().st_mtime, tz=timezone.utc)
-            if file_ts is None or ts > file_ts:
-                file_ts = ts
-            try:
-                evts, agents = self.parse_session_with_agents(jsonl_file)
-            except Exception:
-                evts, agents = [], []
-            all_events.extend(evts)
-            all_agents.extend(agents)
-
-        return all_events, all_agents, file_ts
-
     def _session_summary_from_old_format(
         self, session_id: str, jsonl_files: list[Path], project_path: str
     ) -> SessionSummary:
@@ -176,28 +211,35 @@ class TranscriptProvider:
         The old subdirectory format stores one JSONL per subagent; they must be
         merged into a single session-level summary.
         """
-        all_events, all_agents, file_ts = self._merge_subagent_files(jsonl_files)
+        entries = [self._index_entry(f) for f in jsonl_files]
+        file_ts = max(
+            (datetime.fromtimestamp(f.stat().st_mtime, tz=timezone.utc) for f in jsonl_files),
+            default=None,
+        )
         fallback_ts = file_ts or datetime.now(timezone.utc)
-        # Replace per-file session_id values (agent-id stems) with the real session_id
-        for event in all_events:
-            event.session_id = session_id
-
-        api_events = [e for e in all_events if e.event_type == "api_request"]
+        stamped = [e for e in entries if e["events"]]
+        totals = [0.0, 0, 0, 0, 0]
+        agents: list[AgentSummary] = []
+        for entry in entries:
+            for i, value in enumerate(entry_totals(entry)):
+                totals[i] += value
+            agents.extend(entry_agents(entry))
+        model = next((e["model"] for e in entries if e["model"] is not None), "")
         return SessionSummary(
             session_id=session_id,
             project_path=project_path or None,
-            start_time=min((e.timestamp for e in all_events), default=fallback_ts),
-            end_time=max((e.timestamp for e in all_events), default=fallback_ts),
-            model=api_events[0].model if api_events else "",
-            total_cost=sum(e.cost_usd or 0.0 for e in api_events),
+            start_time=min((to_datetime(e["min"]) for e in stamped), default=fallback_ts),
+            end_time=max((to_datetime(e["max"]) for e in stamped), default=fallback_ts),
+            model=model,
+            total_cost=totals[0],
             cost_is_estimated=False,
-            total_events=len(all_events),
+            total_events=sum(e["events"] for e in entries),
             efficiency_score=0.0,
-            agents=all_agents,
-            input_tokens=sum(e.input_tokens or 0 for e in api_events),
-            output_tokens=sum(e.output_tokens or 0 for e in api_events),
-            cache_read_tokens=sum(e.cache_read_tokens or 0 for e in api_events),
-            cache_creation_tokens=sum(e.cache_creation_tokens or 0 for e in api_events),
+            agents=agents,
+            input_tokens=totals[1],
+            output_tokens=totals[2],
+            cache_read_tokens=totals[3],
+            cache_creation_tokens=totals[4],
         )
 
     def _collect_flat_sessions(
@@ -246,57 +288,33 @@ class TranscriptProvider:
 
         Returns a list of SessionSummary objects, one per session found.
         Handles both the new flat format and the old subdirectory format.
+        Only files that changed since the last call are re-parsed.
         """
         summaries: list[SessionSummary] = []
         if not self.projects_dir.exists():
             return summaries
 
+        self._refresh_index(since)
         for project_dir in self.projects_dir.iterdir():
             if not project_dir.is_dir():
                 continue
             project_path = "/" + project_dir.name.lstrip("-").replace("-", "/")
             self._collect_flat_sessions(project_dir, project_path, since, summaries)
             self._collect_subdir_sessions(project_dir, project_path, since, summaries)
+        self._index.save()
 
         summaries.sort(key=lambda s: s.end_time or s.start_time, reverse=True)
         return summaries
 
-    def _windowed_events(
-        self, jsonl_file: Path, since: datetime
-    ) -> list[SessionEvent]:
-        """Return api_request events from jsonl_file with timestamp >= since."""
-        try:
-            events, _ = self.parse_session_with_agents(jsonl_file)
-        except Exception:
-            return []
-        return [e for e in events if e.event_type == "api_request" and e.timestamp >= since]
-
-    def _accumulate_windowed_event(
-        self,
-        e: SessionEvent,
-        bucket_start: datetime,
-        num_slots: int,
-        totals: dict,
-    ) -> None:
-        """Add one api_request event's cost and tokens into the running totals dict."""
-        cost = e.cost_usd or 0.0
-        totals["cost"] += cost
-        totals["input_tokens"] += e.input_tokens or 0
-        totals["output_tokens"] += e.output_tokens or 0
-        totals["cache_read_tokens"] += e.cache_read_tokens or 0
-        if e.model:
-            totals["models"][e.model] = totals["models"].get(e.model, 0.0) + cost
-        offset = (e.timestamp - bucket_start).total_seconds()
-        if 0.0 <= offset < num_slots * 3600:
-            totals["hourly_costs"][min(int(offset / 3600), num_slots - 1)] += cost
-
     def get_windowed_totals(self, since: datetime) -> dict[str, object]:
         """Sum costs and tokens for api_request events whose timestamp >= since.
 
-        Unlike get_sessions (which uses file mtime to filter), this method parses
-        every session file and sums only the individual API request events that fall
-        within the window. This prevents a session started before the window from
-        contributing its full lifetime cost to the window total.
+        Unlike get_sessions (which uses file mtime to filter), this method sums
+        only the API requests that fall within the window, so a session started
+        before the window does not contribute its full lifetime cost. Requests
+        are summed from the index's clock-hour buckets: the window start is
+        rounded down to the hour, and ``hourly_costs`` holds the last 12 clock
+        hours, the current (partial) hour last.
 
         Returns a dict with keys:
             cost (float), input_tokens (int), output_tokens (int),
@@ -305,7 +323,7 @@ class TranscriptProvider:
         """
         now = datetime.now(timezone.utc)
         num_slots = 12
-        bucket_start = now - timedelta(hours=num_slots)
+        first_slot_hour = hour_floor(now.timestamp()) - (num_slots - 1) * HOUR_S
         hourly: list[float] = [0.0] * num_slots
 
         totals: dict = {
@@ -321,35 +339,63 @@ class TranscriptProvider:
         if not self.projects_dir.exists():
             return totals
 
+        self._refresh_index(since)
         for project_dir in self.projects_dir.iterdir():
             if not project_dir.is_dir():
                 continue
-            self._accumulate_windowed_project(project_dir, since, bucket_start, num_slots, totals)
+            self._accumulate_windowed_project(project_dir, since, first_slot_hour, num_slots, totals)
+        self._index.save()
 
         return totals
 
+    @staticmethod
+    def _accumulate_windowed_entry(
+        entry: dict,
+        min_hour: int,
+        first_slot_hour: int,
+        num_slots: int,
+        totals: dict,
+    ) -> bool:
+        """Add one file's in-window hour buckets to totals; True if any matched."""
+        matched = False
+        for hour, by_model in entry["hours"].items():
+            hour_start = int(hour)
+            if hour_start < min_hour:
+                continue
+            matched = True
+            slot = (hour_start - first_slot_hour) // HOUR_S
+            for model, (cost, input_tokens, output_tokens, cache_read, _) in by_model.items():
+                totals["cost"] += cost
+                totals["input_tokens"] += input_tokens
+                totals["output_tokens"] += output_tokens
+                totals["cache_read_tokens"] += cache_read
+                if model:
+                    totals["models"][model] = totals["models"].get(model, 0.0) + cost
+                if 0 <= slot < num_slots:
+                    totals["hourly_costs"][slot] += cost
+        return matched
+
     def _accumulate_windowed_project(
         self,
         project_dir: Path,
         since: datetime,
-        bucket_start: datetime,
+        first_slot_hour: int,
         num_slots: int,
         totals: dict,
     ) -> None:
         """Accumulate windowed totals for all JSONL files in one project directory."""
+        min_hour = hour_floor(since.timestamp())
         seen_sessions: set[str] = set()
         for jsonl_file, session_id in self._iter_jsonl_files(project_dir):
             file_ts = datetime.fromtimestamp(jsonl_file.stat().st_mtime, tz=timezone.utc)
             if file_ts < since:
                 continue
-            windowed = self._windowed_events(jsonl_file, since)
-            if not windowed:
+            entry = self._index_entry(jsonl_file)
+            if not self._accumulate_windowed_entry(entry, min_hour, first_slot_hour, num_slots, totals):
                 continue
             if session_id not in seen_sessions:
                 totals["sessions"] += 1
                 seen_sessions.add(session_id)
-            for e in windowed:
-                self._accumulate_windowed_event(e, bucket_start, num_slots, totals)
 
     def get_current_session_id(self) -> str | None:
         """Return the session ID of the most recently modified .jsonl file.
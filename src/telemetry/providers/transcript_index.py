@@ -0,0 +1,211 @@
+"""Persistent per-file summary index for TranscriptProvider.
+
+``get_sessions`` and ``get_windowed_totals`` used to parse every transcript
+under the projects dir on every call — once per menubar refresh and several
+times per refresh for the different windows — even though almost every file
+is unchanged since the last call. The index keeps, per JSONL file:
+
+- the file's size and mtime, which together decide whether it is stale;
+- session-level totals (event count, first/last timestamps, first model,
+  agents);
+- api_request cost and tokens bucketed by clock hour and model.
+
+Only stale or new files are parsed. Windowed totals are answered by summing
+the hour buckets, so the window start is effectively rounded down to the hour.
+
+Costs are stored already priced, so the configured ``cost_multiplier`` is
+part of the index fingerprint; changing it rebuilds the index.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+
+from telemetry.models import AgentSummary, SessionEvent
+from telemetry.pricing import _cost_multiplier
+from telemetry.providers.transcript_parse import CostFn, parse_session_file
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+HOUR_S = 3600
+
+# Below this many stale files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = 8
+
+# Per (hour, model) bucket: [cost, input, output, cache_read, cache_creation]
+_COST, _INPUT, _OUTPUT, _CACHE_READ, _CACHE_CREATE = range(5)
+
+
+def default_index_path() -> Path:
+    return data_home() / "telemetry" / "transcript-index.json"
+
+
+def hour_floor(ts: float) -> int:
+    return int(ts // HOUR_S) * HOUR_S
+
+
+def _ts(dt: datetime) -> float:
+    return dt.timestamp()
+
+
+def to_datetime(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def build_entry(
+    events: list[SessionEvent],
+    agents: list[AgentSummary],
+    size: int,
+    mtime_ns: int,
+) -> dict:
+    """Reduce one parsed transcript to its index entry."""
+    hours: dict[str, dict[str, list[float]]] = {}
+    model: str | None = None
+    for evt in events:
+        if evt.event_type != "api_request":
+            continue
+        if model is None:
+            model = evt.model or ""
+        by_model = hours.setdefault(str(hour_floor(_ts(evt.timestamp))), {})
+        bucket = by_model.setdefault(evt.model or "", [0.0, 0, 0, 0, 0])
+        bucket[_COST] += evt.cost_usd or 0.0
+        bucket[_INPUT] += evt.input_tokens or 0
+        bucket[_OUTPUT] += evt.output_tokens or 0
+        bucket[_CACHE_READ] += evt.cache_read_tokens or 0
+        bucket[_CACHE_CREATE] += evt.cache_creation_tokens or 0
+    stamps = [_ts(e.timestamp) for e in events]
+    return {
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "events": len(events),
+        "first": stamps[0] if stamps else None,
+        "last": stamps[-1] if stamps else None,
+        "min": min(stamps) if stamps else None,
+        "max": max(stamps) if stamps else None,
+        "model": model,
+        "hours": hours,
+        "agents": [asdict(a) for a in agents],
+    }
+
+
+def entry_agents(entry: dict) -> list[AgentSummary]:
+    return [AgentSummary(**raw) for raw in entry.get("agents") or []]
+
+
+def entry_totals(entry: dict, min_hour: int | None = None) -> list[float]:
+    """Sum [cost, input, output, cache_read, cache_creation] over hour buckets >= min_hour."""
+    out = [0.0, 0, 0, 0, 0]
+    for hour, by_model in entry["hours"].items():
+        if min_hour is not None and int(hour) < min_hour:
+            continue
+        for bucket in by_model.values():
+            for i, value in enumerate(bucket):
+                out[i] += value
+    return out
+
+
+def summarize_file(path: str, cost_fn: CostFn) -> tuple[str, dict]:
+    """Parse one transcript into an index entry (process-pool worker)."""
+    p = Path(path)
+    st = p.stat()
+    try:
+        events, agents = parse_session_file(p, cost_fn)
+    except Exception:
+        events, agents = [], []
+    return path, build_entry(events, agents, st.st_size, st.st_mtime_ns)
+
+
+class SessionIndex:
+    """Index entries by absolute file path, valid while (size, mtime) match.
+
+    With ``path=None`` the index lives only in memory, which still saves
+    re-parsing across calls on one provider (the menubar keeps one for its
+    lifetime).
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._fingerprint = f"{_INDEX_VERSION}:{_cost_multiplier()}"
+        self._files: dict[str, dict] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        if self._files is None:
+            data = safe_load_json(self.path, default=None) if self.path else None
+            if isinstance(data, dict) and data.get("fingerprint") == self._fingerprint:
+                self._files = data.get("files") or {}
+            else:
+                self._files = {}
+        return self._files
+
+    def lookup(self, path: Path, size: int, mtime_ns: int) -> dict | None:
+        entry = self._load().get(str(path))
+        if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+            return entry
+        return None
+
+    def put(self, path: Path, entry: dict) -> None:
+        self._load()[str(path)] = entry
+        self._dirty = True
+
+    def stale(self, paths: list[Path]) -> list[Path]:
+        out = []
+        for p in paths:
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            if self.lookup(p, st.st_size, st.st_mtime_ns) is None:
+                out.append(p)
+        return out
+
+    def refresh(self, paths: list[Path], parse: Callable[[Path], dict], cost_fn: CostFn) -> None:
+        """Bring entries for ``paths`` up to date, parsing stale files.
+
+        Few stale files are parsed in-process with ``parse``; a cold index
+        fans out over a process pool, falling back to in-process parsing if
+        the pool cannot start.
+        """
+        stale = self.stale(paths)
+        if len(stale) >= _PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=min(_MAX_WORKERS, len(stale))) as pool:
+                    results = list(pool.map(
+                        summarize_file, [str(p) for p in stale], [cost_fn] * len(stale),
+                        chunksize=4,
+                    ))
+                for path, entry in results:
+                    self.put(Path(path), entry)
+                return
+            except (OSError, RuntimeError) as exc:
+                logger.debug("parallel transcript parse unavailable: %s", exc)
+        for p in stale:
+            try:
+                self.put(p, parse(p))
+            except OSError:
+                continue
+
+    def prune(self, keep: set[str]) -> None:
+        """Drop entries for files that no longer exist under the projects dir."""
+        files = self._load()
+        for name in [n for n in files if n not in keep]:
+            del files[name]
+            self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty and self.path is not None:
+            atomic_write_json(self.path, {
+                "fingerprint": self._fingerprint,
+                "files": self._load(),
+            }, indent=None)
+        self._dirty = False
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -150,7 +151,53 @@ def parse_user_record(
     )
 
 
-def parse_session_file(  # NOSONAR S3776 - JSONL file parser; loop+try/except+message-type dispatch is irreducible
+@dataclass
+class SessionParseState:
+    """Parser state carried across chunks of one transcript.
+
+    ``parse_session_lines`` can be fed a file in pieces (e.g. whatever a tail
+    reader found since its last poll) and yields exactly what one pass over
+    the whole file would, as long as the same state object is reused.
+    """
+
+    sequence: int = 0
+    agent_tool_inputs: dict[str, dict] = field(default_factory=dict)
+
+
+def parse_session_lines(
+    lines: Iterable[str],
+    compute_cost_fn: CostFn,
+    state: SessionParseState,
+) -> tuple[list[SessionEvent], list[AgentSummary]]:
+    """Parse JSONL lines into (events, agents), advancing ``state``.
+
+    Blank and undecodable lines are skipped.
+    """
+    events: list[SessionEvent] = []
+    agents: list[AgentSummary] = []
+    for raw_line in lines:
+        raw_line = raw_line.strip()
+        if not raw_line:
+            continue
+        try:
+            record = json.loads(raw_line)
+        except json.JSONDecodeError:
+            continue
+
+        msg_type = record.get("type")
+        if msg_type == "assistant":
+            new_evts, state.sequence = parse_assistant_record(
+                record, state.agent_tool_inputs, state.sequence, compute_cost_fn
+            )
+            events.extend(new_evts)
+        elif msg_type == "user":
+            agent = parse_user_record(record, state.agent_tool_inputs, compute_cost_fn)
+            if agent is not None:
+                agents.append(agent)
+    return events, agents
+
+
+def parse_session_file(
     path: Path,
     compute_cost_fn: CostFn,
 ) -> tuple[list[SessionEvent], list[AgentSummary]]:
@@ -166,33 +213,8 @@ def parse_session_file(  # NOSONAR S3776 - JSONL file parser; loop+try/except+me
         compute_cost_fn: Callable(model, input, output, cache_read, cache_create)
             returning a float USD cost.
     """
-    events: list[SessionEvent] = []
-    agents: list[AgentSummary] = []
-    agent_tool_inputs: dict[str, dict] = {}
-    sequence = 0
-
     with open(path, "r", encoding="utf-8") as fh:
-        for raw_line in fh:
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
-            try:
-                record = json.loads(raw_line)
-            except json.JSONDecodeError:
-                continue
-
-            msg_type = record.get("type")
-            if msg_type == "assistant":
-                new_evts, sequence = parse_assistant_record(
-                    record, agent_tool_inputs, sequence, compute_cost_fn
-                )
-                events.extend(new_evts)
-            elif msg_type == "user":
-                agent = parse_user_record(record, agent_tool_inputs, compute_cost_fn)
-                if agent is not None:
-                    agents.append(agent)
-
-    return events, agents
+        return parse_session_lines(fh, compute_cost_fn, SessionParseState())
 
 
 def iter_jsonl_files(project_dir: Path) -> Iterator[tuple[Path, str]]:
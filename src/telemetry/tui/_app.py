@@ -21,7 +21,8 @@ from telemetry.tui._renderers import (
     _tool_event_detail,
     _tool_stat_detail,
 )
-from telemetry.tui._summary import SummaryConfig, compute_summary
+from telemetry.tui._live import LiveSession
+from telemetry.tui._summary import SummaryConfig
 from telemetry.tui._widgets import (
     APP_CSS,
     _DetailModal,
@@ -57,6 +58,7 @@ class TelemetryTranscriptsApp(App):
         self._refresh = refresh
         self._session_id = session_id
         self._session_file: Path | None = None
+        self._live: LiveSession | None = None
         self._all_events: list[SessionEvent] = []
         self._all_agents: list[AgentSummary] = []
         self._tool_stats_list: list[ToolStats] = []
@@ -106,7 +108,8 @@ class TelemetryTranscriptsApp(App):
         self.set_interval(self._refresh, self._refresh_data)
 
     # ------------------------------------------------------------------
-    # Data refresh — panels always show FULL session data
+    # Data refresh — panels always show FULL session data, built up
+    # incrementally from the lines appended since the last tick
     # ------------------------------------------------------------------
 
     def _refresh_data(self) -> None:  # pragma: no cover - query_one needs a mounted DOM
@@ -116,28 +119,29 @@ class TelemetryTranscriptsApp(App):
             )
             return
 
-        try:
-            events, agents = self._transcript.parse_session_with_agents(
-                self._session_file
+        if self._live is None or self._live.path != self._session_file:
+            self._live = LiveSession(
+                self._session_file, self._classify, self._blame, self._transcript,
             )
+        try:
+            update = self._live.poll()
         except Exception:
             return
+        if not update.changed and self._last_event_count:
+            return
 
+        events, agents = self._live.events, self._live.agents
         self._all_events = events
         self._all_agents = agents
 
-        self._classify.classify(events)
-        self._blame.attribute(events)
-
         project_path = (
             str(self._session_file.parent) if self._session_file else None
         )
-        summary = compute_summary(
-            events, agents,
+        summary = self._live.summary(
             SummaryConfig(self._session_id, project_path, cost_is_estimated=True),
         )
 
-        tips = self._tips_engine.generate(events, max_tips=5)
+        tips = self._live.tips(self._tips_engine, max_tips=5)
 
         self.query_one("#header", HeaderPanel).update_summary(summary)
         self._tips_list = tips
@@ -154,12 +158,19 @@ class TelemetryTranscriptsApp(App):
 
         self._refresh_agents_table(agents)
 
-        tool_count = sum(
-            1 for e in events if e.event_type == "tool_use" and e.tool_name
-        )
-        if tool_count != self._last_event_count:
+        new_rows = [
+            e for e in update.new_events
+            if e.event_type == "tool_use" and e.tool_name
+        ]
+        # Relabelled rows are already on screen, so redraw; otherwise append.
+        if update.reset or update.relabelled or not self._last_event_count:
             self._refresh_timeline(events)
-            self._last_event_count = tool_count
+            self._last_event_count = sum(
+                1 for e in events if e.event_type == "tool_use" and e.tool_name
+            )
+        elif new_rows:
+            self._append_timeline(new_rows)
+            self._last_event_count += len(new_rows)
 
     def _refresh_tools_table(self) -> None:
         key = "|".join(
@@ -200,12 +211,14 @@ class TelemetryTranscriptsApp(App):
             )
 
     def _refresh_timeline(self, events: list[SessionEvent]) -> None:
-        timeline = self.query_one("#timeline", DataTable)
-        timeline.clear()
-        tool_events = [
+        self.query_one("#timeline", DataTable).clear()
+        self._append_timeline([
             e for e in events
             if e.event_type == "tool_use" and e.tool_name
-        ]
+        ])
+
+    def _append_timeline(self, tool_events: list[SessionEvent]) -> None:
+        timeline = self.query_one("#timeline", DataTable)
         for evt in tool_events:
             ts = evt.timestamp.strftime("%H:%M:%S")
             cls = evt.classification or "neutral"
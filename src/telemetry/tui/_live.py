@@ -0,0 +1,139 @@
+"""LiveSession — tail-follow a session transcript and update it incrementally.
+
+The dashboards refresh every couple of seconds. Re-reading, re-classifying
+and re-summarising the whole JSONL on every tick makes each refresh cost
+O(session length); a long session ends up spending most of its refresh
+budget re-parsing lines that have not changed.
+
+LiveSession keeps the byte offset of the last complete line it consumed and
+only parses what was appended since. Classification runs over the new
+suffix through :class:`IncrementalClassifier`, blame runs over the new
+events plus any earlier events whose label changed, and the summary is a
+running :class:`SummaryAccumulator`. If the file shrinks or is replaced,
+state is dropped and the next poll starts from byte zero.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from telemetry.blame import BlameEngine
+from telemetry.classify import ClassifyEngine, IncrementalClassifier
+from telemetry.models import AgentSummary, SessionEvent, SessionSummary, Tip
+from telemetry.providers.transcript import TranscriptProvider
+from telemetry.providers.transcript_parse import SessionParseState, parse_session_lines
+from telemetry.tips import TipsEngine
+from telemetry.tui._summary import SummaryAccumulator, SummaryConfig
+
+
+@dataclass
+class LiveUpdate:
+    """What one :meth:`LiveSession.poll` changed."""
+
+    new_events: list[SessionEvent] = field(default_factory=list)
+    new_agents: list[AgentSummary] = field(default_factory=list)
+    relabelled: list[SessionEvent] = field(default_factory=list)
+    reset: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.new_events or self.new_agents or self.relabelled or self.reset)
+
+
+class LiveSession:
+    """Incrementally parsed, classified and summarised view of one transcript."""
+
+    def __init__(
+        self,
+        path: Path,
+        classify_engine: ClassifyEngine,
+        blame_engine: BlameEngine,
+        transcript: TranscriptProvider,
+    ) -> None:
+        self.path = Path(path)
+        self._classify_engine = classify_engine
+        self._blame = blame_engine
+        self._cost_fn = transcript._compute_token_cost
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.events: list[SessionEvent] = []
+        self.agents: list[AgentSummary] = []
+        self._offset = 0
+        self._inode: int | None = None
+        self._parse_state = SessionParseState()
+        self._classifier = IncrementalClassifier(self._classify_engine)
+        self._summary = SummaryAccumulator()
+        self._active_skill: str | None = None
+        # Per tool event: its position and the skill in effect when it ran,
+        # so a label flipped by a later event can be re-blamed in place.
+        self._tool_at: dict[int, tuple[int, str | None]] = {}
+        self._actionable: dict[int, SessionEvent] = {}
+
+    def _read_appended(self) -> tuple[list[str], bool]:
+        """Return complete lines appended since the last poll, and whether state was reset."""
+        reset = False
+        with open(self.path, "rb") as fh:
+            st = os.fstat(fh.fileno())
+            if st.st_size < self._offset or (self._inode is not None and st.st_ino != self._inode):
+                self._reset_state()
+                reset = True
+            self._inode = st.st_ino
+            fh.seek(self._offset)
+            chunk = fh.read()
+        # A writer may be mid-line; leave the partial tail for the next poll.
+        end = chunk.rfind(b"\n") + 1
+        self._offset += end
+        return chunk[:end].decode("utf-8", errors="replace").splitlines(), reset
+
+    def poll(self) -> LiveUpdate:
+        """Consume newly appended lines and fold them into every aggregate.
+
+        Raises OSError if the transcript cannot be read.
+        """
+        lines, reset = self._read_appended()
+        new_events, new_agents = parse_session_lines(lines, self._cost_fn, self._parse_state)
+        update = LiveUpdate(new_agents=new_agents, reset=reset)
+        self.agents.extend(new_agents)
+        if not new_events:
+            return update
+
+        start = len(self.events)
+        self.events.extend(new_events)
+        marks = self._classifier.extend(self.events, start)
+
+        for idx in range(start, len(self.events)):
+            evt = self.events[idx]
+            self._active_skill = self._blame.active_skill_after(evt, self._active_skill)
+            self._blame.attribute_one(evt, self._active_skill)
+            if evt.event_type == "tool_use":
+                self._tool_at[id(evt)] = (idx, self._active_skill)
+            self._summary.add(evt)
+            self._track_actionable(idx, evt)
+
+        for evt, old_cls, old_reason in marks:
+            idx, skill = self._tool_at[id(evt)]
+            if idx >= start or (evt.classification, evt.waste_reason) == (old_cls, old_reason):
+                # New this poll (add() counted its final label) or flipped back.
+                continue
+            self._blame.attribute_one(evt, skill)
+            self._summary.reclassify(evt, old_cls)
+            self._track_actionable(idx, evt)
+            update.relabelled.append(evt)
+
+        update.new_events = new_events
+        return update
+
+    def _track_actionable(self, idx: int, evt: SessionEvent) -> None:
+        if evt.classification in ("avoidable", "review") and evt.blame_target and evt.waste_reason:
+            self._actionable[idx] = evt
+        else:
+            self._actionable.pop(idx, None)
+
+    def summary(self, config: SummaryConfig) -> SessionSummary:
+        return self._summary.summary(self.agents, config)
+
+    def tips(self, tips_engine: TipsEngine, max_tips: int = 3) -> list[Tip]:
+        """Tips over the actionable events only, in session order."""
+        actionable = [self._actionable[idx] for idx in sorted(self._actionable)]
+        return tips_engine.generate(actionable, max_tips=max_tips)
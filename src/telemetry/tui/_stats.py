@@ -17,6 +17,7 @@ from telemetry.tui._renderers import (
     _render_timeline_line,
     _render_tips_text,
 )
+from telemetry.tui._live import LiveSession
 from telemetry.tui._summary import SummaryConfig, compute_summary
 
 
@@ -42,6 +43,7 @@ class _StatsRenderer:
             transcript.find_session_file(self.resolved_session_id)
             if self.resolved_session_id else None
         )
+        self._live: LiveSession | None = None
 
     def _resolve_session(self) -> None:
         """Lazily discover the current session if not yet known."""
@@ -58,20 +60,20 @@ class _StatsRenderer:
             waiting = self._text_cls("Waiting for session…", style="dim")
             return Panel(waiting, title="[bold]stats[/]", border_style="dim")
 
+        if self._live is None or self._live.path != self.session_file:
+            self._live = LiveSession(
+                self.session_file, self.classify_engine, self.blame_engine, self.transcript,
+            )
         try:
-            events, agents = self.transcript.parse_session_with_agents(self.session_file)
+            self._live.poll()
         except Exception:
             return Panel(
                 self._text_cls("Error reading session.", style="red"),
                 title="[bold]stats[/]", border_style="red",
             )
 
-        self.classify_engine.classify(events)
-        self.blame_engine.attribute(events)
-
         project_path = str(self.session_file.parent)
-        summary = compute_summary(
-            events, agents,
+        summary = self._live.summary(
             SummaryConfig(self.resolved_session_id, project_path, cost_is_estimated=True),
         )
 
@@ -1,6 +1,6 @@
 """Session summary computation — aggregates events into SessionSummary."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 
 from telemetry.models import (
@@ -113,3 +113,107 @@ def compute_summary(  # NOSONAR S3776 - flat aggregation; many generator express
         tool_stats=tool_stats,
         agents=agents,
     )
+
+
+class SummaryAccumulator:
+    """Running form of :func:`compute_summary` for a session that only grows.
+
+    Events are folded in once via :meth:`add`; when a later event changes an
+    earlier event's classification, :meth:`reclassify` moves it between the
+    per-class counters. :meth:`summary` is then O(tools), not O(events).
+    """
+
+    def __init__(self) -> None:
+        self.total_events = 0
+        self.start_time: datetime | None = None
+        self.end_time: datetime | None = None
+        self.model = ""
+        self.api_cost = 0.0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read = 0
+        self.cache_creation = 0
+        self.tool_count = 0
+        self.class_counts: dict[str, int] = {}
+        self.avoidable_cost = 0.0
+        self.tool_stats: dict[str, ToolStats] = {}
+
+    def add(self, evt: SessionEvent) -> None:
+        self.total_events += 1
+        if self.start_time is None:
+            self.start_time = evt.timestamp
+        self.end_time = evt.timestamp
+        if evt.event_type == "api_request":
+            if evt.model:
+                self.model = evt.model
+            self.api_cost += evt.cost_usd or 0.0
+            self.input_tokens += evt.input_tokens or 0
+            self.output_tokens += evt.output_tokens or 0
+            self.cache_read += evt.cache_read_tokens or 0
+            self.cache_creation += evt.cache_creation_tokens or 0
+        elif evt.event_type == "tool_use":
+            self.tool_count += 1
+            name = evt.tool_name or "unknown"
+            stat = self.tool_stats.setdefault(name, ToolStats(tool_name=name))
+            stat.count += 1
+            if evt.cost_usd:
+                stat.cost += evt.cost_usd
+            self._count(evt, evt.classification, 1)
+
+    def reclassify(self, evt: SessionEvent, old_classification: str | None) -> None:
+        """Move a tool event from *old_classification* to its current one."""
+        if evt.event_type != "tool_use" or evt.classification == old_classification:
+            return
+        self._count(evt, old_classification, -1)
+        self._count(evt, evt.classification, 1)
+
+    def _count(self, evt: SessionEvent, classification: str | None, sign: int) -> None:
+        if classification is None:
+            return
+        self.class_counts[classification] = self.class_counts.get(classification, 0) + sign
+        stat = self.tool_stats[evt.tool_name or "unknown"]
+        if classification == "avoidable":
+            stat.avoidable_count += sign
+            if evt.cost_usd:
+                self.avoidable_cost += sign * evt.cost_usd
+        elif classification == "review":
+            stat.review_count += sign
+
+    def summary(self, agents: list[AgentSummary], config: SummaryConfig) -> SessionSummary:
+        counts = self.class_counts
+        productive = counts.get("productive", 0)
+        neutral = counts.get("neutral", 0)
+        total = self.tool_count
+        efficiency_score = (
+            (productive * 1.0 + neutral * 0.5) / total * 100 if total > 0 else 100.0
+        )
+        total_cacheable = self.input_tokens + self.cache_read
+        total_cost = (
+            config.total_cost_override
+            if config.total_cost_override is not None
+            else self.api_cost
+        )
+        return SessionSummary(
+            session_id=config.session_id,
+            project_path=config.project_path,
+            start_time=self.start_time or datetime.now(timezone.utc),
+            end_time=self.end_time,
+            model=self.model,
+            total_cost=total_cost,
+            cost_is_estimated=config.cost_is_estimated,
+            total_events=self.total_events,
+            efficiency_score=efficiency_score,
+            productive_count=productive,
+            neutral_count=neutral,
+            avoidable_count=counts.get("avoidable", 0),
+            review_count=counts.get("review", 0),
+            productive_cost=self.api_cost,
+            avoidable_cost=self.avoidable_cost,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            cache_read_tokens=self.cache_read,
+            cache_creation_tokens=self.cache_creation,
+            cache_hit_rate=self.cache_read / total_cacheable if total_cacheable > 0 else None,
+            tool_stats={name: replace(stat) for name, stat in self.tool_stats.items()},
+            agents=list(agents),
+        )
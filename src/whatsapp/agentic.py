@@ -32,6 +32,7 @@ def _flow_map() -> str:
         [
             "- Local search",
             "  - Search ChatStorage: ./bin/whatsapp search --contains school --limit 20",
+            "  - Refresh FTS5 index: ./bin/whatsapp index",
         ]
     )
 
@@ -41,6 +42,7 @@ def build_agentic_capsule() -> str:
         "help: ./bin/whatsapp --help",
         "search text: ./bin/whatsapp search --contains school --limit 20",
         "search contact: ./bin/whatsapp search --contact 'Teacher' --since-days 30",
+        "ranked search: ./bin/whatsapp search --fts --contains 'school trip'",
     ]
     return _build_capsule(
         META.app_id,
@@ -52,7 +54,8 @@ def build_agentic_capsule() -> str:
 
 def build_domain_map() -> str:
     return _core_build_domain_map(
-        "Top-Level\n- whatsapp/search.py — ChatStorage search helpers",
+        "Top-Level\n- whatsapp/search.py — ChatStorage search helpers\n"
+        "- whatsapp/fts_index.py — FTS5 sidecar index (incremental, BM25)",
         _cli_tree(),
         _flow_map(),
     )
@@ -14,7 +14,16 @@ from core.cli_framework import CLIApp
 from core.cli_output import OutputFormat
 
 from ..meta import META
-from ..pipeline import SearchProcessor, SearchProducer, SearchRequest, SearchRequestConsumer
+from ..pipeline import (
+    IndexProcessor,
+    IndexProducer,
+    IndexRequest,
+    IndexRequestConsumer,
+    SearchProcessor,
+    SearchProducer,
+    SearchRequest,
+    SearchRequestConsumer,
+)
 from ..search import default_db_path
 
 
@@ -46,6 +55,8 @@ def _lazy_agentic():
 @app.argument("--since-days", type=int, help="Restrict to messages in the last N days")
 @app.argument("--limit", type=int, default=50, help="Max rows to return (default 50)")
 @app.argument("--json", action="store_true", help="Output JSON instead of text table")
+@app.argument("--fts", action="store_true", help="Search the local FTS5 sidecar index (refreshed first; ranked by relevance; supports \"phrases\" and prefix*)")
+@app.argument("--index-path", help="Path to the FTS5 sidecar index (defaults under the data home)")
 def cmd_search(args) -> int:
     """Execute the search command."""
     # Handle mutual exclusivity of --from-me and --from-them
@@ -70,6 +81,8 @@ def cmd_search(args) -> int:
         since_days=getattr(args, "since_days", None),
         limit=max(1, int(getattr(args, "limit", 50) or 50)),
         output_format=fmt,
+        use_index=bool(getattr(args, "fts", False)),
+        index_path=getattr(args, "index_path", None),
     )
 
     envelope = SearchProcessor().process(SearchRequestConsumer(request).consume())
@@ -77,7 +90,31 @@ def cmd_search(args) -> int:
 
     if envelope.ok():
         return 0
-    # Handle errors from envelope
+    return _report_error(envelope)
+
+
+@app.command("index", help="Build or refresh the local FTS5 search index (never writes to ChatStorage)")
+@app.argument("--db", help="Path to ChatStorage.sqlite (defaults to macOS group container)")
+@app.argument("--index-path", help="Path to the FTS5 sidecar index (defaults under the data home)")
+@app.argument("--rebuild", action="store_true", help="Discard the existing index and rebuild from scratch")
+@app.argument("--json", action="store_true", help="Output JSON instead of text")
+def cmd_index(args) -> int:
+    """Execute the index command."""
+    request = IndexRequest(
+        db_path=getattr(args, "db", None),
+        index_path=getattr(args, "index_path", None),
+        rebuild=bool(getattr(args, "rebuild", False)),
+        output_format=OutputFormat.JSON if getattr(args, "json", False) else OutputFormat.TEXT,
+    )
+    envelope = IndexProcessor().process(IndexRequestConsumer(request).consume())
+    IndexProducer().produce(envelope)
+    if envelope.ok():
+        return 0
+    return _report_error(envelope)
+
+
+def _report_error(envelope) -> int:
+    """Print the envelope error (plus a --db hint for a missing DB); return 1."""
     diag = envelope.diagnostics or {}
     error_msg = diag.get("message", "Unknown error")
     print(error_msg, file=sys.stderr)
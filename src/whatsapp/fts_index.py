@@ -0,0 +1,226 @@
+"""Local FTS5 sidecar index for WhatsApp message search.
+
+``search.search_messages`` runs ``lower(col) LIKE '%term%'`` against
+ChatStorage, which is a full table scan with per-row lowercasing and has no
+notion of relevance. This module maintains a separate SQLite database holding
+an FTS5 copy of the message text, so searches become index lookups ranked by
+BM25.
+
+The source database is only ever opened read-only (``mode=ro`` URI). The
+sidecar is refreshed incrementally: it records the highest ``ZWAMESSAGE.Z_PK``
+it has copied and each refresh pulls only rows above it. Messages WhatsApp
+edits or deletes after indexing are not reconciled — ``rebuild=True`` starts
+the sidecar over when that matters.
+
+Query syntax (``--contains`` terms):
+- ``word`` — token match (porter-stemmed, case-insensitive)
+- ``two words`` — phrase match
+- ``pref*`` — prefix match
+- terms are joined with AND (``match_all``) or OR
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from core.cli_errors import NotFoundError
+from core.paths import data_home
+
+from .search import APPLE_EPOCH_OFFSET, MessageQuery, MessageRow, _connect_ro, default_db_path
+
+INDEX_FILENAME = "ChatStorage.fts.sqlite"
+
+# Rows copied per executemany batch; keeps memory flat on first builds over
+# years of history.
+_BATCH_SIZE = 5000
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+    "text, partner, pk UNINDEXED, msg_date UNINDEXED, from_me UNINDEXED, "
+    "tokenize='porter unicode61 remove_diacritics 2')",
+)
+
+_SOURCE_SQL = (
+    "SELECT m.Z_PK, m.ZMESSAGEDATE, s.ZPARTNERNAME, m.ZISFROMME, m.ZTEXT "
+    "FROM ZWAMESSAGE m JOIN ZWACHATSESSION s ON s.Z_PK = m.ZCHATSESSION "
+    "WHERE m.Z_PK > ? AND m.ZTEXT IS NOT NULL "
+    "ORDER BY m.Z_PK"
+)
+
+
+@dataclass
+class IndexStats:
+    """Outcome of an index refresh."""
+
+    index_path: str
+    added: int
+    max_pk: int
+    total: int
+    elapsed_s: float
+
+
+def default_index_path() -> str:
+    return str(data_home() / "whatsapp" / INDEX_FILENAME)
+
+
+def _open_index(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path)
+    for stmt in _SCHEMA:
+        conn.execute(stmt)
+    return conn
+
+
+def _get_meta(conn: sqlite3.Connection, key: str, default: str = "") -> str:
+    row = conn.execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+    return str(row[0]) if row else default
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute(
+        "INSERT INTO index_meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value),
+    )
+
+
+def _reset(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM messages_fts")
+    conn.execute("DELETE FROM index_meta")
+
+
+def refresh_index(
+    db_path: str | None = None,
+    index_path: str | None = None,
+    rebuild: bool = False,
+) -> IndexStats:
+    """Copy messages newer than the indexed high-water mark into the sidecar.
+
+    Args:
+        db_path: Source ChatStorage.sqlite (opened read-only).
+        index_path: Sidecar path. Defaults to :func:`default_index_path`.
+        rebuild: Drop existing index contents first.
+    """
+    src = os.path.expanduser(db_path or default_db_path())
+    if not os.path.exists(src):
+        raise NotFoundError(f"WhatsApp ChatStorage not found: {src}")
+    idx = os.path.expanduser(index_path or default_index_path())
+    started = time.monotonic()
+    conn = _open_index(idx)
+    try:
+        source_abs = os.path.abspath(src)
+        if rebuild or _get_meta(conn, "source_path", source_abs) != source_abs:
+            _reset(conn)
+        max_pk = int(_get_meta(conn, "max_pk", "0") or 0)
+        added = 0
+        with _connect_ro(src) as src_conn:
+            cur = src_conn.execute(_SOURCE_SQL, (max_pk,))
+            while True:
+                batch = cur.fetchmany(_BATCH_SIZE)
+                if not batch:
+                    break
+                conn.executemany(
+                    "INSERT INTO messages_fts (text, partner, pk, msg_date, from_me) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (str(text), str(partner or ""), int(pk), float(date or 0), int(fromme or 0))
+                        for pk, date, partner, fromme, text in batch
+                    ],
+                )
+                added += len(batch)
+                max_pk = max(max_pk, int(batch[-1][0]))
+        _set_meta(conn, "source_path", source_abs)
+        _set_meta(conn, "max_pk", str(max_pk))
+        conn.commit()
+        total = int(conn.execute("SELECT count(*) FROM messages_fts").fetchone()[0])
+    finally:
+        conn.close()
+    return IndexStats(
+        index_path=idx,
+        added=added,
+        max_pk=max_pk,
+        total=total,
+        elapsed_s=time.monotonic() - started,
+    )
+
+
+def _quote_term(term: str) -> str:
+    """Render one user term as an FTS5 string, keeping a trailing ``*`` prefix."""
+    prefix = term.endswith("*")
+    body = term.rstrip("*").strip()
+    if not body:
+        return ""
+    quoted = '"' + body.replace('"', '""') + '"'
+    return quoted + ("*" if prefix else "")
+
+
+def build_match_expression(terms: Iterable[str], match_all: bool) -> str:
+    """Build an FTS5 MATCH expression from ``--contains`` terms.
+
+    Each term is quoted, so FTS5 operators typed by the user are matched as
+    text rather than parsed; multi-word terms become phrases.
+    """
+    cleaned = [t.strip() for t in terms if isinstance(t, str) and t.strip()]
+    parts = [p for p in (_quote_term(t) for t in cleaned) if p]
+    joiner = " AND " if match_all else " OR "
+    return joiner.join(parts)
+
+
+def _build_index_where(q: MessageQuery) -> tuple[str, list[object]]:
+    conds: list[str] = []
+    params: list[object] = []
+    expr = build_match_expression(q.contains or [], q.match_all)
+    if expr:
+        # Match the message text only: partner is an indexed column too, and
+        # an unfiltered MATCH would return a chat's messages for its name.
+        conds.append("messages_fts MATCH ?")
+        params.append(f"text : ({expr})")
+    contact = (q.contact or "").strip().lower()
+    if contact:
+        conds.append("lower(partner) LIKE ?")
+        params.append(f"%{contact}%")
+    if q.from_me is True:
+        conds.append("from_me = 1")
+    elif q.from_me is False:
+        conds.append("from_me = 0")
+    if q.since_days and q.since_days > 0:
+        cutoff_unix = time.time() - (q.since_days * 86400)
+        conds.append("msg_date >= ?")
+        params.append(cutoff_unix - APPLE_EPOCH_OFFSET)
+    return " AND ".join(conds) or "1", params
+
+
+def search_index(
+    index_path: str | None = None,
+    query: MessageQuery | None = None,
+) -> list[MessageRow]:
+    """Search the FTS5 sidecar; text queries are ordered by BM25 relevance.
+
+    Without ``contains`` terms there is nothing to rank, so rows come back
+    newest first like :func:`search.search_messages`.
+    """
+    q = query or MessageQuery()
+    idx = os.path.expanduser(index_path or default_index_path())
+    if not os.path.exists(idx):
+        raise NotFoundError(f"WhatsApp search index not found: {idx} (run `whatsapp index`)")
+    where, params = _build_index_where(q)
+    ranked = "messages_fts MATCH" in where
+    order = "bm25(messages_fts), msg_date DESC" if ranked else "msg_date DESC"
+    # Safe: where/order built from fixed fragments and ? placeholders only
+    sql = (
+        "SELECT datetime(msg_date+?,'unixepoch','localtime') AS ts, "  # nosec B608
+        "partner, from_me, text FROM messages_fts "
+        f"WHERE {where} ORDER BY {order} LIMIT ?"
+    )
+    rows: list[MessageRow] = []
+    conn = sqlite3.connect(idx)
+    try:
+        for ts, partner, fromme, text in conn.execute(sql, [APPLE_EPOCH_OFFSET, *params, int(q.limit)]):
+            rows.append(MessageRow(ts=str(ts or ""), partner=str(partner or ""), from_me=int(fromme or 0), text=str(text or "")))
+    finally:
+        conn.close()
+    return rows
@@ -58,6 +58,7 @@ CONFIG = llm_cli.make_app_llm_config(
     policies=_policies,
     agentic_filename="AGENTIC_WHATSAPP.md",
     domain_map_filename="DOMAIN_MAP_WHATSAPP.md",
+    package="whatsapp",
 )
 
 
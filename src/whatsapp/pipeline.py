@@ -1,12 +1,14 @@
 """WhatsApp pipeline primitives built on shared core scaffolding."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from core.cli_output import OutputFormat, OutputWriter
 from core.pipeline import BaseProducer, SafeProcessor, RequestConsumer
 
+from .fts_index import IndexStats, refresh_index, search_index
 from .search import MessageQuery, MessageRow, format_rows_json, format_rows_text, search_messages
 
 
@@ -22,12 +24,35 @@ class SearchRequest:
     since_days: int | None = None
     limit: int = 50
     output_format: OutputFormat = OutputFormat.TEXT
+    use_index: bool = False
+    index_path: str | None = None
 
 
 # Type alias for backward compatibility
 SearchRequestConsumer = RequestConsumer[SearchRequest]
 
 
+@dataclass
+class IndexRequest:
+    """Parameters for refreshing the FTS5 sidecar index."""
+
+    db_path: str | None = None
+    index_path: str | None = None
+    rebuild: bool = False
+    output_format: OutputFormat = OutputFormat.TEXT
+
+
+IndexRequestConsumer = RequestConsumer[IndexRequest]
+
+
+@dataclass
+class IndexResult:
+    """Refresh statistics and output preferences."""
+
+    stats: IndexStats
+    output_format: OutputFormat = OutputFormat.TEXT
+
+
 @dataclass
 class SearchResult:
     """Container for search results and output preferences."""
@@ -40,17 +65,19 @@ class SearchProcessor(SafeProcessor[SearchRequest, SearchResult]):
     """Execute WhatsApp search with automatic error handling."""
 
     def _process_safe(self, payload: SearchRequest) -> SearchResult:
-        rows = search_messages(
-            db_path=payload.db_path,
-            query=MessageQuery(
-                contains=payload.contains,
-                match_all=payload.match_all,
-                contact=payload.contact,
-                from_me=payload.from_me,
-                since_days=payload.since_days,
-                limit=payload.limit,
-            ),
+        query = MessageQuery(
+            contains=payload.contains,
+            match_all=payload.match_all,
+            contact=payload.contact,
+            from_me=payload.from_me,
+            since_days=payload.since_days,
+            limit=payload.limit,
         )
+        if payload.use_index:
+            refresh_index(db_path=payload.db_path, index_path=payload.index_path)
+            rows = search_index(index_path=payload.index_path, query=query)
+        else:
+            rows = search_messages(db_path=payload.db_path, query=query)
         return SearchResult(rows=rows, output_format=payload.output_format)
 
 
@@ -66,3 +93,33 @@ class SearchProducer(BaseProducer):
             self._writer.print(format_rows_json(payload.rows))
         else:
             self._writer.print(format_rows_text(payload.rows))
+
+
+class IndexProcessor(SafeProcessor[IndexRequest, IndexResult]):
+    """Build or incrementally refresh the FTS5 sidecar index."""
+
+    def _process_safe(self, payload: IndexRequest) -> IndexResult:
+        stats = refresh_index(
+            db_path=payload.db_path,
+            index_path=payload.index_path,
+            rebuild=payload.rebuild,
+        )
+        return IndexResult(stats=stats, output_format=payload.output_format)
+
+
+class IndexProducer(BaseProducer):
+    """Output index refresh statistics (text or JSON)."""
+
+    def __init__(self, writer: OutputWriter | None = None) -> None:
+        super().__init__()
+        self._writer = writer or OutputWriter()
+
+    def _produce_success(self, payload: IndexResult, diagnostics: dict[str, Any] | None) -> None:
+        st = payload.stats
+        if payload.output_format == OutputFormat.JSON:
+            self._writer.print(json.dumps(asdict(st), indent=2))
+        else:
+            self._writer.print(
+                f"Indexed {st.added} new message(s) in {st.elapsed_s:.2f}s "
+                f"({st.total} total, max_pk={st.max_pk}) -> {st.index_path}"
+            )
@@ -8,7 +8,7 @@ from pathlib import Path
 from core.assistant import BaseAssistant
 from core.cli_errors import ExitCode
 from core.cli_framework import CLIApp
-from core.cli_output import OutputFormat
+from core.cli_output import OutputFormat, OutputWriter
 
 from .diagnostics_probes import run_diagnosis
 from .diagnostics_report import DiagnoseConfig
@@ -46,6 +46,8 @@ def _lazy_agentic():
 @app.argument("--no-survey", action="store_true", help="Skip quick ICMP survey stage")
 @app.argument("--trace-hops", type=int, default=12, help="Max hops for traceroute")
 @app.argument("--ping-timeout", type=float, default=15.0, help="Timeout per ping command")
+@app.argument("--jobs", type=int, default=8, help="Probes to run concurrently (1 = one after another)")
+@app.argument("--history", nargs="?", const="", help="Fold monitor history into findings (default: the monitor's history file)")
 @app.argument("--json", action="store_true", help="Emit JSON instead of pretty text")
 @app.argument("--out", help="Write report to file")
 def cmd_diagnose(args) -> int:
@@ -64,6 +66,8 @@ def cmd_diagnose(args) -> int:
         trace_max_hops=args.trace_hops,
         run_survey=not args.no_survey,
         survey_count=args.survey_count,
+        max_workers=args.jobs,
+        history_path=_history_arg(args.history),
     )
 
     out_path = Path(args.out) if args.out else None
@@ -77,6 +81,76 @@ def cmd_diagnose(args) -> int:
     return ExitCode((envelope.diagnostics or {}).get("code", ExitCode.ERROR))
 
 
+def _history_arg(value: str | None) -> str | None:
+    if value is None:
+        return None
+    if value:
+        return value
+    from .monitor import default_history_path
+
+    return str(default_history_path())
+
+
+def _format_sample(sample) -> str:
+    from datetime import datetime
+
+    bits = [datetime.fromtimestamp(sample.t).strftime("%H:%M:%S")]
+    for label, (loss, avg, _max) in sample.pings.items():
+        loss_txt = "?" if loss is None else f"{loss:.0f}%"
+        avg_txt = "-" if avg is None else f"{avg:.1f}ms"
+        bits.append(f"{label} {loss_txt} {avg_txt}")
+    bits.append("dns FAIL" if "d" in sample.failed else f"dns {sample.dns_ms or 0:.0f}ms")
+    if "h" in sample.failed:
+        bits.append("https FAIL")
+    elif sample.http_ms is not None:
+        bits.append(f"https {sample.http_ms:.0f}ms")
+    return " | ".join(bits)
+
+
+@app.command("monitor", help="Sample latency/loss/DNS/HTTPS at an interval into a rolling history")
+@app.argument("--gateway", help="Override detected default gateway IP")
+@app.argument("--targets", nargs="+", default=["1.1.1.1", "8.8.8.8"], help="Ping targets (besides gateway)")
+@app.argument("--ping-count", type=int, default=5, help="Packets per target per sample")
+@app.argument("--ping-timeout", type=float, default=10.0, help="Timeout per ping command")
+@app.argument("--interval", type=float, default=30.0, help="Seconds between sample starts")
+@app.argument("--samples", type=int, help="Stop after N samples (default: run until Ctrl-C)")
+@app.argument("--dns-host", default="google.com", help="Host to resolve for DNS timing")
+@app.argument("--http-url", default="https://speed.cloudflare.com/__down", help="URL for HTTPS timing")
+@app.argument("--no-http", action="store_true", help="Skip HTTPS timing")
+@app.argument("--history", help="History file (default: <data home>/wifi/monitor.jsonl)")
+@app.argument("--max-samples", type=int, default=2880, help="Samples kept in the rolling history")
+@app.argument("--jobs", type=int, default=8, help="Probes to run concurrently per sample")
+def cmd_monitor(args, writer: OutputWriter | None = None) -> int:
+    """Continuously sample the link; summarize percentiles at the end."""
+    from .diagnostics_report import _check_history_health, format_history, history_condition
+    from .monitor import MonitorConfig, run_monitor
+
+    out = writer or OutputWriter()
+    cfg = MonitorConfig(
+        ping_targets=args.targets,
+        gateway=args.gateway,
+        ping_count=args.ping_count,
+        ping_timeout=args.ping_timeout,
+        dns_host=args.dns_host,
+        http_url=None if args.no_http else args.http_url,
+        interval_s=args.interval,
+        samples=args.samples,
+        history_path=Path(args.history) if args.history else None,
+        max_samples=args.max_samples,
+        max_workers=args.jobs,
+    )
+    summary = run_monitor(cfg, on_sample=lambda s: out.print(_format_sample(s), flush=True))
+    if summary is None:
+        return ExitCode.SUCCESS
+    out.print("")
+    for line in format_history(summary):
+        out.print(line)
+    out.print(f"Condition: {history_condition(summary)}")
+    for finding in _check_history_health(summary):
+        out.print(f"- {finding}")
+    return ExitCode.SUCCESS
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the Wi-Fi CLI."""
     return app.run_with_assistant(
@@ -4,9 +4,10 @@ from __future__ import annotations
 import re
 import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from .diagnostics_runners import CommandRunner, SubprocessRunner
 
@@ -100,6 +101,20 @@ def _select_trace_target(config: "DiagnoseConfig", ping_targets: list[tuple[str,
     return config.dns_host
 
 
+def _run_probes(tasks: dict[str, Callable[[], Any]], max_workers: int) -> dict[str, Any]:
+    """Run independent probes on a thread pool; results are keyed like ``tasks``.
+
+    Every probe blocks on a subprocess or socket, so threads overlap their
+    timeouts instead of summing them. ``max_workers <= 1`` runs in order.
+    """
+    workers = min(max(1, max_workers), len(tasks))
+    if workers <= 1:
+        return {key: task() for key, task in tasks.items()}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wifi-probe") as pool:
+        futures = {key: pool.submit(task) for key, task in tasks.items()}
+        return {key: fut.result() for key, fut in futures.items()}
+
+
 def run_diagnosis(
     config: "DiagnoseConfig",
     runner: CommandRunner | None = None,
@@ -113,41 +128,60 @@ def run_diagnosis(
         compute_condition,
         derive_findings,
     )
+    from .monitor import load_history_summary  # noqa: PLC0415 - monitor imports this module
 
     runner = runner or SubprocessRunner()
     resolver = resolver or dns_lookup
     http_probe_fn = http_probe_fn or http_probe
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    gateway = config.gateway or detect_gateway(runner)
-    wifi_info = collect_wifi_info(runner) if config.include_wifi else None
+    # Stage 0: gateway detection gates the ping target list; Wi-Fi metadata
+    # is independent of it.
+    stage0: dict[str, Callable[[], Any]] = {}
+    if not config.gateway:
+        stage0["gateway"] = lambda: detect_gateway(runner)
+    if config.include_wifi:
+        stage0["wifi"] = lambda: collect_wifi_info(runner)
+    early = _run_probes(stage0, config.max_workers) if stage0 else {}
+    gateway = config.gateway or early.get("gateway")
+    wifi_info = early.get("wifi")
     ping_targets = _build_ping_targets(gateway, config.ping_targets)
 
-    survey_results: list[PingResult] = []
+    # Everything else is independent: survey pings, main pings, DNS, trace
+    # and HTTP all run together, so a diagnosis costs the slowest probe
+    # rather than the sum of every timeout.
+    tasks: dict[str, Callable[[], Any]] = {}
     if config.run_survey:
         survey_count = max(1, config.survey_count)
-        survey_results = [
-            ping_target(f"survey-{label}", target, count=survey_count, runner=runner, timeout=min(config.ping_timeout, 6))
-            for label, target in ping_targets
-        ]
-
-    ping_results = [
-        ping_target(label, target, count=config.ping_count, runner=runner, timeout=config.ping_timeout)
-        for label, target in ping_targets
-    ]
-
-    dns_result = resolver(config.dns_host)
-
-    trace_result: TraceResult | None = None
+        survey_timeout = min(config.ping_timeout, 6)
+        for label, target in ping_targets:
+            tasks[f"survey:{label}"] = (
+                lambda label=label, target=target: ping_target(
+                    f"survey-{label}", target, count=survey_count, runner=runner, timeout=survey_timeout
+                )
+            )
+    for label, target in ping_targets:
+        tasks[f"ping:{label}"] = (
+            lambda label=label, target=target: ping_target(
+                label, target, count=config.ping_count, runner=runner, timeout=config.ping_timeout
+            )
+        )
+    tasks["dns"] = lambda: resolver(config.dns_host)
     if config.include_trace:
         trace_target = _select_trace_target(config, ping_targets)
-        trace_result = trace_route(trace_target, runner=runner, max_hops=config.trace_max_hops)
-
-    http_result: HttpResult | None = None
+        tasks["trace"] = lambda: trace_route(trace_target, runner=runner, max_hops=config.trace_max_hops)
     if config.include_http and config.http_url:
-        http_result = http_probe_fn(config.http_url)
+        tasks["http"] = lambda: http_probe_fn(config.http_url)
+
+    done = _run_probes(tasks, config.max_workers)
+    survey_results: list[PingResult] = [done[f"survey:{label}"] for label, _ in ping_targets if config.run_survey]
+    ping_results: list[PingResult] = [done[f"ping:{label}"] for label, _ in ping_targets]
+    dns_result: DnsResult = done["dns"]
+    trace_result: TraceResult | None = done.get("trace")
+    http_result: HttpResult | None = done.get("http")
 
     icmp_filtered = _detect_icmp_filtered(survey_results, trace_result)
+    history = load_history_summary(config.history_path) if config.history_path else None
 
     findings = derive_findings(DiagnoseResults(
         gateway=gateway,
@@ -156,6 +190,7 @@ def run_diagnosis(
         dns=dns_result,
         trace=trace_result,
         http=http_result,
+        history=history,
     ))
 
     condition = compute_condition(
@@ -163,6 +198,7 @@ def run_diagnosis(
         icmp_filtered=icmp_filtered,
         http=http_result,
         dns=dns_result,
+        history=history,
     )
 
     return Report(
@@ -176,6 +212,7 @@ def run_diagnosis(
         survey_results=survey_results,
         findings=findings,
         condition=condition,
+        history=history,
     )
 
 
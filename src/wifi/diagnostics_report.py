@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from .diagnostics_probes import (
     DnsResult,
@@ -13,6 +14,9 @@ from .diagnostics_probes import (
     WifiInfo,
 )
 
+if TYPE_CHECKING:
+    from .monitor import HistorySummary
+
 
 @dataclass
 class DiagnoseConfig:
@@ -29,6 +33,8 @@ class DiagnoseConfig:
     trace_max_hops: int = 12
     run_survey: bool = True
     survey_count: int = 4
+    max_workers: int = 8  # concurrent probes; 1 runs them one after another
+    history_path: str | None = None  # monitor history to fold into findings/condition
 
 
 @dataclass
@@ -43,6 +49,7 @@ class Report:
     survey_results: list[PingResult] = dataclasses.field(default_factory=list)
     findings: list[str] = dataclasses.field(default_factory=list)
     condition: str = "unknown"
+    history: HistorySummary | None = None
 
 
 @dataclass
@@ -55,6 +62,7 @@ class DiagnoseResults:
     dns: DnsResult
     trace: TraceResult | None
     http: HttpResult | None
+    history: HistorySummary | None = None
 
 
 def _check_gateway_health(gateway_ping: PingResult | None, icmp_filtered: bool) -> list[str]:
@@ -104,6 +112,43 @@ def _check_http_health(http: HttpResult | None) -> list[str]:
     return []
 
 
+def _check_history_health(history: HistorySummary | None) -> list[str]:
+    """Check monitor history percentiles, return findings.
+
+    A single diagnosis can land between bursts; the history shows whether
+    loss and latency spikes recur and how bad the tail is.
+    """
+    if not history or history.samples < 2:
+        return []
+    n = history.samples
+    findings: list[str] = []
+    gateway = history.target("gateway")
+    if gateway and gateway.lossy_pct >= 10:
+        findings.append(f"Intermittent Wi-Fi loss: {gateway.lossy_pct:.0f}% of {n} samples lost >=10% to the gateway.")
+    elif gateway and gateway.latency_p95 and gateway.latency_p95 > 100:
+        findings.append(
+            f"Gateway latency spikes (p95 {gateway.latency_p95:.0f} ms, median {gateway.latency_p50 or 0:.0f} ms "
+            f"over {n} samples); typical of interference or roaming."
+        )
+    upstream = [t for t in history.targets if t.label != "gateway"]
+    gateway_steady = not gateway or gateway.lossy_pct < 5
+    if upstream:
+        worst_loss = max(upstream, key=lambda t: t.lossy_pct)
+        worst_latency = max(upstream, key=lambda t: t.latency_p95 or 0)
+        if worst_loss.lossy_pct >= 10 and gateway_steady:
+            findings.append(
+                f"Intermittent upstream loss: {worst_loss.lossy_pct:.0f}% of {n} samples lost >=10% to "
+                f"{worst_loss.label} while the gateway held steady."
+            )
+        elif worst_latency.latency_p95 and worst_latency.latency_p95 > 200:
+            findings.append(f"Internet latency tail is high (p95 {worst_latency.latency_p95:.0f} ms to {worst_latency.label}).")
+    if history.dns_fail_pct >= 5 or (history.dns_p95 and history.dns_p95 > 400):
+        findings.append(f"DNS is intermittently slow or failing (p95 {_fmt_ms(history.dns_p95)} ms, {history.dns_fail_pct:.0f}% failed).")
+    if history.http_fail_pct >= 5 or (history.http_p95 and history.http_p95 > 1500):
+        findings.append(f"HTTPS is intermittently slow or failing (p95 {_fmt_ms(history.http_p95)} ms, {history.http_fail_pct:.0f}% failed).")
+    return findings
+
+
 def derive_findings(results: DiagnoseResults) -> list[str]:
     """Derive human-readable findings from diagnostic results."""
     gateway_ping = next((p for p in results.ping_results if p.label == "gateway"), None)
@@ -117,6 +162,7 @@ def derive_findings(results: DiagnoseResults) -> list[str]:
     findings.extend(_check_upstream_health(upstream, gateway_ping))
     findings.extend(_check_dns_health(results.dns))
     findings.extend(_check_http_health(results.http))
+    findings.extend(_check_history_health(results.history))
 
     if not findings:
         findings.append("Link looks healthy: low loss to gateway and upstream targets.")
@@ -159,6 +205,9 @@ def render_report(report: Report) -> str:
     if report.http:
         lines.append("")
         lines.append(f"HTTPS smoke: {format_http(report.http)}")
+    if report.history:
+        lines.append("")
+        lines.extend(format_history(report.history))
     return "\n".join(lines) + "\n"
 
 
@@ -187,12 +236,40 @@ def _score_ping(p: PingResult) -> int:
     return 0
 
 
+def _score_history(history: HistorySummary | None) -> int:
+    """Score monitor history percentiles: 0=good, 1=poor, 2=bad."""
+    if not history or history.samples < 2:
+        return 0
+    worst = 0
+    for target in history.targets:
+        if target.lossy_pct >= 30 or (target.loss_mean or 0) >= 30:
+            worst = max(worst, 2)
+        elif target.lossy_pct >= 10 or (target.latency_p95 and target.latency_p95 > 200):
+            worst = max(worst, 1)
+    dns_bad = history.dns_fail_pct >= 5 or (history.dns_p95 and history.dns_p95 > 400)
+    http_bad = history.http_fail_pct >= 5 or (history.http_p95 and history.http_p95 > 1500)
+    if dns_bad or http_bad:
+        worst = max(worst, 1)
+    return worst
+
+
+_CONDITIONS = ("good", "poor", "bad")
+
+
+def history_condition(history: HistorySummary | None) -> str:
+    """Condition of the link judged from monitor history alone."""
+    if not history:
+        return "unknown"
+    return _CONDITIONS[_score_history(history)]
+
+
 def compute_condition(
     *,
     ping_results: list[PingResult],
     icmp_filtered: bool,
     http: HttpResult | None,
     dns: DnsResult,
+    history: HistorySummary | None = None,
 ) -> str:
     if icmp_filtered:
         return "n/a (icmp filtered)"
@@ -209,12 +286,9 @@ def compute_condition(
     worst = max(scores) if scores else 0
     if dns_bad or http_bad:
         worst = max(worst, 1)
+    worst = max(worst, _score_history(history))
 
-    if worst == 0:
-        return "good"
-    if worst == 1:
-        return "poor"
-    return "bad"
+    return _CONDITIONS[worst]
 
 
 def report_to_dict(report: Report) -> dict[str, Any]:
@@ -273,6 +347,27 @@ def format_http(result: HttpResult) -> str:
     return f"failed: {result.error or 'http error'}"
 
 
+def _fmt_ms(value: float | None) -> str:
+    return f"{value:.0f}" if value is not None else "?"
+
+
+def format_history(history: HistorySummary) -> list[str]:
+    start = datetime.fromtimestamp(history.start).strftime("%Y-%m-%d %H:%M")
+    minutes = (history.end - history.start) / 60.0
+    lines = [f"Monitor history ({history.samples} samples over {minutes:.0f} min since {start}):"]
+    for t in history.targets:
+        lines.append(
+            f"  {t.label:<24} loss avg {t.loss_mean or 0:.1f}% ({t.lossy_pct:.0f}% of samples >=10%)  "
+            f"latency p50 {_fmt_ms(t.latency_p50)} / p95 {_fmt_ms(t.latency_p95)} ms"
+        )
+    lines.append(f"  DNS   p50 {_fmt_ms(history.dns_p50)} / p95 {_fmt_ms(history.dns_p95)} ms, {history.dns_fail_pct:.0f}% failed")
+    if history.http_p50 is not None or history.http_fail_pct:
+        lines.append(
+            f"  HTTPS p50 {_fmt_ms(history.http_p50)} / p95 {_fmt_ms(history.http_p95)} ms, {history.http_fail_pct:.0f}% failed"
+        )
+    return lines
+
+
 def _loss_bar(loss_pct: float | None, width: int = 18) -> str:
     if loss_pct is None:
         return "[" + "?" * width + "]"
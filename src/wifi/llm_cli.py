@@ -63,6 +63,7 @@ CONFIG = llm_cli.LlmConfig(
     policies=_policies,
     agentic_filename="AGENTIC_WIFI.md",
     domain_map_filename="DOMAIN_MAP_WIFI.md",
+    package="wifi",
 )
 
 
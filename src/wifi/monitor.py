@@ -0,0 +1,309 @@
+"""Continuous Wi-Fi monitoring: periodic probe samples in a rolling history.
+
+Each sample pings every target with a few packets, times one DNS lookup and
+one HTTPS fetch, all concurrently, and appends one compact JSON line to the
+history file::
+
+    {"t":1760781600.0,"p":{"gateway":[0.0,3.1,5.2],"1.1.1.1":[0.0,18.4,25.0]},"d":8.5,"h":180.0}
+
+``p`` maps ping label to ``[loss %, avg ms, max ms]`` (``null`` when
+unknown); ``d`` and ``h`` are the DNS and HTTPS timings in ms, ``null`` when
+the probe did not run or failed; failed probes are also listed in ``f``
+(e.g. ``"f":["h"]``). The file keeps the newest ``max_samples`` lines.
+``summarize`` reduces a history to per-target percentiles, which
+``derive_findings`` and ``compute_condition`` reason over alongside a one-off
+diagnosis.
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from core.paths import data_home
+
+from .diagnostics_probes import (
+    DnsResult,
+    HttpResult,
+    _build_ping_targets,
+    _run_probes,
+    detect_gateway,
+    dns_lookup,
+    http_probe,
+    ping_target,
+)
+from .diagnostics_runners import CommandRunner, SubprocessRunner
+
+DEFAULT_MAX_SAMPLES = 2880  # one day at the default 30 s interval
+_TRIM_SLACK = 0.25  # rewrite the file only once it is 25% over budget
+
+
+def default_history_path() -> Path:
+    return data_home() / "wifi" / "monitor.jsonl"
+
+
+@dataclass
+class MonitorConfig:
+    ping_targets: list[str]
+    gateway: str | None = None
+    ping_count: int = 5
+    ping_timeout: float = 10.0
+    dns_host: str = "google.com"
+    http_url: str | None = "https://speed.cloudflare.com/__down"
+    interval_s: float = 30.0
+    samples: int | None = None  # None: run until interrupted
+    history_path: Path | None = None
+    max_samples: int = DEFAULT_MAX_SAMPLES
+    max_workers: int = 8
+
+
+@dataclass
+class Sample:
+    t: float
+    pings: dict[str, list[float | None]]  # label -> [loss %, avg ms, max ms]
+    dns_ms: float | None
+    http_ms: float | None
+    failed: list[str] = field(default_factory=list)  # "d" / "h" when that probe failed
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"t": round(self.t, 3), "p": self.pings, "d": self.dns_ms, "h": self.http_ms}
+        if self.failed:
+            data["f"] = self.failed
+        return data
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "Sample | None":
+        if not isinstance(raw, dict) or not isinstance(raw.get("t"), (int, float)):
+            return None
+        pings = raw.get("p") if isinstance(raw.get("p"), dict) else {}
+        failed = raw.get("f") if isinstance(raw.get("f"), list) else []
+        return cls(t=float(raw["t"]), pings=pings, dns_ms=raw.get("d"), http_ms=raw.get("h"), failed=failed)
+
+
+@dataclass
+class TargetStats:
+    label: str
+    samples: int
+    loss_mean: float | None
+    lossy_pct: float  # share of samples with >= 10% loss (or no reply at all)
+    latency_p50: float | None
+    latency_p95: float | None
+
+
+@dataclass
+class HistorySummary:
+    samples: int
+    start: float
+    end: float
+    targets: list[TargetStats] = field(default_factory=list)
+    dns_p50: float | None = None
+    dns_p95: float | None = None
+    dns_fail_pct: float = 0.0
+    http_p50: float | None = None
+    http_p95: float | None = None
+    http_fail_pct: float = 0.0
+
+    def target(self, label: str) -> TargetStats | None:
+        return next((t for t in self.targets if t.label == label), None)
+
+
+class HistoryFile:
+    """Append-only JSON-lines history trimmed to the newest ``max_samples``."""
+
+    def __init__(self, path: Path, max_samples: int = DEFAULT_MAX_SAMPLES):
+        self.path = Path(path)
+        self.max_samples = max(1, max_samples)
+        self._lines: int | None = None
+
+    def _count(self) -> int:
+        if self._lines is None:
+            try:
+                with self.path.open("rb") as fh:
+                    self._lines = sum(1 for _ in fh)
+            except OSError:
+                self._lines = 0
+        return self._lines
+
+    def append(self, sample: Sample) -> None:
+        count = self._count()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(sample.to_json(), separators=(",", ":")) + "\n")
+        self._lines = count + 1
+        if self._lines > self.max_samples * (1 + _TRIM_SLACK):
+            self._trim()
+
+    def _trim(self) -> None:
+        keep = self.path.read_text(encoding="utf-8").splitlines()[-self.max_samples:]
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text("".join(line + "\n" for line in keep), encoding="utf-8")
+        tmp.replace(self.path)
+        self._lines = len(keep)
+
+    def read(self, since: float | None = None) -> list[Sample]:
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except OSError:
+            return []
+        samples: list[Sample] = []
+        for line in text.splitlines():
+            try:
+                sample = Sample.from_json(json.loads(line))
+            except ValueError:
+                continue  # a torn final line from an interrupted append
+            if sample and (since is None or sample.t >= since):
+                samples.append(sample)
+        return samples
+
+
+def take_sample(
+    config: MonitorConfig,
+    *,
+    runner: CommandRunner,
+    resolver: Callable[[str], DnsResult],
+    http_probe_fn: Callable[[str], HttpResult],
+    gateway: str | None = None,
+    clock: Callable[[], float] = time.time,
+) -> Sample:
+    """Probe every target, DNS and HTTPS once, concurrently."""
+    started = clock()
+    ping_targets = _build_ping_targets(gateway or config.gateway, config.ping_targets)
+    tasks: dict[str, Callable[[], Any]] = {
+        f"ping:{label}": (
+            lambda label=label, target=target: ping_target(
+                label, target, count=config.ping_count, runner=runner, timeout=config.ping_timeout
+            )
+        )
+        for label, target in ping_targets
+    }
+    tasks["dns"] = lambda: resolver(config.dns_host)
+    if config.http_url:
+        tasks["http"] = lambda: http_probe_fn(config.http_url)
+    done = _run_probes(tasks, config.max_workers)
+
+    pings: dict[str, list[float | None]] = {}
+    for label, _ in ping_targets:
+        result = done[f"ping:{label}"]
+        pings[label] = [result.loss_pct, result.avg_ms, result.max_ms]
+    dns: DnsResult = done["dns"]
+    http: HttpResult | None = done.get("http")
+    failed = [key for key, result in (("d", dns), ("h", http)) if result is not None and not result.success]
+    return Sample(
+        t=started,
+        pings=pings,
+        dns_ms=_round(dns.elapsed_ms) if dns.success else None,
+        http_ms=_round(http.elapsed_ms) if http and http.success else None,
+        failed=failed,
+    )
+
+
+def run_monitor(
+    config: MonitorConfig,
+    *,
+    runner: CommandRunner | None = None,
+    resolver: Callable[[str], DnsResult] | None = None,
+    http_probe_fn: Callable[[str], HttpResult] | None = None,
+    on_sample: Callable[[Sample], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.time,
+) -> HistorySummary | None:
+    """Sample every ``interval_s`` into the history; summarize this run's samples.
+
+    Runs ``config.samples`` times, or until interrupted when that is None.
+    """
+    runner = runner or SubprocessRunner()
+    resolver = resolver or dns_lookup
+    http_probe_fn = http_probe_fn or http_probe
+    history = HistoryFile(config.history_path or default_history_path(), config.max_samples)
+    gateway = config.gateway or detect_gateway(runner)
+
+    taken: list[Sample] = []
+    try:
+        while config.samples is None or len(taken) < config.samples:
+            started = clock()
+            sample = take_sample(
+                config, runner=runner, resolver=resolver, http_probe_fn=http_probe_fn, gateway=gateway, clock=clock
+            )
+            history.append(sample)
+            taken.append(sample)
+            if on_sample:
+                on_sample(sample)
+            if config.samples is not None and len(taken) >= config.samples:
+                break
+            sleep(max(0.0, config.interval_s - (clock() - started)))
+    except KeyboardInterrupt:
+        pass
+    return summarize(taken)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)]
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+def _target_stats(label: str, rows: list[list[float | None]]) -> TargetStats:
+    losses = [100.0 if row[0] is None else float(row[0]) for row in rows]
+    latencies = [float(row[1]) for row in rows if row[1] is not None]
+    lossy = sum(1 for loss in losses if loss >= 10)
+    return TargetStats(
+        label=label,
+        samples=len(rows),
+        loss_mean=_round(sum(losses) / len(losses)) if losses else None,
+        lossy_pct=_round(100.0 * lossy / len(rows)) or 0.0,
+        latency_p50=_percentile(latencies, 50),
+        latency_p95=_percentile(latencies, 95),
+    )
+
+
+def _timing_stats(samples: list[Sample], key: str) -> tuple[float | None, float | None, float]:
+    """p50/p95 of one probe's timing and its failure share across the samples that ran it."""
+    ok: list[float] = []
+    failures = 0
+    for sample in samples:
+        value = sample.dns_ms if key == "d" else sample.http_ms
+        if value is not None:
+            ok.append(float(value))
+        elif key in sample.failed:
+            failures += 1
+    attempts = len(ok) + failures
+    fail_pct = 100.0 * failures / attempts if attempts else 0.0
+    return _percentile(ok, 50), _percentile(ok, 95), _round(fail_pct) or 0.0
+
+
+def summarize(samples: list[Sample]) -> HistorySummary | None:
+    """Reduce samples to per-target loss/latency percentiles and DNS/HTTPS timings."""
+    if not samples:
+        return None
+    by_label: dict[str, list[list[float | None]]] = {}
+    for sample in samples:
+        for label, row in sample.pings.items():
+            if isinstance(row, list) and len(row) >= 3:
+                by_label.setdefault(label, []).append(row)
+    dns_p50, dns_p95, dns_fail = _timing_stats(samples, "d")
+    http_p50, http_p95, http_fail = _timing_stats(samples, "h")
+    return HistorySummary(
+        samples=len(samples),
+        start=min(s.t for s in samples),
+        end=max(s.t for s in samples),
+        targets=[_target_stats(label, rows) for label, rows in by_label.items()],
+        dns_p50=dns_p50,
+        dns_p95=dns_p95,
+        dns_fail_pct=dns_fail,
+        http_p50=http_p50,
+        http_p95=http_p95,
+        http_fail_pct=http_fail,
+    )
+
+
+def load_history_summary(path: str | Path, since: float | None = None) -> HistorySummary | None:
+    return summarize(HistoryFile(Path(path)).read(since=since))
@@ -4,7 +4,9 @@ Each handler is a callable: handler(job_dict) -> (success: bool, result_or_error
 
 Built-in handlers:
 - run_cli: run a repo bin command (allowlisted bin/ entries); accepts optional
-  ``cwd`` payload key to set working directory (defaults to repo root)
+  ``cwd`` payload key to set working directory (defaults to repo root), and
+  ``inprocess`` to run an assistant CLI in a warm interpreter (core.warm_cli)
+  instead of a fresh subprocess
 - run_shell: run an allowlisted shell program; supports a ``script`` key to
   avoid quoting issues when embedding Python or multi-line scripts
 
@@ -150,6 +152,30 @@ def _execute_command(cmd: list[str], env_overlay: dict, timeout: int, cwd: str |
     return _execute_subprocess(cmd, env_overlay, timeout, cwd=cwd or str(_repo_root()))
 
 
+def _execute_inprocess(app: str, cmd_list: list, env_overlay: dict, timeout: int, cwd: str | None = None) -> dict:
+    """Run an allow-listed assistant CLI in the shared warm pool; same result shape as _execute_subprocess."""
+    from core.warm_cli import shared_pool
+    out = shared_pool().run(
+        app,
+        [str(x) for x in cmd_list[1:]],
+        # Full env, as ShellJobProcessor gives the subprocess os.environ + overlay.
+        env_overlay={**os.environ, **{k: str(v) for k, v in env_overlay.items()}},
+        cwd=cwd or str(_repo_root()),
+        timeout=timeout,
+    )
+    return {**out, "stdout": out["stdout"][-2000:], "stderr": out["stderr"][-2000:]}
+
+
+def _inprocess_app(payload: dict[str, object], prog: str) -> str | None:
+    """APP_MODULES key when this job should run in-process, else None."""
+    from core.warm_cli import REPO_BIN, app_for_bin, inprocess_requested
+    if not inprocess_requested(payload.get("inprocess")):
+        return None
+    # A bare name means the repo's own wrapper here, never a PATH lookup.
+    path = Path(prog) if Path(prog).parent != Path(".") else REPO_BIN / prog
+    return app_for_bin(str(path))
+
+
 def _validate_run_cli_payload(
     payload: dict[str, object],
 ) -> tuple[str, None, None] | tuple[None, str, list]:
@@ -173,7 +199,8 @@ def _parse_run_cli_timeout(payload: dict[str, object]) -> int:
 def handle_run_cli(job: dict[str, object]) -> tuple[bool, object]:  # pragma: no cover - subprocess execution
     """Run a repo bin command with args.
 
-    payload schema: {"cmd": ["bin_name_or_path", "arg1", ...], "env": {..}, "timeout": 300, "cwd": "/optional/path"}
+    payload schema: {"cmd": ["bin_name_or_path", "arg1", ...], "env": {..}, "timeout": 300, "cwd": "/optional/path",
+                     "inprocess": false}
     """
     payload = dict(job.get("payload") or {})
     error, prog, cmd_list = _validate_run_cli_payload(payload)
@@ -184,9 +211,13 @@ def handle_run_cli(job: dict[str, object]) -> tuple[bool, object]:  # pragma: no
     env_overlay = dict(payload.get("env") or {})
     cwd = str(payload.get("cwd") or "").strip() or None
     timeout = _parse_run_cli_timeout(payload)
+    app = _inprocess_app(payload, prog)
 
     try:
-        out = _execute_command(cmd, env_overlay, timeout, cwd=cwd)
+        if app is not None:
+            out = _execute_inprocess(app, cmd_list, env_overlay, timeout, cwd=cwd)
+        else:
+            out = _execute_command(cmd, env_overlay, timeout, cwd=cwd)
         ok = (int(out.get("returncode", 1)) == 0)
         return (ok, out if ok else out.get("stderr") or out)
     except subprocess.TimeoutExpired:
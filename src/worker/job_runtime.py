@@ -32,13 +32,29 @@ logger = logging.getLogger(__name__)
 
 def _finish_or_retry(
     proc_path: Path, ctx: JobContext, config: WorkerConfig, reason: str
-) -> None:
-    """Finish the job as errored if attempts are exhausted, else retry it."""
+) -> bool:
+    """Finish the job as errored if attempts are exhausted, else retry it.
+
+    Returns True when the job was finished.
+    """
     attempts = ctx.attempts + 1
     if attempts >= ctx.max_attempts:
         q.finish(proc_path, success=False, error_msg=reason)
-    else:
-        q.retry(proc_path, delay_sec=config.backoff, reason=reason)
+        return True
+    q.retry(proc_path, delay_sec=config.backoff, reason=reason)
+    return False
+
+
+def _publish_workflow_stage(ctx: JobContext, success: bool, out: object, duration: int) -> None:
+    """Hand a finished workflow_stage job's result to the workflow run waiting on it."""
+    if ctx.job_type != "workflow_stage":
+        return
+    try:
+        from workflow.completion import publish_stage_result  # lazy — workflow is optional
+
+        publish_stage_result(ctx.job_data, success=success, output=out, duration_ms=duration)
+    except Exception as exc:  # nosec B110 - best-effort; the queue's done/error record stands
+        logger.warning("could not publish workflow stage result: %s", exc)
 
 
 def _effective_job_timeout(job_data: dict[str, object], default_timeout: int) -> int:
@@ -149,6 +165,7 @@ def _handle_outcome(outcome_ctx: OutcomeContext, success: bool, out: object) ->
     out_str = str(out)
     if success:
         q.finish(proc_path, success=True, result=out)
+        _publish_workflow_stage(ctx, True, out, duration)
         log_perf_jsonl(
             "worker", duration, args=[command, ctx.job_type, "ok"], exit_code=0
         )
@@ -162,12 +179,14 @@ def _handle_outcome(outcome_ctx: OutcomeContext, success: bool, out: object) ->
     elif out_str.startswith("terminal-"):
         # Handler signalled an unrecoverable failure — skip retry loop entirely.
         q.finish(proc_path, success=False, error_msg=out_str)
+        _publish_workflow_stage(ctx, False, out_str, duration)
         log_perf_jsonl(
             "worker", duration, args=[command, ctx.job_type, "terminal"], exit_code=1
         )
     else:
         status = "error" if ctx.attempts + 1 >= ctx.max_attempts else "retry"
-        _finish_or_retry(proc_path, ctx, config, out_str)
+        if _finish_or_retry(proc_path, ctx, config, out_str):
+            _publish_workflow_stage(ctx, False, out_str, duration)
         log_perf_jsonl(
             "worker", duration, args=[command, ctx.job_type, status], exit_code=1
         )
@@ -284,7 +303,8 @@ class JobProcessor:
         if not envelope.ok():
             # SafeProcessor caught an exception — treat as handler-raised error.
             reason = (envelope.diagnostics or {}).get("message", "handler raised: unknown error")
-            _finish_or_retry(proc_path, ctx, self.config, str(reason))
+            if _finish_or_retry(proc_path, ctx, self.config, str(reason)):
+                _publish_workflow_stage(ctx, False, reason, duration)
             log_perf_jsonl(
                 "worker",
                 duration,
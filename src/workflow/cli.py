@@ -144,20 +144,28 @@ def cmd_compile(args: argparse.Namespace) -> int:
     help="Trigger parameter overrides (repeatable)",
 )
 @app.argument("--run-id", help="Custom run ID")
+@app.argument(
+    "--jobs", type=int, default=None,
+    help="Max stages in flight; each stage starts once its depends_on finish (default 4)",
+)
+@app.argument(
+    "--wait", type=float, default=0.0, metavar="SECONDS",
+    help="Wait up to SECONDS for worker-queued stages to finish before returning pending",
+)
 @app.argument("--format", "-f", **_format_kwargs(default="table"))
 def cmd_run(args: argparse.Namespace) -> int:
     return _cmd_run(args)
 
 
 @app.command("lint", help="Validate workflow YAML structure without running it")
-@app.argument("file", help="Path to workflow YAML file")
+@app.argument("file", help="Path to workflow YAML file, or a directory of them")
 @app.argument(
     "--strict", action="store_true",
     help="Treat warnings as errors (exit non-zero if any warnings exist)",
 )
 @app.argument(
     "--check-commands", action="store_true", dest="check_commands",
-    help="Validate ./bin/<cli> <subcommand> patterns by probing each binary",
+    help="Validate ./bin/<cli> <subcommand> patterns against each CLI's parser",
 )
 @app.argument("--format", "-f", **_format_kwargs(default="yaml"))
 def cmd_lint(args: argparse.Namespace) -> int:
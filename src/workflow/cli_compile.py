@@ -15,7 +15,7 @@ from pathlib import Path
 from core.fileutil import write_once
 from workflow.cli_helpers import check_workflow_path
 from workflow.compiler import validate_dag_contracts
-from workflow.include import extract_include_entries, resolve_fragment_path
+from workflow.include import fragment_bytes as _fragment_bytes
 
 
 # ---------------------------------------------------------------------------
@@ -23,30 +23,6 @@ from workflow.include import extract_include_entries, resolve_fragment_path
 # ---------------------------------------------------------------------------
 
 
-def _fragment_bytes(
-    yaml_bytes: bytes,
-    yaml_path: Path,
-    _visited: frozenset[str] | None = None,
-) -> bytes:
-    """Return concatenated bytes of all fragment files referenced via include:."""
-    visited = _visited if _visited is not None else frozenset()
-    parts: list[bytes] = []
-    for inc in extract_include_entries(yaml_bytes):
-        if not isinstance(inc, dict) or "path" not in inc:
-            continue
-        p = resolve_fragment_path(str(inc["path"]), yaml_path)
-        p_key = str(p.resolve())
-        if p_key in visited:
-            continue
-        try:
-            frag_content = p.read_bytes()
-        except OSError:
-            continue
-        parts.append(frag_content)
-        parts.append(_fragment_bytes(frag_content, p, _visited=visited | {p_key}))
-    return b"".join(parts)
-
-
 def _compile_cache_path(
     yaml_bytes: bytes,
     project_root: str,
@@ -18,7 +18,8 @@ from workflow.cli_helpers import check_workflow_path, format_workflow_not_found
 from workflow.compiler import resolve_params
 from workflow.include import parse_fragment
 from workflow.models import StageStatus
-from workflow.parser import WorkflowParseError, parse_workflow
+from workflow.manifest_cache import load_definition, load_manifest
+from workflow.parser import WorkflowParseError
 
 if TYPE_CHECKING:
     from workflow.models import WorkflowDefinition, WorkflowManifest
@@ -32,7 +33,7 @@ if TYPE_CHECKING:
 def _load_definition(path: str) -> WorkflowDefinition:
     """Parse a workflow YAML, raising CLIError on failure."""
     try:
-        return parse_workflow(path)
+        return load_definition(path)
     except WorkflowParseError as exc:
         raise CLIError(f"Parse error: {exc}", ExitCode.ERROR) from exc
 
@@ -41,11 +42,11 @@ def _load_manifest(
     path: str,
     trigger_params: dict[str, str] | None = None,
 ) -> tuple[WorkflowDefinition, WorkflowManifest]:
-    """Parse + compile a workflow, raising CLIError on failure."""
-    from workflow.compiler import WorkflowCompileError, compile_workflow
+    """Parse + compile a workflow (through the manifest cache), raising CLIError on failure."""
+    from workflow.compiler import WorkflowCompileError
     defn = _load_definition(path)
     try:
-        return defn, compile_workflow(defn, trigger_params=trigger_params)
+        return defn, load_manifest(path, trigger_params=trigger_params)
     except WorkflowCompileError as exc:
         raise CLIError(f"Compile error: {exc}", ExitCode.ERROR) from exc
 
@@ -69,7 +70,7 @@ def _parse_params(raw: list[str]) -> tuple[dict[str, str], str | None]:
 def _build_resolved_params(path: str, cli_params: dict[str, str]) -> dict[str, str]:
     """Merge trigger-default and CLI params in priority order."""
     try:
-        defn_only = parse_workflow(path)
+        defn_only = load_definition(path)
     except WorkflowParseError as exc:
         raise CLIError(f"workflow: parse error: {exc}", ExitCode.ERROR) from exc
     trigger_defaults = defn_only.trigger.params if defn_only.trigger else {}
@@ -224,7 +225,7 @@ def _cmd_parse(args: argparse.Namespace) -> int:
 def _cmd_run(args: argparse.Namespace) -> int:
     """Parse + compile + execute a workflow."""
     from workflow.cli import _emit_one
-    from workflow.orchestrator import OrchestratorConfig, WorkflowOrchestrator
+    from workflow.orchestrator import DEFAULT_MAX_CONCURRENCY, OrchestratorConfig, WorkflowOrchestrator
     if not check_workflow_path(args.path):
         return 1
     dry_run = not args.execute
@@ -238,6 +239,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
     defn, manifest = _load_manifest(args.path, trigger_params=resolved_params or None)
 
     workspace = _resolve_base_dir(args.workspace, defn, resolved_params)
+    max_concurrency = args.jobs or DEFAULT_MAX_CONCURRENCY
 
     if not dry_run and not _confirm_execution(defn.name, len(defn.stages)):
         print("Aborted.", file=sys.stderr)
@@ -250,6 +252,8 @@ def _cmd_run(args: argparse.Namespace) -> int:
         orchestrator = WorkflowOrchestrator.resume(
             manifest=manifest, workspace_dir=workspace,
             trigger_params=resolved_params or None,
+            max_concurrency=max_concurrency,
+            await_pending=args.wait,
         )
     else:
         orchestrator = WorkflowOrchestrator(
@@ -259,6 +263,8 @@ def _cmd_run(args: argparse.Namespace) -> int:
                 run_id=args.run_id,
                 dry_run=dry_run,
                 trigger_params=resolved_params or {},
+                max_concurrency=max_concurrency,
+                await_pending=args.wait,
             )
         )
     result = orchestrator.run()
@@ -267,6 +273,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
         "workspace": result.workspace_dir, "started_at": result.started_at,
         "dry_run": dry_run, "stages_completed": len(result.stage_results),
         "stages_total": len(defn.stages),
+        "critical_path": " -> ".join(result.critical_path) or "-",
     }, fmt=args.format)
     stage_rows = [{
         "stage": name, "status": sr.status.value,
@@ -283,25 +290,43 @@ def _cmd_run(args: argparse.Namespace) -> int:
 
 
 def _cmd_lint(args: argparse.Namespace) -> int:
-    """Validate workflow YAML structure without executing the workflow."""
+    """Validate workflow YAML structure without executing the workflow.
+
+    ``args.file`` may be a directory: every ``*.yaml`` under it (outside the
+    shared/ and hints/ subdirectories) is linted in one pass, so
+    ``--check-commands`` validates each distinct CLI invocation only once.
+    """
     from workflow.cli import _emit_one
-    from workflow.linter import lint_workflow
+    from workflow.cli_helpers import _EXCLUDED_SUBDIRS
+    from workflow.linter import LintError, lint_workflows
 
-    if not Path(args.file).is_file():
+    target = Path(args.file)
+    if target.is_dir():
+        paths = sorted(
+            p for p in target.rglob("*.yaml")
+            if not _EXCLUDED_SUBDIRS.intersection(p.relative_to(target).parts[:-1])
+        )
+    elif target.is_file():
+        paths = [target]
+    else:
         print(format_workflow_not_found(args.file), file=sys.stderr)
         return 1
-    result = lint_workflow(args.file, check_commands=getattr(args, "check_commands", False))
-
-    if args.strict and result.warnings:
-        from workflow.linter import LintError
-        for w in result.warnings:
-            result.errors.append(LintError(stage=w.stage, field=w.field, message=w.message))
-        result.warnings.clear()
-        result.valid = False
-
-    data = result.as_dict()
+    results = lint_workflows(paths, check_commands=getattr(args, "check_commands", False))
+
+    for result in results:
+        if args.strict and result.warnings:
+            for w in result.warnings:
+                result.errors.append(LintError(stage=w.stage, field=w.field, message=w.message))
+            result.warnings.clear()
+            result.valid = False
+
+    valid = all(result.valid for result in results)
+    if target.is_dir():
+        data = {"valid": valid, "files": [result.as_dict() for result in results]}
+    else:
+        data = results[0].as_dict()
     _emit_one(data, fmt=args.format)
-    return 0 if result.valid else 1
+    return 0 if valid else 1
 
 
 def _cmd_validate_fragment(args: argparse.Namespace) -> int:
@@ -365,7 +390,7 @@ def _cmd_list(args: argparse.Namespace) -> int:
     ):
         rel = str(path.relative_to(Path.cwd()))
         try:
-            defn = parse_workflow(path)
+            defn = load_definition(path)
             rows.append({"file": rel, "name": defn.name, "version": defn.version,
                          "description": defn.description, "stages": len(defn.stages)})
         except Exception:  # noqa: BLE001 # nosec B110 - best-effort listing
@@ -203,16 +203,22 @@ def _drain_level(queue: deque[str], assigned: dict[str, int], level: int) -> lis
 
 
 def _next_ready_queue(
-    stages: tuple[StageSpec, ...],
-    deps: dict[str, set[str]],
-    assigned: dict[str, int],
+    current_level: list[str],
+    dependents: dict[str, list[str]],
+    in_degree: dict[str, int],
 ) -> deque[str]:
-    """Return stages whose dependencies are all assigned but are not yet themselves."""
-    return deque(
-        spec.name
-        for spec in stages
-        if spec.name not in assigned and all(d in assigned for d in deps[spec.name])
-    )
+    """Decrement the dependents of a finished level; return those with no deps left.
+
+    Only the level's outgoing edges are visited, so leveling the whole DAG is
+    O(V + E) rather than a rescan of every stage per level.
+    """
+    ready: deque[str] = deque()
+    for name in current_level:
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+    return ready
 
 
 def _groups_for_level(current_level: list[str], spec_map: dict[str, StageSpec]) -> list[tuple[str, ...]]:
@@ -237,7 +243,11 @@ def _compute_parallel_groups(
         WorkflowCompileError: If the dependency graph contains a cycle or
             references an unknown stage.
     """
-    stage_names, spec_map, deps, in_degree = _build_dependency_graph(stages)
+    stage_names, spec_map, _deps, in_degree = _build_dependency_graph(stages)
+    dependents: dict[str, list[str]] = {name: [] for name in stage_names}
+    for spec in stages:
+        for dep in spec.depends_on:
+            dependents[dep].append(spec.name)
 
     assigned: dict[str, int] = {}
     queue: deque[str] = deque(
@@ -250,7 +260,7 @@ def _compute_parallel_groups(
     while queue:
         current_level = _drain_level(queue, assigned, level)
         groups.extend(_groups_for_level(current_level, spec_map))
-        queue = _next_ready_queue(stages, deps, assigned)
+        queue = _next_ready_queue(current_level, dependents, in_degree)
         level += 1
 
     if len(assigned) != len(stage_names):
@@ -0,0 +1,196 @@
+"""Completion channel between the worker and workflow runs waiting on it.
+
+A stage dispatched through ``WorkerQueueDispatcher`` comes back ``pending``
+as soon as its job is enqueued. When the worker finishes the job it writes
+the stage's final StageResult into the run's workspace
+(``publish_stage_result``) and then writes one line naming the stage to the
+workspace's notification FIFO, ``.completions``. An orchestrator awaiting
+queued stages holds that FIFO open through ``CompletionChannel`` and blocks
+in ``select`` until a line arrives or its timeout expires — nothing polls
+the stages/ directory.
+
+Delivery is best-effort: with no run listening (the FIFO is missing or has
+no reader) the notification is dropped, and the result file is left for
+``resume``/``status`` to pick up. Platforms without ``os.mkfifo`` never
+open a channel, so the run returns ``pending`` as before.
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import logging
+import os
+import select
+import stat
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from core.date_utils import now_utc
+from workflow.models import StageResult, StageStatus
+from workflow.persistence import write_stage_result
+
+__all__ = [
+    "CompletionChannel",
+    "channel_supported",
+    "notify_stage_complete",
+    "publish_stage_result",
+]
+
+logger = logging.getLogger(__name__)
+
+FIFO_NAME = ".completions"
+_READ_CHUNK = 4096
+
+
+def channel_supported() -> bool:
+    return hasattr(os, "mkfifo")
+
+
+def _fifo_path(workspace_dir: str | Path) -> Path:
+    return Path(workspace_dir) / FIFO_NAME
+
+
+class CompletionChannel:
+    """Read end of a workspace's completion FIFO.
+
+    The channel also keeps a write end of its own open: without a writer a
+    FIFO reads as EOF and ``select`` would spin, and ``wake`` uses it to
+    interrupt a blocked ``wait``.
+    """
+
+    def __init__(self, workspace_dir: str | Path) -> None:
+        self.path = _fifo_path(workspace_dir)
+        self._read_fd: int | None = None
+        self._write_fd: int | None = None
+        self._created = False
+        self._buffer = b""
+
+    def open(self) -> bool:
+        """Create and open the FIFO. Returns False when no channel is available."""
+        if not channel_supported():
+            return False
+        try:
+            self.path.unlink(missing_ok=True)
+            os.mkfifo(self.path, 0o600)
+            self._created = True
+            self._read_fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            self._write_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as exc:
+            logger.warning("Completion channel unavailable at %s: %s", self.path, exc)
+            self.close()
+            return False
+        return True
+
+    def close(self) -> None:
+        for fd in (self._read_fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
+        self._read_fd = self._write_fd = None
+        if not self._created:
+            return
+        self._created = False
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:  # nosec B110 - a leftover FIFO only means the next worker write finds no reader
+            pass
+
+    def __enter__(self) -> CompletionChannel:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def wait(self, timeout: float) -> list[str]:
+        """Block up to ``timeout`` seconds; return the stage names signalled.
+
+        Returns an empty list on timeout or after ``wake``.
+        """
+        if self._read_fd is None:
+            return []
+        readable, _, _ = select.select([self._read_fd], [], [], max(0.0, timeout))
+        if not readable:
+            return []
+        try:
+            self._buffer += os.read(self._read_fd, _READ_CHUNK)
+        except BlockingIOError:
+            return []
+        *lines, self._buffer = self._buffer.split(b"\n")
+        names: list[str] = []
+        for line in lines:
+            try:
+                stage = json.loads(line).get("stage") if line.strip() else None
+            except (ValueError, AttributeError):
+                stage = None
+            if isinstance(stage, str):
+                names.append(stage)
+        return names
+
+    def wake(self) -> None:
+        """Interrupt a ``wait`` blocked on another thread."""
+        if self._write_fd is not None:
+            try:
+                os.write(self._write_fd, b"\n")
+            except BlockingIOError:  # nosec B110 - pipe full means the reader is already woken
+                pass
+
+
+def notify_stage_complete(workspace_dir: str | Path, stage_name: str, job_id: str = "") -> bool:
+    """Signal a listening run that ``stage_name`` finished. Returns True if delivered."""
+    line = json.dumps({"stage": stage_name, "job_id": job_id}).encode() + b"\n"
+    try:
+        fd = os.open(_fifo_path(workspace_dir), os.O_WRONLY | os.O_NONBLOCK)
+    except OSError as exc:
+        if exc.errno not in (errno.ENOENT, errno.ENXIO):  # no channel / nobody listening
+            logger.debug("Completion notify for '%s' failed: %s", stage_name, exc)
+        return False
+    try:
+        # Only ever write into the FIFO itself, never a file planted under its name.
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            return False
+        os.write(fd, line)  # one line < PIPE_BUF: atomic among concurrent workers
+        return True
+    except OSError as exc:
+        logger.debug("Completion notify for '%s' failed: %s", stage_name, exc)
+        return False
+    finally:
+        os.close(fd)
+
+
+def publish_stage_result(
+    job: dict[str, Any],
+    *,
+    success: bool,
+    output: object,
+    duration_ms: int = 0,
+) -> StageResult | None:
+    """Write a finished ``workflow_stage`` job's StageResult, then notify its run.
+
+    Returns None when the job payload does not identify a workspace stage.
+    """
+    payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
+    workspace_dir = str(payload.get("workspace_dir") or "").strip()
+    stage_name = str(payload.get("stage_name") or "").strip()
+    if not workspace_dir or not stage_name or not Path(workspace_dir).is_dir():
+        return None
+    job_id = str(job.get("id") or "")
+
+    finished = now_utc()
+    finished_at = finished.strftime("%Y-%m-%dT%H:%M:%SZ")
+    started_at = (finished - timedelta(milliseconds=duration_ms)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    out = "" if output is None or output is True else str(output)
+    result = StageResult(
+        stage_name=stage_name,
+        stage_index=int(payload.get("stage_index") or 0),
+        status=StageStatus.success if success else StageStatus.failed,
+        started_at=started_at,
+        finished_at=finished_at,
+        duration_ms=duration_ms,
+        data={"job_id": job_id, "output": out} if success else {"job_id": job_id},
+        errors=[] if success else [out or "worker job failed"],
+        metadata={"executor": "worker_queue"},
+    )
+    write_stage_result(workspace_dir, result)
+    notify_stage_complete(workspace_dir, stage_name, job_id)
+    return result
@@ -13,6 +13,8 @@ from __future__ import annotations
 import enum
 import json
 import logging
+import os
+import shlex
 import subprocess
 import uuid
 from pathlib import Path
@@ -29,7 +31,7 @@ from workflow.models import (
     StageStatus,
     make_stage_result,
 )
-from workflow.persistence import read_stage_result
+from workflow.persistence import read_stage_result, write_stage_result
 
 __all__ = [
     "CompositeDispatcher",
@@ -89,8 +91,49 @@ def _dispatch_group_serial(
     }
 
 
+# Any of these means the command needs a real shell (pipes, redirects,
+# expansion, globs, comments, history, brace groups, several lines).
+_SHELL_SYNTAX = frozenset("|&;<>()$`*?~[]{}#!\n\r")
+
+
+def _inprocess_argv(cmd: str) -> tuple[str, list[str]] | None:
+    """(app, argv) when ``cmd`` is a plain ``bin/<assistant> ...`` call that may run in-process."""
+    from core.warm_cli import app_for_bin, inprocess_requested
+    if not inprocess_requested() or any(ch in _SHELL_SYNTAX for ch in cmd):
+        return None
+    try:
+        tokens = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not tokens or "=" in tokens[0]:
+        return None
+    app = app_for_bin(tokens[0])
+    return (app, tokens[1:]) if app else None
+
+
+def _run_cli_inprocess(app: str, argv: list[str], cmd: str, timeout: int) -> dict[str, Any]:
+    from core.warm_cli import shared_pool
+    try:
+        # Pass the caller's env and cwd, as the subprocess path inherits them.
+        out = shared_pool().run(app, argv, env_overlay=dict(os.environ), cwd=os.getcwd(), timeout=timeout)
+    except subprocess.TimeoutExpired:
+        logger.warning("Command timed out after %ds: %s", timeout, cmd)
+        return {"status": "timeout", "command": cmd}
+    except RuntimeError as exc:
+        logger.warning("Command failed: %s — %s", cmd, exc)
+        return {"status": "error", "command": cmd, "error": str(exc)}
+    return {"status": "ok" if out["returncode"] == 0 else "error", **out}
+
+
 def _run_cli_command(cmd: str, *, timeout: int = 300) -> dict[str, Any]:
-    """Run a shell command and return a structured result dict."""
+    """Run a shell command and return a structured result dict.
+
+    With DANCING_BEAR_INPROCESS_CLI set, plain ``bin/<assistant>`` commands
+    (no pipes, redirects or expansion) run in a warm interpreter instead.
+    """
+    inproc = _inprocess_argv(cmd)
+    if inproc is not None:
+        return _run_cli_inprocess(*inproc, cmd, timeout)
     try:
         proc = subprocess.run(  # nosec B602 - shell=True required for CLI pipes; commands from trusted workflow YAML
             cmd, shell=True, capture_output=True, text=True, timeout=timeout,  # noqa: S602
@@ -252,7 +295,8 @@ class WorkerQueueDispatcher:
     Each stage becomes a Job with type="workflow_stage" and a payload carrying
     the workflow name, stage name, stage index, CLI commands, and any trigger
     params. The dispatcher returns a 'pending' StageResult immediately — the
-    worker daemon processes the job asynchronously.
+    worker daemon processes the job asynchronously, writes the final result
+    and signals the run through ``workflow.completion``.
     """
 
     JOB_TYPE = "workflow_stage"
@@ -300,13 +344,16 @@ class WorkerQueueDispatcher:
                 "trigger_params": self._trigger_params,
             },
         )
-        enqueue(job)
-        logger.debug("Enqueued stage '%s' as job '%s'", stage.spec.name, job_id)
-
-        return make_stage_result(
+        result = make_stage_result(
             stage, started_at, StageStatus.pending,
             StageResultExtras(data={"job_id": job_id, "job_type": self.JOB_TYPE}),
         )
+        # Persist the pending result before the job exists: the worker writes
+        # the final result to the same file, and must never be overwritten.
+        write_stage_result(workspace_dir, result)
+        enqueue(job)
+        logger.debug("Enqueued stage '%s' as job '%s'", stage.spec.name, job_id)
+        return result
 
     def dispatch_group(
         self,
@@ -7,6 +7,7 @@ the parent workflow's stage list.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Callable, cast
@@ -21,6 +22,7 @@ __all__ = [
     "_expand_includes",
     "resolve_fragment_path",
     "extract_include_entries",
+    "fragment_bytes",
 ]
 
 
@@ -55,11 +57,19 @@ def resolve_fragment_path(path_str: str, source_path: Path) -> Path:
     return source_path.parent / path_str
 
 
+_TOP_LEVEL_INCLUDE = re.compile(rb"^[\"']?include[\"']?\s*:", re.MULTILINE)
+
+
 def extract_include_entries(content: str | bytes) -> list[object]:
     """Return the raw ``include:`` list from YAML *content*, or an empty list.
 
     Swallows all YAML errors — callers use this as a best-effort pre-parse.
+    Block-style YAML without a column-0 ``include:`` key has no top-level
+    include list, so it is answered without parsing the document.
     """
+    raw = content.encode("utf-8") if isinstance(content, str) else content
+    if not _TOP_LEVEL_INCLUDE.search(raw) and not raw.lstrip().startswith(b"{"):
+        return []
     import yaml  # lazy — optional dep
     try:
         data = yaml.safe_load(content)
@@ -71,6 +81,30 @@ def extract_include_entries(content: str | bytes) -> list[object]:
     return raw_includes if isinstance(raw_includes, list) else []
 
 
+def fragment_bytes(
+    yaml_bytes: bytes,
+    yaml_path: Path,
+    _visited: frozenset[str] | None = None,
+) -> bytes:
+    """Return concatenated bytes of all fragment files referenced via include:."""
+    visited = _visited if _visited is not None else frozenset()
+    parts: list[bytes] = []
+    for inc in extract_include_entries(yaml_bytes):
+        if not isinstance(inc, dict) or "path" not in inc:
+            continue
+        p = resolve_fragment_path(str(inc["path"]), yaml_path)
+        p_key = str(p.resolve())
+        if p_key in visited:
+            continue
+        try:
+            frag_content = p.read_bytes()
+        except OSError:
+            continue
+        parts.append(frag_content)
+        parts.append(fragment_bytes(frag_content, p, _visited=visited | {p_key}))
+    return b"".join(parts)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
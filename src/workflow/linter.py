@@ -10,13 +10,14 @@ Additional checks beyond the parser:
 - Fragment files referenced in ``include:`` that do not exist are surfaced
   as errors.
 - ``./bin/<cli> <subcommand>`` patterns in stage descriptions are validated
-  against the actual CLI binaries when ``check_commands=True``.
+  against the actual CLI binaries when ``check_commands=True`` (see
+  ``workflow.linter_commands``).
 """
 
 from __future__ import annotations
 
 import re
-import subprocess
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,25 +26,18 @@ if TYPE_CHECKING:
     from workflow.models import WorkflowDefinition
 
 from .include import extract_include_entries, resolve_fragment_path
+from .linter_commands import command_pairs, resolve_cli_commands
 
 __all__ = [
     "LintError",
     "LintWarning",
     "LintResult",
     "lint_workflow",
+    "lint_workflows",
     "_check_fan_out_worker_queue",
     "_check_inline_executor",
 ]
 
-_CLI_CMD_RE = re.compile(r"\./bin/([a-z-]+)\s+([a-z-]+)")
-
-# CLIs whose subcommands don't support --help after the subcommand.
-_CLI_NO_HELP_ALLOWLIST: dict[str, set[str]] = {
-    "docs": {"search", "get-page", "publish-markdown"},
-    "telemetry": {"sessions", "history", "summary"},
-    "llm": {"familiarize", "auth-verify"},
-}
-
 _GLOBAL_STAGE = "<global>"
 
 _VAR_RE = re.compile(r"(?<!\{)\{([a-z_][a-z0-9_]*)\}(?!\})")
@@ -112,7 +106,24 @@ def lint_workflow(path: str | Path, *, check_commands: bool = False) -> LintResu
     Returns:
         LintResult with ``valid=True`` iff there are no errors.
     """
-    p = Path(path)
+    (result,) = lint_workflows([path], check_commands=check_commands)
+    return result
+
+
+def lint_workflows(paths: Iterable[str | Path], *, check_commands: bool = False) -> list[LintResult]:
+    """Lint several workflow YAML files, one ``LintResult`` per path in order.
+
+    With ``check_commands``, every distinct ``./bin/<cli> <subcommand>`` pair
+    across all files is validated once (see ``workflow.linter_commands``).
+    """
+    linted = [_lint_file(Path(p)) for p in paths]
+    if check_commands:
+        _check_cli_commands(linted)
+    return [result for result, _ in linted]
+
+
+def _lint_file(p: Path) -> tuple[LintResult, WorkflowDefinition | None]:
+    """Lint one file; also return its definition when it parsed as a workflow."""
     result = LintResult(file=str(p))
 
     try:
@@ -122,13 +133,13 @@ def lint_workflow(path: str | Path, *, check_commands: bool = False) -> LintResu
             LintError(stage=_GLOBAL_STAGE, field="file", message=f"file not found: {p}")
         )
         result.valid = False
-        return result
+        return result, None
     except OSError as exc:
         result.errors.append(
             LintError(stage=_GLOBAL_STAGE, field="file", message=f"cannot read {p}: {exc}")
         )
         result.valid = False
-        return result
+        return result, None
 
     import yaml as _yaml
 
@@ -139,11 +150,11 @@ def lint_workflow(path: str | Path, *, check_commands: bool = False) -> LintResu
     is_fragment = isinstance(_top, dict) and bool(_top.get("fragment"))
 
     if is_fragment:
-        return _lint_fragment(p, text, result)
+        return _lint_fragment(p, text, result), None
 
     _check_include_files(text, p, result)
     if not result.valid:
-        return result
+        return result, None
 
     from workflow.parser import WorkflowParseError, parse_workflow_str
 
@@ -154,7 +165,7 @@ def lint_workflow(path: str | Path, *, check_commands: bool = False) -> LintResu
             LintError(stage=_GLOBAL_STAGE, field="<parse>", message=str(exc))
         )
         result.valid = False
-        return result
+        return result, None
 
     result.stages = len(defn.stages)
     result.dag_depth = _compute_dag_depth(defn.stages)
@@ -163,11 +174,8 @@ def lint_workflow(path: str | Path, *, check_commands: bool = False) -> LintResu
     _check_fan_out_worker_queue(defn, result)
     _check_inline_executor(defn, result)
 
-    if check_commands:
-        _check_cli_commands(defn, result)
-
     result.valid = len(result.errors) == 0
-    return result
+    return result, defn
 
 
 def _lint_fragment(p: Path, text: str, result: LintResult) -> LintResult:
@@ -361,60 +369,22 @@ def _extract_var_refs(text: str) -> set[str]:
     return set(_VAR_RE.findall(text))
 
 
-def _check_cli_commands(defn: object, result: LintResult) -> None:
+def _check_cli_commands(linted: list[tuple[LintResult, WorkflowDefinition | None]]) -> None:
     """Append warnings for ./bin/<cli> <subcommand> patterns that cannot be validated."""
-    from workflow.models import WorkflowDefinition
-    if not isinstance(defn, WorkflowDefinition):
-        return
-
-    stage_for: dict[tuple[str, str], str] = {}
-    for stage in defn.stages:
-        for cli, sub in _CLI_CMD_RE.findall(stage.description):
-            stage_for.setdefault((cli, sub), stage.name)
-
-    for (cli, sub), stage_name in stage_for.items():
-        warning = _validate_cli_command(cli, sub, stage_name)
-        if warning is not None:
-            result.warnings.append(warning)
-
-
-def _cmd_warning(stage_name: str, message: str) -> LintWarning:
-    """Build a LintWarning for a CLI command check."""
-    return LintWarning(stage=stage_name, field="description", message=message)
-
-
-def _validate_cli_command(cli: str, sub: str, stage_name: str) -> LintWarning | None:
-    """Probe a single (cli, subcommand) pair and return a warning if it is invalid."""
-    bin_path = Path("./bin") / cli
-    not_found = f"command not found: ./bin/{cli} {sub}"
-
-    allowlisted_subs = _CLI_NO_HELP_ALLOWLIST.get(cli)
-    if allowlisted_subs is not None and sub in allowlisted_subs:
-        return _cmd_warning(stage_name, not_found) if not bin_path.exists() else None
-
-    try:
-        proc = subprocess.run(  # nosec B603 - bin_path resolved from workflow YAML; sub validated against allowlist
-            [str(bin_path), sub, "--help"],
-            capture_output=True,
-            timeout=3,
-        )
-    except FileNotFoundError:
-        return _cmd_warning(stage_name, not_found)
-    except subprocess.TimeoutExpired:
-        return _cmd_warning(stage_name, f"command validation skipped (timeout): ./bin/{cli} {sub}")
-    except OSError as exc:
-        return _cmd_warning(stage_name, f"command validation skipped ({exc.__class__.__name__}): ./bin/{cli} {sub}")
-
-    combined = (proc.stdout + proc.stderr).decode(errors="replace")
-    if proc.returncode != 0 and _looks_like_invalid_subcommand(combined):
-        return _cmd_warning(stage_name, not_found)
-    return None
-
-
-def _looks_like_invalid_subcommand(output: str) -> bool:
-    """Return True when subprocess output indicates the subcommand does not exist."""
-    lowered = output.lower()
-    return "unrecognized arguments" in lowered or "invalid choice" in lowered
+    stage_for: list[dict[tuple[str, str], str]] = []
+    for _, defn in linted:
+        pairs: dict[tuple[str, str], str] = {}
+        for stage in defn.stages if defn is not None else ():
+            for pair in command_pairs(stage.description):
+                pairs.setdefault(pair, stage.name)
+        stage_for.append(pairs)
+
+    verdicts = resolve_cli_commands({pair for pairs in stage_for for pair in pairs})
+    for (result, _), pairs in zip(linted, stage_for):
+        for pair, stage_name in pairs.items():
+            message = verdicts[pair]
+            if message is not None:
+                result.warnings.append(LintWarning(stage=stage_name, field="description", message=message))
 
 
 def _check_include_files(text: str, workflow_path: Path, result: LintResult) -> None:
@@ -0,0 +1,189 @@
+"""``./bin/<cli> <subcommand>`` validation for the workflow linter.
+
+Probing ``./bin/<cli> <sub> --help`` starts a Python interpreter per pair.
+Instead, a CLI whose package exposes the standard ``agentic._get_parser``
+loader (built with ``core.agentic.cached_parser_loader``) has its argparse
+tree introspected once; the resulting subcommand list is cached under
+``<data home>/workflow/cli-subcommands.json`` keyed by a hash of the CLI
+package's source, so later lints skip even the import. Pairs for CLIs that
+cannot be introspected fall back to the ``--help`` probe, run concurrently
+across every workflow being linted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import subprocess  # nosec B404 - fallback --help probes of repo bin/ wrappers
+import threading
+from importlib import import_module
+from pathlib import Path
+
+from core.agentic import list_subcommands
+from core.fileutil import atomic_write_json, safe_load_json
+from core.parallel import parallel_map
+from core.paths import data_home
+
+__all__ = [
+    "CliSubcommands",
+    "resolve_cli_commands",
+]
+
+_CLI_CMD_RE = re.compile(r"\./bin/([a-z-]+)\s+([a-z-]+)")
+
+# CLIs whose subcommands don't support --help after the subcommand.
+_CLI_NO_HELP_ALLOWLIST: dict[str, set[str]] = {
+    "docs": {"search", "get-page", "publish-markdown"},
+    "telemetry": {"sessions", "history", "summary"},
+    "llm": {"familiarize", "auth-verify"},
+}
+
+# ``from mail.__main__ import main`` in a generated bin/ wrapper. Wrappers for
+# single-purpose modules (``from metals.spot import main``) are not the
+# package CLI whose parser ``<pkg>.agentic`` describes, so they are probed.
+_WRAPPER_IMPORT_RE = re.compile(r"^from\s+([A-Za-z_]\w*)\.__main__\s+import\s+main\b", re.MULTILINE)
+
+_CACHE_VERSION = 1
+_PROBE_WORKERS = 8
+
+
+def default_cache_path() -> Path:
+    return data_home() / "workflow" / "cli-subcommands.json"
+
+
+def command_pairs(text: str) -> list[tuple[str, str]]:
+    """``(cli, subcommand)`` pairs referenced as ``./bin/<cli> <sub>`` in *text*."""
+    return _CLI_CMD_RE.findall(text)
+
+
+def _source_hash(package_dir: Path) -> str | None:
+    """sha256 over every Python file in the package (path and content)."""
+    try:
+        files = sorted(package_dir.rglob("*.py"))
+        digest = hashlib.sha256()
+        for path in files:
+            digest.update(str(path.relative_to(package_dir)).encode())
+            digest.update(path.read_bytes())
+    except OSError:
+        return None
+    return digest.hexdigest() if files else None
+
+
+class CliSubcommands:
+    """Subcommands per CLI from its argparse tree, cached by CLI source hash."""
+
+    def __init__(self, bin_dir: Path | None = None, cache_path: Path | None = None) -> None:
+        self.bin_dir = Path(bin_dir) if bin_dir else Path("./bin")
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self._lock = threading.Lock()
+        self._dirty = False
+        raw = safe_load_json(self.cache_path, {})
+        entries = raw.get("clis") if isinstance(raw, dict) and raw.get("version") == _CACHE_VERSION else None
+        self._entries: dict[str, dict] = entries if isinstance(entries, dict) else {}
+
+    def _package(self, cli: str) -> str | None:
+        try:
+            wrapper = (self.bin_dir / cli).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        m = _WRAPPER_IMPORT_RE.search(wrapper)
+        return m.group(1) if m else None
+
+    def known(self, cli: str) -> frozenset[str] | None:
+        """The CLI's top-level subcommands, or None when its parser cannot be introspected."""
+        package = self._package(cli)
+        if package is None:
+            return None
+        src_root = (self.bin_dir / cli).resolve().parents[1] / "src"
+        source_hash = _source_hash(src_root / package)
+        if source_hash is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(cli)
+        if isinstance(entry, dict) and entry.get("hash") == source_hash:
+            subs = entry.get("subcommands")
+            return frozenset(subs) if isinstance(subs, list) else None
+
+        subs = self._introspect(package)
+        with self._lock:
+            self._entries[cli] = {"hash": source_hash, "subcommands": subs}
+            self._dirty = True
+        return frozenset(subs) if subs is not None else None
+
+    @staticmethod
+    def _introspect(package: str) -> list[str] | None:
+        try:
+            get_parser = getattr(import_module(f"{package}.agentic"), "_get_parser", None)
+        except Exception:  # nosec B110 - a CLI without (importable) agentic helpers is probed instead
+            return None
+        parser = get_parser() if callable(get_parser) else None
+        return list_subcommands(parser) or None
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {"version": _CACHE_VERSION, "clis": dict(self._entries)}
+            self._dirty = False
+        try:
+            atomic_write_json(self.cache_path, snapshot, indent=None)
+        except OSError:  # nosec B110 - an unwritable data home only costs the next lint an import
+            pass
+
+
+def _probe(bin_dir: Path, cli: str, sub: str) -> str | None:
+    """Run ``<cli> <sub> --help``; return a warning message if the pair looks invalid."""
+    bin_path = bin_dir / cli
+    not_found = f"command not found: ./bin/{cli} {sub}"
+    try:
+        proc = subprocess.run(  # nosec B603 - bin_path resolved from workflow YAML; sub validated against allowlist
+            [str(bin_path), sub, "--help"],
+            capture_output=True,
+            timeout=3,
+        )
+    except FileNotFoundError:
+        return not_found
+    except subprocess.TimeoutExpired:
+        return f"command validation skipped (timeout): ./bin/{cli} {sub}"
+    except OSError as exc:
+        return f"command validation skipped ({exc.__class__.__name__}): ./bin/{cli} {sub}"
+
+    combined = (proc.stdout + proc.stderr).decode(errors="replace")
+    if proc.returncode != 0 and _looks_like_invalid_subcommand(combined):
+        return not_found
+    return None
+
+
+def _looks_like_invalid_subcommand(output: str) -> bool:
+    """Return True when subprocess output indicates the subcommand does not exist."""
+    lowered = output.lower()
+    return "unrecognized arguments" in lowered or "invalid choice" in lowered
+
+
+def resolve_cli_commands(
+    pairs: set[tuple[str, str]],
+    *,
+    subcommands: CliSubcommands | None = None,
+    max_workers: int = _PROBE_WORKERS,
+) -> dict[tuple[str, str], str | None]:
+    """Map each ``(cli, sub)`` pair to a warning message, or None when it is valid."""
+    resolver = subcommands or CliSubcommands()
+    verdicts: dict[tuple[str, str], str | None] = {}
+    to_probe: list[tuple[str, str]] = []
+    for cli, sub in sorted(pairs):
+        not_found = f"command not found: ./bin/{cli} {sub}"
+        if not (resolver.bin_dir / cli).exists():
+            verdicts[(cli, sub)] = not_found
+            continue
+        known = resolver.known(cli)
+        if known is not None:
+            verdicts[(cli, sub)] = None if sub in known else not_found
+        elif sub in _CLI_NO_HELP_ALLOWLIST.get(cli, ()):
+            verdicts[(cli, sub)] = None
+        else:
+            to_probe.append((cli, sub))
+    resolver.save()
+
+    probed = parallel_map(lambda pair: _probe(resolver.bin_dir, *pair), to_probe, max_workers=max_workers)
+    verdicts.update(zip(to_probe, probed))
+    return verdicts
@@ -0,0 +1,273 @@
+"""Content-addressed cache of parsed definitions and compiled manifests.
+
+``run`` and ``init-workspace`` otherwise re-parse the YAML, expand every
+``include:`` fragment, read every referenced template and writing guide and
+recompile on each invocation. Entries are keyed by the sha256 of the
+workflow YAML, the bytes of every fragment it includes (recursively) and the
+working directory (fragments and templates resolve against it). Each entry
+holds the parsed definition plus one compiled manifest per set of trigger
+params, together with the sha256 of every template/guide that compile read;
+a manifest is reused only while all of those files are unchanged.
+
+Entries live under ``<data home>/workflow/manifests/`` rather than in the
+shared temp dir next to default workspaces: a manifest carries the shell
+commands ``run --execute`` executes, so it must not be plantable by another
+user. Set ``WORKFLOW_MANIFEST_CACHE=0`` to bypass the cache.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import threading
+import types
+import typing
+from enum import Enum
+from pathlib import Path
+from typing import Any, Union
+
+from core.fileutil import atomic_write_json, safe_load_json
+from core.paths import data_home
+from workflow.compiler import compile_workflow
+from workflow.include import fragment_bytes
+from workflow.models import ResolvedStage, WorkflowDefinition, WorkflowManifest
+from workflow.parser import parse_workflow
+
+__all__ = [
+    "ENV_MANIFEST_CACHE",
+    "ManifestCache",
+    "cache_enabled",
+    "load_definition",
+    "load_manifest",
+]
+
+ENV_MANIFEST_CACHE = "WORKFLOW_MANIFEST_CACHE"
+_CACHE_VERSION = 1
+_MAX_MANIFESTS = 8  # compiled variants (distinct trigger params) kept per definition
+
+# Entries already read or written by this process, keyed by entry file, so a
+# command that needs both the definition and the manifest parses at most once.
+_entries: dict[Path, dict[str, Any]] = {}
+_entries_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(ENV_MANIFEST_CACHE, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def default_cache_dir() -> Path:
+    return data_home() / "workflow" / "manifests"
+
+
+def _sha256_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Dataclass <-> JSON
+# ---------------------------------------------------------------------------
+
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _hints(tp: type) -> dict[str, Any]:
+    return typing.get_type_hints(tp)
+
+
+def _decode(tp: Any, raw: Any) -> Any:
+    """Rebuild a value of annotated type ``tp`` from its ``_encode`` form."""
+    if raw is None or tp is Any:
+        return raw
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin in (Union, types.UnionType):
+        return _decode(next(a for a in args if a is not type(None)), raw)
+    if dataclasses.is_dataclass(tp):
+        hints = _hints(tp)
+        return tp(**{f.name: _decode(hints[f.name], raw[f.name]) for f in dataclasses.fields(tp) if f.name in raw})
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp(raw)
+    if origin is tuple:
+        return tuple(_decode(args[0], v) for v in raw)
+    if origin is list:
+        return [_decode(args[0], v) for v in raw]
+    if origin is dict:
+        return {k: _decode(args[1], v) for k, v in raw.items()}
+    return raw
+
+
+_DECODE_ERRORS = (KeyError, TypeError, ValueError, StopIteration)
+
+
+def _round_trips(tp: Any, encoded: Any, original: Any) -> bool:
+    """True when ``encoded`` survives JSON and decodes back to ``original``.
+
+    YAML can yield values JSON cannot hold faithfully (dates, non-string
+    keys); those definitions are simply not cached.
+    """
+    try:
+        return _decode(tp, json.loads(json.dumps(encoded))) == original
+    except (*_DECODE_ERRORS, OverflowError):
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class ManifestCache:
+    """Definitions and manifests for workflow files, reused while their inputs are unchanged."""
+
+    def __init__(self, cache_dir: Path | None = None, *, project_root: Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+
+    def _entry_path(self, yaml_path: Path) -> Path:
+        yaml_bytes = yaml_path.read_bytes()
+        digest = hashlib.sha256(f"v{_CACHE_VERSION}:{self.project_root.resolve()}:".encode())
+        digest.update(hashlib.sha256(yaml_bytes).digest())
+        digest.update(hashlib.sha256(fragment_bytes(yaml_bytes, yaml_path)).digest())
+        return self.cache_dir / f"{digest.hexdigest()[:32]}.json"
+
+    def _load_entry(self, entry_path: Path) -> dict[str, Any]:
+        with _entries_lock:
+            entry = _entries.get(entry_path)
+        if entry is None:
+            raw = safe_load_json(entry_path, {})
+            entry = raw if isinstance(raw, dict) and raw.get("version") == _CACHE_VERSION else {}
+            with _entries_lock:
+                entry = _entries.setdefault(entry_path, entry)
+        return entry
+
+    def _store(self, entry_path: Path, entry: dict[str, Any]) -> None:
+        entry["version"] = _CACHE_VERSION
+        with _entries_lock:
+            _entries[entry_path] = entry
+        try:
+            atomic_write_json(entry_path, entry, indent=None)
+        except OSError:  # nosec B110 - an unwritable data home only costs a recompile
+            pass
+
+    def definition(self, yaml_path: str | Path) -> WorkflowDefinition:
+        """Parsed definition for ``yaml_path``.
+
+        Raises:
+            WorkflowParseError: When the YAML (or a fragment) is invalid.
+        """
+        path = Path(yaml_path)
+        try:
+            entry_path = self._entry_path(path)
+        except OSError:
+            return parse_workflow(path)  # let the parser report the unreadable file
+        return self._definition(path, entry_path)
+
+    def _definition(self, path: Path, entry_path: Path) -> WorkflowDefinition:
+        entry = self._load_entry(entry_path)
+        if "definition" in entry:
+            try:
+                return _decode(WorkflowDefinition, entry["definition"])
+            except _DECODE_ERRORS:
+                pass  # an entry from an incompatible model: re-parse and overwrite
+        definition = parse_workflow(path)
+        encoded = _encode(definition)
+        if _round_trips(WorkflowDefinition, encoded, definition):
+            self._store(entry_path, {"definition": encoded, "manifests": {}})
+        return definition
+
+    def manifest(
+        self,
+        yaml_path: str | Path,
+        trigger_params: dict[str, str] | None = None,
+    ) -> WorkflowManifest:
+        """Compiled manifest for ``yaml_path`` with ``trigger_params``.
+
+        Raises:
+            WorkflowParseError: When the YAML (or a fragment) is invalid.
+            WorkflowCompileError: When compilation fails.
+        """
+        path = Path(yaml_path)
+        try:
+            entry_path = self._entry_path(path)
+        except OSError:
+            return compile_workflow(parse_workflow(path), project_root=self.project_root, trigger_params=trigger_params)
+        definition = self._definition(path, entry_path)
+        entry = self._load_entry(entry_path)
+        params_key = hashlib.sha256(json.dumps(trigger_params or {}, sort_keys=True).encode()).hexdigest()[:16]
+        cached = (entry.get("manifests") or {}).get(params_key)
+        if isinstance(cached, dict) and self._files_unchanged(cached.get("files")):
+            try:
+                return WorkflowManifest(
+                    definition=definition,
+                    parallel_groups=_decode(tuple[tuple[str, ...], ...], cached["parallel_groups"]),
+                    resolved_stages=_decode(dict[str, ResolvedStage], cached["resolved_stages"]),
+                    compiled_at=cached["compiled_at"],
+                )
+            except _DECODE_ERRORS:
+                pass
+
+        manifest = compile_workflow(definition, project_root=self.project_root, trigger_params=trigger_params)
+        resolved = _encode(manifest.resolved_stages)
+        if "definition" in entry and _round_trips(dict[str, ResolvedStage], resolved, manifest.resolved_stages):
+            manifests = dict(entry.get("manifests") or {})
+            manifests.pop(params_key, None)
+            manifests[params_key] = {
+                "files": self._referenced_files(definition),
+                "parallel_groups": _encode(manifest.parallel_groups),
+                "resolved_stages": resolved,
+                "compiled_at": manifest.compiled_at,
+            }
+            while len(manifests) > _MAX_MANIFESTS:
+                manifests.pop(next(iter(manifests)))
+            self._store(entry_path, {**entry, "manifests": manifests})
+        return manifest
+
+    def _referenced_files(self, definition: WorkflowDefinition) -> dict[str, str | None]:
+        """sha256 of every template and writing guide compile reads."""
+        refs = {
+            ref
+            for stage in definition.stages
+            for output in stage.outputs
+            for ref in (output.template_ref, output.writing_guide_ref)
+            if ref
+        }
+        return {ref: _sha256_file(self.project_root / ref) for ref in sorted(refs)}
+
+    def _files_unchanged(self, files: Any) -> bool:
+        if not isinstance(files, dict):
+            return False
+        return all(_sha256_file(self.project_root / ref) == sha for ref, sha in files.items())
+
+
+def load_definition(yaml_path: str | Path) -> WorkflowDefinition:
+    """Parse ``yaml_path``, through the cache unless it is disabled."""
+    if not cache_enabled():
+        return parse_workflow(yaml_path)
+    return ManifestCache().definition(yaml_path)
+
+
+def load_manifest(
+    yaml_path: str | Path,
+    trigger_params: dict[str, str] | None = None,
+) -> WorkflowManifest:
+    """Parse and compile ``yaml_path``, through the cache unless it is disabled."""
+    if not cache_enabled():
+        return compile_workflow(parse_workflow(yaml_path), trigger_params=trigger_params)
+    return ManifestCache().manifest(yaml_path, trigger_params)
@@ -430,3 +430,4 @@ class WorkflowRun:
     started_at: str  # ISO 8601 UTC
     status: StageStatus = StageStatus.pending
     stage_results: dict[str, StageResult] = field(default_factory=dict)
+    critical_path: tuple[str, ...] = ()  # stage chain that bounded the run's makespan
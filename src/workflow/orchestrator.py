@@ -1,15 +1,25 @@
 """Workflow execution engine with pluggable dispatch.
 
-Walks the compiled WorkflowManifest's parallel groups, dispatches stages
-via a StageDispatcher, tracks results via persistence, and pauses on
-human gates.
+Launches each stage of the compiled WorkflowManifest as soon as its own
+``depends_on`` have finished (up to ``max_concurrency`` at once), dispatches
+stages via a StageDispatcher, tracks results via persistence, and pauses on
+human gates. The actual start/finish of every stage and the critical path
+are recorded under ``schedule`` in the workspace manifest.json.
+
+Stages handed to the worker queue come back ``pending``. With
+``await_pending`` set, the run listens on the workspace completion channel
+(``workflow.completion``) and carries on with their dependents as the worker
+finishes them, instead of returning ``pending`` straight away.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -29,11 +39,15 @@ from workflow.models import (
     make_stage_result,
 )
 from workflow.compiler import resolve_params
+from workflow.completion import CompletionChannel
 from workflow.persistence import (
     init_workspace,
     list_stage_results,
+    read_stage_result,
+    write_schedule,
     write_stage_result,
 )
+from workflow.scheduler import ReadyQueue, StageTiming, schedule_summary
 
 __all__ = [
     "OrchestratorConfig",
@@ -41,6 +55,8 @@ __all__ = [
     "WorkflowOrchestrator",
 ]
 
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 @dataclass(frozen=True)
 class OrchestratorConfig:
@@ -51,6 +67,8 @@ class OrchestratorConfig:
     run_id: str | None = None
     dry_run: bool = False
     trigger_params: dict[str, str] = field(default_factory=dict)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    await_pending: float = 0.0  # seconds to wait for worker-queued stages; 0 returns pending at once
 
 
 logger = logging.getLogger(__name__)
@@ -80,6 +98,11 @@ class WorkflowOrchestrator:
         self._results: dict[str, StageResult] = {}
         self._status = StageStatus.pending
         self._trigger_params = dict(config.trigger_params)
+        self._max_concurrency = max(1, config.max_concurrency)
+        self._await_pending = max(0.0, config.await_pending)
+        self._timings: dict[str, StageTiming] = {}
+        self._clock_lock = threading.Lock()
+        self._t0 = time.monotonic()
 
         name = config.manifest.definition.name
         self._run_id = config.run_id or f"{name}-{iso_now()}-{uuid.uuid4().hex[:8]}"
@@ -106,16 +129,23 @@ class WorkflowOrchestrator:
         *,
         dispatcher: StageDispatcher | None = None,
         trigger_params: dict[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        await_pending: float = 0.0,
     ) -> WorkflowOrchestrator:
         """Resume a workflow from existing workspace state.
 
-        Reads existing stage results and skips completed groups.
+        Reads existing stage results and skips completed stages.
         """
         orch = cls.__new__(cls)
         orch._manifest = manifest
         orch._dry_run = False
         orch._trigger_params = trigger_params or {}
         orch._status = StageStatus.running
+        orch._max_concurrency = max(1, max_concurrency)
+        orch._await_pending = max(0.0, await_pending)
+        orch._timings = {}
+        orch._clock_lock = threading.Lock()
+        orch._t0 = time.monotonic()
 
         name = manifest.definition.name
         orch._run_id = f"{name}-resumed-{uuid.uuid4().hex[:8]}"
@@ -134,24 +164,75 @@ class WorkflowOrchestrator:
     def run(self) -> WorkflowRun:
         """Execute the workflow end-to-end.
 
-        Walks parallel groups sequentially. Within each group, stages
-        execute via the configured dispatcher. Human gates pause execution.
+        A stage launches as soon as every stage it depends on has finished
+        (succeeded, been skipped, or failed without being required), with at
+        most ``max_concurrency`` stages in flight. A human-gate stage runs
+        alone: nothing new launches while it waits for in-flight stages or
+        runs, and its success pauses the run. A required failure stops new
+        launches; stages already in flight finish and are recorded. A
+        pending result holds back only that stage's dependents — for up to
+        ``await_pending`` seconds, if set, while the run blocks on the
+        completion channel for the worker to finish queued stages.
 
         Returns:
             WorkflowRun with all stage results.
         """
         self._status = StageStatus.running
         started_at = iso_now()
+        self._t0 = time.monotonic()
+        self._timings = {}
+        params = dict(self._manifest.definition.trigger.params)
+        params.update(self._trigger_params)
 
-        for group in self._manifest.parallel_groups:
-            group_results = self._run_group(group)
-            self._results.update(group_results)
-
-            early_exit = self._process_group_results(group, group_results, started_at)
-            if early_exit is not None:
-                return early_exit
-
-        self._status = StageStatus.success
+        channel = CompletionChannel(self._workspace_dir)
+        listening = self._await_pending > 0 and not self._dry_run and channel.open()
+        queue = ReadyQueue(self._stages_by_name)
+        halt: StageStatus | None = None
+        in_flight: dict[Future[StageResult], str] = {}
+        queued: dict[str, str] = {}  # pending stage -> worker job id
+        deadline: float | None = None
+        watch: Future[list[str]] | None = None
+        with channel, ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="workflow-stage") as pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="workflow-completions") as watcher:
+            while True:
+                while halt is None and (stage := self._next_launch(queue, in_flight)) is not None:
+                    name = stage.spec.name
+                    if name in self._results:  # completed by an earlier run
+                        queue.complete(name)
+                    elif not self._eval_when(stage.spec.when, params):
+                        self._start_timing(name)
+                        self._finish_stage(queue, stage, self._skip_stage(stage))
+                    else:
+                        in_flight[pool.submit(self._dispatch_stage, stage)] = name
+                awaiting = listening and bool(queued) and halt is None and (deadline is None or time.monotonic() < deadline)
+                if not in_flight and not awaiting:
+                    break
+                if awaiting and watch is None:
+                    watch = watcher.submit(channel.wait, deadline - time.monotonic())
+                done, _ = wait([*in_flight, *([watch] if watch else [])], return_when=FIRST_COMPLETED)
+                for future in sorted(done - {watch}, key=lambda f: self._stages_by_name[in_flight[f]].index):
+                    stage = self._stages_by_name[in_flight.pop(future)]
+                    result = future.result()
+                    outcome = self._finish_stage(queue, stage, result)
+                    halt = halt or outcome
+                    if result.status == StageStatus.pending:
+                        queued[stage.spec.name] = str(result.data.get("job_id") or "")
+                        deadline = deadline or time.monotonic() + self._await_pending
+                        if listening:  # the worker may have finished before the future was reaped
+                            halt = halt or self._collect_queued(queue, queued, [stage.spec.name])
+                if watch in done:
+                    signalled, watch = watch.result(), None
+                    halt = halt or self._collect_queued(queue, queued, signalled)
+            if watch is not None:
+                channel.wake()
+                watch.result()
+
+        if halt is not None:
+            self._status = halt
+        elif any(r.status == StageStatus.pending for r in self._results.values()):
+            self._status = StageStatus.pending
+        else:
+            self._status = StageStatus.success
         return self._build_run(started_at)
 
     def run_stage(self, stage_name: str) -> StageResult:
@@ -207,39 +288,92 @@ class WorkflowOrchestrator:
 
     # -- Private helpers ------------------------------------------------------
 
-    def _process_group_results(
+    def _next_launch(
         self,
-        group: tuple[str, ...],
-        group_results: dict[str, StageResult],
-        started_at: str,
-    ) -> WorkflowRun | None:
-        """Persist results, check failures and gates. Returns WorkflowRun if halting."""
-        for result in group_results.values():
+        queue: ReadyQueue,
+        in_flight: dict[Future[StageResult], str],
+    ) -> ResolvedStage | None:
+        """Pop the next ready stage if the concurrency cap and gate isolation allow it."""
+        stage = queue.peek()
+        if stage is None or len(in_flight) >= self._max_concurrency:
+            return None
+        if any(self._stages_by_name[name].spec.human_gate for name in in_flight.values()):
+            return None
+        if stage.spec.human_gate and in_flight:
+            return None
+        return queue.pop()
+
+    def _dispatch_stage(self, stage: ResolvedStage) -> StageResult:
+        """Run one stage on a worker thread, recording its actual start and finish."""
+        name = stage.spec.name
+        self._start_timing(name)
+        try:
+            if self._dry_run:
+                return self.run_stage(name)
+            try:
+                return self._dispatcher.dispatch_group([stage], self._workspace_dir)[name]
+            except (OSError, ValueError, KeyError, RuntimeError, WorkflowExecutionError):
+                return self.run_stage(name)
+        finally:
+            with self._clock_lock:
+                self._timings[name].finish_ms = self._elapsed_ms()
+
+    def _finish_stage(
+        self,
+        queue: ReadyQueue,
+        stage: ResolvedStage,
+        result: StageResult,
+    ) -> StageStatus | None:
+        """Persist a result and release dependents. Returns the run status to halt with, if any."""
+        name = stage.spec.name
+        self._results[name] = result
+        if not (result.status == StageStatus.pending and result.data.get("job_id")):
+            # A queued stage's pending result is written by its dispatcher before
+            # the job exists; rewriting it here could clobber the worker's result.
             write_stage_result(self._workspace_dir, result)
+        with self._clock_lock:
+            timing = self._timings.get(name)
+            if timing is not None and timing.finish_ms is None:
+                timing.finish_ms = self._elapsed_ms()
+
+        if self._any_required_failed({name: result}):
+            return StageStatus.failed
+        if stage.spec.human_gate and result.status == StageStatus.success:
+            return StageStatus.awaiting_human
+        if result.status != StageStatus.pending:
+            queue.complete(name)
+        return None
 
-        if self._any_required_failed(group_results):
-            self._status = StageStatus.failed
-            return self._build_run(started_at)
-
-        for name in group:
-            stage = self._stages_by_name.get(name)
-            if stage is None:
+    def _collect_queued(
+        self,
+        queue: ReadyQueue,
+        queued: dict[str, str],
+        names: list[str],
+    ) -> StageStatus | None:
+        """Record the worker's final result for signalled queued stages; release their dependents."""
+        halt: StageStatus | None = None
+        for name in names:
+            if name not in queued:
                 continue
-            if (
-                stage.spec.human_gate
-                and group_results[name].status == StageStatus.success
-            ):
-                self._status = StageStatus.awaiting_human
-                return self._build_run(started_at)
-
-        if any(
-            group_results[name].status == StageStatus.pending
-            for name in group
-        ):
-            self._status = StageStatus.pending
-            return self._build_run(started_at)
-
-        return None
+            result = read_stage_result(self._workspace_dir, name)
+            if result is None or result.status == StageStatus.pending:
+                continue
+            if str(result.data.get("job_id") or "") != queued[name]:
+                continue  # a stale result from an earlier job for this stage
+            del queued[name]
+            with self._clock_lock:
+                timing = self._timings.get(name)
+                if timing is not None:
+                    timing.finish_ms = self._elapsed_ms()
+            halt = halt or self._finish_stage(queue, self._stages_by_name[name], result)
+        return halt
+
+    def _start_timing(self, name: str) -> None:
+        with self._clock_lock:
+            self._timings[name] = StageTiming(start_ms=self._elapsed_ms())
+
+    def _elapsed_ms(self) -> int:
+        return int((time.monotonic() - self._t0) * 1000)
 
     def _any_required_failed(
         self,
@@ -303,42 +437,14 @@ class WorkflowOrchestrator:
             StageResultExtras(data={"skipped_by_when": stage.spec.when}),
         )
 
-    def _run_group(self, group: tuple[str, ...]) -> dict[str, StageResult]:
-        """Execute all stages in a parallel group via the dispatcher."""
-        params = dict(self._manifest.definition.trigger.params)
-        params.update(self._trigger_params)
-
-        results: dict[str, StageResult] = {}
-        to_dispatch: list[ResolvedStage] = []
-
-        for name in group:
-            stage = self._stages_by_name[name]
-            if name in self._results:
-                results[name] = self._results[name]
-            elif not self._eval_when(stage.spec.when, params):
-                results[name] = self._skip_stage(stage)
-            else:
-                to_dispatch.append(stage)
-
-        if self._dry_run:
-            results.update({stage.spec.name: self.run_stage(stage.spec.name) for stage in to_dispatch})
-            return results
-
-        if not to_dispatch:
-            return results
-
-        try:
-            dispatched = self._dispatcher.dispatch_group(
-                to_dispatch, self._workspace_dir,
-            )
-        except (OSError, ValueError, KeyError, RuntimeError, WorkflowExecutionError):
-            dispatched = {stage.spec.name: self.run_stage(stage.spec.name) for stage in to_dispatch}
-
-        results.update(dispatched)
-        return results
-
     def _build_run(self, started_at: str) -> WorkflowRun:
-        """Construct a WorkflowRun from current state."""
+        """Construct a WorkflowRun from current state and record its schedule."""
+        with self._clock_lock:
+            timings = {name: StageTiming(t.start_ms, t.finish_ms) for name, t in self._timings.items()}
+        schedule = schedule_summary(timings, self._stages_by_name, max_concurrency=self._max_concurrency)
+        schedule["started_at"] = started_at
+        schedule["status"] = self._status.value
+        write_schedule(self._workspace_dir, schedule)
         return WorkflowRun(
             manifest=self._manifest,
             workspace_dir=str(self._workspace_dir),
@@ -346,4 +452,5 @@ class WorkflowOrchestrator:
             started_at=started_at,
             status=self._status,
             stage_results=dict(self._results),
+            critical_path=tuple(schedule["critical_path"]),
         )
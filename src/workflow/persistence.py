@@ -152,6 +152,24 @@ def write_manifest(
     return target
 
 
+def write_schedule(workspace_dir: str | Path, schedule: dict) -> Path:
+    """Record a run's actual schedule under ``schedule`` in manifest.json.
+
+    Other manifest keys are kept; a workspace without a manifest gets one
+    holding just the schedule.
+    """
+    target = Path(workspace_dir) / "manifest.json"
+    try:
+        data = json.loads(target.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, FileNotFoundError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data["schedule"] = schedule
+    atomic_write_json(target, data)
+    return target
+
+
 def read_manifest(workspace_dir: str | Path) -> ManifestRef | None:
     """Load a manifest reference from workspace. Returns None if not found."""
     path = Path(workspace_dir) / "manifest.json"
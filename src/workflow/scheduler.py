@@ -0,0 +1,124 @@
+"""Dependency-driven ready queue and schedule summary for workflow runs.
+
+The compiler levels the DAG into ``parallel_groups`` for display and for the
+skill-driven flow. Executing level by level makes every stage wait for the
+whole previous level, including stages it does not depend on. ``ReadyQueue``
+instead tracks each stage's unfinished ``depends_on`` count and releases a
+stage the moment that count reaches zero, so a run's makespan is bounded by
+its critical path rather than the sum of its slowest stage per level.
+
+``critical_path`` recovers the chain that actually bounded a run from the
+recorded start/finish offsets.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Any
+
+from workflow.models import ResolvedStage
+
+__all__ = [
+    "ReadyQueue",
+    "StageTiming",
+    "critical_path",
+    "schedule_summary",
+]
+
+
+class ReadyQueue:
+    """Stages whose dependencies have all finished, lowest compile index first.
+
+    Each ``complete`` only touches the finished stage's dependents, so a run
+    over V stages and E edges costs O((V + E) log V).
+    """
+
+    def __init__(self, stages: dict[str, ResolvedStage]) -> None:
+        self._stages = stages
+        self._waiting: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = {name: [] for name in stages}
+        self._heap: list[tuple[int, str]] = []
+        for name, stage in stages.items():
+            deps = [d for d in dict.fromkeys(stage.spec.depends_on) if d in stages]
+            self._waiting[name] = len(deps)
+            for dep in deps:
+                self._dependents[dep].append(name)
+            if not deps:
+                heapq.heappush(self._heap, (stage.index, name))
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def peek(self) -> ResolvedStage | None:
+        """The next stage to launch without removing it, or None when none is ready."""
+        return self._stages[self._heap[0][1]] if self._heap else None
+
+    def pop(self) -> ResolvedStage:
+        return self._stages[heapq.heappop(self._heap)[1]]
+
+    def complete(self, name: str) -> None:
+        """Mark ``name`` finished, releasing dependents with nothing else outstanding."""
+        for dependent in self._dependents.get(name, ()):
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                heapq.heappush(self._heap, (self._stages[dependent].index, dependent))
+
+
+@dataclass
+class StageTiming:
+    """Offsets in ms from the start of the run, measured on a monotonic clock."""
+
+    start_ms: int
+    finish_ms: int | None = None
+
+
+def critical_path(
+    timings: dict[str, StageTiming],
+    stages: dict[str, ResolvedStage],
+) -> list[str]:
+    """The dependency chain that finished last, from its first stage to its last.
+
+    Starts at the stage that finished last and repeatedly steps to the
+    dependency that released it (the one that finished last).
+    """
+    finished = {name: t for name, t in timings.items() if t.finish_ms is not None}
+    if not finished:
+        return []
+    current = max(finished, key=lambda name: (finished[name].finish_ms, -stages[name].index))
+    path = [current]
+    while True:
+        deps = [d for d in stages[current].spec.depends_on if d in finished]
+        if not deps:
+            break
+        current = max(deps, key=lambda name: (finished[name].finish_ms, -stages[name].index))
+        path.append(current)
+    path.reverse()
+    return path
+
+
+def schedule_summary(
+    timings: dict[str, StageTiming],
+    stages: dict[str, ResolvedStage],
+    *,
+    max_concurrency: int,
+) -> dict[str, Any]:
+    """JSON-ready record of when each stage ran and which chain bounded the run."""
+    path = critical_path(timings, stages)
+    ordered = sorted(timings, key=lambda name: (timings[name].start_ms, stages[name].index))
+    return {
+        "max_concurrency": max_concurrency,
+        "makespan_ms": max((t.finish_ms or t.start_ms for t in timings.values()), default=0),
+        "critical_path": path,
+        "critical_path_ms": sum(
+            (timings[n].finish_ms or timings[n].start_ms) - timings[n].start_ms for n in path
+        ),
+        "stages": {
+            name: {
+                "start_ms": timings[name].start_ms,
+                "finish_ms": timings[name].finish_ms,
+                "depends_on": list(stages[name].spec.depends_on),
+            }
+            for name in ordered
+        },
+    }
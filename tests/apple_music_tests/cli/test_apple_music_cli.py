@@ -34,6 +34,12 @@ class AppleMusicClientTests(unittest.TestCase):
 
 
 class AppleMusicCLITests(unittest.TestCase):
+    def setUp(self):
+        # Fake search results and libraries must not land in the user's real caches.
+        env = mock.patch.dict("os.environ", {"APPLE_MUSIC_SONG_CACHE": "0", "APPLE_MUSIC_SNAPSHOT": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+
     def test_cli_exports_using_credentials_file(self):
         with tempfile.TemporaryDirectory() as td:
             cfg = Path(td) / "credentials.ini"
@@ -66,6 +66,7 @@ class FakeAppleMusicClient:
         # Track calls for assertions
         self.search_calls: List[tuple] = []
         self.created: Optional[dict] = None
+        self.added: List[tuple] = []
         self.deleted: List[str] = []
 
     def ping(self) -> dict:
@@ -93,6 +94,10 @@ class FakeAppleMusicClient:
             return self._on_create(name, tracks, description)
         return result
 
+    def add_playlist_tracks(self, playlist_id: str, tracks: List[dict]) -> dict:
+        self.added.append((playlist_id, tracks))
+        return {}
+
     def delete_playlist(self, playlist_id: str) -> dict:
         self.deleted.append(playlist_id)
         if self._on_delete:
@@ -0,0 +1,134 @@
+"""Tests for apple_music/library_snapshot.py and snapshot-backed export/dedupe."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from apple_music.cli import ExportProcessor, ExportRequest, TracksProcessor, TracksRequest
+from apple_music.cli_playlist import _delete_duplicate_playlists
+from apple_music.library_snapshot import SnapshotLibrary
+
+from tests.apple_music_tests.fixtures import FakeAppleMusicClient, make_track
+
+
+def _playlist(pl_id: str, name: str, modified: str | None) -> dict:
+    attrs = {"name": name}
+    if modified:
+        attrs["lastModifiedDate"] = modified
+    return {"id": pl_id, "attributes": attrs}
+
+
+class CountingClient(FakeAppleMusicClient):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.track_calls: list[tuple[str, int | None]] = []
+
+    def list_playlist_tracks(self, playlist_id, limit=None):
+        self.track_calls.append((playlist_id, limit))
+        return super().list_playlist_tracks(playlist_id, limit)[:limit]
+
+
+class SnapshotTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.path = Path(td.name) / "library.json"
+        self.tracks = {
+            "p1": [make_track("t1", "Yellow", "Coldplay", "Parachutes"), make_track("t2", "Clocks", "Coldplay", "A Rush")],
+            "p2": [make_track("t3", "Wait", "M83", "Hurry Up")],
+            "p3": [make_track("t4", "Bamboleo", "Gipsy Kings", "Gipsy Kings")],
+        }
+        self.playlists = [
+            _playlist("p1", "Mix", "2025-01-01T00:00:00Z"),
+            _playlist("p2", "Mix", "2025-02-01T00:00:00Z"),
+            _playlist("p3", "Radio", None),
+        ]
+
+    def _client(self) -> CountingClient:
+        return CountingClient(playlists=list(self.playlists), tracks_by_playlist=self.tracks)
+
+    def _export(self, client, **kwargs):
+        library = SnapshotLibrary(client, self.path)
+        envelope = ExportProcessor().process(ExportRequest(client=library, **kwargs))
+        library.save()
+        self.assertTrue(envelope.ok())
+        return envelope.payload
+
+
+class TestIncrementalExport(SnapshotTestBase):
+    def test_rerun_only_refetches_changed_playlists(self):
+        first_client = self._client()
+        first = self._export(first_client)
+        self.assertEqual(sorted(first_client.track_calls), [("p1", None), ("p2", None), ("p3", None)])
+
+        self.playlists[1] = _playlist("p2", "Mix", "2025-03-01T00:00:00Z")
+        self.tracks["p2"].append(make_track("t5", "Midnight City", "M83", "Hurry Up"))
+        client = self._client()
+        second = self._export(client)
+        # p1 unchanged; p2 modified; p3 has no lastModifiedDate so it cannot be trusted
+        self.assertEqual(sorted(client.track_calls), [("p2", None), ("p3", None)])
+        self.assertEqual(second[0], first[0])
+        self.assertEqual([t["name"] for t in second[1].tracks], ["Wait", "Midnight City"])
+
+    def test_matches_direct_export_and_trims_tracks(self):
+        direct = ExportProcessor().process(ExportRequest(client=self._client())).payload
+        self.assertEqual(self._export(self._client()), direct)
+        self.assertEqual(self._export(self._client()), direct)
+        self.assertNotIn("playParams", self.path.read_text())
+
+    def test_track_limit_upgrade_refetches(self):
+        library = SnapshotLibrary(self._client(), self.path)
+        TracksProcessor().process(TracksRequest(client=library, track_limit=1))
+        library.save()
+        client = self._client()
+        self.assertEqual(len(self._export(client, track_limit=1)[0].tracks), 1)
+        self.assertNotIn(("p1", 1), client.track_calls)
+        self._export(client)
+        self.assertIn(("p1", None), client.track_calls)
+
+    def test_fetch_failure_keeps_fetched_playlists(self):
+        client = self._client()
+        original = client.list_playlist_tracks
+
+        def flaky(playlist_id, limit=None):
+            if playlist_id == "p2":
+                raise RuntimeError("503")
+            return original(playlist_id, limit)
+
+        client.list_playlist_tracks = flaky
+        library = SnapshotLibrary(client, self.path)
+        self.assertFalse(ExportProcessor().process(ExportRequest(client=library)).ok())
+        retry = self._client()
+        self._export(retry)
+        self.assertEqual(sorted(retry.track_calls), [("p2", None), ("p3", None)])
+
+
+class TestSnapshotDedupe(SnapshotTestBase):
+    def test_deleted_playlists_leave_the_snapshot(self):
+        self._export(self._client())
+        library = SnapshotLibrary(self._client(), self.path)
+        listing = library.list_library_playlists()
+        _delete_duplicate_playlists(library, [listing[0]])
+        library.save()
+        self.assertEqual([p["id"] for p in library.list_library_playlists()], ["p2", "p3"])
+        self.assertNotIn('"p1"', self.path.read_text())
+
+    def test_cli_uses_snapshot_per_user(self):
+        from apple_music import __main__ as cli
+
+        with tempfile.TemporaryDirectory() as td, \
+                mock.patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": td, "APPLE_MUSIC_DEVELOPER_TOKEN": "D",
+                                             "APPLE_MUSIC_USER_TOKEN": "U"}), \
+                mock.patch("apple_music.cli.AppleMusicClient", return_value=self._client()), \
+                mock.patch("sys.stdout"):
+            self.assertEqual(cli.main(["export"]), 0)
+            snapshots = list((Path(td) / "apple_music").glob("library-*.json"))
+        self.assertEqual(len(snapshots), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for apple_music/song_cache.py and concurrent, cached seed resolution."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from apple_music.cli_helpers import PlaylistCreationConfig
+from apple_music.cli_playlist import _create_from_seeds
+from apple_music.client import AppleMusicCLIError
+from apple_music.song_cache import MISS_TTL_S, SongCache, cache_key
+
+from tests.apple_music_tests.fixtures import FakeAppleMusicClient
+
+SEEDS = [("Yellow", "Coldplay"), ("Clocks", "Coldplay"), ("Fix You", "Coldplay"), ("Nothing", "Nobody")]
+
+
+def _search(term, storefront, limit):
+    if term.endswith("Nobody"):
+        return []
+    return [{"id": f"id-{term}", "type": "songs", "attributes": {"name": term.split(" Coldplay")[0], "artistName": "Coldplay"}}]
+
+
+class SongCacheTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        env = mock.patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": td.name})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("APPLE_MUSIC_SONG_CACHE", None)
+        self.path = Path(td.name) / "apple_music" / "song-cache.json"
+
+    def _config(self, **kwargs) -> PlaylistCreationConfig:
+        return PlaylistCreationConfig(name="Mix", count=len(SEEDS), shuffle_seed=1, storefront="us", **kwargs)
+
+
+class TestSongCache(SongCacheTestBase):
+    def test_key_normalizes_case_accents_form_and_punctuation(self):
+        self.assertEqual(cache_key("fr", "Moi... Lolita", "ALIZÉE"), cache_key("fr", "moi lolita", "alizée"))
+        self.assertNotEqual(cache_key("fr", "Yellow", "Coldplay"), cache_key("us", "Yellow", "Coldplay"))
+
+    def test_misses_expire(self):
+        now = [1000.0]
+        cache = SongCache(self.path, clock=lambda: now[0])
+        cache.put_miss("k", "no search result")
+        cache.save()
+        reloaded = SongCache(self.path, clock=lambda: now[0])
+        self.assertEqual(reloaded.get("k")["miss"], "no search result")
+        now[0] += MISS_TTL_S + 1
+        self.assertIsNone(reloaded.get("k"))
+
+
+class TestCreateFromSeeds(SongCacheTestBase):
+    def test_rerun_skips_every_search(self):
+        first = FakeAppleMusicClient(on_search=_search)
+        plan = _create_from_seeds(first, SEEDS, self._config(dry_run=True))["plan"]
+        self.assertEqual(len(first.search_calls), 4)
+        self.assertEqual(plan["unmatched"][0]["reason"], "no search result")
+
+        second = FakeAppleMusicClient(on_search=_search)
+        self.assertEqual(_create_from_seeds(second, SEEDS, self._config(dry_run=True))["plan"], plan)
+        self.assertEqual(second.search_calls, [])
+
+        third = FakeAppleMusicClient(on_search=_search)
+        _create_from_seeds(third, SEEDS, self._config(dry_run=True, use_cache=False))
+        self.assertEqual(len(third.search_calls), 4)
+
+    def test_searches_run_concurrently_and_keep_seed_order(self):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def slow_search(term, storefront, limit):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _search(term, storefront, limit)
+
+        client = FakeAppleMusicClient(on_search=slow_search)
+        payload = _create_from_seeds(client, SEEDS, self._config(use_cache=False))
+        self.assertGreater(active[1], 1)
+        resolved = [t["title"] for t in payload["plan"]["tracks"]]
+        self.assertEqual([t["id"] for t in client.created["tracks"]], [f"id-{t} Coldplay" for t in resolved])
+
+    def test_search_failure_keeps_resolved_seeds_cached(self):
+        def flaky(term, storefront, limit):
+            if term.startswith("Clocks"):
+                raise AppleMusicCLIError("500 from Apple Music")
+            return _search(term, storefront, limit)
+
+        with self.assertRaises(AppleMusicCLIError):
+            _create_from_seeds(FakeAppleMusicClient(on_search=flaky), SEEDS, self._config(dry_run=True))
+        retry = FakeAppleMusicClient(on_search=_search)
+        _create_from_seeds(retry, SEEDS, self._config(dry_run=True))
+        self.assertEqual([c[0] for c in retry.search_calls], ["Clocks Coldplay"])
+
+    def test_large_playlists_add_tracks_in_batches(self):
+        seeds = [(f"Song {i}", "Coldplay") for i in range(250)]
+        client = FakeAppleMusicClient(on_search=_search, on_create=lambda *a: {"data": [{"id": "p.1"}]})
+        config = PlaylistCreationConfig(name="Big", count=250, storefront="us", use_cache=False)
+        _create_from_seeds(client, seeds, config)
+        self.assertEqual(len(client.created["tracks"]), 100)
+        self.assertEqual([(pid, len(batch)) for pid, batch in client.added], [("p.1", 100), ("p.1", 50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
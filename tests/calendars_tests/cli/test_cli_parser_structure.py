@@ -54,5 +54,16 @@ class TestCLIParserSubcommands(unittest.TestCase):
         self.assertTrue(_has_subcommand(self.parser, ["gmail", "scan-classes"]))
 
 
+
+class TestOutlookIndexIsOptIn(unittest.TestCase):
+    """The local index matches fewer fields than Graph $search, so it is never the default."""
+
+    def test_scans_default_to_graph(self):
+        parser = app.build_parser()
+        self.assertFalse(parser.parse_args(["outlook", "scan-classes"]).use_index)
+        self.assertFalse(parser.parse_args(["outlook", "mail-list"]).use_index)
+        self.assertTrue(parser.parse_args(["outlook", "scan-classes", "--use-index"]).use_index)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -52,7 +52,7 @@ class OutlookMailListProcessorHappyPathTests(unittest.TestCase):
         self.assertIsInstance(env.payload, OutlookMailListResult)
         self.assertEqual(len(env.payload.messages), 1)
         self.assertEqual(env.payload.folder, "inbox")
-        svc.list_messages.assert_called_once_with(folder="inbox", top=5, pages=1)
+        svc.list_messages.assert_called_once_with(folder="inbox", top=5, pages=1, use_index=False)
 
     def test_passes_folder_and_top_to_client(self):
         svc = MagicMock()
@@ -60,7 +60,7 @@ class OutlookMailListProcessorHappyPathTests(unittest.TestCase):
 
         _process(_make_request(svc, folder="SentItems", top=25, pages=1))
 
-        svc.list_messages.assert_called_once_with(folder="SentItems", top=25, pages=1)
+        svc.list_messages.assert_called_once_with(folder="SentItems", top=25, pages=1, use_index=False)
 
     def test_paginates_with_pages_parameter(self):
         svc = MagicMock()
@@ -73,7 +73,7 @@ class OutlookMailListProcessorHappyPathTests(unittest.TestCase):
 
         self.assertTrue(env.ok())
         self.assertEqual(len(env.payload.messages), 3)
-        svc.list_messages.assert_called_once_with(folder="inbox", top=10, pages=2)
+        svc.list_messages.assert_called_once_with(folder="inbox", top=10, pages=2, use_index=False)
 
     def test_returns_correct_folder_in_result(self):
         svc = MagicMock()
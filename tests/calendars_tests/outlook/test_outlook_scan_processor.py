@@ -32,7 +32,9 @@ class FakeScanService:
     messages: dict = field(default_factory=dict)
     raise_on_get: str | None = None  # message id that causes get_message to raise
 
-    def search_inbox_messages(self, query: str, *, days: int, top: int, pages: int) -> List[str]:  # noqa: ARG002
+    def search_inbox_messages(
+        self, query: str, *, days: int, top: int, pages: int, use_index: bool = False,  # noqa: ARG002
+    ) -> List[str]:
         return list(self.message_ids)
 
     def get_message(self, mid: str, *, select_body: bool = False) -> dict:  # noqa: ARG002
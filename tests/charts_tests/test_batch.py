@@ -0,0 +1,136 @@
+"""Tests for charts/batch.py and the ``charts batch`` command."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from charts import batch
+from charts.batch import BatchItem, load_manifest, render_batch
+
+
+def _spec(title: str, value: float = 1.0) -> str:
+    return json.dumps({
+        "title": title,
+        "x_field": "ts",
+        "series": [{"name": "a", "data": [{"ts": "2024-01-01", "value": value}, {"ts": "2024-01-02", "value": 2}]}],
+    })
+
+
+def _fake_render(job):
+    spec_text, output, _theme, _dpi = job
+    title = json.loads(spec_text)["title"]
+    if title == "broken":
+        return 0.01, "missing required field 'x_field'"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text(title)
+    return 0.01, ""
+
+
+class BatchTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name)
+        self.state = self.root / "state.json"
+        for name in ("gold", "silver"):
+            (self.root / f"{name}.json").write_text(_spec(name))
+        self.items = [
+            BatchItem(str(self.root / "gold.json"), str(self.root / "out" / "gold.png")),
+            BatchItem(str(self.root / "silver.json"), str(self.root / "out" / "silver.svg"), theme="light"),
+        ]
+
+    def _run(self, items=None, **kwargs):
+        with patch.object(batch.os, "cpu_count", return_value=1), \
+                patch.object(batch, "_render_one", side_effect=_fake_render) as render:
+            results = render_batch(items or self.items, state_path=self.state, **kwargs)
+        return results, render
+
+
+class TestLoadManifest(unittest.TestCase):
+    def test_paths_resolve_against_manifest_and_defaults_apply(self):
+        with tempfile.TemporaryDirectory() as td:
+            manifest = Path(td) / "charts.yaml"
+            manifest.write_text(
+                "theme: light\ndpi: 100\ncharts:\n"
+                "  - {input: data/a.json, output: out/a.png}\n"
+                "  - {input: b.json, output: b.svg, theme: dark, dpi: 200}\n"
+            )
+            items = load_manifest(str(manifest))
+        self.assertEqual(items[0], BatchItem(f"{td}/data/a.json", f"{td}/out/a.png", "light", 100))
+        self.assertEqual((items[1].theme, items[1].dpi), ("dark", 200))
+
+    def test_invalid_manifests_raise(self):
+        with tempfile.TemporaryDirectory() as td:
+            manifest = Path(td) / "charts.yaml"
+            for text in ("- a\n", "charts: []\n", "charts:\n  - {input: a.json}\n"):
+                manifest.write_text(text)
+                with self.subTest(text=text), self.assertRaises(ValueError):
+                    load_manifest(str(manifest))
+
+
+class TestRenderBatch(BatchTestBase):
+    def test_unchanged_charts_are_skipped(self):
+        first, _ = self._run()
+        self.assertEqual([r.status for r in first], ["rendered", "rendered"])
+        second, render = self._run()
+        self.assertEqual([r.status for r in second], ["skipped", "skipped"])
+        render.assert_not_called()
+
+    def test_changed_spec_or_output_rerenders_only_that_chart(self):
+        self._run()
+        (self.root / "gold.json").write_text(_spec("gold", 5.0))
+        os.unlink(self.items[1].output)
+        results, render = self._run()
+        self.assertEqual([r.status for r in results], ["rendered", "rendered"])
+        self._run()
+        results, _ = self._run(force=True)
+        self.assertEqual([r.status for r in results], ["rendered", "rendered"])
+
+    def test_theme_is_part_of_the_hash(self):
+        self._run()
+        items = [self.items[0], BatchItem(self.items[1].input, self.items[1].output, theme="dark")]
+        results, _ = self._run(items)
+        self.assertEqual([r.status for r in results], ["skipped", "rendered"])
+
+    def test_errors_are_reported_per_chart(self):
+        (self.root / "broken.json").write_text(json.dumps({"title": "broken"}))
+        items = [*self.items, BatchItem(str(self.root / "broken.json"), str(self.root / "out" / "b.png")),
+                 BatchItem(str(self.root / "missing.json"), str(self.root / "out" / "m.png"))]
+        results, _ = self._run(items)
+        self.assertEqual([r.status for r in results], ["rendered", "rendered", "error", "error"])
+        self.assertIn("x_field", results[2].error)
+
+    def test_process_pool_renders_real_charts(self):
+        with patch.object(batch.os, "cpu_count", return_value=2):
+            results = render_batch(self.items, state_path=self.state)
+        self.assertEqual([r.status for r in results], ["rendered", "rendered"])
+        self.assertTrue(Path(self.items[0].output).read_bytes().startswith(b"\x89PNG"))
+        self.assertIn(b"<svg", Path(self.items[1].output).read_bytes())
+
+
+class TestHandleBatch(BatchTestBase):
+    def test_prints_per_chart_timings_and_summary(self):
+        from charts.cli import _handle_batch
+
+        manifest = self.root / "charts.yaml"
+        manifest.write_text("charts:\n  - {input: gold.json, output: out/gold.png}\n")
+        args = MagicMock(manifest_path=str(manifest), jobs=None, force=False)
+        writer = MagicMock()
+        with patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(self.root / "data")}), \
+                patch.object(batch, "_render_one", side_effect=_fake_render), \
+                patch.object(batch.os, "cpu_count", return_value=1):
+            self.assertEqual(_handle_batch(args, writer=writer), 0)
+            self.assertEqual(_handle_batch(args, writer=writer), 0)
+        lines = [c.args[0] for c in writer.print.call_args_list]
+        self.assertRegex(lines[0], r"^rendered\s+\d+\.\d\ds  .*gold\.png$")
+        self.assertEqual(lines[1].split(" in ")[0], "1 rendered, 0 skipped, 0 failed")
+        self.assertTrue(lines[2].startswith("skipped"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -219,15 +219,16 @@ class TestRenderChart(unittest.TestCase):
     def _mock_matplotlib_and_patch(self):
         import sys
         mock_mpl = MagicMock()
-        mock_plt = MagicMock()
+        mock_figure = MagicMock()
         fig = MagicMock()
         fig.get_facecolor.return_value = "#000000"
         ax = _fake_ax()
-        mock_plt.subplots.return_value = (fig, ax)
-        mock_mpl.pyplot = mock_plt
+        mock_figure.Figure.return_value = fig
+        fig.subplots.return_value = ax
+        mock_mpl.figure = mock_figure
         return patch.dict(sys.modules, {
             "matplotlib": mock_mpl,
-            "matplotlib.pyplot": mock_plt,
+            "matplotlib.figure": mock_figure,
             "matplotlib.dates": MagicMock(),
         }), fig, ax
 
@@ -298,8 +299,8 @@ class TestRenderChart(unittest.TestCase):
             mpl_ctx_patch,
         ):
             render_chart(spec, "/tmp/test_dpi.png", dpi=200)  # nosec B108 - mock path, savefig is mocked
-        # subplots should have been called with the overridden dpi
-        # (the mock plt.subplots call is captured via the patch context)
+        # Figure should have been created with the overridden dpi
+        # (the mock Figure call is captured via the patch context)
         # Just assert no error and path returned correctly
         # (dpi verification via mock captured in fig.savefig)
 
@@ -361,23 +362,21 @@ class TestRenderGrid(unittest.TestCase):
     def _mock_matplotlib(self, rows=1, cols=1):
         import sys
         mock_mpl = MagicMock()
-        mock_plt = MagicMock()
+        mock_figure = MagicMock()
         fig = MagicMock()
         fig.get_facecolor.return_value = "#000000"
         # Build axes grid matching rows*cols
         if rows == 1 and cols == 1:
-            ax = _fake_ax()
-            mock_plt.subplots.return_value = (fig, ax)
+            fig.subplots.return_value = _fake_ax()
         elif rows == 1:
-            axes = [_fake_ax() for _ in range(cols)]
-            mock_plt.subplots.return_value = (fig, axes)
+            fig.subplots.return_value = [_fake_ax() for _ in range(cols)]
         else:
-            axes = [[_fake_ax() for _ in range(cols)] for _ in range(rows)]
-            mock_plt.subplots.return_value = (fig, axes)
-        mock_mpl.pyplot = mock_plt
+            fig.subplots.return_value = [[_fake_ax() for _ in range(cols)] for _ in range(rows)]
+        mock_figure.Figure.return_value = fig
+        mock_mpl.figure = mock_figure
         return patch.dict(sys.modules, {
             "matplotlib": mock_mpl,
-            "matplotlib.pyplot": mock_plt,
+            "matplotlib.figure": mock_figure,
             "matplotlib.dates": MagicMock(),
         }), fig
 
@@ -0,0 +1,121 @@
+"""Tests for lazily bound CLI command handlers (LazyHandler / lazy_handlers)."""
+from __future__ import annotations
+
+import os
+import re
+import subprocess  # nosec B404 - test code runs the local interpreter only
+import sys
+import logging
+import unittest
+from unittest.mock import patch
+
+from core.cli_framework import CLIApp, LazyHandler, lazy_handlers
+from tests.fixtures import repo_root
+
+logger = logging.getLogger(__name__)
+
+# Each assistant CLI module, and handler modules its --help must not import.
+_CLI_MODULES = {
+    "mail.cli.main": ("mail.gmail_api", "mail.outlook.commands", "googleapiclient"),
+    "calendars.cli.main": ("calendars.outlook.commands", "calendars.gmail.commands"),
+    "resume.cli.main": ("docx",),
+}
+# CLIs without lazy handlers. Their startup cost is the package __init__ or
+# a pipeline/helper module the command bodies use directly, not a set of
+# handler modules that could bind lazily.
+_EXTRA_BENCH_MODULES = (
+    "schedule.cli.main", "phone.cli.main", "whatsapp.cli.main", "metals.cli.main",
+    "maker.cli.main", "wifi.cli", "worker.cli", "workflow.cli", "desk.cli", "qlty.cli",
+    "slides.cli", "diagrams.cli", "apple_music.cli", "charts.cli",
+)
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(repo_root() / "src"), str(repo_root())]))
+    return subprocess.run(  # nosec B603 - test code with the current interpreter
+        [sys.executable, *args], capture_output=True, text=True, env=env, cwd=str(repo_root()),
+    )
+
+
+class TestLazyHandler(unittest.TestCase):
+    def test_resolves_on_call(self):
+        handler = LazyHandler("json:dumps")
+        self.assertEqual(handler([1]), "[1]")
+
+    def test_relative_target_resolves_against_package(self):
+        path = lazy_handlers(".path", package="os")
+        self.assertEqual(path.join("a", "b"), os.path.join("a", "b"))
+
+    def test_handlers_bind_by_attribute_name(self):
+        handlers = lazy_handlers("json")
+        self.assertEqual((handlers.dumps.module, handlers.dumps.attr), ("json", "dumps"))
+        self.assertEqual((handlers.loads.module, handlers.loads.attr), ("json", "loads"))
+        self.assertEqual(handlers.loads("[2]"), [2])
+
+    def test_missing_handler_fails_when_called(self):
+        handlers = lazy_handlers("json")
+        with self.assertRaises(AttributeError):
+            handlers.no_such_handler({})
+
+    def test_patches_on_target_module_take_effect(self):
+        handler = LazyHandler("json:dumps")
+        with patch("json.dumps", return_value="patched"):
+            self.assertEqual(handler({}), "patched")
+
+    def test_rejects_target_without_attribute(self):
+        with self.assertRaises(ValueError):
+            LazyHandler("json")
+
+    def test_group_register_accepts_target_string(self):
+        app = CLIApp("test", "Test", add_common_args=False)
+        group = app.group("g", help="Group")
+        group.register("dump", "Dump", "json:dumps", [])
+        args = app.build_parser().parse_args(["g", "dump"])
+        self.assertIsInstance(args._cmd_func, LazyHandler)
+
+    def test_run_dispatches_to_lazy_handler(self):
+        app = CLIApp("test", "Test", add_common_args=False)
+        handlers = lazy_handlers("tests.core_tests.test_cli_lazy_handlers")
+
+        @app.command("it", help="It")
+        def cmd_it(args):
+            return handlers._handler_returning_seven(args)
+
+        self.assertEqual(app.run(["it"]), 7)
+
+
+def _handler_returning_seven(args) -> int:
+    return 7
+
+
+class TestCliStartupImports(unittest.TestCase):
+    """Importing a CLI (what --help and argument parsing need) skips handler modules."""
+
+    def test_handler_modules_not_imported(self):
+        for module, heavy in _CLI_MODULES.items():
+            with self.subTest(module=module):
+                code = (
+                    f"import sys, {module}\n"
+                    f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+                )
+                proc = _run_python("-c", code)
+                self.assertEqual(proc.returncode, 0, proc.stderr)
+                self.assertEqual(proc.stdout.strip(), "")
+
+
+@unittest.skipUnless(os.environ.get("CLI_IMPORT_BENCH"), "set CLI_IMPORT_BENCH=1 to run the benchmark")
+class TestCliImportTime(unittest.TestCase):
+    """Cumulative ``-X importtime`` per assistant CLI module."""
+
+    def test_import_time(self):
+        for module in (*_CLI_MODULES, *_EXTRA_BENCH_MODULES):
+            with self.subTest(module=module):
+                proc = _run_python("-X", "importtime", "-c", f"import {module}")
+                pattern = rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$"
+                match = re.search(pattern, proc.stderr, re.M)
+                self.assertIsNotNone(match, proc.stderr[-500:])
+                logger.info("%-22s %7.1f ms", module, int(match.group(1)) / 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
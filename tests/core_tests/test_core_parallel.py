@@ -1,10 +1,12 @@
-"""Tests for core.parallel — chunked and parallel_map."""
+"""Tests for core.parallel — chunked, parallel_map and AdaptiveConcurrency."""
 
 from __future__ import annotations
 
+import threading
+import time
 import unittest
 
-from core.parallel import chunked, parallel_map
+from core.parallel import AdaptiveConcurrency, chunked, parallel_map, throttle_status
 
 
 class TestChunked(unittest.TestCase):
@@ -88,5 +90,96 @@ class TestParallelMap(unittest.TestCase):
         self.assertEqual(result, ["42"])
 
 
+class _Throttled(Exception):
+    def __init__(self, status: int = 429, retry_after: str | None = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.response = type("R", (), {"status_code": status, "headers": {"Retry-After": retry_after} if retry_after else {}})()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def test_additive_increase_per_window(self) -> None:
+        ctl = AdaptiveConcurrency(initial=2, max_limit=4)
+        for _ in range(3):
+            ctl.record_success()
+        self.assertEqual(ctl.limit, 3)
+        for _ in range(20):
+            ctl.record_success()
+        self.assertEqual(ctl.limit, 4)
+
+    def test_throttle_halves_once_per_cooldown(self) -> None:
+        clock = _Clock()
+        ctl = AdaptiveConcurrency("graph", initial=16, cooldown_s=1.0, clock=clock)
+        for _ in range(5):
+            ctl.record_throttle(429)
+        self.assertEqual(ctl.limit, 8)
+        clock.now += 1.5
+        ctl.record_throttle(503)
+        self.assertEqual(ctl.limit, 4)
+        self.assertEqual([e.limit for e in ctl.events], [8, 4])
+        self.assertEqual(ctl.stats()["throttles"], 6)
+        for _ in range(10):
+            clock.now += 2
+            ctl.record_throttle(429)
+        self.assertEqual(ctl.limit, 1)
+
+    def test_retry_after_holds_new_slots(self) -> None:
+        ctl = AdaptiveConcurrency(initial=4)
+        ctl.record_throttle(429, retry_after=0.1)
+        started = time.monotonic()
+        with ctl.slot():
+            pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_throttle_status_of_exceptions(self) -> None:
+        self.assertEqual(throttle_status(_Throttled(503)), 503)
+        self.assertIsNone(throttle_status(_Throttled(404)))
+        self.assertIsNone(throttle_status(ValueError()))
+        gapi = Exception()
+        gapi.resp = type("Resp", (dict,), {"status": 429})()
+        self.assertEqual(throttle_status(gapi), 429)
+
+
+class TestParallelMapAdaptive(unittest.TestCase):
+    def test_in_flight_never_exceeds_limit(self) -> None:
+        ctl = AdaptiveConcurrency(initial=2, max_limit=2)
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def work(x: int) -> int:
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return x
+
+        self.assertEqual(parallel_map(work, range(8), max_workers=8, concurrency=ctl), list(range(8)))
+        self.assertEqual(active[1], 2)
+        self.assertEqual(ctl.stats()["successes"], 8)
+
+    def test_throttled_items_shrink_limit(self) -> None:
+        ctl = AdaptiveConcurrency(initial=8)
+
+        def work(x: int) -> int:
+            if x == 0:
+                raise _Throttled(429)
+            return x
+
+        result = parallel_map(work, range(3), return_exceptions=True, concurrency=ctl)
+        self.assertIsInstance(result[0], _Throttled)
+        self.assertEqual(result[1:], [1, 2])
+        self.assertLess(ctl.limit, 8)
+        self.assertEqual(ctl.throttles, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,205 @@
+"""Tests for core/http_transport.py — pooled, rate-limited HTTP transport."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from core import http_transport
+from core.http import HttpClient
+from core.http_transport import (
+    AsyncTransport,
+    TokenBucket,
+    Transport,
+    concurrency_for,
+    pooled_session,
+    transport_for,
+)
+
+
+class _Resp:
+    def __init__(self, status: int = 200, retry_after: str | None = None, body: str = ""):
+        self.status_code = status
+        self.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        self.text = body
+        self.content = body.encode()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _Session:
+    """Returns queued responses (or raises queued exceptions) per URL."""
+
+    def __init__(self, by_url: dict[str, list], delay: float = 0.0):
+        self.by_url = {url: list(items) for url, items in by_url.items()}
+        self.delay = delay
+        self.calls: list[tuple[str, str, dict]] = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs))
+            item = self.by_url[url].pop(0)
+        if self.delay:
+            time.sleep(self.delay)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        clock = _Clock()
+        bucket = TokenBucket(rate=2.0, capacity=3.0, clock=clock)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        clock.now += 10
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_pause_holds_every_caller(self):
+        clock = _Clock()
+        bucket = TokenBucket(rate=100.0, clock=clock)
+        bucket.pause(5)
+        self.assertAlmostEqual(bucket.reserve(), 5.0)
+        clock.now += 5
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_async_acquire_waits(self):
+        bucket = TokenBucket(rate=50.0, capacity=1.0)
+        started = time.monotonic()
+        asyncio.run(self._acquire_n(bucket, 3))
+        self.assertGreaterEqual(time.monotonic() - started, 0.03)
+
+    @staticmethod
+    async def _acquire_n(bucket, n):
+        for _ in range(n):
+            await bucket.acquire_async()
+
+
+class TestTransport(unittest.TestCase):
+    def _transport(self, session, **kwargs):
+        return Transport(session=session, timeout=5, retries=3, **kwargs)
+
+    def test_retries_429_honouring_retry_after_and_pauses_limiter(self):
+        session = _Session({"u": [_Resp(429, "7"), _Resp(200)]})
+        limiter = TokenBucket(1000.0)
+        with patch.object(http_transport.time, "sleep") as sleep, patch.object(limiter, "pause") as pause:
+            resp = self._transport(session, limiter=limiter).get("u")
+        self.assertEqual(resp.status_code, 200)
+        sleep.assert_called_once_with(7.0)
+        pause.assert_called_once_with(7)
+        self.assertEqual(session.calls[0][2]["timeout"], 5)
+
+    def test_final_error_response_is_returned_not_raised(self):
+        session = _Session({"u": [_Resp(500), _Resp(502), _Resp(503)]})
+        with patch.object(http_transport.time, "sleep"):
+            resp = self._transport(session).get("u")
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(len(session.calls), 3)
+
+    def test_post_not_resent_after_server_error(self):
+        session = _Session({"u": [_Resp(500)]})
+        self.assertEqual(self._transport(session).post("u", json={}).status_code, 500)
+
+    def test_post_resent_after_429(self):
+        session = _Session({"u": [_Resp(429), _Resp(201)]})
+        with patch.object(http_transport.time, "sleep"):
+            self.assertEqual(self._transport(session).post("u", json={}).status_code, 201)
+
+    def test_connection_errors(self):
+        session = _Session({"u": [requests.ConnectionError("reset"), _Resp(200)], "p": [requests.ConnectionError("x")]})
+        with patch.object(http_transport.time, "sleep"):
+            self.assertEqual(self._transport(session).get("u").status_code, 200)
+            with self.assertRaises(requests.ConnectionError):
+                self._transport(session).post("p")
+
+
+class TestConnectionPooling(unittest.TestCase):
+    def test_sessions_share_one_adapter(self):
+        first, second = pooled_session(), pooled_session()
+        self.assertIs(first.get_adapter("https://graph.microsoft.com"), second.get_adapter("https://api.music.apple.com"))
+        self.assertIsNot(first.cookies, second.cookies)
+
+    def test_http_client_uses_shared_pool(self):
+        client = HttpClient("https://example.com")
+        self.assertIs(client._session.get_adapter("https://example.com"), pooled_session().get_adapter("https://x"))
+
+    def test_transport_for_is_shared_per_api(self):
+        self.assertIs(transport_for("graph"), transport_for("graph"))
+        self.assertIsNot(transport_for("graph").limiter, transport_for("gmail").limiter)
+
+    def test_outlook_graph_calls_use_graph_transport(self):
+        from core.outlook import client as outlook_client
+
+        with patch.object(outlook_client, "_requests_wrapper", None):
+            wrapper = outlook_client._requests()
+        self.assertIs(wrapper._requests, transport_for("graph"))
+
+
+class TestHttpClientRateLimit(unittest.TestCase):
+    def test_429_pauses_api_limiter(self):
+        session = _Session({"https://api.example.com/x": [_Resp(429, "3"), _Resp(200)]})
+        client = HttpClient("https://api.example.com", session=session, retries=2, api="apple_music")
+        with patch("core.http.time.sleep"), patch.object(client._limiter, "pause") as pause:
+            self.assertEqual(client.get("/x").status_code, 200)
+        pause.assert_called_once_with(3)
+
+    def test_throttles_shrink_api_concurrency(self):
+        session = _Session({"https://api.example.com/x": [_Resp(503), _Resp(200)]})
+        client = HttpClient("https://api.example.com", session=session, retries=2, api="apple_music")
+        with patch("core.http.time.sleep"), \
+                patch.object(concurrency_for("apple_music"), "record_throttle") as record:
+            client.get("/x")
+        record.assert_called_once_with(503, None)
+        self.assertIs(concurrency_for("apple_music"), concurrency_for("apple_music"))
+
+
+class TestAsyncTransport(unittest.TestCase):
+    def test_backoff_does_not_block_other_requests(self):
+        urls = ["slow"] + [f"fast{i}" for i in range(4)]
+        by_url = {"slow": [_Resp(429, "0"), _Resp(200, body="slow")]}
+        by_url.update({u: [_Resp(200, body=u)] for u in urls[1:]})
+        session = _Session(by_url, delay=0.01)
+        transport = AsyncTransport(Transport(session=session, retries=2), max_in_flight=2)
+        finished: list[str] = []
+
+        async def fetch(url):
+            resp = await transport.get(url)
+            finished.append(resp.text)
+            return resp
+
+        async def main():
+            return await asyncio.gather(*(fetch(u) for u in urls))
+
+        with patch.object(http_transport, "_backoff", return_value=0.2):
+            results = asyncio.run(main())
+        self.assertEqual([r.text for r in results], urls)
+        self.assertEqual(finished[-1], "slow")
+
+    def test_get_all_keeps_order(self):
+        session = _Session({u: [_Resp(200, body=u)] for u in ("a", "b", "c")})
+        results = asyncio.run(AsyncTransport(Transport(session=session)).get_all(["a", "b", "c"]))
+        self.assertEqual([r.text for r in results], ["a", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
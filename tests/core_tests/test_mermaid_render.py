@@ -0,0 +1,131 @@
+"""Tests for core/mermaid_render.py — cached, batched mmdc rendering."""
+from __future__ import annotations
+
+import os
+import re
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core import mermaid_render
+from core.mermaid_render import ENV_RENDER_CACHE, MermaidJob, MermaidRenderError, render_many
+
+
+class FakeMmdc:
+    """Stands in for mmdc: writes ``IMG(<source>)`` for each diagram it is given."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.calls: list[list[str]] = []
+        self.fail_on = fail_on
+
+    def __call__(self, cmd: list[str]) -> None:
+        self.calls.append(cmd)
+        inp = Path(cmd[cmd.index("-i") + 1]).read_text(encoding="utf-8")
+        out = Path(cmd[cmd.index("-o") + 1])
+        if self.fail_on and self.fail_on in inp:
+            raise MermaidRenderError(f"mmdc failed: parse error in {self.fail_on}")
+        if "-e" in cmd:
+            fmt = cmd[cmd.index("-e") + 1]
+            blocks = re.findall(r"```mermaid\n(.*?)\n```", inp, re.S)
+            for n, block in enumerate(blocks, 1):
+                (out.parent / f"{out.stem}-{n}.{fmt}").write_bytes(f"IMG({block})".encode())
+        else:
+            out.write_bytes(f"IMG({inp})".encode())
+
+
+class MermaidRenderTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.tmp = Path(td.name)
+        env = patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(self.tmp / "data")})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(ENV_RENDER_CACHE, None)
+        version = patch.object(mermaid_render, "mmdc_version", return_value="10.9.1")
+        version.start()
+        self.addCleanup(version.stop)
+
+
+class TestRenderMany(MermaidRenderTestBase):
+    def test_misses_share_one_launch_and_keep_order(self):
+        mmdc = FakeMmdc()
+        jobs = [MermaidJob("graph A"), MermaidJob("graph B"), MermaidJob("graph A")]
+        self.assertEqual(render_many(jobs, mmdc_path="mmdc", run=mmdc), [b"IMG(graph A)", b"IMG(graph B)", b"IMG(graph A)"])
+        self.assertEqual(len(mmdc.calls), 1)
+        self.assertIn("-e", mmdc.calls[0])
+
+    def test_second_run_is_served_from_cache(self):
+        jobs = [MermaidJob("graph A", "png", background="white", scale=3), MermaidJob("graph B", "png")]
+        first = render_many(jobs, mmdc_path="mmdc", run=FakeMmdc())
+        mmdc = FakeMmdc()
+        self.assertEqual(render_many(jobs, mmdc_path="mmdc", run=mmdc), first)
+        self.assertEqual(mmdc.calls, [])
+
+    def test_key_covers_options_and_version(self):
+        render_many([MermaidJob("graph A")], mmdc_path="mmdc", run=FakeMmdc())
+        mmdc = FakeMmdc()
+        render_many([MermaidJob("graph A", theme="dark")], mmdc_path="mmdc", run=mmdc)
+        with patch.object(mermaid_render, "mmdc_version", return_value="11.0.0"):
+            render_many([MermaidJob("graph A")], mmdc_path="mmdc", run=mmdc)
+        self.assertEqual(len(mmdc.calls), 2)
+
+    def test_failed_batch_isolates_the_broken_diagram(self):
+        mmdc = FakeMmdc(fail_on="graph BAD")
+        with self.assertRaisesRegex(MermaidRenderError, "graph BAD"):
+            render_many([MermaidJob("graph A"), MermaidJob("graph BAD")], mmdc_path="mmdc", run=mmdc)
+        retry = FakeMmdc()
+        render_many([MermaidJob("graph A")], mmdc_path="mmdc", run=retry)
+        self.assertEqual(retry.calls, [])  # rendered before the failure and cached
+
+    def test_pdf_and_cache_opt_out(self):
+        mmdc = FakeMmdc()
+        with patch.dict(os.environ, {ENV_RENDER_CACHE: "0"}):
+            render_many([MermaidJob("a", "pdf"), MermaidJob("b", "pdf")], mmdc_path="mmdc", run=mmdc)
+            render_many([MermaidJob("a", "pdf")], mmdc_path="mmdc", run=mmdc)
+        self.assertEqual(len(mmdc.calls), 3)
+        self.assertFalse(mermaid_render.cache_dir().exists())
+
+
+class TestMmdcVersion(unittest.TestCase):
+    def test_version_is_remembered_per_binary(self):
+        with tempfile.TemporaryDirectory() as td, \
+                patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(Path(td) / "data")}):
+            counter = Path(td) / "count"
+            script = Path(td) / "mmdc"
+            script.write_text(f"#!/bin/sh\necho x >> {counter}\necho 10.9.1\n", encoding="utf-8")
+            script.chmod(script.stat().st_mode | stat.S_IEXEC)
+            self.assertEqual(mermaid_render.mmdc_version(str(script)), "10.9.1")
+            self.assertEqual(mermaid_render.mmdc_version(str(script)), "10.9.1")
+            self.assertEqual(counter.read_text(encoding="utf-8").count("x"), 1)
+            self.assertEqual(mermaid_render.mmdc_version(str(Path(td) / "missing")), "")
+
+
+class TestSharedAcrossApps(MermaidRenderTestBase):
+    def test_diagrams_and_slides_reuse_each_others_renders(self):
+        from diagrams.renderers import LocalRenderer, RenderOptions
+        from slides.generator import SlideGenerator
+
+        with patch("shutil.which", return_value="/usr/local/bin/mmdc"):
+            renderer = LocalRenderer()
+        mmdc = FakeMmdc()
+        with patch.object(renderer, "_run", side_effect=mmdc):
+            opts = RenderOptions(output_format="png", background="white")
+            out = self.tmp / "out.png"
+            renderer.render_to_file("graph A", str(out), opts)
+            self.assertEqual(out.read_bytes(), b"IMG(graph A)")
+            self.assertEqual(renderer.render_many(["graph A", "graph B"], RenderOptions()), [b"IMG(graph A)", b"IMG(graph B)"])
+        self.assertEqual(len(mmdc.calls), 2)
+
+        mermaid_render.store(mermaid_render.MermaidJob("graph S", "png", background="white", scale=3), "10.9.1", b"PNG")
+        with patch("slides.generator.shutil.which", return_value="/usr/local/bin/mmdc"), \
+                patch("slides.generator.subprocess.run", side_effect=AssertionError("rendered")):
+            png = SlideGenerator._render_mermaid("graph S")
+        self.addCleanup(os.unlink, png)
+        self.assertEqual(Path(png).read_bytes(), b"PNG")
+
+
+if __name__ == "__main__":
+    unittest.main()
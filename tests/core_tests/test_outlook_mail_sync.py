@@ -0,0 +1,211 @@
+"""Tests for the delta-synced Outlook message index (core/outlook/_mail_sync.py)."""
+from __future__ import annotations
+
+import datetime as dt
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+from core.outlook._mail_sync import MessageIndex, compile_local_query
+from core.outlook.mail import OutlookMailMixin
+from core.outlook.models import SearchParams
+
+
+def iso_days_ago(days: int) -> str:
+    stamp = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days)
+    return stamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def graph_message(mid: str, sender: str = "s@example.com", subject: str = "", days_ago: int = 1) -> dict:
+    return {
+        "id": mid,
+        "subject": subject or f"Subject {mid}",
+        "receivedDateTime": iso_days_ago(days_ago),
+        "from": {"emailAddress": {"name": "Sender", "address": sender}},
+        "bodyPreview": "preview",
+    }
+
+
+def response(json_data, status_code=200):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = json_data
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class FakeSyncClient(OutlookMailMixin):
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._cfg_cache = {}
+
+    def _headers(self):
+        return {"Authorization": "Bearer fake-token"}
+
+    def _headers_search(self):
+        return {**self._headers(), "ConsistencyLevel": "eventual"}
+
+    def cfg_get_json(self, key, ttl=300):
+        return self._cfg_cache.get(key)
+
+    def cfg_put_json(self, key, data):
+        self._cfg_cache[key] = data
+
+
+class SyncTestBase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.client = FakeSyncClient(tmp.name)
+        patcher = patch("core.outlook._mail_sync._requests")
+        self.requests = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+
+class TestSyncFolder(SyncTestBase):
+    def test_first_sync_uses_filtered_delta_with_select(self):
+        self.requests.get.side_effect = [
+            response({"value": [graph_message("m1")], "@odata.nextLink": "https://graph/next"}),
+            response({"value": [graph_message("m2")], "@odata.deltaLink": "https://graph/delta?token=1"}),
+        ]
+        stats = self.client.sync_folder("inbox", days=30)
+
+        self.assertTrue(stats.full)
+        self.assertEqual((stats.pages, stats.upserted), (2, 2))
+        first_url = self.requests.get.call_args_list[0].args[0]
+        parsed = urlparse(first_url)
+        self.assertTrue(parsed.path.endswith("/mailFolders/inbox/messages/delta"))
+        qs = parse_qs(parsed.query)
+        self.assertIn("receivedDateTime", qs["$select"][0])
+        self.assertTrue(qs["$filter"][0].startswith("receivedDateTime ge "))
+        headers = self.requests.get.call_args_list[0].kwargs["headers"]
+        self.assertIn("odata.maxpagesize", headers["Prefer"])
+        self.assertEqual(self.client.message_index().state("inbox").delta_link, "https://graph/delta?token=1")
+
+    def test_second_sync_follows_delta_link_and_applies_removals(self):
+        self.requests.get.side_effect = [
+            response({"value": [graph_message("m1"), graph_message("m2")], "@odata.deltaLink": "https://graph/d1"}),
+            response({"value": [{"id": "m1", "@removed": {"reason": "deleted"}}, graph_message("m3")],
+                      "@odata.deltaLink": "https://graph/d2"}),
+        ]
+        self.client.sync_folder("inbox", days=30)
+        stats = self.client.sync_folder("inbox", days=30)
+
+        self.assertFalse(stats.full)
+        self.assertEqual(self.requests.get.call_args_list[1].args[0], "https://graph/d1")
+        self.assertEqual((stats.upserted, stats.removed), (1, 1))
+        ids = {m["id"] for m in self.client.message_index().messages("inbox")}
+        self.assertEqual(ids, {"m2", "m3"})
+
+    def test_wider_window_rebaselines(self):
+        self.requests.get.side_effect = [
+            response({"value": [graph_message("m1")], "@odata.deltaLink": "https://graph/d1"}),
+            response({"value": [graph_message("m1")], "@odata.deltaLink": "https://graph/d2"}),
+        ]
+        self.client.sync_folder("inbox", days=30)
+        stats = self.client.sync_folder("inbox", days=120)
+
+        self.assertTrue(stats.full)
+        self.assertIn("/messages/delta?", self.requests.get.call_args_list[1].args[0])
+
+    def test_expired_delta_link_rebaselines(self):
+        gone = MagicMock(status_code=410)
+        expired = response({})
+        expired.raise_for_status.side_effect = RuntimeError("gone")
+        expired.raise_for_status.side_effect.response = gone
+        self.requests.get.side_effect = [
+            response({"value": [graph_message("m1")], "@odata.deltaLink": "https://graph/d1"}),
+            expired,
+            response({"value": [graph_message("m9")], "@odata.deltaLink": "https://graph/d2"}),
+        ]
+        self.client.sync_folder("inbox", days=30)
+        stats = self.client.sync_folder("inbox", days=30)
+
+        self.assertTrue(stats.full)
+        ids = {m["id"] for m in self.client.message_index().messages("inbox")}
+        self.assertEqual(ids, {"m9"})
+
+    def test_sync_folders_runs_each_folder(self):
+        self.requests.get.side_effect = lambda url, headers: response(
+            {"value": [graph_message(url.split("/mailFolders/")[1].split("/")[0])], "@odata.deltaLink": url}
+        )
+        results = self.client.sync_folders(["inbox", "archive"], days=7)
+
+        self.assertEqual([r.folder for r in results], ["inbox", "archive"])
+        self.assertEqual([m["id"] for m in self.client.message_index().messages("archive")], ["archive"])
+
+
+class TestIndexedSearch(SyncTestBase):
+    def _seed(self):
+        self.requests.get.side_effect = [
+            response({
+                "value": [
+                    graph_message("m1", sender="coach@activerh.com", subject="Swim class", days_ago=2),
+                    graph_message("m2", sender="other@example.com", subject="Swim class", days_ago=3),
+                    graph_message("m3", sender="coach@activerh.com", subject="Old news", days_ago=50),
+                ],
+                "@odata.deltaLink": "https://graph/d1",
+            }),
+        ]
+
+    def test_search_answered_from_index(self):
+        self._seed()
+        params = SearchParams(search_query="from:activerh.com", days=30, use_index=True)
+        ids = self.client.search_inbox_messages(params)
+
+        self.assertEqual(ids, ["m1"])
+        # One delta page; no $search request.
+        self.assertEqual(self.requests.get.call_count, 1)
+
+    def test_repeat_search_within_freshness_skips_network(self):
+        self._seed()
+        params = SearchParams(search_query='subject:"swim class"', days=30, use_index=True)
+        first = self.client.search_inbox_message_dicts(params)
+        second = self.client.search_inbox_message_dicts(params)
+
+        self.assertEqual([m["id"] for m in first], ["m1", "m2"])
+        self.assertEqual(first, second)
+        self.assertEqual(self.requests.get.call_count, 1)
+
+    def test_unsupported_query_falls_back_to_graph(self):
+        params = SearchParams(search_query="a OR b", days=30, use_index=True)
+        with patch("core.outlook.mail._requests") as graph:
+            graph.return_value.get.return_value = response({"value": [graph_message("g1")]})
+            ids = self.client.search_inbox_messages(params)
+        self.assertEqual(ids, ["g1"])
+        self.requests.get.assert_not_called()
+
+    def test_move_discards_indexed_message(self):
+        self._seed()
+        self.client.search_inbox_messages(SearchParams(search_query="swim", days=30, use_index=True))
+        with patch("core.outlook.mail._requests"):
+            self.client.move_message("m1", "folder-x")
+        ids = self.client.search_inbox_messages(SearchParams(search_query="swim", days=30, use_index=True))
+        self.assertEqual(ids, ["m2"])
+
+
+class TestCompileLocalQuery(unittest.TestCase):
+    def test_field_and_phrase_terms(self):
+        pred = compile_local_query('from:"active rh" subject:swim')
+        msg = {"from": {"emailAddress": {"name": "Active RH", "address": "x@y.com"}}, "subject": "Swim Lessons"}
+        self.assertTrue(pred(msg))
+        self.assertFalse(pred({**msg, "subject": "Tennis"}))
+
+    def test_operators_and_unknown_fields_are_unsupported(self):
+        self.assertIsNone(compile_local_query("a OR b"))
+        self.assertIsNone(compile_local_query("hasattachments:true"))
+        self.assertIsNone(compile_local_query(""))
+
+
+class TestMessageIndex(unittest.TestCase):
+    def test_messages_filtered_by_window_newest_first(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index = MessageIndex(f"{tmp}/idx.sqlite")
+            index.apply("inbox", [graph_message("old", days_ago=10), graph_message("new", days_ago=1)])
+            self.assertEqual([m["id"] for m in index.messages("inbox")], ["new", "old"])
+            self.assertEqual([m["id"] for m in index.messages("inbox", iso_days_ago(5))], ["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""Tests for core/warm_cli.py — in-process CLI execution in warm interpreters."""
+from __future__ import annotations
+
+import io
+import os
+import subprocess  # nosec B404 - test code runs the local interpreter only
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from core.warm_cli import (
+    ENV_INPROCESS,
+    WarmCliPool,
+    app_for_bin,
+    inprocess_requested,
+    run_in_this_process,
+)
+from tests.fixtures import bin_path, repo_root
+
+_THIS = "tests.core_tests.test_warm_cli"
+
+
+def main(argv: list[str]) -> int:
+    """Fake CLI entry point driven by argv, used in and out of the pool."""
+    cmd = argv[0] if argv else ""
+    if cmd == "echo":
+        print(" ".join(argv[1:]))
+        print("to-stderr", file=sys.stderr)
+        return 0
+    if cmd == "env":
+        print(os.environ.get(argv[1], ""))
+        return 0
+    if cmd == "cwd":
+        print(os.getcwd())
+        return 0
+    if cmd == "child":
+        return subprocess.call([sys.executable, "-c", "print('from-child')"])  # nosec B603 - fixed test argv
+    if cmd == "exit":
+        raise SystemExit(int(argv[1]))
+    if cmd == "pid":
+        print(os.getpid())
+        return 0
+    if cmd == "sleep":
+        time.sleep(float(argv[1]))
+        return 0
+    raise ValueError(f"boom: {cmd}")
+
+
+class TestRunInThisProcess(unittest.TestCase):
+    def test_captures_stdout_and_stderr(self):
+        out = run_in_this_process(_THIS, ["echo", "hello", "world"])
+        self.assertEqual(out["returncode"], 0)
+        self.assertEqual(out["stdout"], "hello world\n")
+        self.assertEqual(out["stderr"], "to-stderr\n")
+
+    def test_captures_child_process_output(self):
+        out = run_in_this_process(_THIS, ["child"])
+        self.assertIn("from-child", out["stdout"])
+
+    def test_env_overlay_applied_then_restored(self):
+        os.environ.pop("WARM_CLI_TEST_VAR", None)
+        out = run_in_this_process(_THIS, ["env", "WARM_CLI_TEST_VAR"], env_overlay={"WARM_CLI_TEST_VAR": "x1"})
+        self.assertEqual(out["stdout"].strip(), "x1")
+        self.assertNotIn("WARM_CLI_TEST_VAR", os.environ)
+
+    def test_cwd_applied_then_restored(self):
+        before = os.getcwd()
+        with tempfile.TemporaryDirectory() as td:
+            out = run_in_this_process(_THIS, ["cwd"], cwd=td)
+        self.assertEqual(os.path.realpath(out["stdout"].strip()), os.path.realpath(td))
+        self.assertEqual(os.getcwd(), before)
+
+    def test_system_exit_code_becomes_returncode(self):
+        self.assertEqual(run_in_this_process(_THIS, ["exit", "3"])["returncode"], 3)
+
+    def test_exception_reports_traceback_and_fails(self):
+        out = run_in_this_process(_THIS, ["unknown"])
+        self.assertEqual(out["returncode"], 1)
+        self.assertIn("boom: unknown", out["stderr"])
+
+    def test_import_error_is_reported_like_any_failure(self):
+        out = run_in_this_process("tests.core_tests.no_such_cli", [])
+        self.assertEqual(out["returncode"], 1)
+        self.assertIn("ModuleNotFoundError", out["stderr"])
+
+    def test_captures_when_sys_stdout_is_not_fd_backed(self):
+        replaced = io.StringIO()
+        with patch.object(sys, "stdout", replaced):
+            out = run_in_this_process(_THIS, ["echo", "python-level"])
+            self.assertIs(sys.stdout, replaced)
+        self.assertEqual(out["stdout"], "python-level\n")
+        self.assertEqual(replaced.getvalue(), "")
+
+    def test_streams_restored(self):
+        stdout, stderr = sys.stdout, sys.stderr
+        run_in_this_process(_THIS, ["echo"])
+        self.assertIs(sys.stdout, stdout)
+        self.assertIs(sys.stderr, stderr)
+
+
+class TestSelection(unittest.TestCase):
+    def test_app_for_bin(self):
+        self.assertEqual(app_for_bin(str(bin_path("mail-assistant"))), "mail")
+        self.assertEqual(app_for_bin(str(bin_path("calendar"))), "calendar")
+        self.assertIsNone(app_for_bin(str(bin_path("worker"))))
+        self.assertIsNone(app_for_bin("bash"))
+
+    def test_app_for_bin_only_accepts_this_repos_bin(self):
+        self.assertIsNone(app_for_bin("mail"))
+        self.assertIsNone(app_for_bin("mail-assistant"))
+        self.assertIsNone(app_for_bin("/usr/bin/mail"))
+        self.assertIsNone(app_for_bin("/repo/bin/schedule-assistant"))
+        with tempfile.TemporaryDirectory() as td:
+            other = os.path.join(td, "bin", "mail")
+            os.makedirs(os.path.dirname(other))
+            open(other, "w").close()
+            self.assertIsNone(app_for_bin(other))
+
+    def test_relative_path_resolves_against_cwd(self):
+        before = os.getcwd()
+        self.addCleanup(os.chdir, before)
+        os.chdir(repo_root())
+        self.assertEqual(app_for_bin("./bin/calendar"), "calendar")
+        with tempfile.TemporaryDirectory() as td:
+            os.chdir(td)
+            self.assertIsNone(app_for_bin("./bin/calendar"))
+
+    def test_inprocess_requested(self):
+        self.assertTrue(inprocess_requested(True))
+        self.assertFalse(inprocess_requested(False))
+        with patch.dict(os.environ, {ENV_INPROCESS: "1"}):
+            self.assertTrue(inprocess_requested())
+        with patch.dict(os.environ, {ENV_INPROCESS: ""}):
+            self.assertFalse(inprocess_requested())
+
+
+class TestWarmCliPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = WarmCliPool(1, apps=(_THIS,))
+        self.addCleanup(self.pool.shutdown)
+
+    def test_runs_in_a_worker_process(self):
+        out = self.pool.run(_THIS, ["echo", "pooled"], timeout=60)
+        self.assertEqual(out["stdout"], "pooled\n")
+
+    def test_timeout_replaces_worker_and_next_job_runs(self):
+        self.pool.start()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.pool.run(_THIS, ["sleep", "30"], timeout=0.5)
+        out = self.pool.run(_THIS, ["echo", "again"], timeout=60)
+        self.assertEqual(out["stdout"], "again\n")
+
+    def test_timeout_leaves_concurrent_job_running(self):
+        pool = WarmCliPool(2, apps=(_THIS,))
+        self.addCleanup(pool.shutdown)
+        pool.start()
+        results: list[dict] = []
+        other = threading.Thread(target=lambda: results.append(pool.run(_THIS, ["sleep", "2"], timeout=60)))
+        other.start()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            pool.run(_THIS, ["sleep", "30"], timeout=0.5)
+        other.join(timeout=60)
+        self.assertEqual([r["returncode"] for r in results], [0])
+
+    def test_import_error_comes_back_as_a_result(self):
+        out = self.pool.run("tests.core_tests.no_such_cli", [], timeout=60)
+        self.assertEqual(out["returncode"], 1)
+        self.assertIn("ModuleNotFoundError", out["stderr"])
+
+    def test_shutdown_stops_worker_that_finishes_later(self):
+        pid = int(self.pool.run(_THIS, ["pid"], timeout=60)["stdout"])
+        busy = threading.Thread(target=lambda: self.pool.run(_THIS, ["sleep", "1"], timeout=60))
+        busy.start()
+        time.sleep(0.3)
+        self.pool.shutdown()
+        busy.join(timeout=60)
+        self.assertEqual((self.pool._idle, self.pool._live), ([], 0))
+        with self.assertRaises(ProcessLookupError):
+            os.kill(pid, 0)
+        with self.assertRaises(RuntimeError):
+            self.pool.run(_THIS, ["echo"], timeout=60)
+
+    def test_real_cli_help(self):
+        pool = WarmCliPool(1, apps=("mail",))
+        self.addCleanup(pool.shutdown)
+        out = pool.run("mail", ["--help"], timeout=120)
+        self.assertEqual(out["returncode"], 0)
+        self.assertIn("mail-assistant", out["stdout"])
+
+
+@unittest.skipUnless(os.environ.get("WARM_CLI_BENCH"), "set WARM_CLI_BENCH=1 to run the benchmark")
+class TestWarmCliThroughput(unittest.TestCase):
+    """Jobs/s for `mail --help`: fresh subprocess vs warm in-process pool."""
+
+    def test_throughput(self):
+        n = 20
+        started = time.perf_counter()
+        for _ in range(n):
+            subprocess.run(  # nosec B603 - test code with trusted local script
+                [sys.executable, str(bin_path("mail")), "--help"],
+                capture_output=True, cwd=str(repo_root()), check=True,
+            )
+        subprocess_s = time.perf_counter() - started
+
+        pool = WarmCliPool(1, apps=("mail",))
+        self.addCleanup(pool.shutdown)
+        pool.start()
+        started = time.perf_counter()
+        for _ in range(n):
+            pool.run("mail", ["--help"], timeout=60)
+        warm_s = time.perf_counter() - started
+        print(f"\nsubprocess: {n / subprocess_s:6.1f} jobs/s\n   in-proc: {n / warm_s:6.1f} jobs/s")
+
+
+if __name__ == "__main__":
+    unittest.main()
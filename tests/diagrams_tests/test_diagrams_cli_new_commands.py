@@ -2,7 +2,7 @@
 
 Covers: _read_input, _write_output, _load_yaml, _validate_non_empty,
 _convert_yaml_spec, _build_flowchart_from_spec, _build_sequence_from_spec,
-cmd_embed, cmd_health, cmd_from_yaml.
+cmd_embed, cmd_health, cmd_from_yaml, cmd_render_all.
 """
 
 from __future__ import annotations
@@ -359,5 +359,45 @@ class TestCmdFromYaml(unittest.TestCase):
             Path(path).unlink(missing_ok=True)
 
 
+# ---------------------------------------------------------------------------
+# cmd_render_all
+# ---------------------------------------------------------------------------
+
+
+class TestCmdRenderAll(unittest.TestCase):
+    def test_renders_every_input_in_one_call(self):
+        from diagrams.cli import main
+
+        with tempfile.TemporaryDirectory() as td:
+            paths = []
+            for name in ("a", "b"):
+                path = Path(td) / f"{name}.mmd"
+                path.write_text(f"graph {name}", encoding="utf-8")
+                paths.append(str(path))
+            out_dir = Path(td) / "out"
+            renderer = MagicMock()
+            renderer.render_many.return_value = [b"<svg>a</svg>", b"<svg>b</svg>"]
+            with patch("diagrams.renderers.LocalRenderer", return_value=renderer), patch("sys.stdout", StringIO()):
+                rc = main(["render-all", *paths, "--out-dir", str(out_dir)])
+            self.assertEqual(rc, 0)
+            self.assertEqual(renderer.render_many.call_args[0][0], ["graph a", "graph b"])
+            self.assertEqual((out_dir / "b.svg").read_bytes(), b"<svg>b</svg>")
+
+    def test_render_failure_returns_1(self):
+        from diagrams.cli import main
+        from diagrams.renderers import LocalRendererError
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".mmd", delete=False) as f:
+            f.write("graph A")
+        self.addCleanup(Path(f.name).unlink, missing_ok=True)
+        renderer = MagicMock()
+        renderer.render_many.side_effect = LocalRendererError("mmdc failed: boom")
+        err = StringIO()
+        with patch("diagrams.renderers.LocalRenderer", return_value=renderer), patch("sys.stderr", err):
+            rc = main(["render-all", f.name, "--out-dir", tempfile.gettempdir()])
+        self.assertEqual(rc, 1)
+        self.assertIn("boom", err.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
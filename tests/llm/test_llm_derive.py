@@ -0,0 +1,199 @@
+"""Tests for core/llm_derive.py — the memoized, concurrent derive-all engine."""
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core import llm_derive
+from core.llm_builders import make_domain_llm_module
+from core.llm_derive import Artifact, derive, write_outputs
+from core.llm_handlers import _default_policies, main
+from tests.fixtures import capture_stdout
+
+
+def _build_alpha() -> str:
+    return "alpha content"
+
+
+class DeriveTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.tmp = Path(td.name)
+        self.root = self.tmp / "repo"
+        (self.root / "src" / "pkg").mkdir(parents=True)
+        self.source = self.root / "src" / "pkg" / "cli.py"
+        self.source.write_text("x = 1\n", encoding="utf-8")
+        self.cache_path = self.tmp / "derive.json"
+        self.calls: list[str] = []
+
+    def _builder(self, text: str):
+        def build() -> str:
+            self.calls.append(text)
+            return text
+        return build
+
+    def _derive(self, artifacts, **kwargs):
+        return derive(artifacts, root=self.root, cache_path=self.cache_path, **kwargs)
+
+
+class TestDeriveCache(DeriveTestBase):
+    def setUp(self):
+        super().setUp()
+        self.artifacts = [
+            Artifact("AGENTIC.md", self._builder("capsule"), ("src/pkg",)),
+            Artifact("INVENTORY.md", self._builder("inventory")),
+        ]
+
+    def test_unchanged_inputs_reuse_cached_content(self):
+        first = self._derive(self.artifacts)
+        second = self._derive(self.artifacts)
+        self.assertEqual([d.content for d in first], [d.content for d in second])
+        self.assertEqual(self.calls, ["capsule", "inventory", "inventory"])
+        self.assertEqual([d.cached for d in second], [True, False])
+
+    def test_changed_source_rebuilds(self):
+        self._derive(self.artifacts)
+        self.source.write_text("x = 2\n", encoding="utf-8")
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+        self.assertEqual(self.calls.count("capsule"), 2)
+
+    def test_touched_but_identical_source_stays_cached(self):
+        self._derive(self.artifacts)
+        st = self.source.stat()
+        os.utime(self.source, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+        self.assertTrue(self._derive(self.artifacts)[0].cached)
+
+    def test_new_source_file_rebuilds(self):
+        self._derive(self.artifacts)
+        (self.root / "src" / "pkg" / "extra.py").write_text("", encoding="utf-8")
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+
+    def test_failing_or_empty_builders(self):
+        def boom() -> str:
+            raise RuntimeError("nope")
+
+        derived = self._derive([
+            Artifact("A.md", boom, fallback="fallback"),
+            Artifact("B.md", lambda: ""),
+            Artifact("C.md", "core.llm_builders:_DOMAIN_MAP_UNAVAILABLE.missing_attr"),
+        ])
+        self.assertEqual([(d.filename, d.content) for d in derived][0], ("A.md", "fallback"))
+        self.assertNotIn("B.md", [d.filename for d in derived])
+        self.assertIn("error generating content", derived[1].content)
+
+    def test_failed_build_is_not_cached(self):
+        attempts: list[int] = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("import failed")
+            return "capsule"
+
+        def swallowing() -> str:
+            attempts.append(2)
+            return "pending"
+
+        artifacts = [
+            Artifact("A.md", flaky, ("src/pkg",)),
+            Artifact("B.md", swallowing, ("src/pkg",), fallback="pending"),
+        ]
+        first = self._derive(artifacts)
+        self.assertIn("error generating content", first[0].content)
+        second = self._derive(artifacts)
+        self.assertEqual([(d.content, d.cached) for d in second], [("capsule", False), ("pending", False)])
+        self.assertTrue(self._derive(artifacts)[0].cached)
+        self.assertEqual(attempts.count(2), 3)
+
+
+class TestDeriveContext(DeriveTestBase):
+    def setUp(self):
+        super().setUp()
+        self.cwd = self.tmp / "cwd"
+        (self.cwd / "bin").mkdir(parents=True)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.cwd)
+        self.artifacts = [Artifact("AGENTIC.md", self._builder("capsule"), ("src/pkg",))]
+
+    def test_context_file_edit_rebuilds(self):
+        agents = self.cwd / "AGENTS.md"
+        agents.write_text("rules\n", encoding="utf-8")
+        self._derive(self.artifacts)
+        self.assertTrue(self._derive(self.artifacts)[0].cached)
+        agents.write_text("rules\nmarker\n", encoding="utf-8")
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+
+    def test_created_context_and_bin_listing_rebuild(self):
+        self._derive(self.artifacts)
+        (self.cwd / ".llm").mkdir()
+        (self.cwd / ".llm" / "CONTEXT.md").write_text("ctx", encoding="utf-8")
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+        (self.cwd / "bin" / "tool").write_text("#!/bin/sh\n", encoding="utf-8")
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+        self.assertTrue(self._derive(self.artifacts)[0].cached)
+
+    def test_other_working_directory_rebuilds(self):
+        self._derive(self.artifacts)
+        os.chdir(self.tmp)
+        self.assertFalse(self._derive(self.artifacts)[0].cached)
+
+
+class TestDeriveConcurrency(DeriveTestBase):
+    def _targets(self):
+        return [
+            Artifact("ALPHA.md", f"{__name__}:_build_alpha", ("src/pkg",)),
+            Artifact("POLICIES.yaml", "core.llm_handlers:_default_policies", ("src/pkg",)),
+        ]
+
+    def test_pool_matches_in_process_build(self):
+        with patch.object(llm_derive.os, "cpu_count", return_value=2):
+            pooled = self._derive(self._targets())
+        self.assertEqual(
+            [(d.filename, d.content) for d in pooled],
+            [("ALPHA.md", "alpha content"), ("POLICIES.yaml", _default_policies())],
+        )
+
+    def test_falls_back_when_pool_unavailable(self):
+        with patch.object(llm_derive.os, "cpu_count", return_value=2), \
+                patch.object(llm_derive, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            derived = self._derive(self._targets())
+        self.assertEqual(derived[0].content, "alpha content")
+
+
+class TestWriteOutputs(DeriveTestBase):
+    def test_skips_files_already_up_to_date(self):
+        out_dir = self.tmp / "out"
+        derived = self._derive([Artifact("A.md", lambda: "a"), Artifact("B.md", lambda: "b")])
+        self.assertEqual(len(write_outputs(out_dir, derived)), 2)
+        (out_dir / "B.md").write_text("edited", encoding="utf-8")
+        self.assertEqual(write_outputs(out_dir, derived), [out_dir / "B.md"])
+        self.assertEqual((out_dir / "B.md").read_text(encoding="utf-8"), "b")
+
+
+class TestRepoDeriveAll(unittest.TestCase):
+    def test_all_apps_writes_each_app_capsule(self):
+        with tempfile.TemporaryDirectory() as td, \
+                patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(Path(td) / "data")}):
+            out_dir = Path(td) / "out"
+            args = ["derive-all", "--all-apps", "--include-generated", "--out-dir", str(out_dir), "--stdout"]
+            with capture_stdout():
+                self.assertEqual(main(args), 0)
+            with capture_stdout() as buf:
+                self.assertEqual(main(args), 0)
+            for name in ("AGENTIC.md", "AGENTIC_CALENDAR.md", "DOMAIN_MAP_SCHEDULE.md", "PR_POLICIES.yaml"):
+                self.assertTrue((out_dir / name).exists(), name)
+            self.assertIn("AGENTIC_WIFI.md (unchanged)", buf.getvalue())
+
+    def test_domain_config_records_package(self):
+        config = make_domain_llm_module(
+            app_id="demo", app_title="Demo", purpose="p", agentic_module="demo.agentic",
+        )
+        self.assertEqual(config.package, "demo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for core/llm_scan.py — the shared, cached stale/deps scan."""
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core import llm_scan
+from core.llm_scan import ENV_SCAN_CACHE, default_cache_path, import_edges, scan_areas
+from core.llm_staleness import _collect_dep_stats, _iter_candidate_dirs
+
+
+def _write(path: Path, text: str = "", mtime: float | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class ScanTestBase(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name) / "repo"
+        env = patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(Path(td.name) / "data")})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(ENV_SCAN_CACHE, None)
+        # src/ is an import root; tests/ and tools/ are packages.
+        _write(self.root / "src" / "alpha" / "__init__.py", "import beta.util\n")
+        _write(self.root / "src" / "beta" / "__init__.py")
+        _write(self.root / "src" / "beta" / "util.py", "from . import x\nimport json\n")
+        _write(self.root / "tests" / "__init__.py")
+        _write(self.root / "tests" / "test_a.py", "import alpha\nfrom tools.helpers import h\n")
+        _write(self.root / "tools" / "__init__.py")
+        _write(self.root / "tools" / "helpers.py", "def h():\n    from alpha import run\n")
+        _write(self.root / "docs" / "notes.md", "notes\n", mtime=1_000_000_000)
+        os.utime(self.root / "docs", (1_000_000_000, 1_000_000_000))
+
+    def _scan(self, **kwargs):
+        return {s.name: s for s in scan_areas(self.root, _iter_candidate_dirs(self.root), **kwargs)}
+
+
+class TestScanAreas(ScanTestBase):
+    def test_matches_recursive_walk(self):
+        scans = self._scan()
+        for name, path in _iter_candidate_dirs(self.root):
+            latest = max([path.stat().st_mtime] + [p.stat().st_mtime for p in path.rglob("*")])
+            with self.subTest(area=name):
+                self.assertEqual(scans[name].latest_mtime, latest)
+                self.assertEqual(scans[name].py_files, sum(1 for _ in path.rglob("*.py")))
+        self.assertEqual(scans["docs"].latest_mtime, 1_000_000_000)
+
+    def test_import_edges_between_areas(self):
+        edges = import_edges(list(self._scan(with_imports=True).values()))
+        self.assertEqual(edges["tests"], {"src", "tools"})
+        self.assertEqual(edges["tools"], {"src"})
+        self.assertEqual(edges["src"], set())
+        self.assertEqual(edges["docs"], set())
+
+    def test_dep_stats_count_distinct_areas(self):
+        stats = {e["area"]: e for e in _collect_dep_stats(self.root, 0, "desc")}
+        self.assertEqual(stats["src"], {"area": "src", "dependencies": 0, "dependents": 2, "combined": 2})
+        self.assertEqual(stats["tests"]["dependencies"], 2)
+        self.assertEqual(stats["tools"]["combined"], 2)
+
+
+class TestScanCache(ScanTestBase):
+    def test_unchanged_tree_is_not_listed_or_parsed_again(self):
+        first = self._scan(with_imports=True)
+        with patch.object(llm_scan, "_list_dir", side_effect=AssertionError("rescanned")), \
+                patch.object(llm_scan, "_top_level_imports", side_effect=AssertionError("reparsed")):
+            self.assertEqual(self._scan(with_imports=True), first)
+            self.assertEqual(self._scan()["src"].latest_mtime, first["src"].latest_mtime)
+
+    def test_only_changed_directories_are_rescanned(self):
+        self._scan(with_imports=True)
+        _write(self.root / "tools" / "more.py", "import gamma\n")
+        real = llm_scan._list_dir
+        listed = []
+
+        def tracking(path):
+            listed.append(Path(path).name)
+            return real(path)
+
+        with patch.object(llm_scan, "_list_dir", side_effect=tracking):
+            scans = self._scan(with_imports=True)
+        self.assertEqual(listed, ["tools"])
+        self.assertEqual(scans["tools"].py_files, 3)
+        self.assertIn("gamma", scans["tools"].imports)
+
+    def test_in_place_edit_is_picked_up(self):
+        self._scan(with_imports=True)
+        helpers = self.root / "tools" / "helpers.py"
+        dir_st = os.stat(helpers.parent)
+        _write(helpers, "import delta\n", mtime=2_000_000_000)
+        os.utime(helpers.parent, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns))
+        with patch.object(llm_scan, "_list_dir", side_effect=AssertionError("relisted")):
+            scans = self._scan(with_imports=True)
+        self.assertEqual(scans["tools"].latest_mtime, 2_000_000_000)
+        self.assertIn("delta", scans["tools"].imports)
+        self.assertNotIn("alpha", scans["tools"].imports)
+
+    def test_stale_scan_keeps_parsed_imports(self):
+        self._scan(with_imports=True)
+        self._scan()
+        with patch.object(llm_scan, "_top_level_imports", side_effect=AssertionError("reparsed")):
+            self._scan(with_imports=True)
+
+    def test_cache_can_be_disabled(self):
+        with patch.dict(os.environ, {ENV_SCAN_CACHE: "0"}):
+            self._scan()
+        self.assertFalse(default_cache_path(self.root).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
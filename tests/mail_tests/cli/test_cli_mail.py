@@ -14,5 +14,17 @@ class TestAgenticFlag(unittest.TestCase):
         self.assertIn("agentic: mail", out)
 
 
+class TestOutlookRulesSweepArgs(unittest.TestCase):
+    def test_index_is_opt_in(self):
+        # The local index matches fewer fields than Graph $search; rules-sweep
+        # moves mail, so it must not silently match less by default.
+        from mail.cli.main import app
+
+        parser = app.build_parser()
+        base = ["outlook", "rules.sweep", "--config", "filters.yaml"]
+        self.assertFalse(parser.parse_args(base).use_index)
+        self.assertTrue(parser.parse_args([*base, "--use-index"]).use_index)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
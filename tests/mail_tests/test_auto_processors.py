@@ -423,6 +423,33 @@ class TestAutoApplyProcessor(unittest.TestCase):
         # Only old message should be processed (recent is newer than cutoff)
         self.assertEqual(envelope.payload.total_modified, 1)
 
+    def test_cutoff_days_applies_to_gmail_internal_date(self):
+        client = FakeAutoClient(
+            labels=[{"id": "LBL_NEWS", "name": "Lists/Newsletters"}]
+        )
+        ctx = _make_auto_context(client)
+        headers = {"From": "news@example.com", "Subject": "Weekly", "List-Id": "<news.example.com>"}
+        now_ms = int(time.time() * 1000)
+        messages = []
+        for msg_id, age_days in (("m_old", 100), ("m_recent", 5)):
+            msg = _make_message(msg_id, headers)
+            msg["internalDate"] = str(now_ms - age_days * 86400 * 1000)  # Gmail sends a string
+            messages.append({"id": msg_id, **classify_low_interest(msg)})
+
+        with patch("mail.applog.AppLogger"):
+            envelope = AutoApplyProcessor().process(AutoApplyPayload(
+                context=ctx,
+                proposal={"messages": messages},
+                cutoff_days=30,
+                batch_size=10,
+                dry_run=False,
+                log_path="/dev/null",
+            ))
+
+        self.assertTrue(envelope.ok())
+        self.assertEqual(envelope.payload.total_modified, 1)
+        self.assertEqual([ids for ids, _, _ in client.modified_batches], [["m_old"]])
+
     def test_batches_by_label_combination(self):
         client = FakeAutoClient(
             labels=[
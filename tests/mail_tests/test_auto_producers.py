@@ -6,8 +6,8 @@ import unittest
 from pathlib import Path
 
 from core.pipeline import ResultEnvelope
-from mail.auto.processors import AutoProposeResult, AutoSummaryResult, AutoApplyResult
-from mail.auto.producers import AutoProposeProducer, AutoSummaryProducer, AutoApplyProducer
+from mail.auto.processors import AutoProposeResult, AutoSummaryResult, AutoApplyResult, AutoStreamResult
+from mail.auto.producers import AutoProposeProducer, AutoSummaryProducer, AutoApplyProducer, AutoStreamProducer
 from tests.fixtures import capture_stdout
 
 
@@ -184,5 +184,24 @@ class TestAutoApplyProducer(unittest.TestCase):
         self.assertIn("Auto apply failed", output)
 
 
+class TestAutoStreamProducer(unittest.TestCase):
+    """Tests for AutoStreamProducer."""
+
+    def _produce(self, **kwargs) -> str:
+        payload = AutoStreamResult(out_path=Path("out.json"), applied=True, **kwargs)
+        with capture_stdout() as buf:
+            AutoStreamProducer().produce(ResultEnvelope(status="success", payload=payload))
+        return buf.getvalue()
+
+    def test_apply_reports_batches(self):
+        output = self._produce(total_modified=30, batches=2)
+        self.assertIn("Applied to 30 messages in 2 batches", output)
+
+    def test_dry_run_does_not_claim_applied(self):
+        output = self._produce(dry_run=True, groups=[(30, ["Lists/News"], ["INBOX"])])
+        self.assertIn("Would modify 30 messages", output)
+        self.assertNotIn("Applied to", output)
+
+
 if __name__ == "__main__":
     unittest.main()
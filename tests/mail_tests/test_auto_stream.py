@@ -0,0 +1,152 @@
+"""Tests for the streaming auto propose/apply pipeline."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mail.auto.consumers import AutoApplyPayload, AutoStreamPayload, AutoSummaryPayload, load_proposal
+from mail.auto.processors import AutoApplyProcessor, AutoStreamProcessor, AutoSummaryProcessor
+from mail.utils.gmail_ops import MessageQueryParams, iter_messages_with_metadata
+from tests.mail_tests.fixtures import FakeMailContext, make_message_with_headers as _make_message
+from tests.mail_tests.test_auto_processors import FakeAutoClient
+
+
+class PagedAutoClient(FakeAutoClient):
+    """FakeAutoClient that lists IDs page by page and records call order."""
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.events: list[tuple] = []
+
+    def iter_message_id_pages(self, query=None, label_ids=None, max_pages=1, page_size=500):
+        for n, ids in enumerate(self.pages, start=1):
+            self.events.append(("page", n))
+            yield ids
+            if max_pages and n >= max_pages:
+                return
+
+    def batch_modify_messages(self, ids, add_label_ids=None, remove_label_ids=None):
+        self.events.append(("modify", tuple(ids)))
+        super().batch_modify_messages(ids, add_label_ids, remove_label_ids)
+
+
+def _promo(mid: str) -> dict:
+    return _make_message(mid, {"From": "store@example.com", "Subject": "Big Sale"})
+
+
+def _normal(mid: str) -> dict:
+    return _make_message(mid, {"From": "friend@example.com", "Subject": "Lunch?"})
+
+
+def _patched_logger():
+    patcher = patch("mail.applog.AppLogger")
+    mock_cls = patcher.start()
+    mock_cls.return_value = MagicMock(start=MagicMock(return_value="sid"))
+    return patcher
+
+
+class TestIterMessagesWithMetadata(unittest.TestCase):
+    def test_yields_one_list_per_page(self):
+        client = PagedAutoClient([["m1", "m2"], ["m3"]], messages={m: {"id": m} for m in ("m1", "m2", "m3")})
+        pages = list(iter_messages_with_metadata(client, MessageQueryParams(query="q", pages=5)))
+        self.assertEqual([[m["id"] for m in p] for p in pages], [["m1", "m2"], ["m3"]])
+
+    def test_respects_max_msgs(self):
+        client = PagedAutoClient([["m1", "m2"], ["m3", "m4"]])
+        pages = list(iter_messages_with_metadata(client, MessageQueryParams(query="q", pages=5, max_msgs=3)))
+        self.assertEqual([[m["id"] for m in p] for p in pages], [["m1", "m2"], ["m3"]])
+
+    def test_falls_back_to_single_page_without_pager(self):
+        client = FakeAutoClient(message_ids_by_query={"q": ["m1", "m2"]})
+        pages = list(iter_messages_with_metadata(client, MessageQueryParams(query="q", pages=1)))
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(len(pages[0]), 2)
+
+
+class TestAutoStreamProcessor(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(_patched_logger().stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = Path(tmp.name) / "proposal.jsonl"
+
+    def _run(self, client, **kwargs):
+        payload = AutoStreamPayload(
+            context=FakeMailContext(gmail_client=client),
+            out_path=self.out,
+            days=7,
+            pages=10,
+            log_path="/dev/null",
+            **kwargs,
+        )
+        return AutoStreamProcessor().process(payload)
+
+    def test_propose_only_writes_jsonl(self):
+        msgs = {"m1": _promo("m1"), "m2": _normal("m2"), "m3": _promo("m3")}
+        client = PagedAutoClient([["m1", "m2"], ["m3"]], messages=msgs)
+        envelope = self._run(client)
+
+        self.assertTrue(envelope.ok())
+        result = envelope.payload
+        self.assertEqual((result.pages, result.total_considered, result.selected_count), (2, 3, 2))
+        self.assertEqual(client.modified_batches, [])
+        lines = [json.loads(x) for x in self.out.read_text().splitlines()]
+        self.assertIn("query", lines[0])
+        self.assertEqual([r["id"] for r in lines[1:]], ["m1", "m3"])
+
+    def test_apply_flushes_full_batches_before_later_pages(self):
+        msgs = {m: _promo(m) for m in ("m1", "m2", "m3")}
+        client = PagedAutoClient(
+            [["m1", "m2"], ["m3"]],
+            messages=msgs,
+            labels=[{"id": "LBL_COMM", "name": "Lists/Commercial"}],
+        )
+        envelope = self._run(client, apply=True, batch_size=2)
+
+        self.assertTrue(envelope.ok())
+        self.assertEqual(
+            client.events,
+            [("page", 1), ("modify", ("m1", "m2")), ("page", 2), ("modify", ("m3",))],
+        )
+        self.assertEqual(client.modified_batches[0][1:], (["LBL_COMM"], ["INBOX"]))
+        self.assertEqual(envelope.payload.total_modified, 3)
+        self.assertEqual(envelope.payload.batches, 2)
+        self.assertEqual(envelope.payload.groups, [(3, ["LBL_COMM"], ["INBOX"])])
+
+    def test_apply_dry_run_does_not_modify(self):
+        client = PagedAutoClient([["m1"]], messages={"m1": _promo("m1")})
+        envelope = self._run(client, apply=True, dry_run=True)
+
+        self.assertTrue(envelope.ok())
+        self.assertEqual(client.modified_batches, [])
+        self.assertEqual(envelope.payload.total_modified, 1)
+
+    def test_jsonl_proposal_feeds_summary_and_apply(self):
+        msgs = {"m1": _promo("m1"), "m2": _promo("m2")}
+        self._run(PagedAutoClient([["m1", "m2"]], messages=msgs))
+
+        proposal = load_proposal(self.out)
+        self.assertIn("query", proposal)
+        summary = AutoSummaryProcessor().process(AutoSummaryPayload(proposal=proposal))
+        self.assertEqual(summary.payload.message_count, 2)
+
+        client = FakeAutoClient()
+        applied = AutoApplyProcessor().process(
+            AutoApplyPayload(
+                context=FakeMailContext(gmail_client=client),
+                proposal=load_proposal(self.out),
+                batch_size=10,
+                log_path="/dev/null",
+            )
+        )
+        self.assertTrue(applied.ok())
+        self.assertEqual(client.modified_batches, [(["m1", "m2"], ["Lists/Commercial"], ["INBOX"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
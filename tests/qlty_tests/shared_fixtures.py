@@ -35,6 +35,10 @@ class FakeRunner:
     ) -> None:
         self._results = results or {}
         self.calls: list[tuple[Source, bool, tuple[str, ...], bool]] = []
+        self.qlty_version = "qlty 0.640.0"
+
+    def version(self) -> str:
+        return self.qlty_version
 
     def invoke(
         self,
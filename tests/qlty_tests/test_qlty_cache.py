@@ -0,0 +1,173 @@
+"""Per-file finding cache: incremental scans and targeted stability re-scans."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Sequence
+
+from qlty.cache import FindingCache
+from qlty.models import Finding, Location, Source, WireFormat
+from qlty.runner import InvocationResult
+from qlty.scanner import ScanRequest, Scanner
+from tests.qlty_tests.shared_fixtures import FakeRunner, make_finding, result_of
+
+_SMELLS = ScanRequest(sources=(Source.SMELLS,))
+_CHECK = ScanRequest(sources=(Source.CHECK,))
+
+
+class _PathAwareRunner(FakeRunner):
+    """Returns the findings of the files named in ``paths`` (all if none)."""
+
+    def __init__(self, by_file: dict[str, list[Finding]]) -> None:
+        super().__init__()
+        self.by_file = by_file
+
+    def invoke(
+        self,
+        source: Source,
+        *,
+        scan_all: bool = True,
+        include_tests: bool = True,
+        paths: Sequence[str] = (),
+    ) -> InvocationResult:
+        super().invoke(source, scan_all=scan_all, include_tests=include_tests, paths=paths)
+        names = paths or list(self.by_file)
+        return result_of([f for n in names for f in self.by_file.get(n, [])], source=source)
+
+
+class FindingCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        # Enough files that one or two stale ones stay under the full-scan
+        # fallback threshold.
+        for name in [*"abcdefghij"]:
+            (self.root / f"{name}.py").write_text(f"# {name}\n", encoding="utf-8")
+        self.runner = _PathAwareRunner(
+            {
+                "a.py": [make_finding(path="a.py", line=1)],
+                "b.py": [make_finding(path="b.py", line=2)],
+            }
+        )
+
+    def _scanner(self) -> Scanner:
+        cache = FindingCache(
+            self.root,
+            path=self.root / "cache.json",
+            list_files=lambda root, paths: sorted(p.name for p in root.glob("*.py")),
+        )
+        return Scanner(self.runner, cache=cache)
+
+    def test_cold_cache_runs_full_scan(self):
+        result = self._scanner().scan(_SMELLS)
+        self.assertEqual(self.runner.calls[0][2], ())
+        self.assertEqual({f.file for f in result.findings}, {"a.py", "b.py"})
+        self.assertTrue((self.root / "cache.json").exists())
+
+    def test_unchanged_repo_does_not_invoke_qlty(self):
+        self._scanner().scan(_SMELLS)
+        self.runner.calls.clear()
+        result = self._scanner().scan(_SMELLS)
+        self.assertEqual(self.runner.calls, [])
+        self.assertEqual({f.file for f in result.findings}, {"a.py", "b.py"})
+        self.assertEqual(result.wire_formats, (WireFormat.JSON,))
+
+    def test_only_changed_files_are_rescanned(self):
+        self._scanner().scan(_CHECK)
+        self.runner.calls.clear()
+        (self.root / "b.py").write_text("# edited\n", encoding="utf-8")
+        self.runner.by_file["b.py"] = []
+        result = self._scanner().scan(_CHECK)
+        self.assertEqual([c[2] for c in self.runner.calls], [("b.py",)])
+        self.assertEqual({f.file for f in result.findings}, {"a.py"})
+
+    def test_any_change_reruns_smells_over_whole_scope(self):
+        self._scanner().scan(_SMELLS)
+        self.runner.calls.clear()
+        (self.root / "c.py").write_text("# edited\n", encoding="utf-8")
+        # The edit creates a clone pair with a.py, which did not change.
+        self.runner.by_file["a.py"] = [make_finding(
+            rule="similar-code", path="a.py", group_key="h1",
+            other_locations=(Location(path="c.py", line=1),),
+        )]
+        result = self._scanner().scan(_SMELLS)
+        self.assertEqual([c[2] for c in self.runner.calls], [()])
+        self.assertIn("similar-code", {f.rule for f in result.findings})
+
+        self.runner.calls.clear()
+        replay = self._scanner().scan(_SMELLS)
+        self.assertEqual(self.runner.calls, [])
+        self.assertIn("similar-code", {f.rule for f in replay.findings})
+
+    def test_tool_version_change_invalidates(self):
+        self._scanner().scan(_SMELLS)
+        self.runner.calls.clear()
+        self.runner.qlty_version = "qlty 0.641.0"
+        self._scanner().scan(_SMELLS)
+        self.assertEqual(self.runner.calls[0][2], ())
+
+    def test_mostly_stale_tree_falls_back_to_full_scan(self):
+        self._scanner().scan(_SMELLS)
+        self.runner.calls.clear()
+        for name in "abcd":
+            (self.root / f"{name}.py").write_text("# edited\n", encoding="utf-8")
+        self._scanner().scan(_SMELLS)
+        self.assertEqual(self.runner.calls[0][2], ())
+
+    def test_no_cache_request_bypasses_cache(self):
+        self._scanner().scan(_SMELLS)
+        self.runner.calls.clear()
+        self._scanner().scan(ScanRequest(sources=(Source.SMELLS,), use_cache=False))
+        self.assertEqual(len(self.runner.calls), 1)
+
+    def test_degraded_run_is_not_cached(self):
+        runner = FakeRunner(
+            {Source.SMELLS: [result_of([make_finding(path="a.py")], degraded=True, degrade_reason="sarif")]}
+        )
+        self.runner = runner
+        self._scanner().scan(_SMELLS)
+        self._scanner().scan(_SMELLS)
+        self.assertEqual(len(runner.calls), 2)
+
+    def test_cached_smells_stale_run_is_not_sharded(self):
+        for i in range(400):
+            (self.root / f"m{i}.py").write_text("# m\n", encoding="utf-8")
+        request = ScanRequest(sources=(Source.SMELLS,), max_workers=8)
+        self._scanner().scan(request)
+        self.runner.calls.clear()
+        stale = [f"m{i}.py" for i in range(90)]
+        for name in stale:
+            (self.root / name).write_text("# edited\n", encoding="utf-8")
+        result = self._scanner().scan(request)
+        self.assertEqual([c[2] for c in self.runner.calls], [()])
+        self.assertFalse(any("sharded" in d for d in result.degradations))
+
+
+class TargetedRescanTests(unittest.TestCase):
+    def test_rescans_narrow_to_unsettled_files(self):
+        first = result_of([make_finding(path="src/a.py")])
+        second = result_of([make_finding(path="src/a.py"), make_finding(path="src/b.py")])
+        third = result_of([make_finding(path="src/b.py")])
+        runner = FakeRunner({Source.SMELLS: [first, second, third]})
+        result = Scanner(runner).scan(_SMELLS, rescan_until_stable=True)
+
+        self.assertEqual([c[2] for c in runner.calls], [(), (), ("src/b.py",)])
+        self.assertTrue(result.stable)
+        self.assertEqual(result.iterations, 3)
+
+    def test_changed_scope_is_never_narrowed(self):
+        runs = [result_of([make_finding(path=f"src/{i}.py")]) for i in range(4)]
+        runner = FakeRunner({Source.SMELLS: runs})
+        Scanner(runner).scan(
+            ScanRequest(scan_all=False, sources=(Source.SMELLS,)),
+            rescan_until_stable=True,
+            max_iterations=3,
+        )
+        self.assertTrue(all(c[2] == () for c in runner.calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Concurrent check/smells, sharded path scans, and per-invocation timings."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from qlty import report
+from qlty.models import Source
+from qlty.runner import QltyInvocationError
+from qlty.scanner import ScanRequest, Scanner
+from tests.qlty_tests.shared_fixtures import FakeRunner, make_finding, result_of
+
+
+class _BarrierRunner(FakeRunner):
+    """Blocks each invoke until both sources are in flight at once."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def invoke(self, source, **kwargs):
+        self.barrier.wait()
+        return super().invoke(source, **kwargs)
+
+
+class ConcurrentSourcesTests(unittest.TestCase):
+    def test_check_and_smells_run_concurrently(self):
+        # A serial scanner would deadlock on the barrier and time out.
+        runner = _BarrierRunner()
+        result = Scanner(runner).scan()
+        self.assertEqual({c[0] for c in runner.calls}, {Source.CHECK, Source.SMELLS})
+        self.assertEqual({t.source for t in result.timings}, {Source.CHECK, Source.SMELLS})
+
+    def test_failure_in_one_source_propagates(self):
+        class Failing(FakeRunner):
+            def invoke(self, source, **kwargs):
+                if source is Source.CHECK:
+                    raise QltyInvocationError("boom")
+                return super().invoke(source, **kwargs)
+
+        with self.assertRaises(QltyInvocationError):
+            Scanner(Failing()).scan()
+
+
+class ShardingTests(unittest.TestCase):
+    def _paths(self, n: int) -> tuple[str, ...]:
+        return tuple(f"src/m{i}.py" for i in range(n))
+
+    def test_small_path_sets_are_not_sharded(self):
+        runner = FakeRunner()
+        Scanner(runner).scan(ScanRequest(paths=self._paths(10), sources=(Source.CHECK,), max_workers=8))
+        self.assertEqual(len(runner.calls), 1)
+
+    def test_large_path_set_is_split_within_worker_budget(self):
+        runner = FakeRunner()
+        paths = self._paths(400)
+        result = Scanner(runner).scan(
+            ScanRequest(paths=paths, sources=(Source.CHECK,), max_workers=4)
+        )
+        self.assertEqual(len(runner.calls), 4)
+        covered = sorted(p for call in runner.calls for p in call[2])
+        self.assertEqual(covered, sorted(paths))
+        self.assertEqual(sorted(t.shard for t in result.timings), [1, 2, 3, 4])
+        self.assertFalse(result.degraded)
+
+    def test_worker_budget_is_shared_between_sources(self):
+        runner = FakeRunner()
+        Scanner(runner).scan(ScanRequest(paths=self._paths(400), max_workers=4))
+        per_source = {s: sum(1 for c in runner.calls if c[0] is s) for s in Source}
+        self.assertEqual(per_source, {Source.CHECK: 2, Source.SMELLS: 2})
+
+    def test_shard_findings_merge_and_dedupe(self):
+        shared = make_finding(rule="similar-code", path="src/m0.py", group_key="h1")
+        runner = FakeRunner({Source.SMELLS: [result_of([shared, make_finding(path="src/m1.py")])]})
+        result = Scanner(runner).scan(
+            ScanRequest(paths=self._paths(200), sources=(Source.SMELLS,), max_workers=2)
+        )
+        # Both shards return the same canned findings; dedupe collapses them.
+        self.assertEqual(result.total, 2)
+        self.assertEqual(result.duplicates_collapsed, 2)
+
+    def test_sharded_smells_reports_clone_trade_off(self):
+        runner = FakeRunner()
+        result = Scanner(runner).scan(
+            ScanRequest(paths=self._paths(200), sources=(Source.SMELLS,), max_workers=2)
+        )
+        self.assertTrue(any("sharded" in d for d in result.degradations))
+
+
+class TimingReportTests(unittest.TestCase):
+    def test_timings_render_in_text_and_json(self):
+        result = Scanner(FakeRunner()).scan()
+        self.assertIn("timing: ", report.render_scan_text(result))
+        payload = report.scan_payload(result)
+        self.assertEqual({t["source"] for t in payload["timings"]}, {"check", "smells"})
+
+
+if __name__ == "__main__":
+    unittest.main()
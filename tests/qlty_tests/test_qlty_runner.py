@@ -413,6 +413,24 @@ class InvokeFallbackTests(unittest.TestCase):
         self.assertNotIn("--include-tests", executed.call_args[0][0])
 
 
+class VersionTests(unittest.TestCase):
+    """qlty --version feeds the finding-cache fingerprint."""
+
+    def test_version_is_read_once(self):
+        runner = QltyRunner(binary="/fake/qlty")
+        with patch.object(
+            runner, "_execute", return_value=completed("qlty 0.640.0\n", 0)
+        ) as executed:
+            self.assertEqual(runner.version(), "qlty 0.640.0")
+            self.assertEqual(runner.version(), "qlty 0.640.0")
+        executed.assert_called_once_with(["--version"])
+
+    def test_failed_version_reads_as_unknown(self):
+        runner = QltyRunner(binary="/fake/qlty")
+        with patch.object(runner, "_execute", return_value=completed("", 99)):
+            self.assertEqual(runner.version(), "")
+
+
 class ExecuteSubprocessFailureTests(unittest.TestCase):
     """The two subprocess failure modes _execute itself maps.
 
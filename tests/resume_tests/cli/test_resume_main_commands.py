@@ -171,7 +171,7 @@ class TestStructureHelpers(unittest.TestCase):
         result = _find_structure_in_config("prof")
         self.assertEqual(result, {"sections": []})
 
-    @patch('resume.cli.main.infer_structure_from_docx')
+    @patch('resume.structure.infer_structure_from_docx')
     def test_load_structure_from_docx(self, mock_infer):
         """Test _load_structure loads from DOCX."""
         from resume.cli.main import _load_structure
@@ -339,7 +339,7 @@ class TestResumeCommands(unittest.TestCase):
         self.assertEqual(result, 0)
 
     @patch('resume.cli.main.write_yaml_or_json')
-    @patch('resume.cli.main.infer_structure_from_docx')
+    @patch('resume.structure.infer_structure_from_docx')
     def test_cmd_structure(self, mock_infer, mock_write):
         """Test cmd_structure command."""
         from resume.cli.main import cmd_structure
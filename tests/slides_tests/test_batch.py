@@ -0,0 +1,154 @@
+"""Tests for slides.batch.build_decks and the ``slides batch`` command."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from pptx import Presentation as RealPresentation
+
+from slides import batch
+from slides.batch import DeckJob, build_decks
+from slides.cli import cmd_batch
+from slides.generator import SlideGenerator
+
+_DECK = """\
+title: {title}
+slides:
+  - title: Highlights
+    bullets: [One, Two]
+  - title: Results
+    layout: table
+    headers: [Metric, Value]
+    rows: [[Revenue, "$1.2M"]]
+"""
+
+
+class BatchTestBase(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name)
+        self.template = self.root / "template.pptx"
+        prs = RealPresentation()
+        prs.slides.add_slide(prs.slide_layouts[1])
+        prs.save(self.template)
+
+    def _deck(self, name: str, body: str | None = None) -> str:
+        path = self.root / f"{name}.yaml"
+        path.write_text(body if body is not None else _DECK.format(title=name))
+        return str(path)
+
+    def _jobs(self, *names: str) -> list[DeckJob]:
+        return [DeckJob(self._deck(n), str(self.root / "out" / f"{n}.pptx")) for n in names]
+
+
+class TestBuildDecks(BatchTestBase):
+    def test_in_process_builds_every_deck_with_timings(self) -> None:
+        report = build_decks(self._jobs("a", "b"), template_path=str(self.template), max_workers=1)
+        self.assertTrue(report.ok)
+        self.assertEqual(
+            list(report.timings), ["load_ms", "template_ms", "prerender_ms", "assemble_ms", "total_ms"],
+        )
+        for build in report.builds:
+            self.assertTrue(Path(build.output_path).is_file())
+            self.assertEqual(set(build.timings), {"prepare_ms", "populate_ms", "save_ms"})
+            self.assertEqual(len(RealPresentation(build.output_path).slides), 2)
+
+    def test_process_pool_builds_every_deck(self) -> None:
+        report = build_decks(self._jobs("a", "b", "c"), template_path=str(self.template), max_workers=2)
+        self.assertTrue(report.ok, report.as_dict())
+        self.assertTrue(all(Path(b.output_path).is_file() for b in report.builds))
+
+    def test_template_is_read_and_inferred_once(self) -> None:
+        real_read = Path.read_bytes
+        reads: list[str] = []
+
+        def tracking_read(path: Path) -> bytes:
+            reads.append(str(path))
+            return real_read(path)
+
+        with patch.object(Path, "read_bytes", tracking_read), patch.object(
+            SlideGenerator, "infer_layout_map_from_template", return_value={"bullet": 0},
+        ) as infer:
+            report = build_decks(
+                self._jobs("a", "b", "c"), template_path=str(self.template), infer_layout_map=True, max_workers=1,
+            )
+        self.assertTrue(report.ok)
+        self.assertEqual(reads.count(str(self.template)), 1)
+        infer.assert_called_once()
+
+    def test_failing_decks_do_not_stop_the_batch(self) -> None:
+        jobs = self._jobs("good")
+        jobs.append(DeckJob(self._deck("broken", "title: [unclosed\n"), str(self.root / "broken.pptx")))
+        missing_image = "title: pic\nslides:\n  - title: Pic\n    image: /nonexistent/pic.png\n"
+        jobs.append(DeckJob(self._deck("pic", missing_image), str(self.root / "pic.pptx")))
+        report = build_decks(jobs, template_path=str(self.template), max_workers=1)
+
+        good, broken, pic = report.builds
+        self.assertFalse(report.ok)
+        self.assertTrue(good.ok)
+        self.assertIn("Error loading YAML", broken.error)
+        self.assertIn("/nonexistent/pic.png", pic.error)
+        self.assertFalse(Path(pic.output_path).exists())
+
+    def test_missing_template_is_reported_per_deck(self) -> None:
+        report = build_decks(self._jobs("a"), template_path=str(self.root / "nope.pptx"), max_workers=1)
+        self.assertIn("Error reading template", report.builds[0].error)
+        report = build_decks(self._jobs("b"), max_workers=1)
+        self.assertFalse(report.builds[0].ok)
+
+    def test_mermaid_sources_render_in_one_batch(self) -> None:
+        diagram = "title: m\nslides:\n  - title: Flow\n    mermaid: \"graph LR; A-->B\"\n"
+        jobs = [DeckJob(self._deck(n, diagram), str(self.root / f"{n}.pptx")) for n in ("m1", "m2")]
+        with patch.object(batch.shutil, "which", return_value="/usr/bin/mmdc"), patch.object(
+            batch.mermaid_render, "cache_version", return_value="11.0.0",
+        ), patch.object(batch.mermaid_render, "render_many") as render_many, patch.object(
+            batch, "_assemble", return_value=("", {}),
+        ):
+            build_decks(jobs, template_path=str(self.template), max_workers=1)
+        render_many.assert_called_once()
+        self.assertEqual(len(render_many.call_args.args[0]), 1)
+
+
+class TestCmdBatch(BatchTestBase):
+    def _args(self, files: list[str], **overrides: object) -> argparse.Namespace:
+        defaults = {
+            "yaml_files": files, "output_dir": str(self.root / "out"), "template": str(self.template),
+            "layout_map": None, "infer_layout_map": False, "jobs": 1, "format": "json",
+        }
+        defaults.update(overrides)
+        return argparse.Namespace(**defaults)
+
+    def test_json_report(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            rc = cmd_batch(self._args([self._deck("a"), self._deck("b")]))
+        self.assertEqual(rc, 0)
+        report = json.loads(out.getvalue())
+        self.assertEqual([d["output"] for d in report["decks"]], [str(self.root / "out" / f"{n}.pptx") for n in "ab"])
+        self.assertIn("total_ms", report["timings"])
+
+    def test_duplicate_stems_rejected(self) -> None:
+        (self.root / "other").mkdir()
+        dup = self.root / "other" / "a.yaml"
+        dup.write_text(_DECK.format(title="dup"))
+        with patch("slides.batch.build_decks") as build:
+            rc = cmd_batch(self._args([self._deck("a"), str(dup)]))
+        self.assertEqual(rc, 1)
+        build.assert_not_called()
+
+    def test_failed_deck_sets_exit_status(self) -> None:
+        with redirect_stdout(io.StringIO()):
+            rc = cmd_batch(self._args([self._deck("a"), self._deck("bad", "title: [x\n")], format="table"))
+        self.assertEqual(rc, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
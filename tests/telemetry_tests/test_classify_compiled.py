@@ -0,0 +1,162 @@
+"""Parity and throughput checks for the compiled classification rules."""
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from telemetry._classify_rules import compile_any
+from telemetry.classify import ClassifyEngine
+from telemetry.models import SessionEvent
+from telemetry.rules import load_rules
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Labels the engine produced before rule compilation and FileAccessTracker,
+# for _session(seed, n=300, ordered=...) classified with _rules() below.
+_BASELINE = json.loads(
+    (Path(__file__).resolve().parent / "fixtures" / "classify_baseline.json").read_text()
+)
+_BASELINE_EVENTS = 300
+
+_COMMANDS = [
+    "grep -rn foo src", "rg pattern", "cat README.md", "head -n 5 x", "tail -f log",
+    "find . -name '*.py'", "ls -la", "echo hi > out.txt", "tee out.txt", "cat <<EOF",
+    "git status", "python -m pytest -q", "make test", "npm run build", "docker ps | grep x",
+]
+_PATHS = [f"/src/mod{i}.py" for i in range(6)]
+_TOOLS = ["Read", "Read", "Edit", "MultiEdit", "Bash", "Bash", "Grep", "Glob", "Write", "Agent"]
+
+_CUSTOM_RULES = [
+    {"tool": "Bash", "pattern": r"docker\s+ps", "classification": "review", "reason": "docker-peek"},
+    {"pattern": r"^make\b", "classification": "neutral", "reason": "make"},
+    {"tool": "Write", "classification": "review", "reason": "any-write"},
+]
+
+
+def _session(seed: int, n: int = 400, ordered: bool = True) -> list[SessionEvent]:
+    rng = random.Random(seed)
+    events: list[SessionEvent] = []
+    t = 0.0
+    for seq in range(n):
+        t += rng.choice([0, 0, 1, 3, 8, 20, 45, 90])
+        ts = t if ordered else t + rng.uniform(-30, 30)
+        if rng.random() < 0.2:
+            events.append(SessionEvent(
+                timestamp=_BASE + timedelta(seconds=ts), event_type="api_request",
+                sequence=seq, session_id="s",
+            ))
+            continue
+        tool = rng.choice(_TOOLS)
+        if tool == "Bash":
+            tool_input = {"command": rng.choice(_COMMANDS)}
+        elif tool == "Agent":
+            tool_input = {"subagent_type": rng.choice(["general-purpose", "Explore"])}
+        else:
+            tool_input = {"file_path": rng.choice(_PATHS)}
+        events.append(SessionEvent(
+            timestamp=_BASE + timedelta(seconds=ts), event_type="tool_use", sequence=seq,
+            session_id="s", tool_name=tool, tool_input=tool_input,
+            success=False if rng.random() < 0.03 else None,
+        ))
+    return events
+
+
+def _labels(events):
+    return [[e.classification, e.waste_reason] for e in events]
+
+
+def _rules():
+    rules = load_rules(None)
+    rules["custom_rules"] = list(_CUSTOM_RULES)
+    rules["avoidable"]["rapid-re-edit"]["min_gap_seconds"] = 2
+    return rules
+
+
+def _classify(rules, events, use_trackers=True):
+    engine = ClassifyEngine(rules)
+    if use_trackers:
+        engine.classify(events)
+    else:
+        with patch("telemetry.classify._is_ordered", return_value=False):
+            engine.classify(events)
+    return _labels(events)
+
+
+class TestCompiledParity(unittest.TestCase):
+    def setUp(self):
+        self.rules = _rules()
+
+    def _assert_baseline(self, key, ordered):
+        for seed, expected in _BASELINE[key].items():
+            with self.subTest(seed=seed):
+                events = _session(int(seed), n=_BASELINE_EVENTS, ordered=ordered)
+                self.assertEqual(_classify(self.rules, events), expected)
+
+    def test_ordered_sessions_match_baseline(self):
+        self._assert_baseline("ordered", ordered=True)
+
+    def test_unordered_sessions_match_baseline(self):
+        self._assert_baseline("unordered", ordered=False)
+
+    def test_incremental_first_pass_matches_baseline(self):
+        events = _session(7, n=_BASELINE_EVENTS)
+        engine = ClassifyEngine(self.rules)
+        for start in range(0, len(events), 37):
+            engine._first_pass(events[:start + 37], start)
+        engine._second_pass(events)
+        self.assertEqual(_labels(events), _BASELINE["ordered"]["7"])
+
+    def test_rules_reassignment_recompiles(self):
+        engine = ClassifyEngine({})
+        engine.rules = {"custom_rules": [{"pattern": "^git", "classification": "review", "reason": "git"}]}
+        evt = _session(1, n=1)[0]
+        evt.event_type, evt.tool_name, evt.tool_input = "tool_use", "Bash", {"command": "git log"}
+        engine.classify([evt])
+        self.assertEqual(evt.waste_reason, "git")
+
+
+class TestCompileAny(unittest.TestCase):
+    def test_equivalent_to_any_search(self):
+        cases = [
+            [r"grep\b", r"\brg\b"],
+            [r"(?i)^cat", r"tail"],          # global flag cannot be joined
+            [r"(a)\1", r"b+"],               # backreference must stay separate
+            [r"\becho\b\s*>", r"cat\s*<<"],
+        ]
+        texts = ["grep x", "RG", "rg -n", "Cat file", "aa", "bbb", "echo >", "cat <<", "nothing"]
+        for patterns in cases:
+            matcher = compile_any(patterns)
+            for text in texts:
+                with self.subTest(patterns=patterns, text=text):
+                    self.assertEqual(bool(matcher(text)), any(re.search(p, text) for p in patterns))
+
+    def test_empty_is_none(self):
+        self.assertIsNone(compile_any([]))
+
+
+@unittest.skipUnless(os.environ.get("TELEMETRY_BENCH"), "set TELEMETRY_BENCH=1 to run the benchmark")
+class TestClassifyThroughput(unittest.TestCase):
+    """Events/s for the compiled path vs the backward-scan fallback."""
+
+    def test_throughput(self):
+        rules = _rules()
+        n = 50_000
+        timings = {}
+        for label, use_trackers in (("compiled", True), ("scan", False)):
+            events = _session(3, n=n)
+            started = time.perf_counter()
+            _classify(rules, events, use_trackers=use_trackers)
+            timings[label] = time.perf_counter() - started
+        for label, elapsed in timings.items():
+            print(f"\n{label:>9}: {n / elapsed:,.0f} events/s ({elapsed * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""Tests for the parallel, batched-state path of run_parse_transcripts."""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from telemetry import parse_transcripts_io as io_mod
+from telemetry.parse_transcripts import TranscriptParseProducer, TranscriptParseResult
+from telemetry.parse_transcripts_emit import ParseResult
+from telemetry.parse_transcripts_io import _process_one_line, run_parse_transcripts
+
+
+def _records(i: int) -> list[dict]:
+    return [
+        {"message": {"role": "user", "content": f"prompt {i}"}},
+        {"message": {"role": "assistant", "content": [
+            {"type": "tool_use", "name": "Bash", "input": {"command": f"ls {i}"}},
+        ]}},
+    ]
+
+
+class ParallelTestBase(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.addCleanup(self._td.cleanup)
+        self.tmpdir = Path(self._td.name)
+        self.projects_dir = self.tmpdir / "projects"
+        for i in range(10):
+            p = self.projects_dir / f"proj{i % 3}" / f"s{i}.jsonl"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text("".join(json.dumps(r) + "\n" for r in _records(i)), encoding="utf-8")
+
+    def _run(self, index_dir: Path, **kwargs) -> list[ParseResult]:
+        return run_parse_transcripts(
+            since="all", projects_dir=self.projects_dir, index_dir=index_dir,
+            force=kwargs.get("force", False), limit=0,
+        )
+
+    @staticmethod
+    def _snapshot(index_dir: Path) -> dict[str, dict]:
+        out = {}
+        for p in sorted(index_dir.glob("*.json")):
+            data = json.loads(p.read_text(encoding="utf-8"))
+            data.pop("last_updated", None)
+            out[p.name] = data
+        return out
+
+
+class TestParallelParity(ParallelTestBase):
+    def test_parallel_matches_serial(self):
+        parallel_dir = self.tmpdir / "parallel"
+        serial_dir = self.tmpdir / "serial"
+        parallel = self._run(parallel_dir)
+        with patch.object(io_mod, "_PARALLEL_MIN_FILES", 10_000):
+            serial = self._run(serial_dir)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(self._snapshot(parallel_dir), self._snapshot(serial_dir))
+        self.assertEqual(
+            json.loads((parallel_dir / ".state.json").read_text(encoding="utf-8")),
+            json.loads((serial_dir / ".state.json").read_text(encoding="utf-8")),
+        )
+
+    def test_same_stem_in_two_directories_keeps_both(self):
+        for proj in ("projA", "projB"):
+            p = self.projects_dir / proj / "dup.jsonl"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text("".join(json.dumps(r) + "\n" for r in _records(99)), encoding="utf-8")
+        parallel_dir = self.tmpdir / "parallel"
+        serial_dir = self.tmpdir / "serial"
+        self._run(parallel_dir)
+        with patch.object(io_mod, "_PARALLEL_MIN_FILES", 10_000):
+            self._run(serial_dir)
+
+        dup = json.loads((parallel_dir / "dup.json").read_text(encoding="utf-8"))
+        self.assertEqual(dup["prompt_count"], 2)
+        self.assertEqual(self._snapshot(parallel_dir), self._snapshot(serial_dir))
+
+    def test_same_stem_files_run_in_one_worker_job(self):
+        for proj in ("projA", "projB"):
+            p = self.projects_dir / proj / "dup.jsonl"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text("".join(json.dumps(r) + "\n" for r in _records(99)), encoding="utf-8")
+        submitted: list[list[str]] = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def submit(self, fn, jobs):
+                submitted.append(sorted(Path(job[0]).parent.name for job in jobs))
+                return super().submit(fn, jobs)
+
+        with patch.object(io_mod, "ProcessPoolExecutor", RecordingPool):
+            self._run(self.tmpdir / "index")
+        self.assertIn(["projA", "projB"], submitted)
+        self.assertEqual(len(submitted), 11)
+
+    def test_second_run_resumes_from_state(self):
+        index_dir = self.tmpdir / "index"
+        self._run(index_dir)
+        results = self._run(index_dir)
+        self.assertEqual({r.status for r in results}, {"skipped"})
+
+    def test_falls_back_to_serial_when_pool_unavailable(self):
+        index_dir = self.tmpdir / "index"
+        with patch.object(io_mod, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            results = self._run(index_dir)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r.status == "ok" for r in results))
+
+
+class TestBatchedStateCommit(ParallelTestBase):
+    def _state_writes(self, index_dir: Path) -> int:
+        state_path = index_dir / io_mod.STATE_FILE
+        real = io_mod.atomic_write_json
+        writes = []
+
+        def counting(path, data, **kwargs):
+            if Path(path) == state_path:
+                writes.append(dict(data))
+            return real(path, data, **kwargs)
+
+        with patch.object(io_mod, "_PARALLEL_MIN_FILES", 10_000), \
+                patch.object(io_mod, "atomic_write_json", side_effect=counting):
+            self._run(index_dir)
+        return len(writes)
+
+    def test_state_written_once_per_run(self):
+        self.assertEqual(self._state_writes(self.tmpdir / "index"), 1)
+
+    def test_periodic_checkpoints(self):
+        with patch.object(io_mod, "_CHECKPOINT_EVERY", 4):
+            self.assertEqual(self._state_writes(self.tmpdir / "index"), 3)  # 4 + 4 + final 2
+
+    def test_state_committed_when_run_is_interrupted(self):
+        index_dir = self.tmpdir / "index"
+        real = io_mod._parse_file_job
+        calls = []
+
+        def flaky(*args):
+            calls.append(args)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return real(*args)
+
+        with patch.object(io_mod, "_PARALLEL_MIN_FILES", 10_000), \
+                patch.object(io_mod, "_parse_file_job", side_effect=flaky), \
+                self.assertRaises(KeyboardInterrupt):
+            self._run(index_dir)
+        state = json.loads((index_dir / io_mod.STATE_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(len(state), 2)
+
+
+class TestLineDecoding(unittest.TestCase):
+    def _index(self) -> dict:
+        return {"prompts": [], "bash_commands": [], "tool_calls": []}
+
+    def test_decodes_bytes_line(self):
+        idx = self._index()
+        raw = json.dumps({"message": {"role": "user", "content": "héllo"}}).encode() + b"\n"
+        self.assertEqual(_process_one_line(raw, idx, 0, 0), (1, 0))
+        self.assertEqual(idx["prompts"][0]["text"], "héllo")
+
+    def test_invalid_utf8_is_replaced_not_dropped(self):
+        idx = self._index()
+        raw = b'{"message": {"role": "user", "content": "bad \xff byte"}}\n'
+        self.assertEqual(_process_one_line(raw, idx, 0, 0), (1, 0))
+        self.assertIn("�", idx["prompts"][0]["text"])
+
+    def test_malformed_and_blank_lines_return_none(self):
+        self.assertIsNone(_process_one_line(b"{not json\n", self._index(), 0, 0))
+        self.assertIsNone(_process_one_line(b"   \n", self._index(), 0, 0))
+        self.assertIsNone(_process_one_line(b"[1, 2]\n", self._index(), 0, 0))
+
+
+class TestThroughputReport(unittest.TestCase):
+    def test_table_output_reports_mb_per_s(self):
+        result = TranscriptParseResult(
+            results=[ParseResult("s1", 1, 0, 3_000_000, "ok"), ParseResult("s2", 0, 0, 1_000_000, "ok")],
+            elapsed_s=2.0,
+        )
+        self.assertAlmostEqual(result.mb_per_s, 2.0)
+        printed = []
+        producer = TranscriptParseProducer()
+        with patch.object(producer._writer, "print", side_effect=lambda *a, **k: printed.append(a)), \
+                patch("sys.stdout"):
+            producer._produce_success(result, {"fmt": "table"})  # noqa: SLF001
+        self.assertTrue(any("2.0 MB/s" in str(a[0]) for a in printed))
+
+
+if __name__ == "__main__":
+    unittest.main()
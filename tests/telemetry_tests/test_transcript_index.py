@@ -0,0 +1,163 @@
+"""Tests for the persistent session summary index (providers/transcript_index.py)."""
+from __future__ import annotations
+
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from telemetry.providers.transcript import TranscriptProvider
+from telemetry.providers.transcript_index import HOUR_S, SessionIndex, hour_floor
+
+from tests.telemetry_tests.shared_fixtures import (
+    TempProjectsDirMixin,
+    _write_jsonl,
+    make_assistant_record,
+)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class IndexTestBase(TempProjectsDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.index_path = self.projects_dir.parent / f"{self.projects_dir.name}-index.json"
+        self.addCleanup(lambda: self.index_path.unlink(missing_ok=True))
+        self.provider = TranscriptProvider(projects_dir=self.projects_dir, index_path=self.index_path)
+        self.pdir = self.project_dir()
+
+    def _counting(self, provider):
+        real = provider.parse_session_with_agents
+        calls: list = []
+
+        def counted(path):
+            calls.append(path.name)
+            return real(path)
+
+        provider.parse_session_with_agents = counted
+        return calls
+
+
+class TestIncrementalReparse(IndexTestBase):
+    def test_unchanged_files_are_not_reparsed(self):
+        _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record(input_tokens=10)])
+        _write_jsonl(self.pdir, "b.jsonl", [make_assistant_record(input_tokens=20)])
+        calls = self._counting(self.provider)
+
+        first = self.provider.get_sessions()
+        self.assertEqual(sorted(calls), ["a.jsonl", "b.jsonl"])
+        calls.clear()
+
+        second = self.provider.get_sessions()
+        self.assertEqual(calls, [])
+        self.assertEqual(
+            sorted((s.session_id, s.input_tokens) for s in first),
+            sorted((s.session_id, s.input_tokens) for s in second),
+        )
+
+    def test_appended_file_is_reparsed(self):
+        path = _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record(input_tokens=10)])
+        self.provider.get_sessions()
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(make_assistant_record(input_tokens=5)) + "\n")
+        calls = self._counting(self.provider)
+
+        sessions = self.provider.get_sessions()
+        self.assertEqual(calls, ["a.jsonl"])
+        self.assertEqual(sessions[0].input_tokens, 15)
+
+    def test_index_persists_across_providers(self):
+        _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record()])
+        self.provider.get_sessions()
+        fresh = TranscriptProvider(projects_dir=self.projects_dir, index_path=self.index_path)
+        calls = self._counting(fresh)
+
+        self.assertEqual(len(fresh.get_sessions()), 1)
+        self.assertEqual(calls, [])
+
+    def test_deleted_files_are_pruned(self):
+        path = _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record()])
+        self.provider.get_sessions()
+        path.unlink()
+        self.provider.get_sessions()
+        data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertEqual(data["files"], {})
+
+    def test_cost_multiplier_change_rebuilds(self):
+        _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record()])
+        self.provider.get_sessions()
+        with patch("telemetry.providers.transcript_index._cost_multiplier", return_value=2.0):
+            fresh = TranscriptProvider(projects_dir=self.projects_dir, index_path=self.index_path)
+        calls = self._counting(fresh)
+        fresh.get_sessions()
+        self.assertEqual(calls, ["a.jsonl"])
+
+
+class TestWindowedTotalsFromBuckets(IndexTestBase):
+    def test_buckets_summed_and_placed_in_clock_hour_slots(self):
+        now = datetime.now(timezone.utc)
+        this_hour = datetime.fromtimestamp(hour_floor(now.timestamp()), tz=timezone.utc)
+        _write_jsonl(self.pdir, "a.jsonl", [
+            make_assistant_record(timestamp=_iso(this_hour - timedelta(hours=2)), input_tokens=100),
+            make_assistant_record(timestamp=_iso(this_hour), input_tokens=50),
+            make_assistant_record(timestamp=_iso(this_hour - timedelta(hours=30)), input_tokens=999),
+        ])
+        totals = self.provider.get_windowed_totals(now - timedelta(hours=3))
+
+        self.assertEqual(totals["input_tokens"], 150)
+        self.assertEqual(totals["sessions"], 1)
+        hourly = totals["hourly_costs"]
+        self.assertGreater(hourly[-1], 0.0)
+        self.assertGreater(hourly[-3], 0.0)
+        self.assertEqual(hourly[-2], 0.0)
+        self.assertAlmostEqual(sum(hourly), totals["cost"])
+
+    def test_repeat_windows_reuse_index(self):
+        now = datetime.now(timezone.utc)
+        _write_jsonl(self.pdir, "a.jsonl", [make_assistant_record(timestamp=_iso(now))])
+        self.provider.get_windowed_totals(now - timedelta(hours=5))
+        calls = self._counting(self.provider)
+        self.provider.get_windowed_totals(now - timedelta(days=30))
+        self.provider.get_sessions(since=now - timedelta(days=1))
+        self.assertEqual(calls, [])
+
+
+class TestColdParallelParse(IndexTestBase):
+    def test_parallel_cold_parse_matches_serial(self):
+        now = datetime.now(timezone.utc)
+        for i in range(10):
+            _write_jsonl(self.pdir, f"s{i}.jsonl", [
+                make_assistant_record(timestamp=_iso(now - timedelta(minutes=i)), input_tokens=10 + i),
+            ])
+        parallel = self.provider.get_sessions()
+        serial_provider = TranscriptProvider(projects_dir=self.projects_dir)
+        with patch("telemetry.providers.transcript_index._PARALLEL_MIN_FILES", 10_000):
+            serial = serial_provider.get_sessions()
+
+        key = lambda s: (s.session_id, s.input_tokens, round(s.total_cost, 9), s.start_time)  # noqa: E731
+        self.assertEqual(sorted(map(key, parallel)), sorted(map(key, serial)))
+
+    def test_falls_back_to_serial_when_pool_unavailable(self):
+        for i in range(10):
+            _write_jsonl(self.pdir, f"s{i}.jsonl", [make_assistant_record()])
+        with patch("telemetry.providers.transcript_index.ProcessPoolExecutor", side_effect=OSError("no fork")):
+            sessions = self.provider.get_sessions()
+        self.assertEqual(len(sessions), 10)
+
+
+class TestSessionIndex(unittest.TestCase):
+    def test_lookup_requires_matching_size_and_mtime(self):
+        index = SessionIndex(None)
+        index.put("f.jsonl", {"size": 10, "mtime_ns": 5, "hours": {}})
+        self.assertIsNotNone(index.lookup("f.jsonl", 10, 5))
+        self.assertIsNone(index.lookup("f.jsonl", 11, 5))
+        self.assertIsNone(index.lookup("f.jsonl", 10, 6))
+
+    def test_hour_floor(self):
+        self.assertEqual(hour_floor(HOUR_S * 5 + 59), HOUR_S * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
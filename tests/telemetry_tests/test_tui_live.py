@@ -0,0 +1,154 @@
+"""Tests for telemetry/tui/_live.py — incremental tail-follow session model."""
+from __future__ import annotations
+
+import json
+import unittest
+
+from telemetry.blame import BlameEngine
+from telemetry.classify import ClassifyEngine
+from telemetry.rules import load_rules
+from telemetry.tips import TipsEngine
+from telemetry.tui._live import LiveSession
+from telemetry.tui._summary import SummaryConfig, compute_summary
+from tests.telemetry_tests.shared_fixtures import (
+    TempProjectsDirMixin,
+    make_agent_tool_use_result,
+    make_assistant_record,
+    make_tool_use_block,
+    make_user_record,
+)
+
+_CONFIG = SummaryConfig("live", None, cost_is_estimated=True)
+
+
+def _tool(n: int, name: str, tool_input: dict | None = None) -> dict:
+    return make_assistant_record(
+        session_id="live",
+        timestamp=f"2026-04-16T10:{n // 60:02d}:{n % 60:02d}Z",
+        tool_blocks=[make_tool_use_block(name, f"t{n}", tool_input)],
+    )
+
+
+def _session_records() -> list[dict]:
+    """A session exercising look-back and look-forward rules across chunk edges."""
+    records: list[dict] = []
+    n = 0
+
+    def add(name: str, tool_input: dict | None = None) -> None:
+        nonlocal n
+        n += 1
+        records.append(_tool(n, name, tool_input))
+
+    add("Skill", {"skill": "refactor"})
+    for i in range(4):
+        add("Grep", {"pattern": f"needle{i}"})
+    add("Edit", {"file_path": "/src/a.py"})  # write disproves the search run
+    add("Read", {"file_path": "/src/a.py"})
+    add("Read", {"file_path": "/src/a.py"})
+    add("Agent", {"description": "explore", "subagent_type": "general-purpose", "prompt": "x"})
+    records.append(make_user_record(
+        session_id="live", tool_use_id=f"t{n}",
+        tool_use_result=make_agent_tool_use_result(agent_id="a1"),
+    ))
+    add("Bash", {"command": "ls"})
+    add("Write", {"file_path": "/src/b.py"})  # write inside the agent window
+    add("Agent", {"description": "second", "subagent_type": "general-purpose", "prompt": "y"})
+    for i in range(5):
+        add("Glob", {"pattern": f"**/*{i}.py"})
+    return records
+
+
+def _full_view(provider, path, rules):
+    events, agents = provider.parse_session_with_agents(path)
+    ClassifyEngine(rules).classify(events)
+    BlameEngine(rules).attribute(events)
+    return events, agents, compute_summary(events, agents, _CONFIG)
+
+
+def _labels(events):
+    return [
+        (e.sequence, e.classification, e.waste_reason,
+         e.blame_target.name if e.blame_target else None)
+        for e in events
+    ]
+
+
+class TestLiveSessionParity(TempProjectsDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.rules = load_rules(None)
+        self.path = self.project_dir("p") / "live.jsonl"
+        self.lines = [json.dumps(r) + "\n" for r in _session_records()]
+        self.live = LiveSession(
+            self.path, ClassifyEngine(self.rules), BlameEngine(self.rules), self.provider,
+        )
+
+    def _append(self, text: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(text)
+
+    def _assert_parity(self):
+        events, agents, summary = _full_view(self.provider, self.path, self.rules)
+        self.assertEqual(_labels(self.live.events), _labels(events))
+        self.assertEqual(len(self.live.agents), len(agents))
+        live_summary = self.live.summary(_CONFIG)
+        for attr in ("total_events", "productive_count", "neutral_count", "avoidable_count",
+                     "review_count", "input_tokens", "cache_read_tokens", "model", "end_time"):
+            self.assertEqual(getattr(live_summary, attr), getattr(summary, attr), attr)
+        self.assertAlmostEqual(live_summary.total_cost, summary.total_cost)
+        self.assertAlmostEqual(live_summary.efficiency_score, summary.efficiency_score)
+        self.assertEqual(live_summary.tool_stats, summary.tool_stats)
+        tips = TipsEngine(self.rules)
+        self.assertEqual(self.live.tips(tips, max_tips=5), tips.generate(events, max_tips=5))
+
+    def test_matches_full_reclassification_after_every_append(self):
+        self.path.touch()
+        for line in self.lines:
+            self._append(line)
+            self.live.poll()
+            self._assert_parity()
+
+    def test_partial_line_is_held_until_complete(self):
+        first, second = self.lines[0], self.lines[1]
+        self._append(first + second[:10])
+        update = self.live.poll()
+        self.assertEqual(len(update.new_events), 2)  # api_request + tool_use
+        self._append(second[10:])
+        update = self.live.poll()
+        self.assertEqual(len(update.new_events), 2)
+        self._assert_parity()
+
+    def test_later_write_relabels_provisional_marks(self):
+        self.path.touch()
+        for line in self.lines[:5]:  # Skill + four Greps, no write yet
+            self._append(line)
+        self.live.poll()
+        self.assertTrue(any(e.waste_reason == "abandoned-search" for e in self.live.events))
+        self._append(self.lines[5])  # Edit
+        update = self.live.poll()
+        self.assertTrue(update.relabelled)
+        self.assertFalse(any(e.waste_reason == "abandoned-search" for e in self.live.events))
+        self._assert_parity()
+
+    def test_truncated_file_resets(self):
+        self._append("".join(self.lines))
+        self.live.poll()
+        with open(self.path, "w", encoding="utf-8") as fh:
+            fh.write(self.lines[0])
+        update = self.live.poll()
+        self.assertTrue(update.reset)
+        self._assert_parity()
+
+    def test_no_new_lines_is_a_no_op(self):
+        self._append("".join(self.lines))
+        self.live.poll()
+        update = self.live.poll()
+        self.assertFalse(update.changed)
+
+    def test_missing_file_raises_oserror(self):
+        with self.assertRaises(OSError):
+            self.live.poll()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,7 @@ def make_mock_search_args(**overrides) -> MagicMock:
 
     All fields mirror the argparse namespace produced by cmd_search:
       from_me, from_them, db, contains, match_all, match_any,
-      contact, since_days, limit, json.
+      contact, since_days, limit, json, fts, index_path.
 
     Pass keyword arguments to override any default:
 
@@ -31,4 +31,41 @@ def make_mock_search_args(**overrides) -> MagicMock:
     args.since_days = overrides.get("since_days", None)
     args.limit = overrides.get("limit", 50)
     args.json = overrides.get("json", False)
+    args.fts = overrides.get("fts", False)
+    args.index_path = overrides.get("index_path", None)
     return args
+
+
+def make_chat_storage(path: str, messages: list[tuple[str, int, str]]) -> None:
+    """Create a minimal ChatStorage.sqlite at ``path``.
+
+    ``messages`` is a list of ``(partner, from_me, text)``; rows get ascending
+    Z_PK values and recent Apple-epoch timestamps one minute apart.
+    """
+    import sqlite3
+    import time
+
+    from whatsapp.search import APPLE_EPOCH_OFFSET
+
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE ZWACHATSESSION (Z_PK INTEGER PRIMARY KEY, ZPARTNERNAME TEXT)")
+    conn.execute(
+        "CREATE TABLE ZWAMESSAGE (Z_PK INTEGER PRIMARY KEY, ZCHATSESSION INTEGER, "
+        "ZMESSAGEDATE REAL, ZISFROMME INTEGER, ZTEXT TEXT)"
+    )
+    add_chat_messages(conn, messages, base=time.time() - APPLE_EPOCH_OFFSET - 3600)
+    conn.close()
+
+
+def add_chat_messages(conn, messages: list[tuple[str, int, str]], base: float) -> None:
+    """Append messages to an open ChatStorage connection and commit."""
+    sessions = {name: pk for pk, name in conn.execute("SELECT Z_PK, ZPARTNERNAME FROM ZWACHATSESSION")}
+    for i, (partner, from_me, text) in enumerate(messages):
+        if partner not in sessions:
+            cur = conn.execute("INSERT INTO ZWACHATSESSION (ZPARTNERNAME) VALUES (?)", (partner,))
+            sessions[partner] = cur.lastrowid
+        conn.execute(
+            "INSERT INTO ZWAMESSAGE (ZCHATSESSION, ZMESSAGEDATE, ZISFROMME, ZTEXT) VALUES (?, ?, ?, ?)",
+            (sessions[partner], base + i * 60, from_me, text),
+        )
+    conn.commit()
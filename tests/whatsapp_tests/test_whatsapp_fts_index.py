@@ -0,0 +1,114 @@
+"""Tests for the WhatsApp FTS5 sidecar index."""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+import unittest
+
+from core.cli_errors import NotFoundError
+from tests.fixtures import TempDirMixin
+from tests.whatsapp_tests.fixtures import add_chat_messages, make_chat_storage
+from whatsapp import fts_index
+from whatsapp.search import APPLE_EPOCH_OFFSET, MessageQuery, search_messages
+
+
+class TestBuildMatchExpression(unittest.TestCase):
+    def test_or_joins_quoted_terms(self):
+        expr = fts_index.build_match_expression(["hello", " world "], match_all=False)
+        self.assertEqual(expr, '"hello" OR "world"')
+
+    def test_and_with_phrase_and_prefix(self):
+        expr = fts_index.build_match_expression(["school trip", "pick*"], match_all=True)
+        self.assertEqual(expr, '"school trip" AND "pick"*')
+
+    def test_escapes_quotes_and_drops_blanks(self):
+        expr = fts_index.build_match_expression(['say "hi"', "", "*", None], match_all=False)
+        self.assertEqual(expr, '"say ""hi"""')
+
+
+class TestFtsIndex(TempDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = os.path.join(self.tmpdir, "ChatStorage.sqlite")
+        self.idx = os.path.join(self.tmpdir, "sidecar", "index.sqlite")
+        make_chat_storage(
+            self.db,
+            [
+                ("Teacher", 0, "School trip on Friday"),
+                ("Teacher", 1, "Thanks, who is picking up?"),
+                ("Alice", 0, "Pickup at school school school"),
+                ("Bob", 1, "Dinner tonight?"),
+            ],
+        )
+
+    def _digest(self) -> str:
+        with open(self.db, "rb") as fh:
+            return hashlib.sha256(fh.read()).hexdigest()
+
+    def test_refresh_is_incremental_and_never_writes_source(self):
+        before = self._digest()
+        stats = fts_index.refresh_index(self.db, self.idx)
+        self.assertEqual((stats.added, stats.total, stats.max_pk), (4, 4, 4))
+        self.assertEqual(self._digest(), before)
+
+        again = fts_index.refresh_index(self.db, self.idx)
+        self.assertEqual((again.added, again.total), (0, 4))
+
+        conn = sqlite3.connect(self.db)
+        add_chat_messages(conn, [("Bob", 0, "Dinner at eight")], base=time.time() - APPLE_EPOCH_OFFSET)
+        conn.close()
+        after = fts_index.refresh_index(self.db, self.idx)
+        self.assertEqual((after.added, after.total, after.max_pk), (1, 5, 5))
+
+    def test_rebuild_resets_contents(self):
+        fts_index.refresh_index(self.db, self.idx)
+        stats = fts_index.refresh_index(self.db, self.idx, rebuild=True)
+        self.assertEqual((stats.added, stats.total), (4, 4))
+
+    def test_search_ranks_by_bm25(self):
+        fts_index.refresh_index(self.db, self.idx)
+        rows = fts_index.search_index(self.idx, MessageQuery(contains=["school"]))
+        self.assertEqual([r.partner for r in rows], ["Alice", "Teacher"])
+
+    def test_phrase_prefix_and_filters(self):
+        fts_index.refresh_index(self.db, self.idx)
+        phrase = fts_index.search_index(self.idx, MessageQuery(contains=["school trip"]))
+        self.assertEqual([r.text for r in phrase], ["School trip on Friday"])
+        prefix = fts_index.search_index(self.idx, MessageQuery(contains=["pick*"], from_me=True))
+        self.assertEqual([r.text for r in prefix], ["Thanks, who is picking up?"])
+        both = fts_index.search_index(
+            self.idx, MessageQuery(contains=["school", "friday"], match_all=True, contact="teach")
+        )
+        self.assertEqual(len(both), 1)
+        recent = fts_index.search_index(self.idx, MessageQuery(since_days=1, limit=2))
+        self.assertEqual([r.partner for r in recent], ["Bob", "Alice"])
+
+    def test_terms_match_text_not_partner_name(self):
+        conn = sqlite3.connect(self.db)
+        add_chat_messages(conn, [("School Parents", 0, "Bake sale tomorrow")], base=time.time() - APPLE_EPOCH_OFFSET)
+        conn.close()
+        fts_index.refresh_index(self.db, self.idx)
+        rows = fts_index.search_index(self.idx, MessageQuery(contains=["school"]))
+        self.assertNotIn("School Parents", [r.partner for r in rows])
+        rows = fts_index.search_index(self.idx, MessageQuery(contains=["bake"], contact="school"))
+        self.assertEqual([r.text for r in rows], ["Bake sale tomorrow"])
+
+    def test_matches_like_search_for_plain_terms(self):
+        fts_index.refresh_index(self.db, self.idx)
+        q = MessageQuery(contains=["dinner", "friday"])
+        self.assertEqual(
+            sorted(r.text for r in fts_index.search_index(self.idx, q)),
+            sorted(r.text for r in search_messages(self.db, q)),
+        )
+
+    def test_missing_paths_raise_not_found(self):
+        with self.assertRaises(NotFoundError):
+            fts_index.refresh_index(os.path.join(self.tmpdir, "nope.sqlite"), self.idx)
+        with self.assertRaises(NotFoundError):
+            fts_index.search_index(os.path.join(self.tmpdir, "nope.sqlite"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -248,5 +248,36 @@ class TestSearchQueryRemoved(unittest.TestCase):
         self.assertEqual(req.output_format, OutputFormat.TEXT)
 
 
+class TestIndexPipeline(unittest.TestCase):
+    """Tests for the FTS5 sidecar path through the pipeline."""
+
+    @patch("whatsapp.pipeline.search_messages")
+    @patch("whatsapp.pipeline.search_index")
+    @patch("whatsapp.pipeline.refresh_index")
+    def test_use_index_refreshes_then_searches_sidecar(self, mock_refresh, mock_search_index, mock_search):
+        mock_search_index.return_value = [MessageRow(ts="t", partner="A", from_me=0, text="x")]
+        req = SearchRequest(db_path="/db", contains=["x"], use_index=True, index_path="/idx")
+        envelope = SearchProcessor().process(SearchRequestConsumer(req).consume())
+
+        self.assertTrue(envelope.ok())
+        mock_refresh.assert_called_once_with(db_path="/db", index_path="/idx")
+        self.assertEqual(mock_search_index.call_args.kwargs["index_path"], "/idx")
+        mock_search.assert_not_called()
+
+    @patch("whatsapp.pipeline.refresh_index")
+    def test_index_processor_and_producer(self, mock_refresh):
+        from whatsapp.fts_index import IndexStats
+        from whatsapp.pipeline import IndexProcessor, IndexProducer, IndexRequest
+
+        mock_refresh.return_value = IndexStats(index_path="/idx", added=3, max_pk=9, total=7, elapsed_s=0.5)
+        envelope = IndexProcessor().process(IndexRequest(db_path="/db", rebuild=True, output_format=OutputFormat.JSON))
+        mock_refresh.assert_called_once_with(db_path="/db", index_path=None, rebuild=True)
+
+        captured = io.StringIO()
+        with patch("sys.stdout", captured):
+            IndexProducer().produce(envelope)
+        self.assertIn('"added": 3', captured.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -55,6 +55,8 @@ def _make_diagnose_args(**overrides):
         ping_timeout=5.0,
         trace_hops=12,
         survey_count=4,
+        jobs=8,
+        history=None,
         json=False,
         out=None,
     )
@@ -0,0 +1,159 @@
+"""Tests for concurrent probes in run_diagnosis and wifi/monitor.py history/percentiles."""
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from wifi.cli import cmd_monitor
+from wifi.diagnostics_probes import DnsResult, HttpResult, run_diagnosis
+from wifi.diagnostics_report import DiagnoseConfig, DiagnoseResults, compute_condition, derive_findings, history_condition
+from wifi.diagnostics_runners import CommandResult
+from wifi.monitor import HistoryFile, MonitorConfig, Sample, run_monitor, summarize
+
+from tests.wifi_tests.shared_fixtures import FakeRunner
+
+
+def _ping_out(loss: float, avg: float) -> str:
+    received = 4 if loss < 50 else 0
+    return (
+        f"4 packets transmitted, {received} packets received, {loss}% packet loss\n"
+        f"round-trip min/avg/max/stddev = 1.0/{avg}/{avg * 2}/0.5 ms\n"
+    )
+
+
+class SlowRunner(FakeRunner):
+    """FakeRunner whose pings take ``delay`` seconds; records peak concurrency."""
+
+    def __init__(self, delay: float):
+        super().__init__({"ping": CommandResult(stdout=_ping_out(0.0, 5.0), stderr="", returncode=0)})
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run(self, cmd, timeout=None):
+        if cmd[0] == "ping":
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(self.delay)
+            with self._lock:
+                self.active -= 1
+        return super().run(cmd, timeout)
+
+
+def _resolver(host):
+    return DnsResult(host=host, success=True, addresses=["1.2.3.4"], elapsed_ms=9.0)
+
+
+def _http(url):
+    return HttpResult(url=url, success=True, status=200, elapsed_ms=150.0, bytes_read=10)
+
+
+def _sample(t: float, gw: list, up: list, dns: float | None = 10.0, failed: list | None = None) -> Sample:
+    return Sample(t=t, pings={"gateway": gw, "1.1.1.1": up}, dns_ms=dns, http_ms=None, failed=failed or [])
+
+
+class TestConcurrentDiagnosis(unittest.TestCase):
+    def _config(self, **kwargs) -> DiagnoseConfig:
+        return DiagnoseConfig(ping_targets=["1.1.1.1", "8.8.8.8"], gateway="192.168.1.1", include_trace=False,
+                              include_wifi=False, **kwargs)
+
+    def test_probes_overlap_and_keep_target_order(self):
+        runner = SlowRunner(delay=0.1)
+        started = time.monotonic()
+        report = run_diagnosis(self._config(), runner=runner, resolver=_resolver, http_probe_fn=_http)
+        elapsed = time.monotonic() - started
+        self.assertLess(elapsed, 0.4)  # six pings of 0.1 s each would take 0.6 s in sequence
+        self.assertEqual(runner.peak, 6)
+        self.assertEqual([p.label for p in report.ping_results], ["gateway", "1.1.1.1", "8.8.8.8"])
+        self.assertEqual([p.label for p in report.survey_results], ["survey-gateway", "survey-1.1.1.1", "survey-8.8.8.8"])
+        self.assertEqual(report.http.status, 200)
+
+    def test_single_worker_runs_in_order(self):
+        runner = SlowRunner(delay=0.0)
+        run_diagnosis(self._config(max_workers=1, run_survey=False), runner=runner, resolver=_resolver, http_probe_fn=_http)
+        self.assertEqual(runner.peak, 1)
+        self.assertEqual([c[-1] for c in runner.calls], ["192.168.1.1", "1.1.1.1", "8.8.8.8"])
+
+
+class TestHistoryFile(unittest.TestCase):
+    def test_append_trims_to_newest_samples_and_skips_torn_lines(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "h.jsonl"
+            history = HistoryFile(path, max_samples=4)
+            for i in range(6):
+                history.append(_sample(float(i), [0.0, 2.0, 3.0], [0.0, 20.0, 30.0]))
+            self.assertEqual(len(path.read_text().splitlines()), 4)
+            with path.open("a") as fh:
+                fh.write('{"t": 9, "p"')
+            samples = HistoryFile(path).read()
+            self.assertEqual([s.t for s in samples], [2.0, 3.0, 4.0, 5.0])
+            self.assertEqual([s.t for s in HistoryFile(path).read(since=4.0)], [4.0, 5.0])
+            self.assertNotIn(" ", path.read_text().splitlines()[0])
+
+
+class TestSummarize(unittest.TestCase):
+    def test_percentiles_and_failure_rates(self):
+        samples = [_sample(float(i), [0.0, float(i + 1), 0.0], [0.0, 20.0, 0.0]) for i in range(19)]
+        samples.append(_sample(19.0, [50.0, 200.0, 0.0], [None, None, None], dns=None, failed=["d"]))
+        summary = summarize(samples)
+        gw = summary.target("gateway")
+        self.assertEqual((gw.latency_p50, gw.latency_p95), (10.0, 19.0))
+        self.assertEqual(gw.lossy_pct, 5.0)
+        self.assertEqual(summary.target("1.1.1.1").loss_mean, 5.0)
+        self.assertEqual(summary.dns_fail_pct, 5.0)
+        self.assertEqual(summary.http_fail_pct, 0.0)
+        self.assertIsNone(summarize([]))
+
+    def test_history_drives_findings_and_condition(self):
+        samples = [_sample(float(i), [30.0 if i % 3 == 0 else 0.0, 4.0, 8.0], [0.0, 20.0, 30.0]) for i in range(9)]
+        summary = summarize(samples)
+        self.assertEqual(history_condition(summary), "bad")
+        snapshot = dict(ping_results=[], icmp_filtered=False, http=None,
+                        dns=DnsResult(host="h", success=True, addresses=[], elapsed_ms=5.0))
+        self.assertEqual(compute_condition(**snapshot), "good")
+        self.assertEqual(compute_condition(**snapshot, history=summary), "bad")
+        findings = derive_findings(DiagnoseResults(gateway="gw", trace=None, history=summary, **snapshot))
+        self.assertTrue(any("Intermittent Wi-Fi loss: 33%" in f for f in findings))
+
+
+class TestRunMonitor(unittest.TestCase):
+    def test_samples_at_interval_into_history(self):
+        runner = FakeRunner({"ping": CommandResult(stdout=_ping_out(0.0, 4.0), stderr="", returncode=0)})
+        with tempfile.TemporaryDirectory() as td:
+            cfg = MonitorConfig(ping_targets=["1.1.1.1"], gateway="192.168.1.1", samples=3, interval_s=30.0,
+                                history_path=Path(td) / "h.jsonl")
+            sleeps: list[float] = []
+            seen: list[Sample] = []
+            summary = run_monitor(cfg, runner=runner, resolver=_resolver, http_probe_fn=_http,
+                                  on_sample=seen.append, sleep=sleeps.append)
+            lines = (Path(td) / "h.jsonl").read_text().splitlines()
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(len(sleeps), 2)
+        self.assertTrue(all(29 < s <= 30 for s in sleeps))
+        self.assertEqual(json.loads(lines[0])["p"]["gateway"], [0.0, 4.0, 8.0])
+        self.assertEqual((summary.samples, summary.http_p50), (3, 150.0))
+
+    def test_cmd_monitor_prints_samples_and_summary(self):
+        runner = FakeRunner({"ping": CommandResult(stdout=_ping_out(0.0, 4.0), stderr="", returncode=0)})
+        with tempfile.TemporaryDirectory() as td:
+            args = MagicMock(targets=["1.1.1.1"], gateway="192.168.1.1", ping_count=4, ping_timeout=5.0, dns_host="h",
+                             http_url="u", no_http=True, interval=0.0, samples=2, history=str(Path(td) / "h.jsonl"),
+                             max_samples=100, jobs=4)
+            writer = MagicMock()
+            with patch("wifi.monitor.SubprocessRunner", return_value=runner), patch("wifi.monitor.dns_lookup", _resolver):
+                self.assertEqual(cmd_monitor(args, writer=writer), 0)
+        lines = [c.args[0] for c in writer.print.call_args_list]
+        self.assertIn("gateway 0% 4.0ms | 1.1.1.1 0% 4.0ms | dns 9ms", lines[0])
+        self.assertTrue(any(line.startswith("Monitor history (2 samples") for line in lines))
+        self.assertIn("Condition: good", lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
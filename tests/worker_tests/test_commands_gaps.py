@@ -206,6 +206,29 @@ class TestHandleOutcome(unittest.TestCase, QueueRootIsolationMixin):
             _handle_outcome(self._make_outcome_ctx(proc, ctx), False, "transient error")
         self.assertTrue((self.root / "pending" / "h_retry.json").exists())
 
+    def test_finished_workflow_stage_is_published(self):
+        from worker.job_runtime import _handle_outcome
+        proc = self._make_proc_path("h_wf")
+        ctx = self._make_ctx("h_wf")
+        ctx.job_type = "workflow_stage"
+        with patch("worker.job_runtime.log_perf_jsonl"), \
+             patch("worker.job_runtime.q.finish", side_effect=self._patched_finish), \
+             patch("workflow.completion.publish_stage_result") as publish:
+            _handle_outcome(self._make_outcome_ctx(proc, ctx), False, "terminal-bad-script")
+        publish.assert_called_once()
+        self.assertFalse(publish.call_args.kwargs["success"])
+
+    def test_retried_workflow_stage_is_not_published(self):
+        from worker.job_runtime import _handle_outcome
+        proc = self._make_proc_path("h_wf_retry")
+        ctx = self._make_ctx("h_wf_retry", attempts=0, max_attempts=3)
+        ctx.job_type = "workflow_stage"
+        with patch("worker.job_runtime.log_perf_jsonl"), \
+             patch("worker.job_runtime.q.retry", side_effect=self._patched_retry), \
+             patch("workflow.completion.publish_stage_result") as publish:
+            _handle_outcome(self._make_outcome_ctx(proc, ctx), False, "transient error")
+        publish.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # JobProcessor
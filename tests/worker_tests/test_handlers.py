@@ -152,6 +152,41 @@ class TestHandleWorkflowStageCLIPath(unittest.TestCase):
         self.assertEqual(mock_exec.call_args.kwargs.get("cwd"), "/tmp/custom-cwd")  # nosec B108 - test string only
 
 
+class TestHandleRunCliInprocess(unittest.TestCase):
+    """run_cli jobs opt into the warm in-process pool per payload or via env."""
+
+    def _run(self, payload: dict, env: dict | None = None):
+        from worker.handlers import handle_run_cli
+        job = {"id": "t", "type": "run_cli", "payload": {"cmd": ["mail-assistant", "labels", "list"], **payload}}
+        result = {"returncode": 0, "stdout": "", "stderr": ""}
+        with patch.dict("os.environ", env or {"DANCING_BEAR_INPROCESS_CLI": ""}), \
+             patch("worker.handlers._is_allowed_bin", return_value=True), \
+             patch("worker.handlers._execute_subprocess", return_value=result) as mock_sub, \
+             patch("worker.handlers._execute_inprocess", return_value=result) as mock_inproc:
+            ok, _ = handle_run_cli(job)
+        self.assertTrue(ok)
+        return mock_sub, mock_inproc
+
+    def test_subprocess_by_default(self) -> None:
+        mock_sub, mock_inproc = self._run({})
+        mock_sub.assert_called_once()
+        mock_inproc.assert_not_called()
+
+    def test_payload_flag_routes_to_pool(self) -> None:
+        mock_sub, mock_inproc = self._run({"inprocess": True})
+        mock_sub.assert_not_called()
+        self.assertEqual(mock_inproc.call_args.args[0], "mail")
+        self.assertEqual(mock_inproc.call_args.args[1], ["mail-assistant", "labels", "list"])
+
+    def test_env_opt_in_routes_to_pool(self) -> None:
+        _, mock_inproc = self._run({}, env={"DANCING_BEAR_INPROCESS_CLI": "1"})
+        mock_inproc.assert_called_once()
+
+    def test_payload_false_overrides_env(self) -> None:
+        mock_sub, _ = self._run({"inprocess": False}, env={"DANCING_BEAR_INPROCESS_CLI": "1"})
+        mock_sub.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Error path
 # ---------------------------------------------------------------------------
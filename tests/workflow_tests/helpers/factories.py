@@ -178,6 +178,8 @@ def make_cli_args(**kwargs: object) -> MagicMock:
         "params": [],
         "workspace": None,
         "run_id": None,
+        "jobs": None,
+        "wait": 0.0,
         "execute": False,
         "strict": False,
         "check_commands": False,
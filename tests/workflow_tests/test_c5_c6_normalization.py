@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import tempfile
 import unittest
 from unittest.mock import patch
@@ -84,6 +85,7 @@ class TestWorkflowCompileErrorIsCliError(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestLoadDefinitionRaisesCLIError(unittest.TestCase):
     """_load_definition must raise CLIError, never SystemExit."""
 
@@ -133,6 +135,7 @@ class TestLoadDefinitionRaisesCLIError(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestLoadManifestRaisesCLIError(unittest.TestCase):
     """_load_manifest must raise CLIError on both parse and compile failures."""
 
@@ -218,6 +221,7 @@ stages:
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestBuildResolvedParamsRaisesCLIError(unittest.TestCase):
     """_build_resolved_params must raise CLIError when the YAML is unparseable."""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -277,6 +278,7 @@ class TestRenderCompileOutput(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestBuildCompilePayload(unittest.TestCase):
     def test_payload_contains_name(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -336,6 +338,7 @@ class TestBuildCompilePayload(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestCmdCompile(unittest.TestCase):
     def test_returns_zero_on_valid_workflow(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
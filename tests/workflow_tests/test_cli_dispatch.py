@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -327,6 +328,7 @@ class TestConfirmExecution(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestLoadDefinition(unittest.TestCase):
     def test_valid_yaml_returns_definition(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -350,6 +352,7 @@ class TestLoadDefinition(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestLoadManifest(unittest.TestCase):
     def test_valid_yaml_returns_defn_and_manifest(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -368,6 +371,7 @@ class TestLoadManifest(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestBuildResolvedParams(unittest.TestCase):
     def test_cli_params_override_defaults(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -388,6 +392,7 @@ class TestBuildResolvedParams(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestCmdParse(unittest.TestCase):
     def test_returns_zero_on_valid_workflow(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -562,6 +567,7 @@ stages:
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestCmdList(unittest.TestCase):
     def test_returns_one_when_no_workflows_dir(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -727,6 +733,7 @@ class TestCmdResume(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestCmdInitWorkspace(unittest.TestCase):
     def test_returns_zero_and_prints_workspace_path(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -809,6 +816,7 @@ class TestCmdInitWorkspace(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestCmdRunDryRun(unittest.TestCase):
     def test_dry_run_returns_zero(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import io
+import os
 import sys
 import tempfile
 import unittest
@@ -195,6 +196,7 @@ class TestWorkflowStatusFriendlyErrors(unittest.TestCase):
             self.assertNotIn("deleted worktree", combined)
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestWorkflowMainSeparatorNormalization(unittest.TestCase):
     """workflow main() applies CLIApp's optional '--' separator normalization
     exactly once — regression coverage for the argv double-normalization bug
@@ -257,6 +259,7 @@ class TestWorkflowMainSeparatorNormalization(unittest.TestCase):
         self.assertNotIn("unrecognized arguments", combined)
 
 
+@patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0"})
 class TestBuildCliCommandWorkflowRoundTrip(unittest.TestCase):
     """workflow.compiler._build_cli_command's emitted '--' must round-trip
     through workflow.cli.main — this is the actual producer/consumer pair
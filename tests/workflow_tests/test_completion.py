@@ -0,0 +1,132 @@
+"""Tests for workflow.completion and orchestrator waits on worker-queued stages."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from tests.workflow_tests.helpers.factories import (
+    make_resolved_stage,
+    make_stage_result,
+    make_stage_spec,
+    make_workflow_definition,
+    make_workflow_manifest,
+)
+from workflow.completion import CompletionChannel, notify_stage_complete, publish_stage_result
+from workflow.models import StageStatus
+from workflow.orchestrator import OrchestratorConfig, WorkflowOrchestrator
+from workflow.persistence import read_stage_result, write_stage_result
+
+_needs_fifo = unittest.skipUnless(hasattr(os, "mkfifo"), "requires os.mkfifo")
+
+
+def _job(workspace: Path, stage: str, index: int = 0, job_id: str = "job-1") -> dict:
+    return {"id": job_id, "payload": {"workspace_dir": str(workspace), "stage_name": stage, "stage_index": index}}
+
+
+@_needs_fifo
+class TestCompletionChannel(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.workspace = Path(td.name)
+
+    def test_notification_wakes_waiter(self) -> None:
+        with CompletionChannel(self.workspace) as channel:
+            self.assertTrue(channel.open())
+            threading.Timer(0.05, notify_stage_complete, (self.workspace, "build")).start()
+            start = time.monotonic()
+            self.assertEqual(channel.wait(5.0), ["build"])
+            self.assertLess(time.monotonic() - start, 2.0)
+            self.assertEqual(channel.wait(0.01), [])
+        self.assertFalse((self.workspace / ".completions").exists())
+
+    def test_notify_without_listener_is_dropped(self) -> None:
+        self.assertFalse(notify_stage_complete(self.workspace, "build"))
+        planted = self.workspace / ".completions"
+        planted.write_text("")
+        self.assertFalse(notify_stage_complete(self.workspace, "build"))
+        self.assertEqual(planted.read_text(), "")
+
+    def test_publish_writes_result_then_notifies(self) -> None:
+        with CompletionChannel(self.workspace) as channel:
+            channel.open()
+            result = publish_stage_result(_job(self.workspace, "build", 3), success=False, output="boom", duration_ms=1500)
+            self.assertEqual(channel.wait(1.0), ["build"])
+        stored = read_stage_result(self.workspace, "build")
+        self.assertEqual(stored, result)
+        self.assertEqual(stored.status, StageStatus.failed)
+        self.assertEqual((stored.stage_index, stored.errors, stored.data["job_id"]), (3, ["boom"], "job-1"))
+
+
+class QueueingDispatcher:
+    """Returns pending for ``queued`` stages (as WorkerQueueDispatcher does) and
+    completes them from a background "worker" after ``delay`` seconds."""
+
+    def __init__(self, queued: set[str], delay: float | None = 0.05):
+        self.queued = queued
+        self.delay = delay
+        self.calls: list[str] = []
+
+    def dispatch_group(self, stages, workspace_dir):
+        (stage,) = stages
+        name = stage.spec.name
+        self.calls.append(name)
+        if name not in self.queued:
+            return {name: make_stage_result(stage_name=name, stage_index=stage.index)}
+        job_id = f"job-{name}"
+        pending = make_stage_result(
+            stage_name=name, stage_index=stage.index, status=StageStatus.pending, data={"job_id": job_id},
+        )
+        write_stage_result(workspace_dir, pending)
+        if self.delay is not None:
+            threading.Timer(
+                self.delay, publish_stage_result,
+                (_job(workspace_dir, name, stage.index, job_id),), {"success": True, "output": "ok"},
+            ).start()
+        return {name: pending}
+
+
+def _run(dispatcher, tmp_dir, *, await_pending):
+    specs = (make_stage_spec(name="queued"), make_stage_spec(name="after", depends_on=("queued",)))
+    stages = {s.name: make_resolved_stage(spec=s, index=i) for i, s in enumerate(specs)}
+    manifest = make_workflow_manifest(
+        definition=make_workflow_definition(stages=specs), parallel_groups=(), resolved_stages=stages,
+    )
+    config = OrchestratorConfig(manifest=manifest, workspace_dir=tmp_dir, run_id="r", await_pending=await_pending)
+    return WorkflowOrchestrator(config, dispatcher=dispatcher).run()
+
+
+@_needs_fifo
+class TestOrchestratorAwaitsQueuedStages(unittest.TestCase):
+    def test_dependents_run_when_worker_completes(self) -> None:
+        dispatcher = QueueingDispatcher({"queued"})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run = _run(dispatcher, tmp_dir, await_pending=10.0)
+        self.assertEqual(run.status, StageStatus.success)
+        self.assertEqual(dispatcher.calls, ["queued", "after"])
+        self.assertEqual(run.stage_results["queued"].data["output"], "ok")
+
+    def test_times_out_as_pending(self) -> None:
+        dispatcher = QueueingDispatcher({"queued"}, delay=None)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.monotonic()
+            run = _run(dispatcher, tmp_dir, await_pending=0.1)
+        self.assertLess(time.monotonic() - start, 5.0)
+        self.assertEqual(run.status, StageStatus.pending)
+        self.assertEqual(dispatcher.calls, ["queued"])
+
+    def test_without_await_returns_pending_immediately(self) -> None:
+        dispatcher = QueueingDispatcher({"queued"}, delay=None)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run = _run(dispatcher, tmp_dir, await_pending=0.0)
+            self.assertFalse((Path(run.workspace_dir) / ".completions").exists())
+        self.assertEqual(run.status, StageStatus.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from workflow.dispatchers import LocalDispatcher
+from workflow.dispatchers import LocalDispatcher, _inprocess_argv, _run_cli_command
 from workflow.models import StageResult
 
+from tests.fixtures import bin_path
 from tests.workflow_tests.helpers.factories import (
     make_resolved_stage,
     make_stage_spec,
@@ -33,5 +36,53 @@ class TestLocalDispatcherDispatchGroup(unittest.TestCase):
             self.assertIsInstance(results["stage-beta"], StageResult)
 
 
+class TestRunCliCommandInprocess(unittest.TestCase):
+    """DANCING_BEAR_INPROCESS_CLI routes plain bin/<assistant> commands to the warm pool."""
+
+    MAIL = str(bin_path("mail"))
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {"DANCING_BEAR_INPROCESS_CLI": "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_plain_assistant_command_is_eligible(self):
+        self.assertEqual(
+            _inprocess_argv(f"{self.MAIL} labels list --json"),
+            ("mail", ["labels", "list", "--json"]),
+        )
+
+    def test_shell_syntax_and_other_programs_stay_on_subprocess(self):
+        for cmd in (
+            f"{self.MAIL} labels list | jq .",
+            f"{self.MAIL} labels export --out $HOME/x.yaml",
+            f"{self.MAIL} labels list  # trailing comment",
+            f"{self.MAIL} labels list\n{self.MAIL} filters list",
+            f"{self.MAIL} labels export --out out.{{yaml,json}}",
+            f"{self.MAIL} labels list [ab]",
+            f"{self.MAIL} labels list !!",
+            f"FOO=1 {self.MAIL} labels list",
+            f"{bin_path('worker')} status",
+            "mail labels list",
+            "/usr/bin/mail -s subject someone",
+            "python3 -c 'print(1)'",
+        ):
+            with self.subTest(cmd=cmd):
+                self.assertIsNone(_inprocess_argv(cmd))
+
+    def test_disabled_without_opt_in(self):
+        with patch.dict(os.environ, {"DANCING_BEAR_INPROCESS_CLI": ""}):
+            self.assertIsNone(_inprocess_argv(f"{self.MAIL} labels list"))
+
+    def test_result_shape_matches_subprocess_path(self):
+        class FakePool:
+            def run(self, app, argv, **kwargs):
+                return {"returncode": 2, "stdout": "o", "stderr": "e"}
+
+        with patch("core.warm_cli.shared_pool", return_value=FakePool()):
+            result = _run_cli_command(f"{self.MAIL} labels list")
+        self.assertEqual(result, {"status": "error", "returncode": 2, "stdout": "o", "stderr": "e"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for workflow.linter_commands — ./bin/<cli> <subcommand> validation."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from workflow import linter_commands
+from workflow.linter import lint_workflows
+from workflow.linter_commands import CliSubcommands, resolve_cli_commands
+
+_WRAPPER = """\
+#!/usr/bin/env python3
+from pathlib import Path
+import sys
+
+from {package}.__main__ import main  # noqa: E402
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+"""
+
+
+def _workflow(description: str) -> str:
+    return f"""\
+name: cmd-wf
+version: "1.0"
+description: Test workflow
+trigger:
+  source: manual
+stages:
+  - name: gather
+    kind: gather
+    description: "{description}"
+    agent:
+      role: researcher
+"""
+
+
+class LinterCommandsTestBase(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name)
+        (self.root / "bin").mkdir()
+        (self.root / "src" / "fakecli").mkdir(parents=True)
+        (self.root / "src" / "fakecli" / "__main__.py").write_text("def main(): return 0\n")
+        (self.root / "bin" / "fake").write_text(_WRAPPER.format(package="fakecli"))
+        (self.root / "bin" / "tool").write_text("#!/bin/sh\n")
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        env = patch.dict(os.environ, {"DANCING_BEAR_DATA_HOME": str(self.root / "home")})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _introspect(self, subcommands=("alpha", "beta")):
+        return patch.object(CliSubcommands, "_introspect", return_value=subcommands and list(subcommands))
+
+
+class TestCliSubcommands(LinterCommandsTestBase):
+    def test_introspected_cli_is_checked_without_probing(self) -> None:
+        with self._introspect(), patch.object(linter_commands, "_probe", side_effect=AssertionError("probed")):
+            verdicts = resolve_cli_commands({("fake", "alpha"), ("fake", "gamma")})
+        self.assertIsNone(verdicts[("fake", "alpha")])
+        self.assertEqual(verdicts[("fake", "gamma")], "command not found: ./bin/fake gamma")
+
+    def test_cache_is_reused_until_cli_source_changes(self) -> None:
+        with self._introspect() as introspect:
+            resolve_cli_commands({("fake", "alpha")})
+            resolve_cli_commands({("fake", "beta")})
+            self.assertEqual(introspect.call_count, 1)
+            (self.root / "src" / "fakecli" / "cli.py").write_text("# new subcommand\n")
+            resolve_cli_commands({("fake", "alpha")})
+            self.assertEqual(introspect.call_count, 2)
+        self.assertTrue((self.root / "home" / "workflow" / "cli-subcommands.json").is_file())
+
+    def test_missing_binary_is_reported_without_probing(self) -> None:
+        with patch.object(linter_commands, "_probe", side_effect=AssertionError("probed")):
+            verdicts = resolve_cli_commands({("nope", "run")})
+        self.assertEqual(verdicts[("nope", "run")], "command not found: ./bin/nope run")
+
+    def test_non_introspectable_cli_falls_back_to_probe(self) -> None:
+        with self._introspect(None), patch.object(linter_commands, "_probe", return_value=None) as probe:
+            verdicts = resolve_cli_commands({("fake", "alpha"), ("tool", "go")})
+        self.assertEqual(verdicts, {("fake", "alpha"): None, ("tool", "go"): None})
+        self.assertEqual(sorted(call.args[1:] for call in probe.call_args_list), [("fake", "alpha"), ("tool", "go")])
+
+
+class TestLintWorkflowsCheckCommands(LinterCommandsTestBase):
+    def test_shared_pair_is_probed_once_across_files(self) -> None:
+        paths = []
+        for name in ("a", "b"):
+            path = self.root / f"{name}.yaml"
+            path.write_text(_workflow("Run ./bin/tool go then ./bin/fake alpha"))
+            paths.append(path)
+        with self._introspect(), patch.object(
+            linter_commands, "_probe", return_value="command not found: ./bin/tool go",
+        ) as probe:
+            results = lint_workflows(paths, check_commands=True)
+        probe.assert_called_once()
+        for result in results:
+            self.assertTrue(result.valid)
+            self.assertEqual([w.message for w in result.warnings], ["command not found: ./bin/tool go"])
+            self.assertEqual(result.warnings[0].stage, "gather")
+
+
+if __name__ == "__main__":
+    unittest.main()
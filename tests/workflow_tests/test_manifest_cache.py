@@ -0,0 +1,146 @@
+"""Tests for workflow.manifest_cache — content-addressed definition/manifest cache."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from workflow import manifest_cache
+from workflow.compiler import compile_workflow
+from workflow.include import extract_include_entries
+from workflow.manifest_cache import ManifestCache, load_manifest
+from workflow.parser import parse_workflow
+
+_WORKFLOW = """\
+name: cached-wf
+version: "0.1.0"
+description: "Workflow for cache tests"
+trigger:
+  source: manual
+  params:
+    team: core
+include:
+  - path: frag.yaml
+    prefix: fr
+    depends_on: [gather]
+stages:
+  - name: gather
+    kind: gather
+    description: "Gather for {team}"
+    agent:
+      role: researcher
+    outputs:
+      - name: digest
+        mode: invoke
+        skill: mail
+        input_mapping:
+          subcommand: search
+          query: "{team}"
+      - name: report
+        mode: template
+        template_ref: templates/report.md
+"""
+
+_FRAGMENT = """\
+fragment: true
+stages:
+  - name: review
+    kind: validate
+    description: "Review"
+    agent:
+      role: reviewer
+"""
+
+
+class ManifestCacheTestBase(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name)
+        (self.root / "templates").mkdir()
+        (self.root / "templates" / "report.md").write_text("# Report\n")
+        (self.root / "frag.yaml").write_text(_FRAGMENT)
+        self.yaml_path = self.root / "wf.yaml"
+        self.yaml_path.write_text(_WORKFLOW)
+        manifest_cache._entries.clear()
+        self.addCleanup(manifest_cache._entries.clear)
+
+    def _cache(self) -> ManifestCache:
+        return ManifestCache(self.root / "cache", project_root=self.root)
+
+    def _cold(self) -> ManifestCache:
+        """A cache that must go back to disk, as a new process would."""
+        manifest_cache._entries.clear()
+        return self._cache()
+
+
+class TestManifestCache(ManifestCacheTestBase):
+    def test_warm_load_skips_parse_and_compile(self) -> None:
+        compiled = self._cache().manifest(self.yaml_path, {"team": "sre"})
+        with patch.object(manifest_cache, "parse_workflow", side_effect=AssertionError("parsed")), \
+                patch.object(manifest_cache, "compile_workflow", side_effect=AssertionError("compiled")):
+            cached = self._cold().manifest(self.yaml_path, {"team": "sre"})
+        self.assertEqual(cached, compiled)
+        self.assertEqual(cached.resolved_stages["gather"].cli_commands, ("./bin/mail search -- 'sre'",))
+        self.assertEqual(cached.resolved_stages["gather"].template_content, "# Report\n")
+        self.assertEqual(cached.parallel_groups, (("gather",), ("fr-review",)))
+
+    def test_matches_direct_compile(self) -> None:
+        direct = compile_workflow(parse_workflow(self.yaml_path), project_root=self.root)
+        self._cache().manifest(self.yaml_path)
+        cached = self._cold().manifest(self.yaml_path)
+        self.assertEqual(cached.definition, direct.definition)
+        self.assertEqual(cached.resolved_stages, direct.resolved_stages)
+
+    def test_fragment_change_reparses(self) -> None:
+        self._cache().manifest(self.yaml_path)
+        (self.root / "frag.yaml").write_text(_FRAGMENT.replace("Review", "Second look"))
+        manifest = self._cold().manifest(self.yaml_path)
+        self.assertEqual(manifest.resolved_stages["fr-review"].spec.description, "Second look")
+
+    def test_template_change_recompiles_without_reparsing(self) -> None:
+        self._cache().manifest(self.yaml_path)
+        (self.root / "templates" / "report.md").write_text("# Report v2\n")
+        with patch.object(manifest_cache, "parse_workflow", side_effect=AssertionError("parsed")):
+            manifest = self._cold().manifest(self.yaml_path)
+        self.assertEqual(manifest.resolved_stages["gather"].template_content, "# Report v2\n")
+
+    def test_trigger_params_are_cached_separately(self) -> None:
+        self._cache().manifest(self.yaml_path, {"team": "a"})
+        self._cache().manifest(self.yaml_path, {"team": "b"})
+        cache = self._cold()
+        with patch.object(manifest_cache, "compile_workflow", side_effect=AssertionError("compiled")):
+            a = cache.manifest(self.yaml_path, {"team": "a"})
+            b = cache.manifest(self.yaml_path, {"team": "b"})
+        self.assertEqual(a.resolved_stages["gather"].spec.description, "Gather for a")
+        self.assertEqual(b.resolved_stages["gather"].spec.description, "Gather for b")
+
+    def test_corrupt_entry_falls_back_to_compile(self) -> None:
+        self._cache().manifest(self.yaml_path)
+        (entry,) = (self.root / "cache").iterdir()
+        entry.write_text('{"version": 1, "definition": {"name": 3}}')
+        manifest = self._cold().manifest(self.yaml_path)
+        self.assertEqual(manifest.definition.name, "cached-wf")
+
+    def test_disabled_cache_writes_nothing(self) -> None:
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)  # templates resolve against the working directory
+        with patch.dict(os.environ, {"WORKFLOW_MANIFEST_CACHE": "0", "DANCING_BEAR_DATA_HOME": str(self.root / "home")}):
+            manifest = load_manifest(self.yaml_path)
+        self.assertEqual(manifest.definition.name, "cached-wf")
+        self.assertFalse((self.root / "home").exists())
+
+
+class TestExtractIncludeEntriesFastPath(unittest.TestCase):
+    def test_documents_without_top_level_include_skip_yaml(self) -> None:
+        with patch("yaml.safe_load", side_effect=AssertionError("parsed")):
+            self.assertEqual(extract_include_entries(_FRAGMENT), [])
+            self.assertEqual(extract_include_entries(b"stages:\n  - include: nested\n"), [])
+        self.assertEqual(extract_include_entries(_WORKFLOW)[0]["path"], "frag.yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for workflow.scheduler and dependency-driven execution in WorkflowOrchestrator."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from tests.workflow_tests.helpers.factories import (
+    make_resolved_stage,
+    make_stage_result,
+    make_stage_spec,
+    make_workflow_definition,
+    make_workflow_manifest,
+)
+from workflow.models import StageStatus
+from workflow.orchestrator import OrchestratorConfig, WorkflowOrchestrator
+from workflow.scheduler import ReadyQueue, StageTiming, critical_path
+
+
+def _stages(*specs: tuple[str, tuple[str, ...]], gates: tuple[str, ...] = ()):
+    return {
+        name: make_resolved_stage(
+            spec=make_stage_spec(name=name, depends_on=deps, human_gate=name in gates), index=i,
+        )
+        for i, (name, deps) in enumerate(specs)
+    }
+
+
+def _manifest(stages):
+    wf = make_workflow_definition(stages=tuple(s.spec for s in stages.values()))
+    return make_workflow_manifest(definition=wf, parallel_groups=(), resolved_stages=stages)
+
+
+class TimedDispatcher:
+    """Sleeps per stage, returns a fixed status, and tracks peak concurrency."""
+
+    def __init__(self, delays: dict[str, float], statuses: dict[str, StageStatus] | None = None):
+        self.delays = delays
+        self.statuses = statuses or {}
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def dispatch_group(self, stages, workspace_dir):
+        (stage,) = stages
+        name = stage.spec.name
+        with self._lock:
+            self.calls.append(name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(name, 0.0))
+        with self._lock:
+            self.active -= 1
+        status = self.statuses.get(name, StageStatus.success)
+        return {name: make_stage_result(stage_name=name, stage_index=stage.index, status=status)}
+
+
+def _run(stages, dispatcher, tmp_dir, *, max_concurrency=4):
+    config = OrchestratorConfig(
+        manifest=_manifest(stages), workspace_dir=tmp_dir, run_id="r", max_concurrency=max_concurrency,
+    )
+    orch = WorkflowOrchestrator(config, dispatcher=dispatcher)
+    run = orch.run()
+    schedule = json.loads((Path(run.workspace_dir) / "manifest.json").read_text())["schedule"]
+    return run, schedule
+
+
+class TestReadyQueue(unittest.TestCase):
+    def test_releases_stage_once_all_dependencies_complete(self) -> None:
+        queue = ReadyQueue(_stages(("a", ()), ("b", ()), ("c", ("a", "b", "a"))))
+        self.assertEqual([queue.pop().spec.name, queue.pop().spec.name], ["a", "b"])
+        queue.complete("a")
+        self.assertIsNone(queue.peek())
+        queue.complete("b")
+        self.assertEqual(queue.pop().spec.name, "c")
+        self.assertFalse(queue)
+
+    def test_critical_path_follows_last_finishing_dependency(self) -> None:
+        stages = _stages(("a", ()), ("b", ()), ("c", ("a", "b")), ("d", ()))
+        timings = {
+            "a": StageTiming(0, 50), "b": StageTiming(0, 120), "c": StageTiming(120, 200), "d": StageTiming(0, 150),
+        }
+        self.assertEqual(critical_path(timings, stages), ["b", "c"])
+        self.assertEqual(critical_path({}, stages), [])
+
+
+class TestDependencyDrivenRun(unittest.TestCase):
+    def test_stage_starts_when_its_own_dependencies_finish(self) -> None:
+        # Levels would be [slow, fast] then [after_fast]; after_fast must not wait for slow.
+        stages = _stages(("slow", ()), ("fast", ()), ("after_fast", ("fast",)))
+        dispatcher = TimedDispatcher({"slow": 0.3, "fast": 0.02, "after_fast": 0.02})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run, schedule = _run(stages, dispatcher, tmp_dir)
+        self.assertEqual(run.status, StageStatus.success)
+        timing = schedule["stages"]
+        self.assertLess(timing["after_fast"]["finish_ms"], timing["slow"]["finish_ms"])
+        self.assertEqual(run.critical_path, ("slow",))
+        self.assertEqual(schedule["critical_path"], ["slow"])
+        self.assertGreaterEqual(schedule["makespan_ms"], timing["slow"]["finish_ms"])
+
+    def test_concurrency_cap_is_respected(self) -> None:
+        stages = _stages(*((f"s{i}", ()) for i in range(5)))
+        dispatcher = TimedDispatcher({f"s{i}": 0.03 for i in range(5)})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run, _ = _run(stages, dispatcher, tmp_dir, max_concurrency=2)
+        self.assertEqual(run.status, StageStatus.success)
+        self.assertEqual(dispatcher.peak, 2)
+        self.assertEqual(len(run.stage_results), 5)
+
+    def test_human_gate_runs_alone_and_pauses(self) -> None:
+        stages = _stages(("work", ()), ("review", ()), ("later", ()), gates=("review",))
+        dispatcher = TimedDispatcher({"work": 0.05})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run, schedule = _run(stages, dispatcher, tmp_dir)
+        self.assertEqual(run.status, StageStatus.awaiting_human)
+        self.assertEqual(dispatcher.calls, ["work", "review"])
+        self.assertGreaterEqual(schedule["stages"]["review"]["start_ms"], schedule["stages"]["work"]["finish_ms"])
+
+    def test_pending_holds_back_only_its_dependents(self) -> None:
+        stages = _stages(("agent", ()), ("uses_agent", ("agent",)), ("local", ()), ("after_local", ("local",)))
+        dispatcher = TimedDispatcher({}, {"agent": StageStatus.pending})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run, _ = _run(stages, dispatcher, tmp_dir)
+        self.assertEqual(run.status, StageStatus.pending)
+        self.assertEqual(sorted(dispatcher.calls), ["after_local", "agent", "local"])
+
+    def test_required_failure_stops_new_launches(self) -> None:
+        stages = _stages(("bad", ()), ("in_flight", ()), ("queued", ()))
+        dispatcher = TimedDispatcher({"in_flight": 0.05}, {"bad": StageStatus.failed})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run, _ = _run(stages, dispatcher, tmp_dir, max_concurrency=2)
+        self.assertEqual(run.status, StageStatus.failed)
+        self.assertEqual(set(run.stage_results), {"bad", "in_flight"})
+
+
+if __name__ == "__main__":
+    unittest.main()